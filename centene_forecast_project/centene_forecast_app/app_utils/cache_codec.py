@@ -0,0 +1,259 @@
+"""
+Cache Payload Codec
+
+Compact encoding for large values stored by cache_with_ttl. Report endpoints
+return lists of normalized record dicts where every row repeats every key;
+pickled as-is, a 10k-row forecast month costs ~2 MB per worker in locmem.
+
+Only record payloads (a list of at least COLUMNAR_MIN_ROWS same-shaped dicts,
+at the top level or one dict level down) go through the codec. Every other
+value is stored unchanged without being pickled here, so existing cache
+readers keep working and small entries cost nothing extra.
+
+Encoding steps for record payloads (each applied only when it pays off):
+
+1. Columnar (opt-in, ForecastCacheConfig.COLUMNAR_ENCODING): the dicts become
+   the key list plus one value list per column. Low-cardinality string
+   columns (main_lob, state, case_type, ...) are dictionary-encoded as
+   uniques + array of codes. Smallest entries, but rebuilding the dicts on
+   every hit costs more CPU than unpickling them.
+2. Pickle the (possibly columnar) value.
+3. Compress with zlib or lz4 when the pickle exceeds a size threshold.
+"""
+
+import logging
+import pickle
+import zlib
+from array import array
+from typing import Any, Dict, List, Tuple
+
+from core.config import ForecastCacheConfig
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # Optional dependency
+    lz4_frame = None
+
+logger = logging.getLogger('django')
+
+# Dictionary-encode a string column when uniques are at most this share of rows
+_DICTIONARY_MAX_RATIO = 0.5
+
+
+class ColumnarRecords:
+    """List of same-shaped dicts stored as one key list and per-column values."""
+
+    __slots__ = ('keys', 'columns', 'row_count')
+
+    def __init__(self, keys: List[str], columns: List[Tuple], row_count: int):
+        self.keys = keys
+        self.columns = columns
+        self.row_count = row_count
+
+    def __getstate__(self):
+        return (self.keys, self.columns, self.row_count)
+
+    def __setstate__(self, state):
+        self.keys, self.columns, self.row_count = state
+
+
+class EncodedPayload:
+    """
+    Cache envelope for an encoded value.
+
+    Attributes:
+        data: Pickled (and possibly compressed) value
+        compression: 'none', 'zlib' or 'lz4'
+        columnar: Whether record lists were converted to columns
+        encoded_size: Pickled size before compression, in bytes
+    """
+
+    __slots__ = ('data', 'compression', 'columnar', 'encoded_size')
+
+    def __init__(self, data: bytes, compression: str, columnar: bool, encoded_size: int):
+        self.data = data
+        self.compression = compression
+        self.columnar = columnar
+        self.encoded_size = encoded_size
+
+    def __getstate__(self):
+        return (self.data, self.compression, self.columnar, self.encoded_size)
+
+    def __setstate__(self, state):
+        self.data, self.compression, self.columnar, self.encoded_size = state
+
+    @property
+    def stored_size(self) -> int:
+        return len(self.data)
+
+
+# ============================================================================
+# Columnar Encoding
+# ============================================================================
+
+def _encode_column(values: List[Any]) -> Tuple:
+    """Dictionary-encode low-cardinality string columns, keep others as lists."""
+    if values and all(type(value) is str for value in values):
+        uniques = list(dict.fromkeys(values))
+        if len(uniques) <= len(values) * _DICTIONARY_MAX_RATIO and len(uniques) < 65536:
+            index = {value: code for code, value in enumerate(uniques)}
+            typecode = 'B' if len(uniques) < 256 else 'H'
+            return ('dict', uniques, array(typecode, [index[value] for value in values]))
+    return ('list', values)
+
+
+def _decode_column(column: Tuple) -> List[Any]:
+    if column[0] == 'dict':
+        uniques = column[1]
+        return [uniques[code] for code in column[2]]
+    return column[1]
+
+
+def _is_record_list(value: Any) -> bool:
+    """Lists of dicts that all share the first row's keys (in order)."""
+    if not isinstance(value, list) or len(value) < ForecastCacheConfig.COLUMNAR_MIN_ROWS:
+        return False
+    first = value[0]
+    if not isinstance(first, dict):
+        return False
+    keys = list(first)
+    return all(type(row) is dict and len(row) == len(keys) and list(row) == keys for row in value)
+
+
+def to_columnar(records: List[Dict]) -> ColumnarRecords:
+    """
+    Convert a list of same-shaped dicts to columns.
+
+    Args:
+        records: Normalized records (every row has the same keys)
+
+    Returns:
+        ColumnarRecords
+    """
+    keys = list(records[0])
+    columns = [_encode_column([row[key] for row in records]) for key in keys]
+    return ColumnarRecords(keys, columns, len(records))
+
+
+def from_columnar(columnar: ColumnarRecords) -> List[Dict]:
+    """Rebuild the list of dicts from ColumnarRecords."""
+    columns = [_decode_column(column) for column in columnar.columns]
+    keys = columnar.keys
+    if not keys:
+        return [{} for _ in range(columnar.row_count)]
+    return [dict(zip(keys, row)) for row in zip(*columns)]
+
+
+def _has_record_list(value: Any) -> bool:
+    """Whether a value holds a record list at the top level or one dict level down."""
+    if isinstance(value, dict):
+        return any(_is_record_list(item) for item in value.values())
+    return _is_record_list(value)
+
+
+def _columnarize(value: Any) -> Tuple[Any, bool]:
+    """Convert record lists at the top level or one dict level down (e.g. {'data': [...]})."""
+    if _is_record_list(value):
+        return to_columnar(value), True
+    if isinstance(value, dict) and any(_is_record_list(item) for item in value.values()):
+        return {
+            key: to_columnar(item) if _is_record_list(item) else item
+            for key, item in value.items()
+        }, True
+    return value, False
+
+
+def _decolumnarize(value: Any) -> Any:
+    if isinstance(value, ColumnarRecords):
+        return from_columnar(value)
+    if isinstance(value, dict):
+        return {
+            key: from_columnar(item) if isinstance(item, ColumnarRecords) else item
+            for key, item in value.items()
+        }
+    return value
+
+
+# ============================================================================
+# Compression
+# ============================================================================
+
+def _compression_method() -> str:
+    method = ForecastCacheConfig.PAYLOAD_COMPRESSION
+    if method == 'lz4' and lz4_frame is None:
+        logger.debug("lz4 not installed, falling back to zlib for cache payloads")
+        return 'zlib'
+    return method
+
+
+def _compress(data: bytes, method: str) -> bytes:
+    if method == 'lz4':
+        return lz4_frame.compress(data)
+    return zlib.compress(data, ForecastCacheConfig.PAYLOAD_COMPRESSION_LEVEL)
+
+
+def _decompress(data: bytes, method: str) -> bytes:
+    if method == 'lz4':
+        if lz4_frame is None:
+            raise RuntimeError("Cached payload is lz4-compressed but lz4 is not installed")
+        return lz4_frame.decompress(data)
+    if method == 'zlib':
+        return zlib.decompress(data)
+    return data
+
+
+# ============================================================================
+# Public API
+# ============================================================================
+
+def encode_payload(value: Any) -> Tuple[Any, int]:
+    """
+    Encode a value for caching.
+
+    Args:
+        value: Value returned by a cached function
+
+    Returns:
+        Tuple of (value_to_store, stored_size_in_bytes). value_to_store is
+        the original value when encoding would not help, otherwise an
+        EncodedPayload. Values without record lists are returned as-is
+        with size 0 (not measured).
+    """
+    if not _has_record_list(value):
+        return value, 0
+
+    encoded, columnar = value, False
+    if ForecastCacheConfig.COLUMNAR_ENCODING:
+        encoded, columnar = _columnarize(value)
+    data = pickle.dumps(encoded, pickle.HIGHEST_PROTOCOL)
+    encoded_size = len(data)
+
+    method = _compression_method()
+    compress = method != 'none' and encoded_size >= ForecastCacheConfig.PAYLOAD_COMPRESSION_THRESHOLD
+
+    if not columnar and not compress:
+        return value, encoded_size
+
+    compression = 'none'
+    if compress:
+        compressed = _compress(data, method)
+        if len(compressed) < encoded_size:
+            data, compression = compressed, method
+
+    return EncodedPayload(data, compression, columnar, encoded_size), len(data)
+
+
+def decode_payload(value: Any) -> Any:
+    """
+    Decode a value read from the cache.
+
+    Args:
+        value: Raw cache value (EncodedPayload or a plain value)
+
+    Returns:
+        The original value
+    """
+    if not isinstance(value, EncodedPayload):
+        return value
+    decoded = pickle.loads(_decompress(value.data, value.compression))
+    return _decolumnarize(decoded) if value.columnar else decoded
@@ -0,0 +1,207 @@
+"""
+Cache Metrics
+
+Per-prefix counters and miss-latency histograms recorded by cache_with_ttl,
+plus helpers to merge snapshots from several workers and render them in the
+Prometheus text exposition format.
+
+Counters (per key prefix):
+    hits, stale_hits, misses, sets, evictions, expirations, bytes_written
+Gauges (filled in at snapshot time from payload size accounting):
+    entries, stored_bytes
+Histogram:
+    miss_latency - seconds spent in the wrapped function on a cache miss
+"""
+
+import copy
+import threading
+from typing import Dict, Iterable, List
+
+# Upper bounds (seconds) of the miss latency histogram buckets; +Inf is implicit
+MISS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+COUNTERS = ('hits', 'stale_hits', 'misses', 'sets', 'evictions', 'expirations', 'bytes_written',
+            'revalidations', 'not_modified')
+GAUGES = ('entries', 'stored_bytes')
+
+_METRIC_PREFIX = 'centene_cache'
+
+_COUNTER_HELP = {
+    'hits': 'Cache hits served fresh.',
+    'stale_hits': 'Cache hits served stale while a background refresh ran.',
+    'misses': 'Cache misses (the wrapped function had to be called or awaited).',
+    'sets': 'Values written to the cache.',
+    'evictions': 'Misses for entries this worker stored that disappeared before their TTL.',
+    'expirations': 'Misses for entries this worker stored whose TTL had passed.',
+    'bytes_written': 'Bytes written to the cache (record payloads measured by the payload codec).',
+    'revalidations': 'Expired entries checked against the backend with conditional GETs.',
+    'not_modified': 'Revalidations answered 304 Not Modified (TTL extended, nothing refetched).',
+}
+
+_GAUGE_HELP = {
+    'entries': 'Live cache entries written by the worker(s).',
+    'stored_bytes': 'Approximate bytes held by live cache entries (record payloads measured by the payload codec).',
+}
+
+
+def empty_prefix_metrics() -> dict:
+    metrics = {counter: 0 for counter in COUNTERS}
+    metrics.update({gauge: 0 for gauge in GAUGES})
+    metrics['miss_latency'] = {
+        'buckets': [0] * len(MISS_LATENCY_BUCKETS),
+        'sum': 0.0,
+        'count': 0,
+    }
+    return metrics
+
+
+class CacheMetrics:
+    """
+    Thread-safe per-prefix cache metrics for one worker process.
+
+    Example:
+        >>> metrics = CacheMetrics()
+        >>> metrics.incr('forecast', 'misses')
+        >>> metrics.observe_miss('forecast', 0.42)
+        >>> metrics.snapshot()['forecast']['misses']
+        1
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._prefixes: Dict[str, dict] = {}
+
+    def _metrics_for(self, prefix: str) -> dict:
+        metrics = self._prefixes.get(prefix)
+        if metrics is None:
+            metrics = self._prefixes[prefix] = empty_prefix_metrics()
+        return metrics
+
+    def incr(self, prefix: str, counter: str, amount: int = 1):
+        """Increment a counter for a key prefix."""
+        with self._lock:
+            self._metrics_for(prefix)[counter] += amount
+
+    def observe_miss(self, prefix: str, seconds: float):
+        """Record time spent computing a missed value."""
+        with self._lock:
+            histogram = self._metrics_for(prefix)['miss_latency']
+            histogram['sum'] += seconds
+            histogram['count'] += 1
+            for index, upper_bound in enumerate(MISS_LATENCY_BUCKETS):
+                if seconds <= upper_bound:
+                    histogram['buckets'][index] += 1
+                    break
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        Copy of all metrics.
+
+        Histogram buckets are stored non-cumulative; render_prometheus()
+        accumulates them.
+        """
+        with self._lock:
+            return copy.deepcopy(self._prefixes)
+
+    def reset(self):
+        with self._lock:
+            self._prefixes.clear()
+
+
+def merge_snapshots(snapshots: Iterable[Dict[str, dict]]) -> Dict[str, dict]:
+    """
+    Sum per-prefix metrics from several workers.
+
+    Args:
+        snapshots: Iterable of CacheMetrics.snapshot() results
+
+    Returns:
+        Merged snapshot in the same shape
+    """
+    merged: Dict[str, dict] = {}
+    for snapshot in snapshots:
+        for prefix, metrics in (snapshot or {}).items():
+            target = merged.setdefault(prefix, empty_prefix_metrics())
+            for name in COUNTERS + GAUGES:
+                target[name] += metrics.get(name, 0)
+            latency = metrics.get('miss_latency') or {}
+            target_latency = target['miss_latency']
+            for index, count in enumerate(latency.get('buckets', [])[:len(MISS_LATENCY_BUCKETS)]):
+                target_latency['buckets'][index] += count
+            target_latency['sum'] += latency.get('sum', 0.0)
+            target_latency['count'] += latency.get('count', 0)
+    return merged
+
+
+def hit_ratio(metrics: dict) -> float:
+    """Share of lookups served from cache (fresh or stale), 0.0 when unused."""
+    hits = metrics.get('hits', 0) + metrics.get('stale_hits', 0)
+    lookups = hits + metrics.get('misses', 0)
+    return round(hits / lookups, 4) if lookups else 0.0
+
+
+def _label(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_prometheus(snapshot: Dict[str, dict], workers: int = 1,
+                      single_flight: Dict[str, dict] = None) -> str:
+    """
+    Render metrics in the Prometheus text exposition format (version 0.0.4).
+
+    Args:
+        snapshot: Merged per-prefix metrics
+        workers: Number of workers the snapshot was aggregated from
+        single_flight: Optional per-prefix stampede counters
+
+    Returns:
+        Exposition text
+    """
+    prefixes = sorted(snapshot)
+    lines: List[str] = [
+        f"# HELP {_METRIC_PREFIX}_workers Workers included in these metrics.",
+        f"# TYPE {_METRIC_PREFIX}_workers gauge",
+        f"{_METRIC_PREFIX}_workers {workers}",
+    ]
+
+    for counter in COUNTERS:
+        name = f"{_METRIC_PREFIX}_{counter}_total"
+        lines.append(f"# HELP {name} {_COUNTER_HELP[counter]}")
+        lines.append(f"# TYPE {name} counter")
+        for prefix in prefixes:
+            lines.append(f'{name}{{prefix="{_label(prefix)}"}} {snapshot[prefix][counter]}')
+
+    for gauge in GAUGES:
+        name = f"{_METRIC_PREFIX}_{gauge}"
+        lines.append(f"# HELP {name} {_GAUGE_HELP[gauge]}")
+        lines.append(f"# TYPE {name} gauge")
+        for prefix in prefixes:
+            lines.append(f'{name}{{prefix="{_label(prefix)}"}} {snapshot[prefix][gauge]}')
+
+    name = f"{_METRIC_PREFIX}_miss_duration_seconds"
+    lines.append(f"# HELP {name} Time spent in the wrapped function on a cache miss.")
+    lines.append(f"# TYPE {name} histogram")
+    for prefix in prefixes:
+        latency = snapshot[prefix]['miss_latency']
+        label = _label(prefix)
+        cumulative = 0
+        for upper_bound, count in zip(MISS_LATENCY_BUCKETS, latency['buckets']):
+            cumulative += count
+            lines.append(f'{name}_bucket{{prefix="{label}",le="{upper_bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{prefix="{label}",le="+Inf"}} {latency["count"]}')
+        lines.append(f'{name}_sum{{prefix="{label}"}} {_format_number(latency["sum"])}')
+        lines.append(f'{name}_count{{prefix="{label}"}} {latency["count"]}')
+
+    if single_flight:
+        name = f"{_METRIC_PREFIX}_single_flight_events_total"
+        lines.append(f"# HELP {name} Stampede protection events (coalesced waits, lock waits, refreshes).")
+        lines.append(f"# TYPE {name} counter")
+        for prefix in sorted(single_flight):
+            for event, count in sorted(single_flight[prefix].items()):
+                lines.append(f'{name}{{prefix="{_label(prefix)}",event="{_label(event)}"}} {count}')
+
+    return '\n'.join(lines) + '\n'
@@ -1,41 +1,123 @@
 """
 Cache Utilities for Forecast Data
 
-Provides caching decorator and cache management functions for Django local memory cache.
-Lightweight, fast, zero-dependency caching for development and single-worker deployments.
+Provides caching decorator and cache management functions on top of Django's
+cache framework. The cache alias is selected by ForecastCacheConfig.CACHE_BACKEND:
+
+- 'default' (locmem): fast, zero-dependency, per-process cache
+- 'filebased': per-host cache shared by workers on one machine
+- 'redis': shared cache for all workers, with native pattern invalidation
 """
 
 import logging
+import calendar
+import contextvars
 import hashlib
 import inspect
-import os
 import fnmatch
+import os
+import socket
+import threading
+import time
+import uuid
+from collections import defaultdict
 from functools import wraps
-from typing import Any, Callable, Optional, List
-from django.core.cache import cache
+from typing import Any, Callable, Dict, Iterable, Optional, List
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
 from django.conf import settings
 from core.config import ForecastCacheConfig
 from core.constants import SUMMARY_TYPES
+from centene_forecast_app.app_utils.cache_codec import EncodedPayload, decode_payload, encode_payload
+from centene_forecast_app.app_utils.cache_metrics import (
+    CacheMetrics,
+    empty_prefix_metrics,
+    hit_ratio,
+    merge_snapshots,
+)
 
 logger = logging.getLogger('django')
 
-# Key registry for locmem cache (to enable pattern matching)
+# Key registry for process-local backends (locmem/filebased) to enable pattern matching
 _CACHE_KEY_REGISTRY = set()
 
+# Number of keys fetched per SCAN round trip / deleted per DEL command on redis
+_REDIS_SCAN_COUNT = 500
+
+# Tag registry for process-local backends: tag -> cache keys carrying it
+# (redis keeps one SET per tag under the '__tag__:' key prefix instead)
+_CACHE_TAG_REGISTRY: Dict[str, set] = {}
+_TAG_KEY_PREFIX = '__tag__'
+
+# Single-flight state: in-process recomputes keyed by cache key, keys with a
+# background refresh running, and per-prefix stampede counters
+_SINGLE_FLIGHT_LOCK = threading.Lock()
+_IN_FLIGHT: Dict[str, '_InFlightCall'] = {}
+_REFRESHING = set()
+_SINGLE_FLIGHT_STATS = defaultdict(lambda: defaultdict(int))
+
+# Size accounting for entries written by this process:
+# cache key -> (key_prefix, stored_bytes, uncompressed_bytes, compression, columnar, expires_at)
+_PAYLOAD_SIZES: Dict[str, tuple] = {}
+
+# Per-prefix hit/miss/set/eviction counters and miss latency for this process.
+# Snapshots are published to the shared cache under '__metrics__:worker:<id>'
+# so any worker can report totals for the whole deployment.
+_METRICS = CacheMetrics()
+# (pid, 'host:pid'); recomputed when the pid changes, so workers forked after
+# this module was imported publish under their own id
+_worker_id_cache = (0, '')
+_METRICS_KEY_PREFIX = '__metrics__:worker'
+_last_metrics_publish = 0.0
+
+# Collects the backend GETs (with ETag / Last-Modified) made while a
+# revalidating entry is computed; set per call by cache_with_ttl
+_VALIDATOR_RECORDER: contextvars.ContextVar = contextvars.ContextVar('cache_validator_recorder', default=None)
+
 
 # ============================================================================
 # Cache Backend Detection & Pattern Matching Utilities
 # ============================================================================
 
+def _get_cache():
+    """
+    Get the Django cache selected by ForecastCacheConfig.CACHE_BACKEND.
+
+    Returns:
+        Django cache instance for the configured alias
+    """
+    return caches[ForecastCacheConfig.CACHE_BACKEND]
+
+
+def validate_cache_backend():
+    """
+    Fail at startup when ForecastCacheConfig.CACHE_BACKEND is not a cache alias.
+
+    Otherwise e.g. CENTENE_CACHE_BACKEND=redis without CENTENE_REDIS_URL
+    would only fail at the first cache access.
+
+    Raises:
+        ImproperlyConfigured: The alias is missing from settings.CACHES
+    """
+    alias = ForecastCacheConfig.CACHE_BACKEND
+    if alias in settings.CACHES:
+        return
+    hint = ' (set CENTENE_REDIS_URL to enable it)' if alias == 'redis' else ''
+    raise ImproperlyConfigured(
+        f"CENTENE_CACHE_BACKEND={alias!r} is not a configured cache{hint}; "
+        f"available: {', '.join(sorted(settings.CACHES))}"
+    )
+
+
 def _get_cache_backend_type() -> str:
     """
-    Detect the cache backend type.
+    Detect the cache backend type of the configured cache alias.
 
     Returns:
         'filebased', 'locmem', 'redis', or 'unknown'
     """
     try:
-        backend = settings.CACHES.get('default', {}).get('BACKEND', '')
+        backend = settings.CACHES.get(ForecastCacheConfig.CACHE_BACKEND, {}).get('BACKEND', '')
 
         if 'FileBasedCache' in backend:
             return 'filebased'
@@ -50,76 +132,141 @@ def _get_cache_backend_type() -> str:
         return 'unknown'
 
 
-def _get_filebased_cache_location() -> Optional[str]:
+def is_shared_cache() -> bool:
     """
-    Get the file path for file-based cache.
+    Whether cache entries and their invalidation are shared between processes (redis).
 
-    Returns:
-        Cache directory path or None if not file-based cache
+    Entries written to locmem exist only in the process that wrote them, so
+    e.g. a warm-up run from manage.py never reaches the server's cache. A
+    filebased cache shares the entries but not the key / tag registries, so
+    the server's tag and pattern invalidation would never drop them.
     """
-    try:
-        if _get_cache_backend_type() == 'filebased':
-            return settings.CACHES.get('default', {}).get('LOCATION')
-    except Exception as e:
-        logger.debug(f"Could not get cache location: {e}")
-    return None
+    return _get_cache_backend_type() == 'redis'
+
+
+def _uses_key_registry() -> bool:
+    """Process-local backends rely on the key registry for pattern matching."""
+    return _get_cache_backend_type() in ('locmem', 'filebased')
 
-# TODO: FIX this: doesnot give output matching the pattern style.
-def _match_pattern_filebased(pattern: str) -> List[str]:
+
+def _match_pattern_registry(pattern: str) -> List[str]:
     """
-    Match cache files in file-based cache using filesystem.
+    Match cache keys using the process-local key registry (locmem / filebased).
 
     Args:
         pattern: Wildcard pattern (e.g., 'cascade:*', 'forecast:7:*')
 
     Returns:
-        List of matching file paths (not keys, as file cache hashes keys)
+        List of matching cache keys
     """
-    cache_dir = _get_filebased_cache_location()
-    if not cache_dir or not os.path.exists(cache_dir):
-        logger.warning(f"Cache directory not found: {cache_dir}")
-        return []
+    matching_keys = []
 
-    matching_files = []
+    # Use fnmatch for Unix-style pattern matching
+    for key in list(_CACHE_KEY_REGISTRY):
+        if fnmatch.fnmatch(key, pattern):
+            matching_keys.append(key)
 
-    try:
-        # Remove special chars from pattern for filename matching
-        pattern_parts = pattern.replace(':', '_').replace('*', '').split('_')
+    return matching_keys
 
-        for filename in os.listdir(cache_dir):
-            filepath = os.path.join(cache_dir, filename)
 
-            if not os.path.isfile(filepath):
-                continue
+def _get_redis_client():
+    """
+    Get a raw redis client for the configured redis cache.
 
-            # Check if filename contains pattern elements
-            # Django file cache hashes keys, so we match on hash content
-            if any(part in filename for part in pattern_parts if part):
-                matching_files.append(filepath)
+    Supports Django's built-in RedisCache and django-redis.
 
-    except Exception as e:
-        logger.warning(f"Error matching file-based cache pattern '{pattern}': {e}")
+    Returns:
+        redis.Redis client
+    """
+    redis_cache = _get_cache()
+    if hasattr(redis_cache, 'client') and hasattr(redis_cache.client, 'get_client'):
+        # django-redis
+        return redis_cache.client.get_client(write=True)
+    # django.core.cache.backends.redis.RedisCache
+    return redis_cache._cache.get_client(None, write=True)
 
-    return matching_files
 
-def _match_pattern_locmem(pattern: str) -> List[str]:
+def get_shared_redis_client():
     """
-    Match cache keys in local memory cache using registry.
+    Raw redis client of the shared cache, for pub/sub between workers.
+
+    Returns:
+        redis.Redis client, or None when the cache is not redis-backed
+    """
+    if _get_cache_backend_type() != 'redis':
+        return None
+    return _get_redis_client()
+
+
+def _match_pattern_redis(pattern: str) -> List[bytes]:
+    """
+    Match keys on the shared redis cache with SCAN (non-blocking, unlike KEYS).
+
+    The pattern is run through the cache's make_key() so KEY_PREFIX and
+    VERSION are applied exactly as they are for stored entries.
 
     Args:
         pattern: Wildcard pattern (e.g., 'cascade:*', 'forecast:7:*')
 
     Returns:
-        List of matching cache keys
+        List of raw redis keys (already prefixed)
     """
-    matching_keys = []
+    redis_pattern = _get_cache().make_key(pattern)
+    client = _get_redis_client()
+    return list(client.scan_iter(match=redis_pattern, count=_REDIS_SCAN_COUNT))
 
-    # Use fnmatch for Unix-style pattern matching
-    for key in _CACHE_KEY_REGISTRY:
-        if fnmatch.fnmatch(key, pattern):
-            matching_keys.append(key)
 
-    return matching_keys
+def _delete_raw_keys_redis(raw_keys: List) -> int:
+    """
+    Delete raw (prefixed) redis keys atomically in one MULTI/EXEC transaction.
+
+    Args:
+        raw_keys: Prefixed redis keys
+
+    Returns:
+        Number of keys deleted
+    """
+    if not raw_keys:
+        return 0
+
+    client = _get_redis_client()
+    pipeline = client.pipeline(transaction=True)
+    for start in range(0, len(raw_keys), _REDIS_SCAN_COUNT):
+        pipeline.delete(*raw_keys[start:start + _REDIS_SCAN_COUNT])
+    return sum(pipeline.execute())
+
+
+def delete_many(keys: Iterable[str]) -> int:
+    """
+    Invalidate several cache keys as one operation.
+
+    On redis all keys are removed in a single MULTI/EXEC transaction, so other
+    workers never observe a partially invalidated set (e.g. fresh forecast
+    data next to a stale schema). Other backends delete key by key.
+
+    Args:
+        keys: Cache keys (unprefixed, as produced by cache_with_ttl)
+
+    Returns:
+        Number of keys deleted
+    """
+    keys = list(keys)
+    if not keys:
+        return 0
+
+    cache = _get_cache()
+    if _get_cache_backend_type() == 'redis':
+        deleted_count = _delete_raw_keys_redis([cache.make_key(key) for key in keys])
+    else:
+        deleted_count = 0
+        for key in keys:
+            if cache.delete(key):
+                deleted_count += 1
+
+    for key in keys:
+        _unregister_cache_key(key)
+
+    return deleted_count
 
 
 def delete_pattern(pattern: str) -> int:
@@ -127,9 +274,11 @@ def delete_pattern(pattern: str) -> int:
     Delete cache keys matching a wildcard pattern.
 
     Works with:
-    - File-based cache: Lists files and matches patterns
-    - Local memory cache: Uses internal registry to match keys
-    - Redis: Not implemented 
+    - Redis: SCAN for matching keys, then one atomic MULTI/EXEC delete.
+      Shared by all workers, so every worker sees the invalidation.
+    - django-redis: native delete_pattern
+    - Local memory / file-based cache: internal key registry
+      (only keys cached by this process are matched)
 
     Args:
         pattern: Wildcard pattern using * and ?
@@ -146,35 +295,34 @@ def delete_pattern(pattern: str) -> int:
     backend_type = _get_cache_backend_type()
     logger.debug(f"Deleting cache keys matching pattern '{pattern}' (backend: {backend_type})")
 
-    if backend_type == 'filebased':
-        # File-based cache: use helper to match files
-        matching_files = _match_pattern_filebased(pattern)
+    if backend_type == 'redis':
+        cache = _get_cache()
+        if hasattr(cache, 'delete_pattern'):
+            # django-redis implements SCAN + DEL itself
+            deleted_count = cache.delete_pattern(pattern, itersize=_REDIS_SCAN_COUNT)
+        else:
+            deleted_count = _delete_raw_keys_redis(_match_pattern_redis(pattern))
 
-        # Delete matched files
-        deleted_count = 0
-        for filepath in matching_files:
-            try:
-                os.remove(filepath)
-                deleted_count += 1
-                logger.debug(f"Deleted cache file: {filepath}")
-            except Exception as e:
-                logger.warning(f"Could not delete cache file {filepath}: {e}")
+        for key in [key for key in list(_PAYLOAD_SIZES) if fnmatch.fnmatch(key, pattern)]:
+            _PAYLOAD_SIZES.pop(key, None)
 
-        logger.info(f"Deleted {deleted_count} file-based cache entries matching '{pattern}'")
+        logger.info(f"Deleted {deleted_count} redis cache entries matching '{pattern}'")
         return deleted_count
 
-    elif backend_type == 'locmem':
-        # Local memory cache: use registry
-        matching_keys = _match_pattern_locmem(pattern)
+    elif backend_type in ('locmem', 'filebased'):
+        # Process-local registry: file-based cache stores keys as md5 hashes,
+        # so filenames cannot be matched against the pattern directly
+        matching_keys = _match_pattern_registry(pattern)
 
         deleted_count = 0
+        cache = _get_cache()
         for key in matching_keys:
             if cache.delete(key):
                 deleted_count += 1
-                _unregister_cache_key(key)
                 logger.debug(f"Deleted cache key: {key}")
+            _unregister_cache_key(key)
 
-        logger.info(f"Deleted {deleted_count} locmem cache entries matching '{pattern}'")
+        logger.info(f"Deleted {deleted_count} {backend_type} cache entries matching '{pattern}'")
         return deleted_count
 
     else:
@@ -187,26 +335,209 @@ def delete_pattern(pattern: str) -> int:
 
 def _register_cache_key(key: str):
     """
-    Register a cache key in the registry (for locmem pattern matching only).
+    Register a cache key in the registry (for process-local backends only).
 
     Args:
         key: Cache key to register
     """
-    # Only register if using local memory cache
-    if _get_cache_backend_type() == 'locmem':
+    if _uses_key_registry():
         _CACHE_KEY_REGISTRY.add(key)
 
 
 def _unregister_cache_key(key: str):
     """
-    Remove a cache key from the registry (for locmem only).
+    Remove a cache key from the registry (for process-local backends only).
 
     Args:
         key: Cache key to unregister
     """
-    # Only unregister if using local memory cache
-    if _get_cache_backend_type() == 'locmem':
-        _CACHE_KEY_REGISTRY.discard(key)
+    _CACHE_KEY_REGISTRY.discard(key)
+    _PAYLOAD_SIZES.pop(key, None)
+
+
+def _cache_get(key: str) -> Any:
+    """Read a cache entry and decode it if it was stored by the payload codec."""
+    return decode_payload(_get_cache().get(key))
+
+
+# ============================================================================
+# Tag-Based Invalidation
+# ============================================================================
+
+def _normalize_month(month: Any) -> Optional[int]:
+    """
+    Convert a month number or name ('7', 7, 'July', 'Jul') to 1-12.
+
+    Returns:
+        Month number, or None if the value is not a recognizable month
+    """
+    if month is None or month == '':
+        return None
+    try:
+        number = int(month)
+        return number if 1 <= number <= 12 else None
+    except (TypeError, ValueError):
+        pass
+
+    name = str(month).strip().lower()
+    for number in range(1, 13):
+        if name in (calendar.month_name[number].lower(), calendar.month_abbr[number].lower()):
+            return number
+    return None
+
+
+def _normalize_year(year: Any) -> Optional[int]:
+    try:
+        return int(year)
+    except (TypeError, ValueError):
+        return None
+
+
+def cache_tags(domain: str, month: Any = None, year: Any = None) -> List[str]:
+    """
+    Build the tags attached to a cache entry of a data domain.
+
+    Every entry carries the domain tag; period-scoped entries also carry a
+    year tag and either a month tag or '<domain>:<year>:all', and entries
+    without a year are tagged '<domain>:global'.
+
+    Args:
+        domain: Data domain (e.g., 'forecast', 'roster')
+        month: Month number or name the entry was computed for
+        year: Year the entry was computed for
+
+    Returns:
+        List of tag names
+
+    Example:
+        cache_tags('forecast', 'July', 2025)
+        → ['forecast', 'forecast:2025', 'forecast:2025:7']
+    """
+    month = _normalize_month(month)
+    year = _normalize_year(year)
+
+    if year is None:
+        return [domain, f"{domain}:global"]
+    if month is None:
+        return [domain, f"{domain}:{year}", f"{domain}:{year}:all"]
+    return [domain, f"{domain}:{year}", f"{domain}:{year}:{month}"]
+
+
+def _invalidation_tags(domain: str, month: Any = None, year: Any = None) -> List[str]:
+    """Tags to drop so no entry of `domain` for (month, year) survives."""
+    month = _normalize_month(month)
+    year = _normalize_year(year)
+
+    if year is None:
+        return [domain]
+    if month is None:
+        return [f"{domain}:{year}", f"{domain}:global"]
+    return [f"{domain}:{year}:{month}", f"{domain}:{year}:all", f"{domain}:global"]
+
+
+def _tag_key(tag: str) -> str:
+    return f"{_TAG_KEY_PREFIX}:{tag}"
+
+
+def _tag_cache_keys(keys: List[str], tags: List[str], timeout: int):
+    """
+    Record that cache keys belong to tags.
+
+    Redis keeps one SET of raw keys per tag, shared by all workers;
+    process-local backends use the in-memory tag registry.
+    """
+    if not keys or not tags:
+        return
+
+    if _get_cache_backend_type() == 'redis':
+        cache = _get_cache()
+        raw_keys = [cache.make_key(key) for key in keys]
+        tag_set_ttl = max(timeout, ForecastCacheConfig.TAG_SET_TTL)
+        pipeline = _get_redis_client().pipeline(transaction=False)
+        for tag in tags:
+            raw_tag_key = cache.make_key(_tag_key(tag))
+            pipeline.sadd(raw_tag_key, *raw_keys)
+            pipeline.expire(raw_tag_key, tag_set_ttl)
+        pipeline.execute()
+    else:
+        for tag in tags:
+            _CACHE_TAG_REGISTRY.setdefault(tag, set()).update(keys)
+
+
+def delete_tags(tags: Iterable[str]) -> int:
+    """
+    Delete every cache entry carrying any of the given tags.
+
+    On redis the tagged keys and the tag sets are removed in one
+    MULTI/EXEC transaction.
+
+    Args:
+        tags: Tag names (see cache_tags)
+
+    Returns:
+        Number of cache entries deleted
+    """
+    tags = list(dict.fromkeys(tags))
+    if not tags:
+        return 0
+
+    if _get_cache_backend_type() == 'redis':
+        cache = _get_cache()
+        raw_tag_keys = [cache.make_key(_tag_key(tag)) for tag in tags]
+        pipeline = _get_redis_client().pipeline(transaction=False)
+        for raw_tag_key in raw_tag_keys:
+            pipeline.smembers(raw_tag_key)
+        member_sets = pipeline.execute()
+
+        raw_keys = set().union(*member_sets)
+        existing_tag_sets = sum(1 for members in member_sets if members)
+        deleted = _delete_raw_keys_redis(list(raw_keys) + raw_tag_keys)
+
+        # Forget sizes of dropped entries, so their next miss is not an eviction
+        dropped = {key.decode() if isinstance(key, bytes) else key for key in raw_keys}
+        for key in [key for key in list(_PAYLOAD_SIZES) if cache.make_key(key) in dropped]:
+            _PAYLOAD_SIZES.pop(key, None)
+        return max(deleted - existing_tag_sets, 0)
+
+    keys = set()
+    for tag in tags:
+        keys.update(_CACHE_TAG_REGISTRY.pop(tag, ()))
+    return delete_many(keys)
+
+
+def invalidate_tags(domains: Iterable[str], month: Any = None, year: Any = None) -> int:
+    """
+    Invalidate cached entries of data domains for one period.
+
+    Drops the entries computed for (month, year) plus each domain's
+    cross-period entries (year lists, unfiltered lists); entries for other
+    months stay cached. Without a year the whole domain is dropped.
+
+    Args:
+        domains: Data domains (e.g., ['forecast', 'execution'])
+        month: Month number or name (e.g., 7 or 'July')
+        year: Year (e.g., 2025)
+
+    Returns:
+        Number of cache entries deleted
+
+    Usage:
+        invalidate_tags(['forecast'], 'April', 2025)  # April 2025 forecast entries
+        invalidate_tags(['roster'])                   # All roster entries
+    """
+    if isinstance(domains, str):
+        domains = [domains]
+
+    tags = []
+    for domain in domains:
+        tags.extend(_invalidation_tags(domain, month, year))
+
+    deleted_count = delete_tags(tags)
+    logger.info(
+        f"Invalidated {deleted_count} cache entries for domains {list(domains)} "
+        f"(month={month}, year={year})"
+    )
+    return deleted_count
 
 
 # ============================================================================
@@ -224,12 +555,7 @@ def _clear_cache_keys(keys: List[str], description: str = "cache") -> int:
     Returns:
         Number of keys successfully cleared
     """
-    cleared_count = 0
-    for key in keys:
-        if cache.delete(key):
-            _unregister_cache_key(key)
-            cleared_count += 1
-            logger.debug(f"Cleared cache: {key}")
+    cleared_count = delete_many(keys)
 
     if cleared_count > 0:
         logger.info(f"Cleared {cleared_count} {description} entries")
@@ -278,13 +604,611 @@ def _generate_cache_key(key_prefix: str, *args, **kwargs) -> str:
 
     return cache_key
 
-def cache_with_ttl(ttl: int, key_prefix: str):
+
+# ============================================================================
+# Stampede Protection (single-flight / stale-while-revalidate)
+# ============================================================================
+
+class _InFlightCall:
+    """Result slot shared by every caller waiting on one in-process recompute."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+def _record_single_flight(key_prefix: str, counter: str):
+    """Increment a per-prefix stampede counter (see get_single_flight_stats)."""
+    with _SINGLE_FLIGHT_LOCK:
+        _SINGLE_FLIGHT_STATS[key_prefix][counter] += 1
+
+
+def get_single_flight_stats() -> dict:
+    """
+    Get per-prefix stampede protection counters for this process.
+
+    Counters:
+        coalesced_waits: callers that reused another thread's in-flight recompute
+        lock_waits: recomputes that waited on another worker's cache lock
+        lock_timeouts: waits that gave up and recomputed locally
+        stale_served: stale values returned while a refresh ran
+        background_refreshes: stale-while-revalidate refreshes started
+
+    Returns:
+        Dictionary: {'forecast': {'coalesced_waits': 4, ...}, ...}
+    """
+    with _SINGLE_FLIGHT_LOCK:
+        return {prefix: dict(counters) for prefix, counters in _SINGLE_FLIGHT_STATS.items()}
+
+
+def reset_single_flight_stats():
+    """Reset stampede counters (used by tests)."""
+    with _SINGLE_FLIGHT_LOCK:
+        _SINGLE_FLIGHT_STATS.clear()
+
+
+def _fresh_key(cache_key: str) -> str:
+    """Marker key whose presence means cache_key is still within its TTL."""
+    return f"{cache_key}:__fresh__"
+
+
+def _is_error_result(result: Any) -> bool:
+    """True for the error dicts APIClient._make_request returns instead of raising."""
+    return isinstance(result, dict) and result.get('success') is False and 'error' in result
+
+
+def _retention(ttl: int, stale_ttl: int, validators: Optional[dict]) -> int:
+    """Total lifetime of a stored value: its TTL plus the stale / revalidation window."""
+    if validators:
+        return ttl + max(stale_ttl, ForecastCacheConfig.REVALIDATION_WINDOW)
+    return ttl + stale_ttl
+
+
+def _store_result(
+    cache_key: str,
+    key_prefix: str,
+    result: Any,
+    ttl: int,
+    stale_ttl: int,
+    tags: List[str] = None,
+    validators: Optional[dict] = None,
+    revalidate: bool = False
+):
+    """
+    Store a computed result, keeping it stale_ttl seconds past its TTL.
+
+    With stale_ttl the value outlives its freshness marker, so readers can
+    be served the previous value while a single refresh runs. With
+    validators (the backend's ETag / Last-Modified per request) it is kept
+    for REVALIDATION_WINDOW past its TTL so an expired entry can be
+    revalidated with conditional GETs instead of refetched (revalidate
+    marks freshness even when the backend sent none). Large values
+    are stored through the payload codec and their size is recorded.
+    """
+    if result is None or _is_error_result(result):
+        return
+
+    cache = _get_cache()
+    timeout = _retention(ttl, stale_ttl, validators)
+    stored_keys = [cache_key]
+    stored_value, stored_size = result, 0
+    if ForecastCacheConfig.ENABLE_PAYLOAD_CODEC:
+        stored_value, stored_size = encode_payload(result)
+    _record_payload_size(cache_key, key_prefix, stored_value, stored_size, timeout)
+    cache.set(cache_key, stored_value, timeout)
+    _METRICS.incr(key_prefix, 'sets')
+    _METRICS.incr(key_prefix, 'bytes_written', stored_size)
+    _register_cache_key(cache_key)
+    if stale_ttl or revalidate:
+        cache.set(_fresh_key(cache_key), True, ttl)
+        _register_cache_key(_fresh_key(cache_key))
+        stored_keys.append(_fresh_key(cache_key))
+    if validators:
+        cache.set(_validators_key(cache_key), validators, timeout)
+        _register_cache_key(_validators_key(cache_key))
+        stored_keys.append(_validators_key(cache_key))
+    if tags:
+        _tag_cache_keys(stored_keys, tags, timeout)
+    logger.debug(
+        f"Cache SET: {cache_key} (TTL: {ttl}s, stale: {stale_ttl}s, "
+        f"revalidatable: {bool(validators)}, tags: {tags or []})"
+    )
+
+
+# ============================================================================
+# Conditional Revalidation (ETag / Last-Modified)
+# ============================================================================
+
+def _validators_key(cache_key: str) -> str:
+    """Key holding the backend validators an entry can be revalidated with."""
+    return f"{cache_key}:__validators__"
+
+
+class _ValidatorRecorder:
+    """Backend GETs (with their validators) made while computing one entry."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests: List[dict] = []
+        self.complete = True
+
+    def add(self, url: str, accept: Optional[str], etag: Optional[str], last_modified: Optional[str]):
+        with self._lock:
+            if not etag and not last_modified:
+                # One unvalidatable request makes the whole entry unvalidatable
+                self.complete = False
+                return
+            self.requests.append({
+                'url': url, 'accept': accept, 'etag': etag, 'last_modified': last_modified
+            })
+
+    def validators(self) -> Optional[dict]:
+        with self._lock:
+            if not self.complete or not self.requests:
+                return None
+            return {'requests': list(self.requests), 'stored_at': time.time()}
+
+
+def record_response_validators(response) -> None:
+    """
+    Note a successful backend GET made while a revalidating entry is computed.
+
+    APIClient calls this for every 2xx GET; outside a cache_with_ttl(...,
+    revalidate=True) computation it does nothing. Pages fetched on worker
+    threads are recorded too when the caller's context is propagated
+    (contextvars.copy_context()).
+
+    Args:
+        response: requests.Response of the GET
+    """
+    recorder = _VALIDATOR_RECORDER.get()
+    if recorder is not None:
+        recorder.add(
+            response.request.url if response.request is not None else response.url,
+            response.request.headers.get('Accept') if response.request is not None else None,
+            response.headers.get('ETag'),
+            response.headers.get('Last-Modified'),
+        )
+
+
+def record_request_failure() -> None:
+    """
+    Note a failed or partial backend GET made while a revalidating entry is computed.
+
+    APIClient calls this for every GET that did not return 2xx (and when a
+    paginated result is cut short), so an entry computed from incomplete
+    data is stored without validators and refetched when it expires
+    instead of being revalidated as-is.
+    """
+    recorder = _VALIDATOR_RECORDER.get()
+    if recorder is not None:
+        recorder.complete = False
+
+
+def _revalidate_entry(
+    cache_key: str,
+    key_prefix: str,
+    owner: Any,
+    ttl: int,
+    stale_ttl: int,
+    tags: Optional[List[str]]
+) -> Any:
+    """
+    Revalidate an expired entry with conditional GETs.
+
+    owner.revalidate(requests) (APIClient.revalidate) answers True only when
+    the backend returned 304 Not Modified for every recorded request. The
+    stored value is then kept as-is - no download, no decode/re-encode -
+    and its freshness, validators and tags are extended by another TTL.
+
+    Returns:
+        The cached value when still valid, else None (caller recomputes)
+    """
+    revalidate = getattr(owner, 'revalidate', None)
+    cache = _get_cache()
+    validators = cache.get(_validators_key(cache_key))
+    if revalidate is None or not validators:
+        return None
+    cached_value = decode_payload(cache.get(cache_key))
+    if cached_value is None:
+        return None
+
+    _METRICS.incr(key_prefix, 'revalidations')
+    try:
+        unchanged = revalidate(validators['requests'])
+    except Exception as e:
+        logger.warning(f"Revalidation failed for {cache_key}: {e}")
+        unchanged = False
+    if not unchanged:
+        logger.debug(f"Cache CHANGED: {cache_key} - backend data changed, refetching")
+        return None
+
+    timeout = _retention(ttl, stale_ttl, validators)
+    if not cache.touch(cache_key, timeout):
+        return None
+    validators['stored_at'] = time.time()
+    cache.set(_validators_key(cache_key), validators, timeout)
+    cache.set(_fresh_key(cache_key), True, ttl)
+    _register_cache_key(_fresh_key(cache_key))
+    if tags:
+        _tag_cache_keys([cache_key, _fresh_key(cache_key), _validators_key(cache_key)], tags, timeout)
+    entry = _PAYLOAD_SIZES.get(cache_key)
+    if entry is not None:
+        _PAYLOAD_SIZES[cache_key] = entry[:5] + (time.time() + timeout,)
+    _METRICS.incr(key_prefix, 'not_modified')
+    logger.debug(f"Cache NOT MODIFIED: {cache_key} - TTL extended by {ttl}s")
+    return cached_value
+
+
+def _load_with_cache_lock(
+    cache_key: str,
+    key_prefix: str,
+    loader: Callable[[], Any],
+    require_fresh: bool = False
+) -> Any:
+    """
+    Recompute a value while holding a cross-worker cache lock.
+
+    cache.add() is atomic on every backend, so exactly one worker computes;
+    the others poll the cache until the value appears, the lock is released
+    or LOCK_WAIT_TIMEOUT passes, and only then compute it themselves.
+    With require_fresh (revalidation of a value still in the cache) they
+    wait for its freshness marker instead.
+    """
+    cache = _get_cache()
+    lock_key = f"{cache_key}:__lock__"
+    token = uuid.uuid4().hex
+
+    if cache.add(lock_key, token, ForecastCacheConfig.LOCK_TTL):
+        try:
+            return loader()
+        finally:
+            # Never release a lock that expired and was taken by another worker
+            if cache.get(lock_key) == token:
+                cache.delete(lock_key)
+
+    _record_single_flight(key_prefix, 'lock_waits')
+    logger.debug(f"Cache LOCKED: {cache_key} - waiting for another worker")
+
+    deadline = time.monotonic() + ForecastCacheConfig.LOCK_WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(ForecastCacheConfig.LOCK_POLL_INTERVAL)
+        value = decode_payload(cache.get(cache_key))
+        if value is not None and (not require_fresh or cache.get(_fresh_key(cache_key)) is not None):
+            return value
+        if cache.get(lock_key) is None:
+            # Holder finished without caching a value (None result or error)
+            return loader()
+
+    _record_single_flight(key_prefix, 'lock_timeouts')
+    logger.warning(f"Timed out waiting for cache lock on {cache_key}, computing locally")
+    return loader()
+
+
+def _single_flight(
+    cache_key: str,
+    key_prefix: str,
+    loader: Callable[[], Any],
+    require_fresh: bool = False
+) -> Any:
+    """
+    Run loader once per cache key no matter how many threads miss at once.
+
+    The first caller becomes the leader and recomputes (under the
+    cross-worker lock); concurrent callers wait for and share its result
+    or exception.
+    """
+    with _SINGLE_FLIGHT_LOCK:
+        call = _IN_FLIGHT.get(cache_key)
+        is_leader = call is None
+        if is_leader:
+            call = _InFlightCall()
+            _IN_FLIGHT[cache_key] = call
+
+    if not is_leader:
+        _record_single_flight(key_prefix, 'coalesced_waits')
+        logger.debug(f"Cache COALESCED: {cache_key}")
+        if call.event.wait(ForecastCacheConfig.LOCK_WAIT_TIMEOUT):
+            if call.error is not None:
+                raise call.error
+            return call.result
+        _record_single_flight(key_prefix, 'lock_timeouts')
+        return loader()
+
+    try:
+        call.result = _load_with_cache_lock(cache_key, key_prefix, loader, require_fresh)
+        return call.result
+    except BaseException as e:
+        call.error = e
+        raise
+    finally:
+        with _SINGLE_FLIGHT_LOCK:
+            _IN_FLIGHT.pop(cache_key, None)
+        call.event.set()
+
+
+def _refresh_in_background(cache_key: str, key_prefix: str, loader: Callable[[], Any]):
+    """Start one background refresh per stale key in this process."""
+    with _SINGLE_FLIGHT_LOCK:
+        if cache_key in _IN_FLIGHT or cache_key in _REFRESHING:
+            return
+        _REFRESHING.add(cache_key)
+
+    _record_single_flight(key_prefix, 'background_refreshes')
+
+    def _refresh():
+        try:
+            _single_flight(cache_key, key_prefix, loader)
+        except Exception as e:
+            logger.error(f"Background refresh failed for {cache_key}: {e}", exc_info=True)
+        finally:
+            with _SINGLE_FLIGHT_LOCK:
+                _REFRESHING.discard(cache_key)
+
+    threading.Thread(target=_refresh, name=f"cache-refresh:{cache_key}", daemon=True).start()
+
+
+def _record_payload_size(cache_key: str, key_prefix: str, stored_value: Any, stored_size: int, timeout: int):
+    """Remember how many bytes an entry written by this process occupies."""
+    if isinstance(stored_value, EncodedPayload):
+        encoded_size = stored_value.encoded_size
+        compression = stored_value.compression
+        columnar = stored_value.columnar
+    else:
+        encoded_size, compression, columnar = stored_size, 'none', False
+    _PAYLOAD_SIZES[cache_key] = (
+        key_prefix, stored_size, encoded_size, compression, columnar, time.time() + timeout
+    )
+
+
+def get_payload_stats() -> dict:
+    """
+    Get size accounting for cache entries written by this process.
+
+    Expired entries are dropped from the accounting as they are seen. On a
+    shared redis cache the numbers cover this worker's writes only.
+
+    Sizes are measured by the payload codec, which only pickles record
+    payloads. Other entries, and all entries with
+    ForecastCacheConfig.ENABLE_PAYLOAD_CODEC off, are counted with 0 bytes
+    (an extra pickle per write just for accounting is not worth it).
+
+    Returns:
+        Dictionary:
+        {
+            'entries': 12,
+            'stored_bytes': 734003,         # bytes held by the cache
+            'uncompressed_bytes': 1301062,  # pickled size before compression
+            'columnar_entries': 3,
+            'compressed_entries': 3,
+            'by_prefix': {'forecast': {'entries': 2, 'stored_bytes': ..., 'uncompressed_bytes': ...}},
+            'largest': [{'key': 'forecast:7:2025', 'stored_bytes': 534137}, ...]
+        }
+    """
+    now = time.time()
+    by_prefix = defaultdict(lambda: {'entries': 0, 'stored_bytes': 0, 'uncompressed_bytes': 0})
+    live = []
+
+    for key, entry in list(_PAYLOAD_SIZES.items()):
+        key_prefix, stored_size, encoded_size, compression, columnar, expires_at = entry
+        if expires_at <= now:
+            _PAYLOAD_SIZES.pop(key, None)
+            continue
+        live.append((key, entry))
+        prefix_stats = by_prefix[key_prefix]
+        prefix_stats['entries'] += 1
+        prefix_stats['stored_bytes'] += stored_size
+        prefix_stats['uncompressed_bytes'] += encoded_size
+
+    largest = sorted(live, key=lambda item: item[1][1], reverse=True)[:5]
+
+    return {
+        'entries': len(live),
+        'stored_bytes': sum(entry[1] for _, entry in live),
+        'uncompressed_bytes': sum(entry[2] for _, entry in live),
+        'columnar_entries': sum(1 for _, entry in live if entry[4]),
+        'compressed_entries': sum(1 for _, entry in live if entry[3] != 'none'),
+        'by_prefix': dict(by_prefix),
+        'largest': [{'key': key, 'stored_bytes': entry[1]} for key, entry in largest],
+    }
+
+
+# ============================================================================
+# Cache Metrics
+# ============================================================================
+
+def _record_miss(cache_key: str, key_prefix: str):
+    """
+    Count a miss, classifying entries this process stored earlier.
+
+    A previously stored entry that vanished before its TTL was evicted
+    (MAX_ENTRIES / redis maxmemory) or dropped by another worker; one past
+    its TTL simply expired. Explicit invalidations here forget the entry
+    first, so they are not counted as either.
+    """
+    _METRICS.incr(key_prefix, 'misses')
+    entry = _PAYLOAD_SIZES.pop(cache_key, None)
+    if entry is not None:
+        _METRICS.incr(key_prefix, 'evictions' if entry[5] > time.time() else 'expirations')
+
+
+def _worker_id() -> str:
+    """'host:pid' of the current process."""
+    global _worker_id_cache
+    pid = os.getpid()
+    if _worker_id_cache[0] != pid:
+        _worker_id_cache = (pid, f"{socket.gethostname()}:{pid}")
+    return _worker_id_cache[1]
+
+
+def _local_metrics_snapshot() -> dict:
+    """This process's counters plus live-entry gauges from size accounting."""
+    prefixes = _METRICS.snapshot()
+    for key_prefix, sizes in get_payload_stats()['by_prefix'].items():
+        metrics = prefixes.setdefault(key_prefix, empty_prefix_metrics())
+        metrics['entries'] = sizes['entries']
+        metrics['stored_bytes'] = sizes['stored_bytes']
+
+    return {
+        'worker': _worker_id(),
+        'timestamp': time.time(),
+        'prefixes': prefixes,
+        'single_flight': get_single_flight_stats(),
+    }
+
+
+def _publish_metrics(snapshot: dict = None):
+    """Write this worker's metrics snapshot to the shared cache."""
+    global _last_metrics_publish
+    _last_metrics_publish = time.time()
+    _get_cache().set(
+        f"{_METRICS_KEY_PREFIX}:{_worker_id()}",
+        snapshot or _local_metrics_snapshot(),
+        ForecastCacheConfig.METRICS_SNAPSHOT_TTL
+    )
+
+
+def _maybe_publish_metrics():
+    """Publish at most once per METRICS_PUBLISH_INTERVAL, and only to a shared cache."""
+    if time.time() - _last_metrics_publish < ForecastCacheConfig.METRICS_PUBLISH_INTERVAL:
+        return
+    if _get_cache_backend_type() != 'redis':
+        return
+    try:
+        _publish_metrics()
+    except Exception as e:
+        logger.debug(f"Failed to publish cache metrics: {e}")
+
+
+def _worker_snapshots() -> List[dict]:
+    """Read every worker's published snapshot from redis."""
+    cache = _get_cache()
+    base = cache.make_key('')
+    keys = []
+    for raw_key in _match_pattern_redis(f"{_METRICS_KEY_PREFIX}:*"):
+        raw_key = raw_key.decode() if isinstance(raw_key, bytes) else raw_key
+        if raw_key.startswith(base):
+            keys.append(raw_key[len(base):])
+    return [snapshot for snapshot in cache.get_many(keys).values() if snapshot]
+
+
+def get_cache_metrics(aggregate: bool = True) -> dict:
+    """
+    Get per-prefix cache metrics.
+
+    On redis every worker publishes its snapshot to the shared cache, so the
+    result covers the whole deployment; with process-local backends (each
+    worker has its own cache anyway) it covers this worker.
+
+    Args:
+        aggregate: Merge snapshots from all workers when the cache is shared
+
+    Returns:
+        Dictionary:
+        {
+            'scope': 'cluster',          # or 'process'
+            'workers': 4,
+            'worker_ids': ['web-1:311', ...],
+            'prefixes': {
+                'forecast': {
+                    'hits': 120, 'stale_hits': 3, 'misses': 9, 'sets': 9,
+                    'evictions': 0, 'expirations': 6, 'bytes_written': 4644000,
+                    'entries': 3, 'stored_bytes': 1548000, 'hit_ratio': 0.9318,
+                    'miss_latency': {'buckets': [...], 'sum': 7.9, 'count': 9}
+                }
+            },
+            'single_flight': {'forecast': {'coalesced_waits': 14}},
+            'hit_ratio': 0.91
+        }
+    """
+    local = _local_metrics_snapshot()
+    snapshots = {local['worker']: local}
+    scope = 'process'
+
+    if aggregate and _get_cache_backend_type() == 'redis':
+        scope = 'cluster'
+        try:
+            _publish_metrics(local)
+            for snapshot in _worker_snapshots():
+                snapshots.setdefault(snapshot.get('worker'), snapshot)
+        except Exception as e:
+            logger.warning(f"Failed to aggregate cache metrics across workers: {e}")
+
+    prefixes = merge_snapshots(snapshot.get('prefixes') for snapshot in snapshots.values())
+    for metrics in prefixes.values():
+        metrics['hit_ratio'] = hit_ratio(metrics)
+
+    single_flight = defaultdict(lambda: defaultdict(int))
+    for snapshot in snapshots.values():
+        for key_prefix, counters in (snapshot.get('single_flight') or {}).items():
+            for counter, count in counters.items():
+                single_flight[key_prefix][counter] += count
+
+    totals = merge_snapshots([{'all': metrics} for metrics in prefixes.values()]).get('all', {})
+
+    return {
+        'scope': scope,
+        'workers': len(snapshots),
+        'worker_ids': sorted(worker for worker in snapshots if worker),
+        'prefixes': prefixes,
+        'single_flight': {key_prefix: dict(counters) for key_prefix, counters in single_flight.items()},
+        'hit_ratio': hit_ratio(totals),
+    }
+
+
+def reset_cache_metrics():
+    """Reset this process's cache metrics (used by tests)."""
+    global _last_metrics_publish
+    _METRICS.reset()
+    _last_metrics_publish = 0.0
+
+
+def _build_entry_tags(sig: inspect.Signature, domains: tuple, args: tuple, kwargs: dict) -> List[str]:
+    """Resolve a decorated call's tag domains and month/year into entry tags."""
+    try:
+        bound = sig.bind_partial(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = bound.arguments
+    except TypeError:
+        arguments = dict(kwargs)
+
+    entry_tags = []
+    for domain in domains:
+        if '{' in domain:
+            domain = domain.format(**arguments)
+        entry_tags.extend(cache_tags(domain, arguments.get('month'), arguments.get('year')))
+    return list(dict.fromkeys(entry_tags))
+
+
+def cache_with_ttl(
+    ttl: int,
+    key_prefix: str,
+    stale_ttl: int = 0,
+    tags: Iterable[str] = (),
+    revalidate: bool = False
+):
     """
     Decorator to cache function results with custom TTL.
 
+    Concurrent misses for the same key are coalesced into one call
+    (ForecastCacheConfig.ENABLE_SINGLE_FLIGHT), so an expired hot key
+    triggers one backend request instead of one per waiting request.
+
     Args:
         ttl: Time to live in seconds
         key_prefix: Prefix for cache key (e.g., 'cascade', 'forecast')
+        stale_ttl: Seconds an expired value may still be served while one
+                   background refresh recomputes it (0 disables)
+        tags: Data domains the result is derived from (e.g., ('forecast',)).
+              Entries are tagged by domain and by the call's month/year
+              arguments so invalidate_tags() can drop exactly one period.
+              '{arg}' placeholders are filled from the call arguments.
+        revalidate: Keep the backend's ETag / Last-Modified of every GET made
+                    while computing the value; once the TTL passes, check
+                    them with conditional GETs (owner.revalidate()) and on
+                    304 Not Modified only extend the TTL. For APIClient
+                    methods (ForecastCacheConfig.ENABLE_REVALIDATION).
 
     Usage:
         # On instance methods:
@@ -298,6 +1222,11 @@ def cache_with_ttl(ttl: int, key_prefix: str):
         def process_data(data: dict):
             return expensive_processing(data)
 
+        # Tagged for invalidate_tags(['forecast'], month, year):
+        @cache_with_ttl(ttl=900, key_prefix='forecast', tags=('forecast',))
+        def get_all_forecast_records(self, month: int, year: int, ...):
+            return fetch_records(month, year)
+
     Cache key format: {key_prefix}:{arg1}:{arg2}:...
 
     Example keys:
@@ -308,6 +1237,8 @@ def cache_with_ttl(ttl: int, key_prefix: str):
 
     Note: Automatically detects and skips 'self' for instance methods using inspect.
     """
+    tag_domains = tuple(tags)
+
     def decorator(func: Callable) -> Callable:
         # Inspect function signature at decoration time
         sig = inspect.signature(func)
@@ -333,23 +1264,70 @@ def cache_with_ttl(ttl: int, key_prefix: str):
             # Generate cache key
             cache_key = _generate_cache_key(key_prefix, *cache_args, **kwargs)
 
+            revalidating = revalidate and ForecastCacheConfig.ENABLE_REVALIDATION
+            outer_recorder = _VALIDATOR_RECORDER.get()
+            if outer_recorder is not None:
+                # A cached inner call hides its GETs from the outer entry
+                outer_recorder.complete = False
+
+            def _load() -> Any:
+                entry_tags = _build_entry_tags(sig, tag_domains, args, kwargs) if tag_domains else None
+                if revalidating and is_method and args:
+                    unchanged = _revalidate_entry(cache_key, key_prefix, args[0], ttl, stale_ttl, entry_tags)
+                    if unchanged is not None:
+                        return unchanged
+
+                recorder = _ValidatorRecorder() if revalidating else None
+                token = _VALIDATOR_RECORDER.set(recorder)
+                started = time.perf_counter()
+                try:
+                    result = func(*args, **kwargs)
+                finally:
+                    _VALIDATOR_RECORDER.reset(token)
+                _METRICS.observe_miss(key_prefix, time.perf_counter() - started)
+                validators = recorder.validators() if recorder is not None else None
+                _store_result(
+                    cache_key, key_prefix, result, ttl, stale_ttl, entry_tags, validators, revalidating
+                )
+                return result
+
             # Try to get from cache
-            cached_value = cache.get(cache_key)
+            cache = _get_cache()
+            cached_value = decode_payload(cache.get(cache_key))
+            expired = cached_value is not None and (stale_ttl or revalidating) \
+                and cache.get(_fresh_key(cache_key)) is None
+            if expired and revalidating:
+                validators = cache.get(_validators_key(cache_key))
+                if not stale_ttl or (
+                    validators and time.time() - validators['stored_at'] > ttl + stale_ttl
+                ):
+                    # Past any stale window: check with the backend before serving
+                    logger.debug(f"Cache EXPIRED: {cache_key} - revalidating")
+                    _maybe_publish_metrics()
+                    if not ForecastCacheConfig.ENABLE_SINGLE_FLIGHT:
+                        return _load()
+                    return _single_flight(cache_key, key_prefix, _load, require_fresh=True)
+
             if cached_value is not None:
-                logger.info(f"Cache HIT: {cache_key}")  # TODO: change to debug
+                if stale_ttl and expired:
+                    logger.debug(f"Cache STALE: {cache_key} - refreshing in background")
+                    _METRICS.incr(key_prefix, 'stale_hits')
+                    _record_single_flight(key_prefix, 'stale_served')
+                    _refresh_in_background(cache_key, key_prefix, _load)
+                else:
+                    logger.info(f"Cache HIT: {cache_key}")  # TODO: change to debug
+                    _METRICS.incr(key_prefix, 'hits')
+                _maybe_publish_metrics()
                 return cached_value
 
             # Cache miss - call function
             logger.debug(f"Cache MISS: {cache_key}")
-            result = func(*args, **kwargs)
+            _record_miss(cache_key, key_prefix)
+            _maybe_publish_metrics()
+            if not ForecastCacheConfig.ENABLE_SINGLE_FLIGHT:
+                return _load()
 
-            # Store in cache
-            if result is not None:
-                cache.set(cache_key, result, ttl)
-                _register_cache_key(cache_key)
-                logger.debug(f"Cache SET: {cache_key} (TTL: {ttl}s)")
-
-            return result
+            return _single_flight(cache_key, key_prefix, _load)
 
         return wrapper
     return decorator
@@ -478,9 +1456,10 @@ def get_cache_stats() -> dict:
         stats = get_cache_stats()
         print(f"Cache enabled: {stats['enabled']}")
         print(f"Keys: {stats['sample_keys']}")
+        print(f"Hit ratio: {stats['metrics']['hit_ratio']}")
 
-    Note: Local memory cache doesn't provide hit rate or size stats.
-    For detailed stats, use Redis in production.
+    Hit ratios, evictions and miss latency come from the counters kept by
+    cache_with_ttl ('metrics'); see get_cache_metrics().
     """
     # Try to get some sample keys (this is limited with locmem)
     sample_keys = []
@@ -494,6 +1473,7 @@ def get_cache_stats() -> dict:
         'summary:capacity:7:2025',
     ]
 
+    cache = _get_cache()
     for key in test_patterns:
         if cache.get(key) is not None:
             sample_keys.append(key)
@@ -501,6 +1481,7 @@ def get_cache_stats() -> dict:
     stats = {
         'enabled': ForecastCacheConfig.ENABLE_CACHING,
         'backend': ForecastCacheConfig.CACHE_BACKEND,
+        'backend_type': _get_cache_backend_type(),
         'ttls': {
             'cascade': ForecastCacheConfig.CASCADE_TTL,
             'data': ForecastCacheConfig.DATA_TTL,
@@ -509,12 +1490,34 @@ def get_cache_stats() -> dict:
         },
         'sample_cached_keys': sample_keys,
         'sample_count': len(sample_keys),
+        'single_flight': get_single_flight_stats(),
+        'payloads': get_payload_stats(),
+        'metrics': get_cache_metrics(),
     }
 
     logger.debug(f"Cache stats: {stats}")
     return stats
 
 
+def peek_cached(key_prefix: str, *args, **kwargs) -> Optional[Any]:
+    """
+    Value cached by a cache_with_ttl function, without calling it on a miss.
+
+    Args:
+        key_prefix: key_prefix of the cache_with_ttl decorator
+        *args, **kwargs: Arguments the function would be called with
+
+    Returns:
+        Cached value (fresh or stale), or None if not cached
+
+    Usage:
+        tree = peek_cached('cascade:tree', 2025, 7)
+    """
+    if not ForecastCacheConfig.ENABLE_CACHING:
+        return None
+    return _cache_get(_generate_cache_key(key_prefix, *args, **kwargs))
+
+
 def inspect_cache_value(key: str) -> Optional[Any]:
     """
     Inspect a specific cache value for debugging.
@@ -529,7 +1532,7 @@ def inspect_cache_value(key: str) -> Optional[Any]:
         value = inspect_cache_value('forecast:7:2025')
         print(f"Cached data: {value}")
     """
-    value = cache.get(key)
+    value = _cache_get(key)
 
     if value is not None:
         logger.info(f"Cache key '{key}' exists")
@@ -547,8 +1550,8 @@ def clear_all_caches():
 
     Clears:
     - All cached data
-    - Registry for locmem 
-    - index file for file-based cache
+    - Key registry for locmem / file-based cache
+    - Only this app's KEY_PREFIX-scoped keys on redis
 
     Use with caution - clears all cached data.
     Useful after major data updates or for testing.
@@ -557,9 +1560,14 @@ def clear_all_caches():
         clear_all_caches()  # Clear everything
     """
     logger.warning("Clearing ALL caches - this may impact performance temporarily")
-    cache.clear()
     backend_type = _get_cache_backend_type()
-    if backend_type == 'locmem':
-        _CACHE_KEY_REGISTRY.clear()
-        logger.debug("Cleared locmem cache key registry")
-    logger.info("All caches cleared")
\ No newline at end of file
+    if backend_type == 'redis':
+        # Only remove this app's keys (KEY_PREFIX scoped) - never FLUSHDB a shared redis
+        delete_pattern('*')
+    else:
+        _get_cache().clear()
+    _CACHE_KEY_REGISTRY.clear()
+    _CACHE_TAG_REGISTRY.clear()
+    _PAYLOAD_SIZES.clear()
+    logger.debug("Cleared cache key and tag registries")
+    logger.info("All caches cleared")
@@ -0,0 +1,183 @@
+"""
+DataTables Server-Side Processing Utilities
+
+Parses the request parameters DataTables sends in server-side mode
+(draw/start/length/search/order/columns) and applies them to an
+already-fetched list of records, so a view can return one page of a
+cached report instead of the whole payload.
+"""
+
+import logging
+from numbers import Number
+from typing import Any, Dict, List, Tuple
+
+logger = logging.getLogger('django')
+
+
+def is_server_side_request(query_params) -> bool:
+    """
+    Check whether a request was sent by a DataTable in server-side mode.
+
+    Client-side ajax tables only send their own query string; server-side
+    tables always include 'start' and 'length'.
+
+    Args:
+        query_params: request.GET (QueryDict) or plain dict
+
+    Returns:
+        True if paging parameters are present
+    """
+    return 'start' in query_params and 'length' in query_params
+
+
+def _to_int(value: Any, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def parse_datatable_request(query_params) -> Dict[str, Any]:
+    """
+    Parse DataTables server-side parameters.
+
+    Args:
+        query_params: request.GET (QueryDict) or plain dict
+
+    Returns:
+        Dictionary:
+        {
+            'draw': 3,
+            'start': 20,
+            'length': 10,            # -1 means "All"
+            'search': 'medicaid',    # lowercased global search value
+            'column_search': {'state': 'ca'},
+            'searchable': ['main_lob', 'state', ...],
+            'order': [('forecast', 'desc'), ...]
+        }
+    """
+    columns = []
+    index = 0
+    while f'columns[{index}][data]' in query_params:
+        prefix = f'columns[{index}]'
+        columns.append({
+            'data': query_params.get(f'{prefix}[data]'),
+            'searchable': query_params.get(f'{prefix}[searchable]', 'true') == 'true',
+            'orderable': query_params.get(f'{prefix}[orderable]', 'true') == 'true',
+            'search': (query_params.get(f'{prefix}[search][value]') or '').strip().lower(),
+        })
+        index += 1
+
+    order = []
+    index = 0
+    while f'order[{index}][column]' in query_params:
+        column_index = _to_int(query_params.get(f'order[{index}][column]'), -1)
+        direction = query_params.get(f'order[{index}][dir]', 'asc')
+        if 0 <= column_index < len(columns) and columns[column_index]['orderable'] and columns[column_index]['data']:
+            order.append((columns[column_index]['data'], 'desc' if direction == 'desc' else 'asc'))
+        index += 1
+
+    return {
+        'draw': _to_int(query_params.get('draw'), 1),
+        'start': max(_to_int(query_params.get('start'), 0), 0),
+        'length': _to_int(query_params.get('length'), -1),
+        'search': (query_params.get('search[value]') or '').strip().lower(),
+        'column_search': {col['data']: col['search'] for col in columns if col['search'] and col['data']},
+        'searchable': [col['data'] for col in columns if col['searchable'] and col['data']],
+        'order': order,
+    }
+
+
+def _sort_key(value: Any) -> Tuple[int, Any]:
+    """Sort numbers before strings, and None/blank last (ascending)."""
+    if value is None or value == '':
+        return (2, '')
+    if isinstance(value, Number) and not isinstance(value, bool):
+        return (0, value)
+    return (1, str(value).lower())
+
+
+def apply_datatable_request(records: List[Dict], params: Dict[str, Any]) -> Tuple[int, List[Dict]]:
+    """
+    Filter, sort and slice records for one DataTables draw.
+
+    Args:
+        records: Full (cached) list of normalized records
+        params: Output of parse_datatable_request()
+
+    Returns:
+        Tuple of (records_filtered_count, page_records)
+    """
+    rows = records
+    search = params.get('search')
+    column_search = params.get('column_search') or {}
+
+    if search or column_search:
+        searchable = params.get('searchable') or (list(records[0].keys()) if records else [])
+
+        def _matches(rec: Dict) -> bool:
+            for key, term in column_search.items():
+                value = rec.get(key)
+                if value is None or term not in str(value).lower():
+                    return False
+            if search:
+                for key in searchable:
+                    value = rec.get(key)
+                    if value is not None and search in str(value).lower():
+                        return True
+                return False
+            return True
+
+        rows = [rec for rec in rows if _matches(rec)]
+
+    order = params.get('order') or []
+    if order:
+        rows = list(rows)
+        # Stable sorts applied from lowest to highest priority column
+        for key, direction in reversed(order):
+            rows.sort(key=lambda rec: _sort_key(rec.get(key)), reverse=(direction == 'desc'))
+
+    filtered_count = len(rows)
+    start = params.get('start', 0)
+    length = params.get('length', -1)
+    page = rows[start:] if length is None or length < 0 else rows[start:start + length]
+
+    return filtered_count, page
+
+
+def build_datatable_response(records: List[Dict], query_params) -> Dict[str, Any]:
+    """
+    Build the JSON payload for a DataTables ajax request.
+
+    In server-side mode only the requested page is returned along with
+    recordsTotal/recordsFiltered; otherwise every record is returned as before.
+
+    Args:
+        records: Full (cached) list of normalized records
+        query_params: request.GET (QueryDict) or plain dict
+
+    Returns:
+        DataTables response dictionary
+    """
+    if not is_server_side_request(query_params):
+        return {
+            "draw": _to_int(query_params.get('draw'), 1),
+            "recordsTotal": len(records),
+            "recordsFiltered": len(records),
+            "data": records
+        }
+
+    params = parse_datatable_request(query_params)
+    filtered_count, page = apply_datatable_request(records, params)
+
+    logger.debug(
+        f"[DataTable] draw={params['draw']} start={params['start']} length={params['length']} "
+        f"filtered={filtered_count}/{len(records)} returned={len(page)}"
+    )
+
+    return {
+        "draw": params['draw'],
+        "recordsTotal": len(records),
+        "recordsFiltered": filtered_count,
+        "data": page
+    }
@@ -1,12 +1,26 @@
+import calendar
 import json
+import logging
 import os
-from django.http import FileResponse,Http404
+import re
+import uuid
+from asgiref.sync import sync_to_async
+from django.http import FileResponse,Http404,StreamingHttpResponse
 from typing import(
+    Callable,
     List,
+    Optional,
+    Tuple,
 )
+from django.core.files.base import ContentFile
 from .temp_view_data import get_formatted_date
 from django.contrib.auth.models import User
 from django.conf import settings
+from core.config import APIClientConfig
+
+logger = logging.getLogger('django')
+
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
 
 def read_json_from_json_file(file_path):
     try:
@@ -61,3 +75,223 @@ def excel_file_download():
         raise Http404("file not found")
 
 
+
+
+class BackendDownloadStream:
+    """
+    Async iterator over a streamed requests.Response that releases the connection on close().
+
+    The app is served by daphne (ASGI), where StreamingHttpResponse drains a
+    sync iterator with sync_to_async(list) - i.e. buffers the whole file -
+    before sending the first byte. Each chunk is therefore read on a worker
+    thread and handed to the event loop as it arrives.
+
+    The backend response is closed when the download ends, when the client
+    disconnects mid-transfer (the ASGI handler closes the generator) and
+    when StreamingHttpResponse calls close() before the first chunk.
+    """
+
+    def __init__(self, backend_response, chunk_size: int = None):
+        self.backend_response = backend_response
+        self._chunks = backend_response.iter_content(chunk_size=chunk_size or APIClientConfig.DOWNLOAD_CHUNK_SIZE)
+
+    def __aiter__(self):
+        return self._relay()
+
+    async def _relay(self):
+        read_chunk = sync_to_async(self._read_chunk, thread_sensitive=False)
+        try:
+            while (chunk := await read_chunk()) is not None:
+                yield chunk
+        finally:
+            self.close()
+
+    def _read_chunk(self) -> Optional[bytes]:
+        """Next non-empty chunk, or None at the end of the body."""
+        for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return None
+
+    def close(self):
+        self.backend_response.close()
+
+
+def relay_streaming_download(
+    backend_response,
+    filename: str,
+    content_type: str = XLSX_CONTENT_TYPE
+) -> StreamingHttpResponse:
+    """
+    Relay a streamed backend file download to the browser chunk by chunk.
+
+    Content-Type, Content-Length and Content-Disposition are taken from the
+    backend when present; filename/content_type are the fallbacks. The
+    backend connection is closed when the download ends or is aborted.
+
+    Args:
+        backend_response: requests.Response opened with stream=True
+        filename: Attachment filename if the backend does not send one
+        content_type: Content type if the backend does not send one
+
+    Returns:
+        StreamingHttpResponse
+    """
+    headers = backend_response.headers
+    response = StreamingHttpResponse(
+        BackendDownloadStream(backend_response),
+        content_type=headers.get('Content-Type') or content_type
+    )
+    response['Content-Disposition'] = (
+        headers.get('Content-Disposition') or f'attachment; filename="{filename}"'
+    )
+    # requests decodes gzip/deflate while streaming, so the backend length
+    # only matches what we relay when the body is not content-encoded
+    if headers.get('Content-Length') and not headers.get('Content-Encoding'):
+        response['Content-Length'] = headers['Content-Length']
+    return response
+
+
+def upload_content_type(filename: str) -> str:
+    """Content type sent to the backend for an uploaded file."""
+    if filename.endswith('.csv'):
+        return 'text/csv'
+    if filename.endswith('.xlsx'):
+        return XLSX_CONTENT_TYPE
+    return 'application/octet-stream'
+
+
+class MultipartFileStream:
+    """
+    Streamed multipart/form-data body holding one file field.
+
+    Iterating yields the part header, the file in chunks (Django
+    File.chunks(), which reads temporary uploads from disk) and the closing
+    boundary. __len__ gives the exact body size so requests sends a
+    Content-Length instead of chunked encoding. Every iteration starts from
+    the beginning of the file, so a retried request re-sends the whole body.
+
+    Example:
+        >>> body = MultipartFileStream(request.FILES['file'], 'forecast.xlsx')
+        >>> session.post(url, data=body, headers={'Content-Type': body.content_type})
+    """
+
+    def __init__(
+        self,
+        file,
+        filename: str,
+        field_name: str = 'file',
+        content_type: str = None,
+        chunk_size: int = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ):
+        """
+        Args:
+            file: Django File/UploadedFile, or bytes
+            filename: Filename sent in the part header
+            field_name: Form field name
+            content_type: Part content type (default: from the filename)
+            chunk_size: Bytes per chunk (default: APIClientConfig.UPLOAD_CHUNK_SIZE)
+            progress_callback: Called with (bytes_sent, total_bytes) after each chunk
+        """
+        self.file = ContentFile(file) if isinstance(file, (bytes, bytearray)) else file
+        self.chunk_size = chunk_size or APIClientConfig.UPLOAD_CHUNK_SIZE
+        self.progress_callback = progress_callback
+        boundary = uuid.uuid4().hex
+        self.content_type = f'multipart/form-data; boundary={boundary}'
+        quoted_name = filename.replace('\\', '\\\\').replace('"', '%22')
+        self._head = (
+            f'--{boundary}\r\n'
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{quoted_name}"\r\n'
+            f'Content-Type: {content_type or upload_content_type(filename)}\r\n\r\n'
+        ).encode('utf-8')
+        self._tail = f'\r\n--{boundary}--\r\n'.encode('utf-8')
+
+    def __len__(self) -> int:
+        return len(self._head) + self.file.size + len(self._tail)
+
+    def __iter__(self):
+        total = len(self)
+        sent = len(self._head)
+        yield self._head
+        for chunk in self.file.chunks(self.chunk_size):
+            sent += len(chunk)
+            yield chunk
+            if self.progress_callback:
+                self.progress_callback(sent, total)
+        yield self._tail
+        if self.progress_callback:
+            self.progress_callback(total, total)
+
+
+def log_upload_progress(filename: str, step_percent: int = 10) -> Callable[[int, int], None]:
+    """
+    Progress callback for MultipartFileStream that logs every step_percent.
+
+    Example:
+        >>> client.upload_forecast_file(f, f.name, user, progress_callback=log_upload_progress(f.name))
+    """
+    next_percent = [step_percent]
+
+    def _report(sent: int, total: int):
+        percent = int(sent * 100 / total) if total else 100
+        if percent >= next_percent[0]:
+            logger.info("Upload progress %s: %d%% (%d/%d bytes)", filename, percent, sent, total)
+            next_percent[0] = (percent // step_percent + 1) * step_percent
+
+    return _report
+
+
+_MONTH_LOOKUP = {
+    **{calendar.month_name[i].lower(): i for i in range(1, 13)},
+    **{calendar.month_abbr[i].lower(): i for i in range(1, 13)},
+}
+
+
+def _parse_month(value) -> Optional[int]:
+    number = to_int(value)
+    if number is not None:
+        return number if 1 <= number <= 12 else None
+    if isinstance(value, str):
+        return _MONTH_LOOKUP.get(value.strip().lower())
+    return None
+
+
+def get_upload_period(response: dict, filename: str) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Determine the (month, year) an uploaded file belongs to.
+
+    Looks at month/year fields in the upload response (top level or under
+    'data') first, then falls back to the filename, e.g.
+    'forecast_July_2025.xlsx', 'roster-Jul-2025.csv' or 'forecast_2025_07.xlsx'.
+
+    Args:
+        response: Upload API response
+        filename: Original uploaded filename
+
+    Returns:
+        Tuple of (month 1-12, year); either may be None when unknown
+    """
+    for source in (response or {}, (response or {}).get('data')):
+        if not isinstance(source, dict):
+            continue
+        month = _parse_month(source.get('month', source.get('report_month')))
+        year = to_int(source.get('year', source.get('report_year')))
+        if month and year:
+            return month, year
+
+    stem = os.path.splitext(os.path.basename(filename or ''))[0].lower()
+    tokens = [token for token in re.split(r'[^a-z0-9]+', stem) if token]
+    year = next((int(token) for token in tokens if re.fullmatch(r'20\d{2}', token)), None)
+    month = next((_MONTH_LOOKUP[token] for token in tokens if token in _MONTH_LOOKUP), None)
+
+    if month is None and year is not None:
+        # Numeric month next to the year: 2025_07 or 07-2025
+        year_index = tokens.index(str(year))
+        for neighbour in tokens[year_index + 1:year_index + 2] + tokens[max(year_index - 1, 0):year_index]:
+            if re.fullmatch(r'\d{1,2}', neighbour):
+                month = _parse_month(neighbour)
+                if month:
+                    break
+
+    return month, year
@@ -0,0 +1,483 @@
+"""
+Backend HTTP Transport
+
+Pooled, retrying transport for APIClient plus per-endpoint transport metrics.
+
+build_api_session() returns the requests.Session every APIClient call goes
+through. Its adapters keep APIClientConfig.POOL_MAXSIZE keep-alive
+connections per host and record, per endpoint:
+
+Counters:
+    requests, errors, new_connections, reused_connections
+Histogram:
+    latency - seconds until the response headers arrived
+
+Reuse is what the pool size is tuned against: with enough connections for
+the worker's threads nearly every request reuses a kept-alive connection;
+a high new_connections count means threads are outgrowing the pool.
+
+With APIClientConfig.ENABLE_HTTP2 (and the optional `h2` package) the base
+URL is served by HTTPXAdapter instead, which multiplexes requests over
+httpx HTTP/2 connections. HTTP/2 is negotiated via TLS ALPN, so plain
+http:// backends keep using HTTP/1.1 keep-alive.
+"""
+
+import copy
+import importlib.util
+import logging
+import re
+import threading
+import time
+import weakref
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from core.config import APIClientConfig
+
+logger = logging.getLogger('django')
+
+# Upper bounds (seconds) of the request latency histogram buckets; +Inf is implicit
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+COUNTERS = ('requests', 'errors', 'new_connections', 'reused_connections')
+
+# Distinct endpoints tracked per process; further ones are folded into 'other'
+MAX_ENDPOINTS = 200
+
+_METRIC_PREFIX = 'centene_api'
+
+_COUNTER_HELP = {
+    'requests': 'Requests sent to the backend.',
+    'errors': 'Requests that failed without a response (timeouts, connection errors).',
+    'new_connections': 'Connections opened for a request (pool miss).',
+    'reused_connections': 'Requests served over a kept-alive pooled connection.',
+}
+
+_ID_SEGMENT = re.compile(r'^(\d+|[0-9a-f]{8}-[0-9a-f-]{27,}|[0-9a-f]{24,})$', re.IGNORECASE)
+
+
+def endpoint_label(method: str, url: str) -> str:
+    """
+    Metric label for a request: method plus path with id segments collapsed.
+
+    Example:
+        >>> endpoint_label('GET', 'http://api/api/v1/forecasts/42/months?x=1')
+        'GET /api/v1/forecasts/{id}/months'
+    """
+    path = urlsplit(url).path or '/'
+    segments = ['{id}' if _ID_SEGMENT.match(segment) else segment for segment in path.split('/')]
+    return f"{method.upper()} {'/'.join(segments)}"
+
+
+def empty_endpoint_metrics() -> dict:
+    metrics = {counter: 0 for counter in COUNTERS}
+    metrics['latency'] = {
+        'buckets': [0] * len(LATENCY_BUCKETS),
+        'sum': 0.0,
+        'count': 0,
+    }
+    return metrics
+
+
+class TransportMetrics:
+    """
+    Thread-safe per-endpoint transport metrics for one worker process.
+
+    Example:
+        >>> metrics = TransportMetrics()
+        >>> metrics.observe('GET /record_history/all', 0.12, new_connections=0)
+        >>> metrics.snapshot()['GET /record_history/all']['reused_connections']
+        1
+    """
+
+    def __init__(self, max_endpoints: int = MAX_ENDPOINTS):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, dict] = {}
+        self.max_endpoints = max_endpoints
+
+    def observe(self, endpoint: str, seconds: float, new_connections: Optional[int], error: bool = False):
+        """
+        Record one request.
+
+        Args:
+            endpoint: Label from endpoint_label()
+            seconds: Time until the response (or the failure)
+            new_connections: Connections opened for it; None when unknown
+            error: True when no response was received
+        """
+        with self._lock:
+            metrics = self._endpoints.get(endpoint)
+            if metrics is None:
+                if len(self._endpoints) >= self.max_endpoints:
+                    endpoint = 'other'
+                metrics = self._endpoints.setdefault(endpoint, empty_endpoint_metrics())
+            metrics['requests'] += 1
+            if error:
+                metrics['errors'] += 1
+            if new_connections:
+                metrics['new_connections'] += new_connections
+            elif new_connections == 0:
+                metrics['reused_connections'] += 1
+            latency = metrics['latency']
+            latency['sum'] += seconds
+            latency['count'] += 1
+            for index, upper_bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= upper_bound:
+                    latency['buckets'][index] += 1
+                    break
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Copy of all metrics; histogram buckets are non-cumulative."""
+        with self._lock:
+            return copy.deepcopy(self._endpoints)
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+_METRICS = TransportMetrics()
+
+
+def get_transport_metrics() -> dict:
+    """
+    Per-endpoint transport metrics of this process, plus the pool settings.
+
+    Returns:
+        {
+            'pool': {'pool_connections': 10, 'pool_maxsize': 32, 'http2': False},
+            'endpoints': {
+                'GET /record_history/all': {
+                    'requests': 40, 'errors': 0, 'new_connections': 2,
+                    'reused_connections': 38, 'reuse_ratio': 0.95,
+                    'latency': {'buckets': [...], 'sum': 3.1, 'count': 40}
+                }
+            }
+        }
+    """
+    endpoints = _METRICS.snapshot()
+    for metrics in endpoints.values():
+        known = metrics['new_connections'] + metrics['reused_connections']
+        metrics['reuse_ratio'] = round(metrics['reused_connections'] / known, 4) if known else 0.0
+    return {
+        'pool': {
+            'pool_connections': APIClientConfig.POOL_CONNECTIONS,
+            'pool_maxsize': APIClientConfig.POOL_MAXSIZE,
+            'http2': APIClientConfig.ENABLE_HTTP2,
+        },
+        'endpoints': endpoints,
+    }
+
+
+def reset_transport_metrics():
+    """Reset this process's transport metrics (used by tests)."""
+    _METRICS.reset()
+
+
+def _label(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def render_transport_prometheus(metrics: dict) -> str:
+    """
+    Render get_transport_metrics() in the Prometheus text exposition format.
+
+    Returns:
+        Exposition text
+    """
+    endpoints = metrics['endpoints']
+    names = sorted(endpoints)
+    lines: List[str] = [
+        f"# HELP {_METRIC_PREFIX}_pool_maxsize Keep-alive connections kept per backend host.",
+        f"# TYPE {_METRIC_PREFIX}_pool_maxsize gauge",
+        f"{_METRIC_PREFIX}_pool_maxsize {metrics['pool']['pool_maxsize']}",
+    ]
+
+    for counter in COUNTERS:
+        name = f"{_METRIC_PREFIX}_{counter}_total"
+        lines.append(f"# HELP {name} {_COUNTER_HELP[counter]}")
+        lines.append(f"# TYPE {name} counter")
+        for endpoint in names:
+            lines.append(f'{name}{{endpoint="{_label(endpoint)}"}} {endpoints[endpoint][counter]}')
+
+    name = f"{_METRIC_PREFIX}_request_duration_seconds"
+    lines.append(f"# HELP {name} Time until the backend response headers arrived.")
+    lines.append(f"# TYPE {name} histogram")
+    for endpoint in names:
+        latency = endpoints[endpoint]['latency']
+        label = _label(endpoint)
+        cumulative = 0
+        for upper_bound, count in zip(LATENCY_BUCKETS, latency['buckets']):
+            cumulative += count
+            lines.append(f'{name}_bucket{{endpoint="{label}",le="{upper_bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{endpoint="{label}",le="+Inf"}} {latency["count"]}')
+        lines.append(f'{name}_sum{{endpoint="{label}"}} {float(latency["sum"])!r}')
+        lines.append(f'{name}_count{{endpoint="{label}"}} {latency["count"]}')
+
+    return '\n'.join(lines) + '\n'
+
+
+# ===== HTTP/1.1 POOLED ADAPTER =====
+
+# Connections opened by the current thread's in-flight request
+_connections = threading.local()
+
+
+def _count_connect():
+    _connections.opened = getattr(_connections, 'opened', 0) + 1
+
+
+class _TrackedHTTPConnection(HTTPConnection):
+    def connect(self):
+        _count_connect()
+        super().connect()
+
+
+class _TrackedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        _count_connect()
+        super().connect()
+
+
+class _TrackedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TrackedHTTPConnection
+
+
+class _TrackedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TrackedHTTPSConnection
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that records per-endpoint latency and connection reuse.
+
+    A request reuses a connection when urllib3 did not have to open a new
+    socket for it; connect() calls are counted per thread while the
+    request is in flight.
+    """
+
+    def __init__(self, *args, metrics: TransportMetrics = None, **kwargs):
+        self.metrics = metrics or _METRICS
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TrackedHTTPConnectionPool,
+            'https': _TrackedHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        _connections.opened = 0
+        started = time.perf_counter()
+        endpoint = endpoint_label(request.method, request.url)
+        try:
+            response = super().send(request, **kwargs)
+        except Exception:
+            self.metrics.observe(endpoint, time.perf_counter() - started, _connections.opened, error=True)
+            raise
+        self.metrics.observe(endpoint, time.perf_counter() - started, _connections.opened)
+        return response
+
+
+# ===== OPTIONAL HTTP/2 ADAPTER (httpx) =====
+
+# Connection-specific headers are not allowed on HTTP/2 requests
+_HOP_BY_HOP_HEADERS = frozenset(('connection', 'keep-alive', 'proxy-connection', 'transfer-encoding', 'upgrade'))
+
+
+def http2_available() -> bool:
+    """True when httpx can speak HTTP/2 (the optional `h2` package is installed)."""
+    return importlib.util.find_spec('h2') is not None
+
+
+class _HTTPXRawStream:
+    """File-like `raw` for a requests.Response backed by a streamed httpx response."""
+
+    def __init__(self, response):
+        self._response = response
+        self._chunks = response.iter_bytes()
+        self._buffer = b''
+
+    def read(self, amt=None, **kwargs) -> bytes:
+        while amt is None or len(self._buffer) < amt:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self.close()
+                break
+            self._buffer += chunk
+        if amt is None:
+            data, self._buffer = self._buffer, b''
+        else:
+            data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    def close(self):
+        self._response.close()
+
+    release_conn = close
+
+
+class HTTPXAdapter(BaseAdapter):
+    """
+    requests transport adapter that sends through a shared httpx.Client.
+
+    Lets the existing requests-based APIClient code (Response objects,
+    requests exceptions, streamed iter_content) run over httpx HTTP/2
+    connections. Status retries follow the urllib3 Retry passed in
+    (status_forcelist / allowed_methods / backoff); connection failures are
+    retried by the httpx transport.
+    """
+
+    def __init__(self, client, max_retries: Retry, metrics: TransportMetrics = None):
+        super().__init__()
+        self.client = client
+        self.max_retries = max_retries
+        self.metrics = metrics or _METRICS
+        # Network streams already seen, to tell reused connections from new ones
+        self._streams = weakref.WeakSet()
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        import httpx
+
+        endpoint = endpoint_label(request.method, request.url)
+        headers = [(k, v) for k, v in request.headers.items() if k.lower() not in _HOP_BY_HOP_HEADERS]
+        body = request.body.encode('utf-8') if isinstance(request.body, str) else request.body
+
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            try:
+                response = self.client.send(
+                    self.client.build_request(
+                        request.method, request.url, headers=headers,
+                        content=body, timeout=self._timeout(timeout)
+                    ),
+                    stream=True
+                )
+            except httpx.TimeoutException as e:
+                self.metrics.observe(endpoint, time.perf_counter() - started, None, error=True)
+                error = requests.exceptions.ConnectTimeout if isinstance(e, httpx.ConnectTimeout) \
+                    else requests.exceptions.ReadTimeout
+                raise error(e, request=request)
+            except (httpx.ConnectError, httpx.NetworkError, httpx.RemoteProtocolError) as e:
+                self.metrics.observe(endpoint, time.perf_counter() - started, None, error=True)
+                raise requests.exceptions.ConnectionError(e, request=request)
+            except httpx.HTTPError as e:
+                self.metrics.observe(endpoint, time.perf_counter() - started, None, error=True)
+                raise requests.exceptions.RequestException(e, request=request)
+
+            self.metrics.observe(endpoint, time.perf_counter() - started, self._opened_connection(response))
+
+            retry = self.max_retries
+            if attempt < (retry.total or 0) and retry.is_retry(
+                request.method, response.status_code, 'Retry-After' in response.headers
+            ):
+                response.close()
+                attempt += 1
+                time.sleep(min(retry.backoff_factor * (2 ** (attempt - 1)), retry.DEFAULT_BACKOFF_MAX))
+                continue
+            return self.build_response(request, response, stream)
+
+    def _opened_connection(self, response) -> Optional[int]:
+        network_stream = response.extensions.get('network_stream')
+        if network_stream is None:
+            return None
+        try:
+            if network_stream in self._streams:
+                return 0
+            self._streams.add(network_stream)
+        except TypeError:
+            return None
+        return 1
+
+    @staticmethod
+    def _timeout(timeout):
+        import httpx
+
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    def build_response(self, request, httpx_response, stream: bool) -> requests.Response:
+        response = requests.Response()
+        response.status_code = httpx_response.status_code
+        response.headers = CaseInsensitiveDict(httpx_response.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = httpx_response.reason_phrase
+        response.raw = _HTTPXRawStream(httpx_response)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        # The client may be shared between mounts; closing it twice is a no-op
+        self.client.close()
+
+
+# ===== SESSION =====
+
+def build_api_session(
+    base_url: str,
+    retry: Retry,
+    upload_retry: Retry,
+    metrics: TransportMetrics = None
+) -> requests.Session:
+    """
+    Build the pooled session APIClient sends every request through.
+
+    Args:
+        base_url: Backend base URL (no trailing slash)
+        retry: Retry policy for regular API calls
+        upload_retry: Retry policy for {base_url}/upload/ (no re-sending
+            of a body the backend may already have processed)
+        metrics: Metrics sink (default: process-wide metrics)
+
+    Returns:
+        requests.Session with the adapters mounted
+    """
+    session = requests.Session()
+    pool = {
+        'pool_connections': APIClientConfig.POOL_CONNECTIONS,
+        'pool_maxsize': APIClientConfig.POOL_MAXSIZE,
+        'pool_block': APIClientConfig.POOL_BLOCK,
+    }
+
+    adapter = PooledHTTPAdapter(max_retries=retry, metrics=metrics, **pool)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    # Upload endpoints get their own pool on the same session: streamed
+    # upload bodies are retried only when the connection could not be
+    # made, never re-sent after the backend has started processing them
+    session.mount(f"{base_url}/upload/", PooledHTTPAdapter(max_retries=upload_retry, metrics=metrics, **pool))
+
+    if APIClientConfig.ENABLE_HTTP2:
+        if http2_available():
+            import httpx
+
+            client = httpx.Client(transport=httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=APIClientConfig.POOL_MAXSIZE,
+                    max_keepalive_connections=APIClientConfig.POOL_MAXSIZE
+                ),
+                retries=retry.connect or retry.total or 0,
+            ))
+            session.mount(f"{base_url}/", HTTPXAdapter(client, retry, metrics))
+            session.mount(f"{base_url}/upload/", HTTPXAdapter(client, upload_retry, metrics))
+            logger.info(f"APIClient using HTTP/2 transport for {base_url}")
+        else:
+            logger.warning("ENABLE_HTTP2 is set but the 'h2' package is not installed; using HTTP/1.1")
+
+    return session
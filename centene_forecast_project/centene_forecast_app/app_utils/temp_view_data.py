@@ -130,7 +130,7 @@ def get_roster_colmns(roster_type, cols):
     
     objects["table_id"] = "roster"
     objects["table_url"] = reverse("forecast_app:roster_table_data", args=[roster_type])
-    objects["table_props"] = {'destroy':True,'ordering':True,'deferRender':True,'scrollX':True,'processing': True,'serverSide': False,}
+    objects["table_props"] = {'destroy':True,'ordering':True,'deferRender':True,'scrollX':True,'processing': True,'serverSide': True,}
     objects["columns"] = cols
     return objects
 
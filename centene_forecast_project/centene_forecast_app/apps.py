@@ -20,10 +20,13 @@ class CenteneForecastAppConfig(AppConfig):
         """
         Called when Django starts.
         
+        - Checks that the configured cache alias exists
         - Registers cleanup handlers for graceful shutdown
         - Initializes any required app-level resources
         """
         logger.info("Centene Forecast app initializig ...")
+        from centene_forecast_app.app_utils.cache_utils import validate_cache_backend
+        validate_cache_backend()
         # Set admin site url
         try:
             admin.site.site_url = reverse('forecast_app:dataview')
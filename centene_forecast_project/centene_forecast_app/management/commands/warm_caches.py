@@ -0,0 +1,86 @@
+"""
+Prefetch the data view caches for the active report months.
+
+Warms the forecast cascade tree (years -> months -> platforms -> markets ->
+localities -> worktypes), roster/forecast model schemas and summary tables
+in parallel (see services/cache_warmup_service.py). Run after a deploy or
+a full cache clear.
+
+Only useful with the shared redis backend (CENTENE_CACHE_BACKEND=redis): a
+locmem cache lives in this command's process and is gone when it exits, and
+filebased entries written here are missing from the server's in-memory tag
+registry, so uploads would not invalidate them. Otherwise warm the server's
+own cache via POST /api/cache/warm/.
+
+Usage:
+    python manage.py warm_caches
+    python manage.py warm_caches --months-ahead 2 --workers 4
+    python manage.py warm_caches --period 3/2025 --period 4/2025 --no-summaries
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from centene_forecast_app.app_utils.cache_utils import is_shared_cache
+from centene_forecast_app.services.cache_warmup_service import active_report_months, warm_caches
+from core.config import ForecastCacheConfig
+
+
+def _parse_period(value: str):
+    try:
+        month, year = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise CommandError(f"Invalid period '{value}', expected MONTH/YEAR (e.g. 3/2025)")
+    if not 1 <= month <= 12:
+        raise CommandError(f"Invalid month in period '{value}'")
+    return month, year
+
+
+class Command(BaseCommand):
+    help = 'Prefetch cascade, schema and summary caches for the active report months'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--period',
+            action='append',
+            default=[],
+            help='Report month to warm as MONTH/YEAR; repeatable (default: current and next months)',
+        )
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            default=None,
+            help='Months after the current one to warm (default: CacheWarmupConfig.MONTHS_AHEAD)',
+        )
+        parser.add_argument('--workers', type=int, default=None, help='Concurrent backend requests')
+        parser.add_argument('--no-schemas', action='store_true', help='Skip model schemas')
+        parser.add_argument('--no-summaries', action='store_true', help='Skip summary tables')
+
+    def handle(self, *args, **options):
+        if not is_shared_cache():
+            raise CommandError(
+                f"The '{ForecastCacheConfig.CACHE_BACKEND}' cache is not shared with the server, so "
+                "entries warmed here are lost or never invalidated by uploads. Use "
+                "CENTENE_CACHE_BACKEND=redis or warm the running server with "
+                "POST /centene_forecasting/api/cache/warm/."
+            )
+
+        periods = [_parse_period(value) for value in options['period']]
+        if not periods:
+            periods = active_report_months(months_ahead=options['months_ahead'])
+
+        requested = ', '.join(f"{month}/{year}" for month, year in periods)
+        self.stdout.write(f"Warming caches for {requested} ...")
+
+        result = warm_caches(
+            periods,
+            include_schemas=False if options['no_schemas'] else None,
+            include_summaries=False if options['no_summaries'] else None,
+            max_workers=options['workers'],
+        )
+
+        warmed_periods = ', '.join(f"{month}/{year}" for month, year in result['periods']) or 'none'
+        self.stdout.write(self.style.SUCCESS(
+            f"Warmed {result['warmed']} cache entries in {result['duration_seconds']:.2f}s "
+            f"(periods: {warmed_periods})"
+        ))
+        if result['failed']:
+            self.stdout.write(self.style.WARNING(f"{result['failed']} requests failed, see the log"))
@@ -1,10 +1,11 @@
 # repository.py
+import contextvars
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from typing import Dict, List, Optional
 from urllib.parse import quote
 import requests
-from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from django.conf import settings
@@ -15,8 +16,14 @@ from centene_forecast_app.mock_data import (
 )
 
 # Import caching utilities
-from centene_forecast_app.app_utils.cache_utils import cache_with_ttl
-from core.config import ForecastCacheConfig, ManagerViewConfig, ExecutionMonitoringConfig, EditViewConfig, ConfigurationViewConfig
+from centene_forecast_app.app_utils.cache_utils import (
+    cache_with_ttl,
+    record_request_failure,
+    record_response_validators,
+)
+from centene_forecast_app.app_utils.file_utils import MultipartFileStream
+from centene_forecast_app.app_utils.http_transport import build_api_session
+from core.config import APIClientConfig, ForecastCacheConfig, ManagerViewConfig, ExecutionMonitoringConfig, EditViewConfig, ConfigurationViewConfig
 
 logger = logging.getLogger('django')
 
@@ -61,17 +68,17 @@ class APIClient:
             9: "September", 10: "October", 11: "November", 12: "December"
         }
 
-        # Configure session with retry strategy
-        self.session = requests.Session()
+        # One pooled keep-alive session for every call path (see APIClientConfig.POOL_*)
         retry_strategy = Retry(
             total=max_retries,
             backoff_factor=1,  # Wait 1, 2, 4 seconds between retries
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "OPTIONS", "POST"]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # Streamed upload bodies are retried only when the connection could not
+        # be made, never re-sent after the backend has started processing them
+        upload_retry = Retry(total=max_retries, read=False, backoff_factor=1)
+        self.session = build_api_session(self.base_url, retry_strategy, upload_retry)
 
         logger.info(f"APIClient initialized with base_url: {self.base_url}")
 
@@ -128,6 +135,8 @@ class APIClient:
                 logger.warning(
                     f"API {method} {url} - Client error {response.status_code}: {error_detail}"
                 )
+                if method == 'GET':
+                    record_request_failure()
                 return {
                     'success': False,
                     'error': error_detail,
@@ -139,10 +148,14 @@ class APIClient:
 
             logger.debug(f"API {method} {url} - Status: {response.status_code}")
 
+            if method == 'GET':
+                record_response_validators(response)
             return response.json()
 
         except requests.exceptions.Timeout:
             logger.error(f"Request timeout after {request_timeout}s: {method} {url}")
+            if method == 'GET':
+                record_request_failure()
             return {
                 'success': False,
                 'error': f'Request timeout after {request_timeout}s',
@@ -150,6 +163,8 @@ class APIClient:
             }
         except requests.exceptions.ConnectionError:
             logger.error(f"Connection error: {method} {url}")
+            if method == 'GET':
+                record_request_failure()
             return {
                 'success': False,
                 'error': 'Connection error: Unable to reach the API server',
@@ -165,6 +180,8 @@ class APIClient:
                 error_detail = str(e)
 
             logger.error(f"HTTP error {e.response.status_code}: {method} {url} - {error_detail}")
+            if method == 'GET':
+                record_request_failure()
             return {
                 'success': False,
                 'error': error_detail,
@@ -172,33 +189,40 @@ class APIClient:
             }
         except Exception as e:
             logger.error(f"Unexpected error in API request: {str(e)}")
+            if method == 'GET':
+                record_request_failure()
             return {
                 'success': False,
                 'error': f'Unexpected error: {str(e)}',
                 'status_code': 500
             }
 
-    def _upload_file(self, endpoint: str, file_content: bytes, filename: str, user: str):
+    def _upload_file(self, endpoint: str, file_content, filename: str, user: str, progress_callback=None):
+        """
+        Upload a file as a streamed multipart body over the pooled session.
+
+        Args:
+            endpoint: Upload endpoint path
+            file_content: Django UploadedFile (streamed in chunks) or bytes
+            filename: Original filename
+            user: Uploading user's display name
+            progress_callback: Optional callable(bytes_sent, total_bytes)
+
+        Returns:
+            Backend response dict, or {'error': ...} on failure
+        """
         url = f"{self.base_url}{endpoint}"
         params = {'user': user}
 
-        if filename.endswith('.csv'):
-            content_type = 'text/csv'
-        elif filename.endswith('.xlsx'):
-            content_type = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        else:
-            content_type = 'application/octet-stream'
+        body = MultipartFileStream(file_content, filename, progress_callback=progress_callback)
 
         headers = self.headers.copy()
         headers.pop('accept', None)
-        headers.pop('Content-Type', None)  # Remove to allow multipart/form-data
-
-        files = {
-            'file': (filename, file_content, content_type)
-        }
+        headers['Content-Type'] = body.content_type
 
         try:
-            response = requests.post(url, params=params, files=files, headers=headers, timeout=(30, 300))
+            logger.info(f"[Upload] {endpoint} | User: {user} | File: {filename} | {len(body)} bytes")
+            response = self.session.post(url, params=params, data=body, headers=headers, timeout=(30, 300))
             response.raise_for_status()
             return response.json()
 
@@ -221,7 +245,99 @@ class APIClient:
     def get(self, endpoint: str, params: dict = None, headers: dict = None):
         return self._make_request('GET', endpoint, params=params)
 
-    @cache_with_ttl(ttl=ManagerViewConfig.FILTERS_TTL, key_prefix='manager_view:filters')
+    def _fetch_page(self, endpoint: str, params: Dict, skip: int, limit: int) -> Dict:
+        """Fetch a single page of a paginated records endpoint."""
+        page_params = {'skip': skip, 'limit': limit, **params}
+        return self.get(endpoint, params=page_params)
+
+    def _fetch_all_pages(
+        self,
+        endpoint: str,
+        params: Dict,
+        records_key: str,
+        limit: int = APIClientConfig.PAGE_SIZE,
+        max_workers: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Fetch every page of a paginated records endpoint and normalize the records.
+
+        The first page is fetched on its own to learn the backend's 'total'.
+        Remaining page offsets are then fetched over a bounded thread pool on
+        the shared session and reassembled in offset order. If parallel
+        pagination is disabled, pages are walked sequentially instead.
+
+        A failed or empty page ends the result at that point, matching the
+        sequential walk (records after a gap are never returned). A result
+        cut short this way is never revalidated (record_request_failure).
+
+        Args:
+            endpoint: API endpoint path (e.g., '/records/forecast')
+            params: Query parameters shared by every page (without skip/limit)
+            records_key: Response key holding the page's records ('data' or 'records')
+            limit: Number of records per page
+            max_workers: Max concurrent page fetches
+                         (default: APIClientConfig.PAGE_FETCH_MAX_WORKERS)
+
+        Returns:
+            list[dict]: All records, each normalized to the union of keys
+        """
+        first_page = self._fetch_page(endpoint, params, 0, limit)
+        if not first_page:
+            logger.warning(f"[Paginated Fetch Warning] No response for {endpoint} skip=0")
+            return []
+
+        pages = [first_page]
+        total = first_page.get('total', 0)
+        first_records = first_page.get(records_key, [])
+        offsets = list(range(limit, total, limit)) if first_records else []
+
+        if offsets:
+            workers = min(max_workers or APIClientConfig.PAGE_FETCH_MAX_WORKERS, len(offsets))
+            if APIClientConfig.ENABLE_PARALLEL_PAGINATION and workers > 1:
+                logger.debug(
+                    f"[Paginated Fetch] {endpoint}: fetching {len(offsets)} remaining pages "
+                    f"with {workers} workers (total={total})"
+                )
+                # Each page runs in a copy of this context so cache revalidation
+                # (record_response_validators) sees every page's ETag
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='api-page') as executor:
+                    futures = [
+                        executor.submit(
+                            contextvars.copy_context().run,
+                            self._fetch_page, endpoint, params, skip, limit
+                        )
+                        for skip in offsets
+                    ]
+                    pages.extend(future.result() for future in futures)
+            else:
+                for skip in offsets:
+                    page = self._fetch_page(endpoint, params, skip, limit)
+                    pages.append(page)
+                    if not page or not page.get(records_key):
+                        break
+
+        all_records = []
+        all_keys = set()
+        for index, (skip, page) in enumerate(zip([0] + offsets, pages)):
+            records = page.get(records_key, []) if page else []
+            if not records:
+                if page and not page.get('success', True):
+                    logger.warning(
+                        f"[Paginated Fetch Warning] {endpoint} skip={skip} failed: {page.get('error')}"
+                    )
+                if index < len(offsets):
+                    # Later pages are dropped: the ETags recorded for them
+                    # do not describe the truncated result
+                    record_request_failure()
+                break
+            for rec in records:
+                all_keys.update(rec.keys())
+            all_records.extend(records)
+
+        # Normalize records to have same keys
+        return [{k: rec.get(k) for k in all_keys} for rec in all_records]
+
+    @cache_with_ttl(ttl=ManagerViewConfig.FILTERS_TTL, key_prefix='manager_view:filters', tags=('forecast',))
     def get_manager_view_filters(self) -> Dict[str, List[Dict[str, str]]]:
         """
         Get filter options for manager view (report months and categories).
@@ -243,6 +359,7 @@ class APIClient:
         """
         return self._make_request('GET', '/api/manager-view/filters')
 
+    @cache_with_ttl(ttl=ManagerViewConfig.MANAGER_DATA_TTL, key_prefix='manager_view:data', tags=('forecast',))
     def get_manager_view_data(
         self,
         report_month: str,
@@ -275,52 +392,24 @@ class APIClient:
             params['category'] = category
         return self._make_request('GET', '/api/manager-view/data', params=params)
 
-    @cache_with_ttl(ttl=ForecastCacheConfig.DATA_TTL, key_prefix='roster')
-    def get_all_roster(self, roster_type, search=None, searchable_field='', global_filter=None, limit=100, month: int = None, year: int = None):
-        all_records = []
-        skip = 0
-        all_keys = set()
+    @cache_with_ttl(ttl=ForecastCacheConfig.DATA_TTL, key_prefix='roster', stale_ttl=ForecastCacheConfig.DATA_STALE_TTL, tags=('{roster_type}',), revalidate=True)
+    def get_all_roster(self, roster_type, search=None, searchable_field='', global_filter=None, limit=APIClientConfig.PAGE_SIZE, month: int = None, year: int = None):
         url = '/records/'+roster_type
-        while True:
-            params = {
-                'skip': skip,
-                'limit': limit,
-                'search': search,
-                'searchable_field': searchable_field,
-                'global_filter': global_filter
-            }
-
-            if month and year:
-                params['month'] = self.month_mapper.get(month, "Invalid Month")
-                params['year'] = year
-
-            params = {k: v for k, v in params.items() if v not in [None, '', []]}
-
-            response = self.get(url, params=params)
-            if not response:
-                break
-
-            records = response.get('records', [])
-            total = response.get('total', 0)
-
-            # Collect all keys from this batch
-            for rec in records:
-                all_keys.update(rec.keys())
+        params = {
+            'search': search,
+            'searchable_field': searchable_field,
+            'global_filter': global_filter
+        }
 
-            all_records.extend(records)
-            skip += limit
-            if skip >= total or not records:
-                break
+        if month and year:
+            params['month'] = self.month_mapper.get(month, "Invalid Month")
+            params['year'] = year
 
-        # Normalize each record so all have same keys
-        normalized_records = []
-        for rec in all_records:
-            normalized = {key: rec.get(key) for key in all_keys}
-            normalized_records.append(normalized)
+        params = {k: v for k, v in params.items() if v not in [None, '', []]}
 
-        return normalized_records
+        return self._fetch_all_pages(url, params, records_key='records', limit=limit)
 
-    @cache_with_ttl(ttl=ForecastCacheConfig.DATA_TTL, key_prefix='forecast')
+    @cache_with_ttl(ttl=ForecastCacheConfig.DATA_TTL, key_prefix='forecast', stale_ttl=ForecastCacheConfig.DATA_STALE_TTL, tags=('forecast',), revalidate=True)
     def get_all_forecast_records(
         self,
         month: int,
@@ -331,7 +420,7 @@ class APIClient:
         search: str = None,
         searchable_field: str = '',
         global_filter: str = '',
-        limit: int = 100
+        limit: int = APIClientConfig.PAGE_SIZE
     ):
         """
         Fetch all forecast records with pagination.
@@ -351,9 +440,6 @@ class APIClient:
             list[dict]: List of all forecast records (normalized)
         """
         endpoint = "/records/forecast"
-        all_records = []
-        skip = 0
-        all_keys = set()
 
         # Validate months
         month_name = self.month_mapper.get(month)
@@ -362,66 +448,39 @@ class APIClient:
             logger.error(f"[Forecast Fetch Error] Invalid month or forecast month: {month}, {forecast_month}")
             return []
 
-        while True:
-            params = {
-                'skip': skip,
-                'limit': limit,
-                'month': month_name,
-                'year': year,
-                'forecast_month': forecast_month,
-                'search': search,
-                'searchable_field': searchable_field,
-                'global_filter': global_filter,
-                'main_lob': main_lob,
-                'case_type': case_type
-            }
-
-            # Remove empty/None fields
-            params = {k: v for k, v in params.items() if v not in [None, '', []]}
-
-            logger.debug(f"[Forecast Fetch] Requesting {endpoint} with params: {params}")
-            response = self.get(endpoint, params=params)
-
-            if not response:
-                logger.warning(f"[Forecast Fetch Warning] No response for skip={skip}")
-                break
-
-            records = response.get('data', [])
-            total = response.get('total', 0)
-
-            for rec in records:
-                all_keys.update(rec.keys())
-            all_records.extend(records)
-
-            logger.debug(f"[Forecast Fetch] Received {len(records)} records (skip={skip}, total={total})")
+        params = {
+            'month': month_name,
+            'year': year,
+            'forecast_month': forecast_month,
+            'search': search,
+            'searchable_field': searchable_field,
+            'global_filter': global_filter,
+            'main_lob': main_lob,
+            'case_type': case_type
+        }
 
-            skip += limit
-            if skip >= total or not records:
-                break
+        # Remove empty/None fields
+        params = {k: v for k, v in params.items() if v not in [None, '', []]}
 
-        # Normalize records to have same keys
-        normalized_records = []
-        for rec in all_records:
-            normalized = {k: rec.get(k) for k in all_keys}
-            normalized_records.append(normalized)
+        normalized_records = self._fetch_all_pages(endpoint, params, records_key='data', limit=limit)
 
         logger.info(f"[Forecast Fetch Complete] Total records fetched: {len(normalized_records)}")
         return normalized_records
 
-    def upload_roster_file(self, file_content: bytes, filename: str, user: str):
-        return self._upload_file('/upload/upload_roster', file_content, filename, user)
+    def upload_roster_file(self, file_content, filename: str, user: str, progress_callback=None):
+        return self._upload_file('/upload/upload_roster', file_content, filename, user, progress_callback)
 
-    def upload_forecast_file(self, file_content: bytes, filename: str, user: str):
-        return self._upload_file('/upload/forecast', file_content, filename, user)
+    def upload_forecast_file(self, file_content, filename: str, user: str, progress_callback=None):
+        return self._upload_file('/upload/forecast', file_content, filename, user, progress_callback)
 
-    def upload_altered_forecast_file(self, file_content: bytes, filename: str, user: str):
-        return self._upload_file('/upload/altered_forecast', file_content, filename, user)
+    def upload_altered_forecast_file(self, file_content, filename: str, user: str, progress_callback=None):
+        return self._upload_file('/upload/altered_forecast', file_content, filename, user, progress_callback)
 
-    def upload_prod_team_roster_file(self, file_content: bytes, filename: str, user: str):
+    def upload_prod_team_roster_file(self, file_content, filename: str, user: str, progress_callback=None):
         """ Uploads a production team roster file"""
-        return self._upload_file('/upload/prod_team_roster', file_content, filename, user)
+        return self._upload_file('/upload/prod_team_roster', file_content, filename, user, progress_callback)
 
-    @cache_with_ttl(ttl=ForecastCacheConfig.SUMMARY_TTL, key_prefix='summary')
+    @cache_with_ttl(ttl=ForecastCacheConfig.SUMMARY_TTL, key_prefix='summary', tags=('forecast', 'roster'), revalidate=True)
     def get_table_summary(self, summary_type: str, month: int, year: int):
         if month not in self.month_mapper:
             return {"error": f"Invalid month number: {month}"}
@@ -431,7 +490,7 @@ class APIClient:
         params = {"month": month_str, "year": year}
 
         try:
-            response = requests.get(
+            response = self.session.get(
                 url,
                 params=params,
                 headers={'accept': 'text/html'},  # HTML response expected
@@ -445,14 +504,17 @@ class APIClient:
                 except Exception:
                     error_detail = response.text or 'Unknown error'
                 logger.error(f"[Fetch Error] {url} Detail: {error_detail}")
+                record_request_failure()
                 return {"error": error_detail}
 
             response.raise_for_status()
+            record_response_validators(response)
             return response.text  # On success: HTML table
 
         except requests.RequestException as e:
             # Other network or HTTP errors
             logger.exception(f"[Fetch Error - Exception] {url} | Error: {e}")
+            record_request_failure()
             return {"error": str(e)}
 
     def get_all_record_history(self, skip=0, limit=100):
@@ -509,7 +571,10 @@ class APIClient:
 
     def download_file_stream(self, file_type: str, month: int, year: int):
         """
-        Streams a file download from the API and returns an in-memory buffer and filename.
+        Open a streamed file download from the API without reading the body.
+
+        The caller relays the body chunk by chunk (see relay_streaming_download)
+        and must close the response when done.
 
         Args:
             file_type (str): Type of file to download (e.g., 'roster', 'forecast').
@@ -517,29 +582,32 @@ class APIClient:
             year (int): Year for which the file is requested.
 
         Returns:
-            Tuple[BytesIO, str] or (None, None) if error
+            Tuple[requests.Response, str] or (None, None) if error
         """
         endpoint = f"/download_file/{file_type}"
         params = {"month": self.month_mapper.get(month, "Invalid Month"), "year": year}
+        response = None
 
         try:
-            response = requests.get(f"{self.base_url}{endpoint}", params=params, stream=True, timeout=(30,300))
-            # if response.status_code == 404:
-            #     logger.error(f"Download error: File not found for {file_type}, month={month}, year={year}")
-            #     raise FileNotFoundError(f"File not found for {file_type}, month={month}, year={year}")
+            response = self.session.get(
+                f"{self.base_url}{endpoint}",
+                params=params,
+                stream=True,
+                timeout=(30, 300),
+                headers=self.headers
+            )
             response.raise_for_status()
 
             filename = f"{file_type}.xlsx"
-            file_buffer = BytesIO(response.content)
-            file_buffer.seek(0)
-
-            return file_buffer, filename
+            return response, filename
 
         except requests.RequestException as e:
             logger.error(f"Download error: {e}")
+            if response is not None:
+                response.close()
             return None, None
 
-    @cache_with_ttl(ttl=ForecastCacheConfig.SCHEMA_TTL, key_prefix='schema:roster')
+    @cache_with_ttl(ttl=ForecastCacheConfig.SCHEMA_TTL, key_prefix='schema:roster', tags=('{roster_type}',), revalidate=True)
     def get_roster_model_schema(self, roster_type:str, month: int, year:int):
         """
         Fetch the roster model schema for the given month and year.
@@ -574,7 +642,7 @@ class APIClient:
         logger.debug(f"[Schema Fetch Success] Response: {response}")
         return response
 
-    @cache_with_ttl(ttl=ForecastCacheConfig.SCHEMA_TTL, key_prefix='schema:forecast')
+    @cache_with_ttl(ttl=ForecastCacheConfig.SCHEMA_TTL, key_prefix='schema:forecast', tags=('forecast',), revalidate=True)
     def get_forecast_model_schema(self, month: int, year: int, main_lob: str = None, case_type: str = None):
         """
         Fetch the forecast model schema for the given parameters.
@@ -635,7 +703,7 @@ class APIClient:
         logger.debug(f"[Dropdown Fetch Success] Response: {response}")
         return data
 
-    @cache_with_ttl(ttl=ForecastCacheConfig.CASCADE_TTL, key_prefix='cascade:years')
+    @cache_with_ttl(ttl=ForecastCacheConfig.CASCADE_TTL, key_prefix='cascade:years', tags=('forecast',))
     def get_forecast_filter_years(self) -> Dict[str, List[Dict[str, str]]]:
         """
         Get available years for forecast filter dropdowns.
@@ -653,7 +721,7 @@ class APIClient:
         """
         return self._make_request('GET', '/forecast/filter-years')
 
-    @cache_with_ttl(ttl=ForecastCacheConfig.CASCADE_TTL, key_prefix='cascade:roster_years')
+    @cache_with_ttl(ttl=ForecastCacheConfig.CASCADE_TTL, key_prefix='cascade:roster_years', tags=('roster', 'prod_team_roster'))
     def get_roster_filter_years(self) -> Dict[str, List[Dict[str, str]]]:
         """
         Get available years for roster/prod_team_roster filter dropdowns.
@@ -671,7 +739,7 @@ class APIClient:
         """
         return self._make_request('GET', '/roster/filter-years')
 
-    @cache_with_ttl(ttl=ForecastCacheConfig.CASCADE_TTL, key_prefix='cascade:months')
+    @cache_with_ttl(ttl=ForecastCacheConfig.CASCADE_TTL, key_prefix='cascade:months', tags=('forecast',))
     def get_forecast_months_for_year(self, year: int) -> List[Dict[str, str]]:
         """
         Get available months for the selected year.
@@ -691,7 +759,7 @@ class APIClient:
         """
         return self._make_request('GET', f'/forecast/months/{year}')
 
-    @cache_with_ttl(ttl=ForecastCacheConfig.CASCADE_TTL, key_prefix='cascade:platforms')
+    @cache_with_ttl(ttl=ForecastCacheConfig.CASCADE_TTL, key_prefix='cascade:platforms', tags=('forecast',))
     def get_forecast_platforms(self, year: int, month: int) -> List[Dict[str, str]]:
         """
         Get available platforms (formerly boc) for selected year and month.
@@ -712,7 +780,7 @@ class APIClient:
         params = {'year': year, 'month': month}
         return self._make_request('GET', '/forecast/platforms', params=params)
 
-    @cache_with_ttl(ttl=ForecastCacheConfig.CASCADE_TTL, key_prefix='cascade:markets')
+    @cache_with_ttl(ttl=ForecastCacheConfig.CASCADE_TTL, key_prefix='cascade:markets', tags=('forecast',))
     def get_forecast_markets(
         self,
         year: int,
@@ -739,7 +807,7 @@ class APIClient:
         params = {'year': year, 'month': month, 'platform': platform}
         return self._make_request('GET', '/forecast/markets', params=params)
 
-    @cache_with_ttl(ttl=ForecastCacheConfig.CASCADE_TTL, key_prefix='cascade:localities')
+    @cache_with_ttl(ttl=ForecastCacheConfig.CASCADE_TTL, key_prefix='cascade:localities', tags=('forecast',))
     def get_forecast_localities(
         self,
         year: int,
@@ -769,7 +837,7 @@ class APIClient:
         params = {'year': year, 'month': month, 'platform': platform, 'market': market}
         return self._make_request('GET', '/forecast/localities', params=params)
 
-    @cache_with_ttl(ttl=ForecastCacheConfig.CASCADE_TTL, key_prefix='cascade:worktypes')
+    @cache_with_ttl(ttl=ForecastCacheConfig.CASCADE_TTL, key_prefix='cascade:worktypes', tags=('forecast',))
     def get_forecast_worktypes(
         self,
         year: int,
@@ -811,7 +879,7 @@ class APIClient:
     # Execution Monitoring Methods
     # ============================================================================
 
-    @cache_with_ttl(ttl=30, key_prefix='execution_list')
+    @cache_with_ttl(ttl=30, key_prefix='execution_list', tags=('execution',))
     def get_executions(
         self,
         month: Optional[str] = None,
@@ -921,14 +989,15 @@ class APIClient:
 
         logger.debug(f"[Execution Details] Status: {status}, Cache TTL: {ttl}s")
 
-        @cache_with_ttl(ttl=ttl, key_prefix=f'execution_detail:{execution_id}')
-        def _get_cached_details():
+        # Same key as before ('execution_detail:<id>'), one metrics prefix for all executions
+        @cache_with_ttl(ttl=ttl, key_prefix='execution_detail')
+        def _get_cached_details(execution_id):
             return response
 
         logger.info(f"[Execution Details] Fetched execution {execution_id}")
-        return _get_cached_details()
+        return _get_cached_details(execution_id)
 
-    @cache_with_ttl(ttl=60, key_prefix='execution_kpi')
+    @cache_with_ttl(ttl=60, key_prefix='execution_kpi', tags=('execution',))
     def get_execution_kpis(
         self,
         month: Optional[str] = None,
@@ -1056,7 +1125,7 @@ class APIClient:
     # EDIT VIEW API METHODS
     # ============================================================
 
-    @cache_with_ttl(ttl=EditViewConfig.ALLOCATION_REPORTS_TTL, key_prefix='edit_view:reports')
+    @cache_with_ttl(ttl=EditViewConfig.ALLOCATION_REPORTS_TTL, key_prefix='edit_view:reports', tags=('forecast',))
     def get_allocation_reports(self) -> Dict:
         """
         Get available allocation reports for dropdown.
@@ -1079,7 +1148,7 @@ class APIClient:
         response = self._make_request('GET', endpoint)
         return response
 
-    @cache_with_ttl(ttl=EditViewConfig.PREVIEW_CACHE_TTL, key_prefix='edit_view:preview')
+    @cache_with_ttl(ttl=EditViewConfig.PREVIEW_CACHE_TTL, key_prefix='edit_view:preview', tags=('forecast', 'roster'))
     def get_bench_allocation_preview(self, month: str, year: int) -> Dict:
         """
         Calculate bench allocation preview (modified records only).
@@ -1200,13 +1269,38 @@ class APIClient:
             'user_notes': user_notes
         }
         response = self._make_request('POST', endpoint, data=data)
+
+        # Clear caches derived from this month's forecast after successful update
+        if response.get('success', True) and 'error' not in response:
+            self._invalidate_edited_period('Bench Allocation Update', month, year)
+
         return response
 
+    def _invalidate_edited_period(self, operation: str, month: str, year: int):
+        """
+        Invalidate cached forecast-derived data and history for an edited month.
+
+        Only entries tagged with the edited (month, year) and cross-period
+        entries are dropped; other months stay cached.
+
+        Args:
+            operation: Name used in log messages (e.g., 'CPH Update')
+            month: Month name (e.g., 'April')
+            year: Year (e.g., 2025)
+        """
+        try:
+            from centene_forecast_app.app_utils.cache_utils import invalidate_tags
+
+            cleared = invalidate_tags(('forecast', 'history'), month, year)
+            logger.info(f"[{operation}] Cleared {cleared} cache entries for {month} {year}")
+        except Exception as e:
+            logger.warning(f"[{operation}] Failed to clear caches: {e}")
+
     # ============================================================
     # TARGET CPH UPDATE METHODS
     # ============================================================
 
-    @cache_with_ttl(ttl=900, key_prefix='cph_data')  # 15 minutes
+    @cache_with_ttl(ttl=900, key_prefix='cph_data', tags=('forecast',))  # 15 minutes
     def get_target_cph_data(self, month: str, year: int) -> Dict:
         """
         Get CPH records for editing in Target CPH tab.
@@ -1243,7 +1337,7 @@ class APIClient:
         response = self._make_request('GET', endpoint, params=params)
         return response
 
-    @cache_with_ttl(ttl=300, key_prefix='cph_preview')  # 5 minutes
+    @cache_with_ttl(ttl=300, key_prefix='cph_preview', tags=('forecast',))  # 5 minutes
     def get_target_cph_preview(
         self,
         month: str,
@@ -1374,26 +1468,14 @@ class APIClient:
         timeout = 60  # Update timeout
         response = self._make_request('POST', endpoint, data=data, timeout=timeout)
 
-        # Clear CPH caches after successful update
-        try:
-            from centene_forecast_app.app_utils.cache_utils import delete_pattern
-
-            # Clear CPH data cache (get_target_cph_data)
-            cph_data_cleared = delete_pattern('cph_data:*')
-
-            # Clear CPH preview cache (get_target_cph_preview)
-            cph_preview_cleared = delete_pattern('cph_preview:*')
-
-            logger.info(
-                f"[CPH Update] Cleared {cph_data_cleared} CPH data cache entries "
-                f"and {cph_preview_cleared} CPH preview cache entries"
-            )
-        except Exception as e:
-            logger.warning(f"[CPH Update] Failed to clear CPH caches: {e}")
+        # Clear caches derived from this month's forecast after successful update
+        # (CPH data/preview, forecast records, summaries, edit previews, history)
+        if response.get('success', True) and 'error' not in response:
+            self._invalidate_edited_period('CPH Update', month, year)
 
         return response
 
-    @cache_with_ttl(ttl= EditViewConfig.HISTORY_CACHE_TTL, key_prefix='edit_view:history')
+    @cache_with_ttl(ttl= EditViewConfig.HISTORY_CACHE_TTL, key_prefix='edit_view:history', tags=('history',))
     def get_history_log(
         self,
         month: str = None,
@@ -1540,7 +1622,7 @@ class APIClient:
     # FORECAST REALLOCATION API METHODS
     # ============================================================
 
-    @cache_with_ttl(ttl=300, key_prefix='reallocation:filters')
+    @cache_with_ttl(ttl=300, key_prefix='reallocation:filters', tags=('forecast',))
     def get_reallocation_filter_options(self, month: str, year: int) -> Dict:
         """
         Get available filter options (LOBs, States, Case Types) for forecast reallocation.
@@ -1574,7 +1656,7 @@ class APIClient:
         logger.info(f"[Reallocation Filters] Retrieved filter options for {month} {year}")
         return response
 
-    @cache_with_ttl(ttl=900, key_prefix='reallocation:data')
+    @cache_with_ttl(ttl=900, key_prefix='reallocation:data', tags=('forecast',))
     def get_reallocation_data(
         self,
         month: str,
@@ -1742,26 +1824,10 @@ class APIClient:
         logger.info(f"[Reallocation Update] Submitting {len(modified_records)} records for {month} {year}")
         response = self._make_request('POST', endpoint, data=data, timeout=EditViewConfig.UPDATE_TIMEOUT_SECONDS)
 
-        # Clear reallocation caches after successful update
+        # Clear caches derived from this month's forecast after successful update
+        # (reallocation data/filters, bench allocation preview, forecast records, history)
         if response.get('success'):
-            try:
-                from centene_forecast_app.app_utils.cache_utils import delete_pattern
-
-                # Clear reallocation data cache
-                data_cleared = delete_pattern('reallocation:data:*')
-
-                # Clear reallocation filter cache
-                filter_cleared = delete_pattern('reallocation:filters:*')
-
-                # Also clear bench allocation preview since data changed
-                bench_cleared = delete_pattern('bench_allocation:*')
-
-                logger.info(
-                    f"[Reallocation Update] Cleared {data_cleared} data cache entries, "
-                    f"{filter_cleared} filter cache entries, {bench_cleared} bench allocation entries"
-                )
-            except Exception as e:
-                logger.warning(f"[Reallocation Update] Failed to clear caches: {e}")
+            self._invalidate_edited_period('Reallocation Update', month, year)
 
             records_updated = response.get('records_updated', 0)
             history_log_id = response.get('history_log_id', 'N/A')
@@ -2185,6 +2251,43 @@ class APIClient:
             f"/api/v1/forecasts/{forecast_id}/months/{month_key}/ramp/{encoded_name}",
         )
 
+    def revalidate(self, validators: List[Dict]) -> bool:
+        """
+        Check cached backend responses with conditional GETs.
+
+        Each recorded GET is re-sent with If-None-Match / If-Modified-Since;
+        the backend answers 304 Not Modified without a body when the data
+        is unchanged. Bodies of changed responses are never read - the
+        caller refetches them through the normal path.
+
+        Args:
+            validators: Recorded requests (url, accept, etag, last_modified),
+                        as stored by cache_with_ttl(..., revalidate=True)
+
+        Returns:
+            True only if every request was answered 304
+        """
+        def _not_modified(validator: Dict) -> bool:
+            headers = {'Accept': validator.get('accept') or self.headers.get('Accept', '*/*')}
+            if validator.get('etag'):
+                headers['If-None-Match'] = validator['etag']
+            if validator.get('last_modified'):
+                headers['If-Modified-Since'] = validator['last_modified']
+            try:
+                with self.session.get(validator['url'], headers=headers, timeout=self.timeout, stream=True) as response:
+                    return response.status_code == 304
+            except requests.RequestException as e:
+                logger.warning(f"[Revalidate] {validator['url']} failed: {e}")
+                return False
+
+        if not validators:
+            return False
+        if len(validators) == 1:
+            return _not_modified(validators[0])
+        workers = min(APIClientConfig.PAGE_FETCH_MAX_WORKERS, len(validators))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='api-revalidate') as executor:
+            return all(executor.map(_not_modified, validators))
+
     def close(self):
         """Close the session and cleanup resources."""
         self.session.close()
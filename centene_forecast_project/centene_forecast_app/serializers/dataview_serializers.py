@@ -109,6 +109,40 @@ class ForecastSerializer:
                 f"Failed to serialize {option_type} options"
             )
 
+    @staticmethod
+    def serialize_cascade_tree_response(tree: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Serialize the cascade option tree of a month for frontend.
+
+        Args:
+            tree: Tree from get_cascade_tree()
+
+        Returns:
+            JSON-ready dictionary with the nested options
+
+        Example:
+            {
+                'success': True,
+                'type': 'cascade_tree',
+                'year': 2025,
+                'month': 7,
+                'platforms': [{'value': 'Amisys', 'display': 'Amisys', 'markets': [...]}],
+                'count': 1,
+                'timestamp': '2025-10-22T15:30:00'
+            }
+        """
+        platforms = tree.get('platforms', [])
+        logger.debug(f"Serialized cascade tree response - {len(platforms)} platforms")
+        return {
+            'success': True,
+            'type': 'cascade_tree',
+            'year': tree.get('year'),
+            'month': tree.get('month'),
+            'platforms': platforms,
+            'count': len(platforms),
+            'timestamp': ForecastSerializer._get_timestamp()
+        }
+
     @staticmethod
     def serialize_error_response(
         error_message: str,
@@ -170,6 +204,11 @@ def serialize_cascade_response(
     return ForecastSerializer.serialize_cascade_response(options, option_type)
 
 
+def serialize_cascade_tree_response(tree: Dict[str, Any]) -> Dict[str, Any]:
+    """Serialize cascade option tree response"""
+    return ForecastSerializer.serialize_cascade_tree_response(tree)
+
+
 def serialize_error_response(
     error_message: str,
     status_code: int = 400
@@ -0,0 +1,255 @@
+"""
+Cache Change Event Service
+
+Backend-driven cache invalidation. The FastAPI backend (or any tool that
+writes to it) reports data changes as {domain, month, year} events, so
+cached entries are dropped as soon as the data changes instead of living
+out their TTL.
+
+Events arrive two ways:
+    - POST /api/cache/events/ (webhook): the receiving worker invalidates
+      the shared cache and forwards the event to the other workers
+    - the redis channel ForecastCacheConfig.CHANGE_EVENT_CHANNEL: every
+      worker's subscriber applies it
+
+Applying an event drops the cache_with_ttl entries tagged with the event's
+domains for (month, year) and the process-local chat filter caches
+(filter options, facet indexes and option matchers).
+
+Event format:
+    {"domain": "forecast", "month": 3, "year": 2025}
+    month (number or name) and year are optional; without a year the whole
+    domain is invalidated.
+"""
+
+import atexit
+import json
+import logging
+import threading
+import uuid
+from typing import Any, Dict, List, Optional
+
+from core.config import ForecastCacheConfig
+from centene_forecast_app.app_utils.cache_utils import (
+    _normalize_month,
+    _normalize_year,
+    get_shared_redis_client,
+    invalidate_tags,
+)
+
+logger = logging.getLogger('django')
+
+# Identifies events this process published, so its subscriber skips them
+_ORIGIN = uuid.uuid4().hex
+
+_subscriber: Optional['ChangeEventSubscriber'] = None
+_subscriber_lock = threading.Lock()
+
+
+# ===== EVENTS =====
+
+def parse_change_event(payload: Any) -> Dict:
+    """
+    Validate a change event.
+
+    Args:
+        payload: Decoded event ({'domain', 'month', 'year'})
+
+    Returns:
+        Normalized event: {'domain': str, 'month': int|None, 'year': int|None}
+
+    Raises:
+        ValueError: If the domain is unknown or month/year are invalid
+    """
+    if not isinstance(payload, dict):
+        raise ValueError('Change event must be a JSON object')
+
+    domain = payload.get('domain')
+    if domain not in ForecastCacheConfig.CHANGE_EVENT_DOMAINS:
+        known = ', '.join(sorted(ForecastCacheConfig.CHANGE_EVENT_DOMAINS))
+        raise ValueError(f"Unknown domain '{domain}' (expected one of: {known})")
+
+    month, year = payload.get('month'), payload.get('year')
+    normalized_month = _normalize_month(month)
+    normalized_year = _normalize_year(year)
+    if month not in (None, '') and normalized_month is None:
+        raise ValueError(f"Invalid month: {month}")
+    if year not in (None, '') and normalized_year is None:
+        raise ValueError(f"Invalid year: {year}")
+    if normalized_month is not None and normalized_year is None:
+        raise ValueError('month requires year')
+
+    return {'domain': domain, 'month': normalized_month, 'year': normalized_year}
+
+
+def apply_change_event(event: Dict, shared: bool = True) -> int:
+    """
+    Invalidate the caches affected by one change event in this process.
+
+    Args:
+        event: Event from parse_change_event()
+        shared: Also invalidate the cache_with_ttl entries. False when
+                another worker already did so on the shared redis cache.
+
+    Returns:
+        Number of cache entries deleted
+    """
+    domains = ForecastCacheConfig.CHANGE_EVENT_DOMAINS[event['domain']]
+    month, year = event['month'], event['year']
+
+    deleted = invalidate_tags(domains, month, year) if shared else 0
+    if 'forecast' in domains:
+        _invalidate_filter_options(month, year)
+
+    logger.info(
+        f"[Cache Events] {event['domain']} changed ({month or '*'}/{year or '*'}): "
+        f"invalidated {', '.join(domains)}"
+    )
+    return deleted
+
+
+def handle_change_events(events: List[Dict]) -> int:
+    """
+    Apply change events received by this worker and forward them to the others.
+
+    Returns:
+        Number of cache entries deleted
+    """
+    deleted = sum(apply_change_event(event) for event in events)
+    for event in events:
+        publish_change_event(event, applied=True)
+    return deleted
+
+
+def publish_change_event(event: Dict, applied: bool = False) -> bool:
+    """
+    Publish an event to every worker's subscriber.
+
+    Args:
+        event: Event from parse_change_event()
+        applied: The shared cache was already invalidated; subscribers
+                 only clear their process-local caches
+
+    Returns:
+        True if published (False without a redis cache backend)
+    """
+    try:
+        client = get_shared_redis_client()
+        if client is None:
+            return False
+        message = json.dumps({**event, 'origin': _ORIGIN, 'applied': applied})
+        client.publish(ForecastCacheConfig.CHANGE_EVENT_CHANNEL, message)
+        return True
+    except Exception as e:
+        logger.warning(f"[Cache Events] Failed to publish change event: {e}")
+        return False
+
+
+def _invalidate_filter_options(month: Optional[int], year: Optional[int]) -> None:
+    """Drop the chat filter caches (options, facet indexes, matchers) for the period (all periods without one)."""
+    try:
+        from chat_app.utils.filter_cache import invalidate_filter_caches
+        invalidate_filter_caches(month, year)
+    except ImportError:
+        logger.debug("Filter cache not available (chat_app not installed)")
+    except Exception as e:
+        logger.warning(f"[Cache Events] Failed to clear filter cache: {e}")
+
+
+# ===== SUBSCRIBER =====
+
+class ChangeEventSubscriber(threading.Thread):
+    """
+    Daemon thread applying change events published on the redis channel.
+
+    Reconnects after redis errors; since events sent while disconnected
+    are lost, the process-local filter options cache is cleared on every
+    reconnect.
+    """
+
+    def __init__(self, client, channel: str = None):
+        super().__init__(name='cache-change-events', daemon=True)
+        self.client = client
+        self.channel = channel or ForecastCacheConfig.CHANGE_EVENT_CHANNEL
+        self.subscribed = threading.Event()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        reconnecting = False
+        while not self._stop_event.is_set():
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(self.channel)
+                if reconnecting:
+                    _invalidate_filter_options(None, None)
+                self.subscribed.set()
+                logger.info(f"[Cache Events] Subscribed to {self.channel}")
+                while not self._stop_event.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get('type') == 'message':
+                        self.handle_message(message['data'])
+            except Exception as e:
+                self.subscribed.clear()
+                reconnecting = True
+                logger.warning(f"[Cache Events] Subscriber error, reconnecting: {e}")
+                self._stop_event.wait(ForecastCacheConfig.CHANGE_EVENT_RECONNECT_DELAY)
+            finally:
+                try:
+                    pubsub.close()
+                except Exception:
+                    pass
+
+    def handle_message(self, data) -> None:
+        """Apply one published event, unless this process published it."""
+        try:
+            payload = json.loads(data)
+            if payload.get('origin') == _ORIGIN:
+                return
+            apply_change_event(parse_change_event(payload), shared=not payload.get('applied'))
+        except (ValueError, TypeError) as e:
+            logger.warning(f"[Cache Events] Ignoring invalid change event {data!r}: {e}")
+        except Exception as e:
+            logger.error(f"[Cache Events] Failed to apply change event {data!r}: {e}")
+
+    def stop(self, timeout: float = 5.0):
+        self._stop_event.set()
+        self.join(timeout)
+
+
+def start_change_event_subscriber() -> Optional[ChangeEventSubscriber]:
+    """
+    Start this process's change event subscriber (once).
+
+    Called from the WSGI/ASGI entry points. Does nothing unless change
+    events are enabled and the cache is redis-backed; with a per-process
+    cache there are no other workers to notify.
+
+    Returns:
+        The running subscriber, or None
+    """
+    global _subscriber
+    if not ForecastCacheConfig.ENABLE_CHANGE_EVENTS:
+        return None
+    with _subscriber_lock:
+        if _subscriber is not None:
+            return _subscriber
+        try:
+            client = get_shared_redis_client()
+        except Exception as e:
+            logger.warning(f"[Cache Events] Redis not available, subscriber not started: {e}")
+            return None
+        if client is None:
+            return None
+        _subscriber = ChangeEventSubscriber(client)
+        _subscriber.start()
+        atexit.register(stop_change_event_subscriber)
+        return _subscriber
+
+
+def stop_change_event_subscriber() -> None:
+    """Stop the subscriber; the next start creates a new one."""
+    global _subscriber
+    with _subscriber_lock:
+        subscriber, _subscriber = _subscriber, None
+    if subscriber is not None:
+        subscriber.stop()
@@ -0,0 +1,265 @@
+"""
+Cache Warm-up Service
+
+Prefetches what the data view needs for the active report months so the
+first user after a deploy, clear_all_caches() or an upload is served from
+cache:
+
+    filter years -> months -> platforms -> markets -> localities -> worktypes
+    the whole cascade tree of each month (built from the levels above)
+    roster / forecast model schemas
+    summary tables
+
+Every call goes through the cached APIClient methods with the same
+arguments the views use, so the entries land under the keys the views read.
+Requests run on a bounded thread pool; each level of the cascade is
+submitted as soon as its parent has answered. The cascade trees are built
+last, from the level entries just cached, so they cost no extra requests.
+
+Used by POST /api/cache/warm/ (start_background_warmup, inside the server
+process), by `python manage.py warm_caches` (redis cache backend only)
+and, with CacheWarmupConfig.WARM_AFTER_UPLOAD, by upload jobs.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from core.config import CacheWarmupConfig, ForecastCacheConfig
+from core.constants import SUMMARY_TYPES
+from centene_forecast_app.app_utils.api_utils import is_api_error
+from centene_forecast_app.repository import get_api_client
+from centene_forecast_app.services.dataview_service import load_cascade_tree
+
+logger = logging.getLogger('django')
+
+ROSTER_TYPES = ('roster', 'prod_team_roster')
+
+# One background warm-up per process at a time
+_background_lock = threading.Lock()
+
+
+class WarmupTask(NamedTuple):
+    """One cached APIClient call; expand(result) yields the next cascade level."""
+    name: str
+    call: Callable[[], Any]
+    expand: Optional[Callable[[Any], List['WarmupTask']]] = None
+
+
+def active_report_months(today: Optional[date] = None, months_ahead: Optional[int] = None) -> List[Tuple[int, int]]:
+    """
+    The current report month and the months_ahead after it.
+
+    Returns:
+        List of (month, year), e.g. [(12, 2025), (1, 2026)]
+    """
+    today = today or date.today()
+    months_ahead = CacheWarmupConfig.MONTHS_AHEAD if months_ahead is None else months_ahead
+    periods = []
+    for offset in range(months_ahead + 1):
+        index = today.month - 1 + offset
+        periods.append((index % 12 + 1, today.year + index // 12))
+    return periods
+
+
+def warm_caches(
+    periods: Optional[Iterable[Tuple[int, int]]] = None,
+    include_schemas: Optional[bool] = None,
+    include_summaries: Optional[bool] = None,
+    max_workers: Optional[int] = None,
+    client=None
+) -> Dict:
+    """
+    Prefetch the cascade levels and tree, schemas and summaries for report months.
+
+    Args:
+        periods: (month, year) pairs (default: active_report_months()).
+                 Months the backend does not list are skipped.
+        include_schemas: Warm model schemas (default: CacheWarmupConfig)
+        include_summaries: Warm summary tables (default: CacheWarmupConfig)
+        max_workers: Concurrent requests (default: CacheWarmupConfig.MAX_WORKERS)
+        client: APIClient (default: the shared instance)
+
+    Returns:
+        {
+            'periods': [[3, 2025]],   # periods that were warmed
+            'warmed': 42,             # cache entries now populated
+            'failed': 0,              # calls that returned an error
+            'duration_seconds': 1.8
+        }
+    """
+    started = time.perf_counter()
+    client = client or get_api_client()
+    periods = sorted(set(periods or active_report_months()), key=lambda period: (period[1], period[0]))
+    include_schemas = CacheWarmupConfig.INCLUDE_SCHEMAS if include_schemas is None else include_schemas
+    include_summaries = CacheWarmupConfig.INCLUDE_SUMMARIES if include_summaries is None else include_summaries
+    warmed_periods = []
+
+    def _months_task(year: int) -> WarmupTask:
+        def _expand(months) -> List[WarmupTask]:
+            available = {str(option.get('value')) for option in months if isinstance(option, dict)}
+            tasks = []
+            for month, period_year in periods:
+                if period_year == year and str(month) in available:
+                    warmed_periods.append([month, year])
+                    tasks.extend(_period_tasks(client, month, year, include_schemas, include_summaries))
+                elif period_year == year:
+                    logger.info(f"[Cache Warmup] Skipping {month}/{year}: no data on the backend")
+            return tasks
+        return WarmupTask(f'months:{year}', lambda: client.get_forecast_months_for_year(year), _expand)
+
+    roots = [
+        WarmupTask('years', client.get_forecast_filter_years),
+        WarmupTask('roster_years', client.get_roster_filter_years),
+    ]
+    roots.extend(_months_task(year) for year in sorted({year for _, year in periods}))
+
+    max_workers = max_workers or CacheWarmupConfig.MAX_WORKERS
+    warmed, failed = _run(roots, max_workers)
+    if ForecastCacheConfig.SERVE_CASCADE_FROM_TREE and warmed_periods:
+        # The dropdowns read the whole tree first; without it the first
+        # load after an upload falls back to per-level requests
+        tree_warmed, tree_failed = _run([
+            WarmupTask(f'cascade_tree:{month}:{year}', lambda month=month, year=year: load_cascade_tree(year, month))
+            for month, year in warmed_periods
+        ], max_workers)
+        warmed += tree_warmed
+        failed += tree_failed
+
+    result = {
+        'periods': sorted(warmed_periods, key=lambda period: (period[1], period[0])),
+        'warmed': warmed,
+        'failed': failed,
+        'duration_seconds': round(time.perf_counter() - started, 3),
+    }
+    logger.info(
+        f"[Cache Warmup] Warmed {warmed} entries for {result['periods']} "
+        f"in {result['duration_seconds']}s ({failed} failed)"
+    )
+    return result
+
+
+def start_background_warmup(periods: Optional[Iterable[Tuple[int, int]]] = None, **options) -> Optional[threading.Thread]:
+    """
+    Run warm_caches() on a background thread of this process.
+
+    Args:
+        periods: (month, year) pairs (default: active_report_months())
+        **options: Passed on to warm_caches()
+
+    Returns:
+        The started thread, or None if a warm-up is already running
+    """
+    if not _background_lock.acquire(blocking=False):
+        return None
+
+    def _run_warmup():
+        try:
+            warm_caches(periods, **options)
+        except Exception as e:
+            logger.error(f"[Cache Warmup] Background warm-up failed: {e}")
+        finally:
+            _background_lock.release()
+
+    thread = threading.Thread(target=_run_warmup, name='cache-warmup', daemon=True)
+    thread.start()
+    return thread
+
+
+def _period_tasks(client, month: int, year: int, include_schemas: bool, include_summaries: bool) -> List[WarmupTask]:
+    """Root tasks of one report month: the platform cascade, schemas and summaries."""
+    def _platforms(platforms) -> List[WarmupTask]:
+        return [
+            WarmupTask(
+                f'markets:{platform}',
+                lambda platform=platform: client.get_forecast_markets(year, month, platform),
+                lambda markets, platform=platform: _markets(platform, markets)
+            )
+            for platform in _option_values(platforms)
+        ]
+
+    def _markets(platform: str, markets) -> List[WarmupTask]:
+        return [
+            WarmupTask(
+                f'localities:{platform}:{market}',
+                lambda market=market: client.get_forecast_localities(year, month, platform, market),
+                lambda localities, market=market: _localities(platform, market, localities)
+            )
+            for market in _option_values(markets)
+        ]
+
+    def _localities(platform: str, market: str, localities) -> List[WarmupTask]:
+        # '' is the "All localities" option: worktypes without a locality
+        tasks = []
+        for locality in [None] + _option_values(localities):
+            tasks.append(WarmupTask(
+                f'worktypes:{platform}:{market}:{locality or "all"}',
+                lambda locality=locality: client.get_forecast_worktypes(year, month, platform, market, locality)
+            ))
+            if include_schemas:
+                # main_lob as data_view builds it from the dropdown values
+                main_lob = ' '.join(part for part in (platform, market, locality) if part)
+                tasks.append(WarmupTask(
+                    f'schema:forecast:{main_lob}',
+                    lambda main_lob=main_lob: client.get_forecast_model_schema(month, year, main_lob, '')
+                ))
+        return tasks
+
+    tasks = [WarmupTask(f'platforms:{month}:{year}', lambda: client.get_forecast_platforms(year, month), _platforms)]
+    if include_schemas:
+        tasks.extend(
+            WarmupTask(
+                f'schema:{roster_type}:{month}:{year}',
+                lambda roster_type=roster_type: client.get_roster_model_schema(roster_type, month, year)
+            )
+            for roster_type in ROSTER_TYPES
+        )
+    if include_summaries:
+        tasks.extend(
+            WarmupTask(
+                f'summary:{summary_type}:{month}:{year}',
+                lambda summary_type=summary_type: client.get_table_summary(summary_type, month, year)
+            )
+            for summary_type in SUMMARY_TYPES
+        )
+    return tasks
+
+
+def _option_values(options) -> List[str]:
+    """Non-empty 'value's of a dropdown option list."""
+    if not isinstance(options, list):
+        return []
+    return [str(option['value']) for option in options if isinstance(option, dict) and option.get('value')]
+
+
+def _is_failed(result: Any) -> bool:
+    return result is None or is_api_error(result) or (isinstance(result, dict) and 'error' in result)
+
+
+def _run(roots: List[WarmupTask], max_workers: int) -> Tuple[int, int]:
+    """Run tasks on a bounded pool, submitting each task's children as it completes."""
+    warmed = failed = 0
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='cache-warmup') as executor:
+        pending = {executor.submit(task.call): task for task in roots}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                task = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.warning(f"[Cache Warmup] {task.name} failed: {e}")
+                    failed += 1
+                    continue
+                if _is_failed(result):
+                    logger.warning(f"[Cache Warmup] {task.name} returned an error: {result}")
+                    failed += 1
+                    continue
+                warmed += 1
+                if task.expand:
+                    for child in task.expand(result):
+                        pending[executor.submit(child.call)] = child
+    return warmed, failed
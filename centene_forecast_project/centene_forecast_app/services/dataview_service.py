@@ -3,10 +3,19 @@ Data View Service Layer
 
 Business logic for data view cascading dropdowns and filter management.
 Handles interactions with repository layer and data transformations.
+
+The platform -> market -> locality -> worktype options of one month form a
+cascade tree. It is built once per month with parallel backend requests and
+cached as a whole (get_cascade_tree); the per-level functions answer from an
+already cached tree when ForecastCacheConfig.SERVE_CASCADE_FROM_TREE is set,
+and otherwise fetch their level and start building the tree in the background.
 """
 
 import logging
-from typing import Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 from centene_forecast_app.repository import (
     get_forecast_filter_years,
     get_forecast_months_for_year,
@@ -16,9 +25,214 @@ from centene_forecast_app.repository import (
     get_forecast_worktypes
 )
 from centene_forecast_app.app_utils.api_utils import is_api_error
+from centene_forecast_app.app_utils.cache_utils import cache_with_ttl, peek_cached
+from core.config import ForecastCacheConfig
 
 logger = logging.getLogger('django')
 
+# Child option lists of each tree level (stripped when serving one level)
+_TREE_CHILD_KEYS = ('markets', 'localities', 'worktypes')
+_TREE_KEY_PREFIX = 'cascade:tree'
+
+# (year, month) -> monotonic time until which a failed tree build is not retried
+_tree_failures: Dict[Tuple[int, int], float] = {}
+# (year, month) -> thread building that tree in the background
+_tree_builds: Dict[Tuple[int, int], threading.Thread] = {}
+_tree_lock = threading.Lock()
+
+
+@cache_with_ttl(ttl=ForecastCacheConfig.CASCADE_TTL, key_prefix=_TREE_KEY_PREFIX, tags=('forecast',))
+def get_cascade_tree(year: int, month: int) -> Dict[str, Any]:
+    """
+    Get the whole cascade option tree for a year/month.
+
+    Each level is fetched through the per-level repository calls (and their
+    caches); all requests of a level run in parallel, so the tree costs one
+    round trip per level instead of one per dropdown selection.
+
+    Args:
+        year: Selected year
+        month: Selected month (1-12)
+
+    Returns:
+        {
+            'year': 2025,
+            'month': 7,
+            'platforms': [{
+                'value': 'Amisys', 'display': 'Amisys',
+                'markets': [{
+                    'value': 'Medicaid', 'display': 'Medicaid',
+                    'localities': [{'value': '', 'display': '-- All Localities --'}, ...],
+                    'worktypes': {          # by locality value, '' = all localities
+                        '': [{'value': 'Claims', 'display': 'Claims Processing'}],
+                        'Domestic': [...]
+                    }
+                }]
+            }]
+        }
+        or {'success': False, 'error': ...} (not cached) if any request failed
+    """
+    platforms = get_forecast_platforms(year, month)
+    if is_api_error(platforms):
+        return _tree_error('platforms', platforms)
+
+    platform_nodes = [dict(option) for option in _options(platforms)]
+    workers = ForecastCacheConfig.CASCADE_TREE_MAX_WORKERS
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='cascade-tree') as executor:
+        markets = list(executor.map(
+            lambda node: get_forecast_markets(year, month, node['value']), platform_nodes
+        ))
+        market_nodes = []
+        for platform_node, platform_markets in zip(platform_nodes, markets):
+            if is_api_error(platform_markets):
+                return _tree_error('markets', platform_markets)
+            platform_node['markets'] = [dict(option) for option in _options(platform_markets)]
+            market_nodes.extend((platform_node['value'], node) for node in platform_node['markets'])
+
+        localities = list(executor.map(
+            lambda item: get_forecast_localities(year, month, item[0], item[1]['value']), market_nodes
+        ))
+        worktype_requests = []
+        for (platform, market_node), market_localities in zip(market_nodes, localities):
+            if is_api_error(market_localities):
+                return _tree_error('localities', market_localities)
+            market_node['localities'] = _options(market_localities)
+            market_node['worktypes'] = {}
+            locality_values = [''] + [
+                str(option['value']) for option in market_node['localities'] if option.get('value')
+            ]
+            worktype_requests.extend((platform, market_node, locality) for locality in locality_values)
+
+        worktypes = list(executor.map(
+            lambda item: get_forecast_worktypes(year, month, item[0], item[1]['value'], item[2] or None),
+            worktype_requests
+        ))
+        for (_, market_node, locality), locality_worktypes in zip(worktype_requests, worktypes):
+            if is_api_error(locality_worktypes):
+                return _tree_error('worktypes', locality_worktypes)
+            market_node['worktypes'][locality] = _options(locality_worktypes)
+
+    logger.debug(
+        f"Built cascade tree for {month}/{year}: {len(platform_nodes)} platforms, "
+        f"{len(market_nodes)} markets, {len(worktype_requests)} worktype lists"
+    )
+    return {'year': year, 'month': month, 'platforms': platform_nodes}
+
+
+def load_cascade_tree(year: int, month: int) -> Dict[str, Any]:
+    """
+    get_cascade_tree() that does not retry a recently failed build.
+
+    A failed tree is not cached, so it is remembered here for
+    ForecastCacheConfig.CASCADE_TREE_FAILURE_TTL seconds instead.
+
+    Args:
+        year: Selected year
+        month: Selected month (1-12)
+
+    Returns:
+        Tree as returned by get_cascade_tree(), or {'success': False, 'error': ...}
+    """
+    period = (year, month)
+    with _tree_lock:
+        failed_until = _tree_failures.get(period, 0.0)
+    if failed_until > time.monotonic():
+        return {'success': False, 'error': 'Cascade tree build failed recently'}
+
+    try:
+        tree = get_cascade_tree(year, month)
+    except Exception as e:
+        logger.error(f"Failed to build cascade tree for {month}/{year}: {e}")
+        tree = {'success': False, 'error': str(e)}
+
+    with _tree_lock:
+        if is_api_error(tree):
+            _tree_failures[period] = time.monotonic() + ForecastCacheConfig.CASCADE_TREE_FAILURE_TTL
+        else:
+            _tree_failures.pop(period, None)
+    return tree
+
+
+def start_cascade_tree_build(year: int, month: int) -> Optional[threading.Thread]:
+    """
+    Build (and cache) the cascade tree of a month on a background thread.
+
+    Returns:
+        The started thread, or None if the tree is already being built or
+        its last build failed recently
+    """
+    period = (year, month)
+    with _tree_lock:
+        if period in _tree_builds or _tree_failures.get(period, 0.0) > time.monotonic():
+            return None
+        thread = threading.Thread(
+            target=_build_tree_in_background, args=period, name=f'cascade-tree-{year}-{month}', daemon=True
+        )
+        _tree_builds[period] = thread
+    thread.start()
+    return thread
+
+
+def _build_tree_in_background(year: int, month: int):
+    try:
+        load_cascade_tree(year, month)
+    finally:
+        with _tree_lock:
+            _tree_builds.pop((year, month), None)
+
+
+def _options(options: Any) -> List[Dict[str, Any]]:
+    return options if isinstance(options, list) else []
+
+
+def _tree_error(level: str, response: Dict) -> Dict[str, Any]:
+    logger.error(f"API error building cascade tree ({level}): {response.get('error')}")
+    return {'success': False, 'error': response.get('error') or f'Failed to fetch {level}'}
+
+
+def _find_node(nodes: List[Dict], value: str) -> Optional[Dict]:
+    return next((node for node in nodes if str(node.get('value')) == str(value)), None)
+
+
+def _level_options(nodes: List[Dict]) -> List[Dict[str, Any]]:
+    """Options of one level, without their child lists."""
+    return [{k: v for k, v in node.items() if k not in _TREE_CHILD_KEYS} for node in nodes]
+
+
+def _tree_lookup(year: int, month: int, *path: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Options below a (platform, market, locality) path of the cascade tree.
+
+    Only a tree that is already cached is used; the caller is never blocked
+    on building one. On a miss the build starts in the background, so the
+    next dropdown level can be answered from it.
+
+    Returns:
+        Option list (empty if the path does not exist), or None when the
+        tree is disabled or not cached yet - callers then fetch the level
+        on its own.
+    """
+    if not (ForecastCacheConfig.SERVE_CASCADE_FROM_TREE and ForecastCacheConfig.ENABLE_CACHING):
+        return None
+    tree = peek_cached(_TREE_KEY_PREFIX, year, month)
+    if not isinstance(tree, dict) or 'platforms' not in tree:
+        start_cascade_tree_build(year, month)
+        return None
+
+    if not path:
+        return _level_options(tree['platforms'])
+    platform = _find_node(tree['platforms'], path[0])
+    if platform is None:
+        return []
+    if len(path) == 1:
+        return _level_options(platform['markets'])
+    market = _find_node(platform['markets'], path[1])
+    if market is None:
+        return []
+    if len(path) == 2:
+        return _level_options(market['localities'])
+    return market['worktypes'].get(path[2] or '', [])
+
 
 class ForecastFilterService:
     """
@@ -123,6 +337,10 @@ class ForecastFilterService:
         logger.info(f"Fetching platforms for year: {year}, month: {month}")
 
         try:
+            from_tree = _tree_lookup(year, month)
+            if from_tree is not None:
+                return from_tree
+
             platforms = get_forecast_platforms(year, month)
 
             # Handle API error response
@@ -165,6 +383,10 @@ class ForecastFilterService:
         )
 
         try:
+            from_tree = _tree_lookup(year, month, platform)
+            if from_tree is not None:
+                return from_tree
+
             markets = get_forecast_markets(year, month, platform)
 
             # Handle API error response
@@ -211,6 +433,10 @@ class ForecastFilterService:
         )
 
         try:
+            from_tree = _tree_lookup(year, month, platform, market)
+            if from_tree is not None:
+                return from_tree
+
             localities = get_forecast_localities(year, month, platform, market)
 
             # Handle API error response
@@ -262,6 +488,10 @@ class ForecastFilterService:
         )
 
         try:
+            from_tree = _tree_lookup(year, month, platform, market, locality)
+            if from_tree is not None:
+                return from_tree
+
             worktypes = get_forecast_worktypes(
                 year, month, platform, market, locality
             )
@@ -8,10 +8,58 @@ Handles KPI calculations using ManagerViewConfig settings.
 import logging
 from typing import Dict, List, Optional
 from core.config import ManagerViewConfig
+from centene_forecast_app.app_utils.api_utils import is_api_error
+from centene_forecast_app.app_utils.cache_utils import cache_with_ttl
 from centene_forecast_app.repository import get_api_client
 
 logger = logging.getLogger('django')
 
+ROLLUP_METRICS = ('cf', 'hc', 'cap', 'gap')
+
+
+def build_month_rollups(data: Dict) -> Dict[str, Dict[str, int]]:
+    """
+    Sum top-level category values per displayed month.
+
+    Each top-level category's data already includes the sum of its children,
+    so only level-1 categories are added (recursing would double-count).
+
+    Args:
+        data: Manager view payload with 'months' and 'categories'
+
+    Returns:
+        {month: {'cf': ..., 'hc': ..., 'cap': ..., 'gap': ...}} for every month
+    """
+    rollups = {month: dict.fromkeys(ROLLUP_METRICS, 0) for month in data['months']}
+    for cat in data['categories']:
+        for month, totals in rollups.items():
+            month_data = cat['data'].get(month)
+            if month_data:
+                for metric in ROLLUP_METRICS:
+                    totals[metric] += month_data[metric]
+    return rollups
+
+
+@cache_with_ttl(ttl=ManagerViewConfig.MANAGER_DATA_TTL, key_prefix='manager_view:rollups', tags=('forecast',))
+def get_manager_view_rollups(report_month: str, category: Optional[str] = None) -> Dict:
+    """
+    Per-month KPI rollups for one report month and category.
+
+    Built from the same cached payload manager_view_data_api serves
+    (APIClient.get_manager_view_data), so a dashboard render fetches the
+    hierarchy from the backend once for both the table and the KPI cards.
+
+    Returns:
+        {'months': [...], 'totals': {month: {'cf', 'hc', 'cap', 'gap'}}}
+
+    Raises:
+        ValueError: If the backend returned an error response
+    """
+    data = get_api_client().get_manager_view_data(report_month, category)
+    if is_api_error(data):
+        raise ValueError(data['error'])
+    return {'months': list(data['months']), 'totals': build_month_rollups(data)}
+
 
 class ManagerViewService:
     """
@@ -21,16 +69,23 @@ class ManagerViewService:
     """
     
     @staticmethod
-    def calculate_kpi_data(report_month: str, category: Optional[str] = None) -> Dict:
+    def calculate_kpi_data(
+        report_month: str,
+        category: Optional[str] = None,
+        kpi_index: Optional[int] = None
+    ) -> Dict:
         """
         Calculate KPI summary card data for the specified report month.
         
         Uses ManagerViewConfig.KPI_MONTH_INDEX to determine which month's data
         to display in the summary cards (default: index 1 = second displayed month).
+        Totals come from the cached per-month rollups (get_manager_view_rollups),
+        so any month index is served without another backend call.
         
         Args:
             report_month: Report month in YYYY-MM format (e.g., '2025-02')
             category: Optional category filter (e.g., 'amisys-onshore')
+            kpi_index: Optional month index overriding KPI_MONTH_INDEX
             
         Returns:
             Dictionary containing KPI data:
@@ -57,46 +112,34 @@ class ManagerViewService:
             f"Calculating KPI data - report_month: {report_month}, category: {category or 'all'}"
         )
         
-        # Get data from API client (currently using mock data)
+        # Get per-month rollups (shared with the data endpoint's cached payload)
         try:
-            client = get_api_client()
-            data = client.get_manager_view_data(report_month, category)
+            rollups = get_manager_view_rollups(report_month, category)
         except ValueError as e:
             logger.error(f"Failed to get manager view data: {str(e)}")
             raise
         
         # Get KPI month index from config (default: 1 = second month)
-        kpi_index = ManagerViewConfig.KPI_MONTH_INDEX
+        if kpi_index is None:
+            kpi_index = ManagerViewConfig.KPI_MONTH_INDEX
         
         # Validate index is within range
-        if kpi_index >= len(data['months']):
+        if kpi_index >= len(rollups['months']):
             logger.warning(
                 f"KPI_MONTH_INDEX ({kpi_index}) exceeds available months "
-                f"({len(data['months'])}). Using first month instead."
+                f"({len(rollups['months'])}). Using first month instead."
             )
             kpi_index = 0
         
         # Get the KPI month
-        kpi_month = data['months'][kpi_index]
+        kpi_month = rollups['months'][kpi_index]
         logger.debug(f"Using KPI month: {kpi_month} (index {kpi_index})")
         
-        # Calculate totals across all TOP-LEVEL categories for the KPI month
-        # Note: Each top-level category's data already includes the sum of its children,
-        # so we don't need to recursively sum children (that would be double-counting)
-        total_cf = 0
-        total_hc = 0
-        total_cap = 0
-        total_gap = 0
-        
-        # Only sum level-1 (top-level) categories
-        # Their data already contains aggregated values from all descendants
-        for cat in data['categories']:
-            if kpi_month in cat['data']:
-                month_data = cat['data'][kpi_month]
-                total_cf += month_data['cf']
-                total_hc += month_data['hc']
-                total_cap += month_data['cap']
-                total_gap += month_data['gap']
+        totals = rollups['totals'][kpi_month]
+        total_cf = totals['cf']
+        total_hc = totals['hc']
+        total_cap = totals['cap']
+        total_gap = totals['gap']
         
         # Format KPI month display name
         kpi_month_display = ManagerViewService._format_month_display(kpi_month)
@@ -192,10 +235,10 @@ class ManagerViewService:
 
 
 # Convenience function for backward compatibility
-def calculate_kpi_data(report_month: str, category: Optional[str] = None) -> Dict:
+def calculate_kpi_data(report_month: str, category: Optional[str] = None, kpi_index: Optional[int] = None) -> Dict:
     """Convenience function to calculate KPI data"""
     service = ManagerViewService()
-    return service.calculate_kpi_data(report_month, category)
+    return service.calculate_kpi_data(report_month, category, kpi_index)
 
 
 def get_filter_options() -> Dict[str, List[Dict[str, str]]]:
@@ -0,0 +1,336 @@
+"""
+Upload Job Service
+
+Runs file uploads as background jobs so upload_view can answer straight
+away instead of holding a request worker for the whole transfer.
+
+A job is an UploadedFile row. upload_view copies the file to the spool
+directory and submits the job to a local worker pool; the worker streams
+the file to the backend, records progress on the row, then invalidates the
+affected caches as a post-completion stage. The upload page polls
+check_progress for status, progress and the final message. With
+CacheWarmupConfig.WARM_AFTER_UPLOAD the uploaded month is warmed again
+once the job has completed.
+
+Stages (UploadedFile.status):
+    pending -> uploading -> invalidating -> completed
+                        \\-> error
+"""
+
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from typing import Callable, Dict, Optional, Tuple
+
+from django.core.files import File
+from django.db import close_old_connections, connection
+from django.utils import timezone
+
+from core.config import CacheWarmupConfig, ForecastCacheConfig, UploadJobConfig
+from core.models import UploadedFile
+from centene_forecast_app.app_utils.auth import get_display_name
+from centene_forecast_app.app_utils.cache_utils import invalidate_tags
+from centene_forecast_app.app_utils.file_utils import get_upload_period, log_upload_progress
+from centene_forecast_app.repository import get_api_client
+from centene_forecast_app.services.cache_warmup_service import warm_caches
+
+logger = logging.getLogger('django')
+
+# file type (upload form 'filetype') -> APIClient upload method
+UPLOAD_METHODS: Dict[str, str] = {
+    'roster': 'upload_roster_file',
+    'forecast': 'upload_forecast_file',
+    'prod_team_roster': 'upload_prod_team_roster_file',
+    'altered_forecast': 'upload_altered_forecast_file',
+}
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_futures: Dict[int, Future] = {}
+
+
+def get_upload_executor() -> ThreadPoolExecutor:
+    """Process-wide worker pool for upload jobs (created on first use)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=UploadJobConfig.MAX_WORKERS,
+                thread_name_prefix='upload-job'
+            )
+        return _executor
+
+
+def shutdown_upload_executor(wait: bool = True) -> None:
+    """Stop the worker pool; a new one is created on the next submit."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+# ===== SUBMISSION =====
+
+def spool_upload(uploaded_file) -> str:
+    """
+    Copy an uploaded file into the spool directory, chunk by chunk.
+
+    Returns:
+        Path of the spooled copy
+    """
+    os.makedirs(UploadJobConfig.SPOOL_DIR, exist_ok=True)
+    suffix = os.path.splitext(uploaded_file.name)[1]
+    fd, path = tempfile.mkstemp(prefix='upload_', suffix=suffix, dir=UploadJobConfig.SPOOL_DIR)
+    with os.fdopen(fd, 'wb') as spool:
+        for chunk in uploaded_file.chunks():
+            spool.write(chunk)
+    return path
+
+
+def submit_upload_job(uploaded_file, file_type: str, user) -> UploadedFile:
+    """
+    Create an upload job and queue it on the worker pool.
+
+    Args:
+        uploaded_file: Django UploadedFile from request.FILES
+        file_type: One of UPLOAD_METHODS
+        user: Requesting user (owner of the job)
+
+    Returns:
+        The pending UploadedFile job
+
+    Raises:
+        ValueError: If file_type is not supported
+    """
+    if file_type not in UPLOAD_METHODS:
+        raise ValueError(f"Unsupported file type: {file_type}")
+
+    spool_path = spool_upload(uploaded_file)
+    try:
+        job = UploadedFile.objects.create(
+            filename=uploaded_file.name,
+            file_type=file_type,
+            spool_path=spool_path,
+            uploaded_by=user if getattr(user, 'pk', None) else None,
+        )
+    except Exception:
+        _remove_spool(spool_path)
+        raise
+
+    _futures[job.id] = get_upload_executor().submit(run_upload_job, job.id)
+    _futures[job.id].add_done_callback(lambda _: _futures.pop(job.id, None))
+    logger.info("Queued upload job %s: %s (%s)", job.id, job.filename, file_type)
+    return job
+
+
+def wait_for_upload_job(job_id: int, timeout: Optional[float] = None) -> UploadedFile:
+    """Block until a job submitted by this process has finished; returns the job."""
+    future = _futures.get(job_id)
+    if future is not None:
+        future.result(timeout=timeout)
+    return UploadedFile.objects.get(id=job_id)
+
+
+# ===== WORKER =====
+
+def run_upload_job(job_id: int) -> None:
+    """
+    Worker entry point: send the spooled file, then invalidate caches.
+
+    Never raises; failures are recorded on the job as status 'error'.
+    """
+    close_old_connections()
+    job = None
+    try:
+        job = UploadedFile.objects.select_related('uploaded_by').get(id=job_id)
+        _update_job(job.id, status=UploadedFile.STATUS_UPLOADING)
+
+        response, error = _send_to_backend(job)
+        if error:
+            logger.error("Upload job %s failed: %s", job.id, error)
+            _finish_job(job.id, UploadedFile.STATUS_ERROR, error)
+            return
+
+        _update_job(
+            job.id,
+            status=UploadedFile.STATUS_INVALIDATING,
+            progress=UploadJobConfig.UPLOAD_PROGRESS_SHARE
+        )
+        month, year = invalidate_upload_caches(job.file_type, response, job.filename)
+
+        logger.info("Upload job %s completed: %s", job.id, job.filename)
+        _finish_job(
+            job.id,
+            UploadedFile.STATUS_COMPLETED,
+            response.get('message', "some error fetching message"),
+            result=response.get('data') or None
+        )
+        if CacheWarmupConfig.WARM_AFTER_UPLOAD and month and year:
+            warm_upload_period(month, year)
+    except Exception as e:
+        logger.exception("Upload job %s crashed: %s", job_id, str(e))
+        _finish_job(job_id, UploadedFile.STATUS_ERROR, 'Upload failed due to server error')
+    finally:
+        if job is not None:
+            _remove_spool(job.spool_path)
+        connection.close()
+
+
+def _send_to_backend(job: UploadedFile) -> Tuple[Optional[dict], Optional[str]]:
+    """Stream the spooled file to the backend; returns (response, error message)."""
+    upload = getattr(get_api_client(), UPLOAD_METHODS[job.file_type])
+    user_name = get_display_name(job.uploaded_by) if job.uploaded_by else ''
+    with open(job.spool_path, 'rb') as spooled:
+        response = upload(
+            file_content=File(spooled, name=job.filename),
+            filename=job.filename,
+            user=user_name,
+            progress_callback=_progress_recorder(job)
+        )
+    if response is None:
+        return None, 'Upload failed'
+    if 'error' in response:
+        return None, response['error']
+    return response, None
+
+
+def _progress_recorder(job: UploadedFile) -> Callable[[int, int], None]:
+    """
+    MultipartFileStream progress callback that writes to the job row.
+
+    Sending the file covers 0..UPLOAD_PROGRESS_SHARE percent; the row is
+    only updated every PROGRESS_STEP_PERCENT to keep writes cheap.
+    """
+    log_progress = log_upload_progress(job.filename)
+    share = UploadJobConfig.UPLOAD_PROGRESS_SHARE
+    step = UploadJobConfig.PROGRESS_STEP_PERCENT
+    recorded = [0]
+
+    def _record(sent: int, total: int):
+        log_progress(sent, total)
+        progress = int(sent * share / total) if total else share
+        if progress - recorded[0] >= step or (progress == share and recorded[0] < share):
+            recorded[0] = progress
+            _update_job(job.id, progress=progress)
+
+    return _record
+
+
+def invalidate_upload_caches(file_type: str, response: dict, filename: str) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Post-completion stage: invalidate caches for the uploaded period.
+
+    Only the affected data domains of the uploaded month/year are dropped;
+    forecast uploads also clear the LLM chat filter options cache. Failures
+    are logged and never fail the upload.
+
+    Returns:
+        The uploaded (month, year); either may be None when unknown
+    """
+    month = year = None
+    try:
+        month, year = get_upload_period(response, filename)
+        domains = ForecastCacheConfig.UPLOAD_INVALIDATION_DOMAINS.get(file_type, ())
+        logger.info(
+            "Invalidating %s caches for %s/%s after successful %s upload",
+            ', '.join(domains), month or '*', year or '*', file_type
+        )
+        invalidate_tags(domains, month, year)
+
+        if file_type in ('forecast', 'altered_forecast'):
+            # Clear filter options cache for LLM chat validation
+            try:
+                from chat_app.utils.filter_cache import invalidate_filter_caches
+                invalidate_filter_caches(month, year)
+                logger.info("Cleared filter options cache for LLM chat validation")
+            except ImportError:
+                logger.debug("Filter cache not available (chat_app not installed)")
+            except Exception as filter_cache_error:
+                logger.warning(f"Failed to clear filter cache: {filter_cache_error}")
+    except Exception as cache_error:
+        # Don't fail the upload if cache clearing fails
+        logger.warning(f"Failed to clear caches after upload: {cache_error}")
+    return month, year
+
+
+def warm_upload_period(month: int, year: int) -> None:
+    """Optional post-upload hook: prefetch the uploaded month's caches again."""
+    try:
+        warm_caches([(month, year)])
+    except Exception as warm_error:
+        logger.warning(f"Failed to warm caches after upload: {warm_error}")
+
+
+def _update_job(job_id: int, **fields) -> None:
+    UploadedFile.objects.filter(id=job_id).update(updated_at=timezone.now(), **fields)
+
+
+def _finish_job(job_id: int, status: str, message: str, result: Optional[dict] = None) -> None:
+    progress = {'progress': 100} if status == UploadedFile.STATUS_COMPLETED else {}
+    _update_job(
+        job_id, status=status, message=message, result=result,
+        finished_at=timezone.now(), **progress
+    )
+
+
+def _remove_spool(path: str) -> None:
+    if path:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Could not remove spooled upload %s: %s", path, e)
+
+
+# ===== STATUS =====
+
+def get_upload_job(job_id, user) -> Optional[UploadedFile]:
+    """
+    Fetch a job for status polling.
+
+    Returns None when the job does not exist or belongs to another user
+    (superusers see every job). Unfinished jobs that have not been updated
+    for STALE_AFTER_SECONDS - e.g. lost to a process restart - are marked
+    as failed so the upload page stops polling. A job still queued in this
+    process's pool (waiting behind MAX_WORKERS) is not stale; one of ours
+    is only given up on once it has been uploading that long.
+    """
+    try:
+        job = UploadedFile.objects.get(id=job_id)
+    except (UploadedFile.DoesNotExist, ValueError, TypeError):
+        return None
+
+    if job.uploaded_by_id and job.uploaded_by_id != user.pk and not user.is_superuser:
+        return None
+
+    stale_before = timezone.now() - timedelta(seconds=UploadJobConfig.STALE_AFTER_SECONDS)
+    is_stale = not job.is_finished and job.updated_at < stale_before and (
+        job.id not in _futures or job.status == UploadedFile.STATUS_UPLOADING
+    )
+    if is_stale:
+        logger.warning("Upload job %s stalled in '%s'; marking as failed", job.id, job.status)
+        _finish_job(job.id, UploadedFile.STATUS_ERROR, 'Upload was interrupted, please upload the file again')
+        _remove_spool(job.spool_path)
+        job.refresh_from_db()
+    return job
+
+
+def serialize_upload_job(job: UploadedFile) -> dict:
+    """Status payload for check_progress."""
+    data = {
+        'success': True,
+        'job_id': job.id,
+        'filename': job.filename,
+        'file_type': job.file_type,
+        'status': job.status,
+        'progress': job.progress,
+        'message': job.message,
+    }
+    if job.result:
+        data['data'] = job.result
+    return data
@@ -7,6 +7,9 @@
  *   1. In-memory cache (fast, cleared on page refresh)
  *   2. SessionStorage cache (persists across page refreshes until browser session ends)
  * - Dynamic dropdown population via AJAX with loading indicators
+ * - Forecast cascade options of a month fetched in one call (cascade tree),
+ *   loaded in the background while platforms come from their own endpoint;
+ *   lower levels use per-level requests until the tree has arrived
  * - URL parameter synchronization and auto-restoration
  * - Smart cascade restoration: when switching data types or reloading page,
  *   previously fetched dropdown options are restored from sessionStorage
@@ -29,6 +32,7 @@
         cacheMaxSize: 50,
         cacheTTL: 300000,  // 5 minutes
         sessionStoragePrefix: 'dataview_dropdown_',
+        cascadeTree: null,  // platforms -> markets -> localities/worktypes of the selected month
         currentFilters: {
             year: null,
             month: null,
@@ -237,6 +241,58 @@
         }
     }
 
+    // Per-level endpoints, used when the cascade tree is unavailable
+    const CASCADE_ENDPOINTS = {
+        markets: 'forecastMarkets',
+        localities: 'forecastLocalities',
+        worktypes: 'forecastWorktypes'
+    };
+
+    function loadCascadeTree(year, month) {
+        // Not awaited: the platform dropdown does not wait for the whole tree
+        fetchCascadeData(window.DATA_VIEW_URLS.forecastCascadeTree, { year, month })
+            .then(tree => {
+                STATE.cascadeTree = tree;
+            })
+            .catch(error => {
+                console.warn('Cascade tree unavailable, fetching dropdown levels individually:', error);
+            });
+    }
+
+    function optionsFromTree(level, params) {
+        const tree = STATE.cascadeTree;
+        if (!tree || String(tree.year) !== String(params.year) || String(tree.month) !== String(params.month)) {
+            return null;
+        }
+
+        const findNode = (nodes, value) => (nodes || []).find(node => String(node.value) === String(value));
+        const levelOptions = nodes => (nodes || []).map(({ markets, localities, worktypes, ...option }) => option);
+
+        const platform = findNode(tree.platforms, params.platform);
+        if (!platform) {
+            return [];
+        }
+        if (level === 'markets') {
+            return levelOptions(platform.markets);
+        }
+        const market = findNode(platform.markets, params.market);
+        if (!market) {
+            return [];
+        }
+        if (level === 'localities') {
+            return market.localities || [];
+        }
+        return (market.worktypes || {})[params.locality || ''] || [];
+    }
+
+    async function fetchCascadeOptions(level, params) {
+        const options = optionsFromTree(level, params);
+        if (options !== null) {
+            return { success: true, type: level, options: options };
+        }
+        return fetchCascadeData(window.DATA_VIEW_URLS[CASCADE_ENDPOINTS[level]], params);
+    }
+
     // ============================================================================
     // DROPDOWN POPULATION
     // ============================================================================
@@ -403,7 +459,8 @@
         disableDropdown(worktypeSelect);
 
         try {
-            // Fetch platforms for selected year/month
+            // Platforms from their own endpoint; the rest of the month's tree loads meanwhile
+            loadCascadeTree(STATE.currentFilters.year, monthValue);
             const data = await fetchCascadeData(window.DATA_VIEW_URLS.forecastPlatforms, {
                 year: STATE.currentFilters.year,
                 month: monthValue
@@ -455,7 +512,7 @@
 
         try {
             // Fetch markets for selected platform
-            const data = await fetchCascadeData(window.DATA_VIEW_URLS.forecastMarkets, {
+            const data = await fetchCascadeOptions('markets', {
                 year: STATE.currentFilters.year,
                 month: STATE.currentFilters.month,
                 platform: platformValue
@@ -502,7 +559,7 @@
 
         try {
             // Fetch localities for selected platform/market (optional field)
-            const data = await fetchCascadeData(window.DATA_VIEW_URLS.forecastLocalities, {
+            const data = await fetchCascadeOptions('localities', {
                 year: STATE.currentFilters.year,
                 month: STATE.currentFilters.month,
                 platform: STATE.currentFilters.platform,
@@ -568,7 +625,7 @@
                 params.locality = localityValue;
             }
 
-            const data = await fetchCascadeData(window.DATA_VIEW_URLS.forecastWorktypes, params);
+            const data = await fetchCascadeOptions('worktypes', params);
 
             populateDropdown(worktypeSelect, data.options, 'Select Worktype');
             enableDropdown(worktypeSelect);
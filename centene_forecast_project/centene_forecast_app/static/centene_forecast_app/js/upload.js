@@ -62,8 +62,11 @@ $(document).ready(function(){
             success: function(response){
                 console.log(response);
                 var warning = response && response.data && response.data.warning ? response.data.warning : null;
+                // Upload queued as a background job: follow it until it finishes
+                if (response && response.success && response.job_id) {
+                    pollProgress(response.job_id, fileType);
                 // Check success field first (preferred), then fallback to message check
-                if (response && response.success) {
+                } else if (response && response.success) {
                     onUploadSuccess(warning, fileType);
                 } else if (response && response.message && response.message.toLowerCase().includes('file uploaded')) {
                     onUploadSuccess(warning, fileType);
@@ -127,7 +130,9 @@ $(document).ready(function(){
             .filter(key => key.startsWith('dataview_dropdown_'))
             .forEach(key => sessionStorage.removeItem(key))
     }
-    function pollProgress(file_upload_id){
+    function pollProgress(file_upload_id, fileType){
+        $('#progress-bar').css('width', '0%').text('0%');
+        $('#progress-container').show();
         var interval = setInterval(function(){
             $.ajax({
                 url: checkProgressUrl,
@@ -138,20 +143,22 @@ $(document).ready(function(){
                     if(data.status === 'completed' || data.status === 'error'){
                         clearInterval(interval);
                         $('#progress-container').hide();
-                        $('#successMsg').show();
 
                         if(data.status === 'error'){
-                            $('#error-message').show();
-                            alert('Error processing file.');
+                            $('#error-message').text(data.message || 'Error processing file.').show();
+                            enable_upload_button();
                         } else {
-                            refreshTable();
+                            var warning = data.data && data.data.warning ? data.data.warning : null;
+                            onUploadSuccess(warning, fileType);
                         }
                     }
                 },
                 error: function(xhr){
                     clearInterval(interval);
+                    $('#progress-container').hide();
                     var errorMsg = getErrorMessage(xhr, 'Error checking upload progress');
                     $('#error-message').text(errorMsg).show();
+                    enable_upload_button();
                 }
             });
         }, 1000); // Poll every second
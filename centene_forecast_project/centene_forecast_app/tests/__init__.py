@@ -0,0 +1 @@
+# Tests package for centene_forecast_app
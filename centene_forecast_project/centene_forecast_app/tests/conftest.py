@@ -0,0 +1,225 @@
+"""
+Pytest Configuration and Fixtures for Centene Forecast App Tests
+
+Provides fixtures for:
+- Local stub backend (threaded HTTP server standing in for the FastAPI API)
+- APIClient pointed at the stub backend
+- Clean Django cache between tests
+"""
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+
+# Configure Django settings before importing Django modules
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'centene_forecast_project.settings')
+
+import django
+django.setup()
+
+from django.core.cache import cache
+
+
+# ===== STUB BACKEND =====
+
+class StubBackend:
+    """
+    In-process stand-in for the FastAPI backend.
+
+    Routes are registered as callables taking (path, query) and returning
+    (status_code, payload) or (status_code, payload, headers). Payloads are
+    sent as JSON, except bytes (sent as-is) and iterators of bytes (streamed;
+    give Content-Length in headers). Every request is counted so tests can
+    assert on round trips; POST bodies are kept per path in request_bodies
+    (sizes only in body_sizes when store_bodies is False). With keep_alive
+    the server speaks HTTP/1.1 and keeps client connections open.
+
+    Conditional GETs are honoured: a request whose If-None-Match matches the
+    route's ETag header (or If-Modified-Since its Last-Modified) gets an
+    empty 304. bytes_sent counts response body bytes written.
+    """
+
+    def __init__(self, latency: float = 0.0, keep_alive: bool = False):
+        self.latency = latency
+        self.keep_alive = keep_alive
+        self.routes = {}
+        self.request_log = []
+        self.request_bodies = {}
+        self.body_sizes = {}
+        self.store_bodies = True
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def route(self, path: str, handler):
+        self.routes[path] = handler
+
+    def requests_for(self, path: str) -> list:
+        with self._lock:
+            return [entry for entry in self.request_log if entry[0] == path]
+
+    def start(self):
+        backend = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1' if backend.keep_alive else 'HTTP/1.0'
+
+            def do_GET(self):
+                self._respond(body=None)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                if backend.store_bodies:
+                    body = self.rfile.read(length) if length else b''
+                else:
+                    # Drain without buffering (large upload tests)
+                    remaining = length
+                    while remaining > 0:
+                        chunk = self.rfile.read(min(remaining, 1 << 20))
+                        if not chunk:
+                            break
+                        remaining -= len(chunk)
+                    body = None
+                with backend._lock:
+                    backend.body_sizes.setdefault(urlparse(self.path).path, []).append(length)
+                self._respond(body=body if body is not None else b'')
+
+            def _respond(self, body):
+                parsed = urlparse(self.path)
+                query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+                with backend._lock:
+                    backend.request_log.append((parsed.path, query))
+                    if body is not None and backend.store_bodies:
+                        backend.request_bodies.setdefault(parsed.path, []).append(body)
+                handler = backend.routes.get(parsed.path)
+                if backend.latency:
+                    time.sleep(backend.latency)
+                if handler is None:
+                    status, payload, headers = 404, {'detail': 'Not found'}, {}
+                else:
+                    status, payload, *extra = handler(parsed.path, query)
+                    headers = extra[0] if extra else {}
+                if status == 200 and self._not_modified(headers):
+                    self.send_response(304)
+                    for name in ('ETag', 'Last-Modified'):
+                        if name in headers:
+                            self.send_header(name, headers[name])
+                    self.end_headers()
+                    return
+                self.send_response(status)
+                if hasattr(payload, '__next__'):
+                    if 'Content-Length' not in headers:
+                        self.close_connection = True  # body ends when the connection does
+                    for name, value in headers.items():
+                        self.send_header(name, value)
+                    self.end_headers()
+                    try:
+                        for chunk in payload:
+                            self.wfile.write(chunk)
+                            backend._count_sent(len(chunk))
+                    except (BrokenPipeError, ConnectionResetError):
+                        pass
+                    return
+                body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+                headers = {'Content-Type': 'application/json', **headers, 'Content-Length': str(len(body))}
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+                backend._count_sent(len(body))
+
+            def _not_modified(self, headers) -> bool:
+                if_none_match = self.headers.get('If-None-Match')
+                if if_none_match is not None:
+                    return if_none_match == headers.get('ETag')
+                if_modified_since = self.headers.get('If-Modified-Since')
+                return if_modified_since is not None and if_modified_since == headers.get('Last-Modified')
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def _count_sent(self, size: int):
+        with self._lock:
+            self.bytes_sent += size
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+
+def make_forecast_rows(total: int) -> list:
+    """Build forecast-shaped rows with a stable id per offset."""
+    return [
+        {
+            'id': i,
+            'main_lob': f"Amisys Medicaid {'DOMESTIC' if i % 2 == 0 else 'GLOBAL'}",
+            'state': ['CA', 'TX', 'FL', 'NY', 'GA'][i % 5],
+            'case_type': 'Claims Processing',
+            'forecast': 1000 + i,
+        }
+        for i in range(total)
+    ]
+
+
+def paginated_route(rows: list, records_key: str = 'data'):
+    """Serve `rows` with skip/limit pagination like /records/forecast."""
+    def _handler(path, query):
+        skip = int(query.get('skip', 0))
+        limit = int(query.get('limit', 100))
+        return 200, {records_key: rows[skip:skip + limit], 'total': len(rows)}
+    return _handler
+
+
+@pytest.fixture
+def stub_backend():
+    """Start a stub backend for the duration of one test."""
+    backend = StubBackend().start()
+    yield backend
+    backend.stop()
+
+
+@pytest.fixture
+def api_client(stub_backend):
+    """APIClient pointed at the stub backend, with retries disabled."""
+    from centene_forecast_app.repository import APIClient
+
+    client = APIClient(base_url=stub_backend.base_url, max_retries=0)
+    yield client
+    client.close()
+
+
+@pytest.fixture(autouse=True)
+def clear_django_cache():
+    """Start and finish every test with an empty cache."""
+    from centene_forecast_app.app_utils.cache_utils import clear_all_caches, reset_cache_metrics
+
+    clear_all_caches()
+    reset_cache_metrics()
+    yield
+    clear_all_caches()
+
+
+# ===== PYTEST CONFIGURATION =====
+
+def pytest_configure(config):
+    """Configure pytest with custom markers."""
+    config.addinivalue_line(
+        "markers", "slow: mark test as slow-running (benchmarks)"
+    )
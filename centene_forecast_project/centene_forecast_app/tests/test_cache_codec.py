@@ -0,0 +1,208 @@
+"""
+Tests for the cache payload codec (compression, opt-in columnar encoding)
+and the per-entry size accounting it feeds into get_cache_stats().
+"""
+import json
+import pickle
+import random
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from core.config import ForecastCacheConfig
+from centene_forecast_app.app_utils import cache_codec
+from centene_forecast_app.app_utils.cache_codec import (
+    EncodedPayload,
+    decode_payload,
+    encode_payload,
+)
+from centene_forecast_app.app_utils.cache_utils import (
+    _get_cache,
+    cache_with_ttl,
+    get_cache_stats,
+    inspect_cache_value,
+)
+from centene_forecast_app.tests.conftest import make_forecast_rows
+
+MONTH_LABELS = ['Jun-25', 'Jul-25', 'Aug-25', 'Sep-25', 'Oct-25', 'Nov-25']
+
+
+def make_report_rows(total: int, seed: int = 1) -> list:
+    """Forecast-report shaped rows (29 columns), JSON round-tripped like API data."""
+    rng = random.Random(seed)
+    lobs = ['Amisys Medicaid DOMESTIC', 'Amisys Medicaid GLOBAL', 'Facets Medicare',
+            'Xcelys Medicaid (Domestic)', 'Amisys Marketplace']
+    rows = []
+    for i in range(total):
+        row = {
+            'id': i,
+            'main_lob': rng.choice(lobs),
+            'state': rng.choice(['CA', 'TX', 'FL', 'NY', 'GA', 'MO', 'OH', 'N/A']),
+            'case_type': rng.choice(['Claims Processing', 'Appeals', 'Correspondence', 'Enrollment']),
+            'case_id': f"CASE-{i:06d}",
+            'target_cph': round(rng.uniform(5, 30), 1),
+        }
+        for label in MONTH_LABELS:
+            row[f"{label}_forecast"] = rng.randint(0, 50000)
+            row[f"{label}_fte_req"] = rng.randint(0, 200)
+            row[f"{label}_fte_avail"] = rng.randint(0, 200)
+            row[f"{label}_capacity"] = rng.randint(0, 60000)
+        rows.append(row)
+    return json.loads(json.dumps(rows))
+
+
+@pytest.fixture
+def columnar(monkeypatch):
+    monkeypatch.setattr(ForecastCacheConfig, 'COLUMNAR_ENCODING', True)
+
+
+class TestPayloadCodec:
+    def test_record_list_round_trips_columnar(self, columnar):
+        rows = make_report_rows(500)
+
+        stored, stored_size = encode_payload(rows)
+
+        assert isinstance(stored, EncodedPayload)
+        assert stored.columnar is True
+        assert stored_size == stored.stored_size
+        assert decode_payload(stored) == rows
+
+    def test_nested_record_list_round_trips(self, columnar):
+        value = {'data': make_report_rows(100), 'total': 100, 'success': True}
+
+        stored, _ = encode_payload(value)
+
+        assert stored.columnar is True
+        assert decode_payload(stored) == value
+
+    def test_mixed_shapes_are_not_columnar(self):
+        rows = make_forecast_rows(100)
+        rows[50]['extra'] = 1
+
+        stored, _ = encode_payload(rows)
+
+        assert not isinstance(stored, EncodedPayload) or stored.columnar is False
+        assert decode_payload(stored) == rows
+
+    def test_small_values_stored_unchanged(self):
+        value = {'years': [{'value': '2025', 'display': '2025'}]}
+
+        stored, stored_size = encode_payload(value)
+
+        assert stored is value
+        assert stored_size == 0
+
+    def test_values_without_records_are_not_pickled(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError('value was pickled')
+
+        monkeypatch.setattr(cache_codec, 'pickle', SimpleNamespace(dumps=fail, HIGHEST_PROTOCOL=5))
+        value = ['claims processing backlog'] * 20000
+
+        assert encode_payload(value) == (value, 0)
+        assert encode_payload(make_report_rows(10)) == (make_report_rows(10), 0)
+
+    def test_compression_above_threshold(self):
+        rows = make_report_rows(500)
+
+        stored, stored_size = encode_payload(rows)
+
+        assert (stored.compression, stored.columnar) == ('zlib', False)
+        assert stored_size < stored.encoded_size
+        assert decode_payload(stored) == rows
+
+    def test_lz4_falls_back_to_zlib_when_missing(self, monkeypatch):
+        monkeypatch.setattr(ForecastCacheConfig, 'PAYLOAD_COMPRESSION', 'lz4')
+        monkeypatch.setattr(cache_codec, 'lz4_frame', None)
+
+        stored, _ = encode_payload(make_report_rows(2000))
+
+        assert stored.compression == 'zlib'
+
+    def test_compression_disabled(self, monkeypatch):
+        monkeypatch.setattr(ForecastCacheConfig, 'PAYLOAD_COMPRESSION', 'none')
+        rows = make_report_rows(2000)
+
+        stored, stored_size = encode_payload(rows)
+
+        assert stored is rows
+        assert stored_size > 0
+
+    def test_compression_disabled_columnar(self, monkeypatch, columnar):
+        monkeypatch.setattr(ForecastCacheConfig, 'PAYLOAD_COMPRESSION', 'none')
+
+        stored, _ = encode_payload(make_report_rows(2000))
+
+        assert stored.compression == 'none'
+        assert stored.columnar is True
+
+
+class TestCachedPayloads:
+    def test_decorated_function_returns_decoded_records(self):
+        rows = make_report_rows(300)
+
+        @cache_with_ttl(ttl=60, key_prefix='codec_test')
+        def load(month, year):
+            return rows
+
+        assert load(7, 2025) == rows
+        assert isinstance(_get_cache().get('codec_test:7:2025'), EncodedPayload)
+        assert load(7, 2025) == rows
+        assert inspect_cache_value('codec_test:7:2025') == rows
+
+    def test_size_accounting_in_cache_stats(self):
+        @cache_with_ttl(ttl=60, key_prefix='codec_stats')
+        def load(month):
+            return make_report_rows(1000, seed=month)
+
+        load(7)
+        load(8)
+
+        payloads = get_cache_stats()['payloads']
+        prefix_stats = payloads['by_prefix']['codec_stats']
+        assert prefix_stats['entries'] == 2
+        assert prefix_stats['stored_bytes'] < prefix_stats['uncompressed_bytes']
+        assert payloads['compressed_entries'] >= 2
+        assert payloads['largest'][0]['key'] in ('codec_stats:7', 'codec_stats:8')
+
+    def test_codec_can_be_disabled(self, monkeypatch):
+        monkeypatch.setattr(ForecastCacheConfig, 'ENABLE_PAYLOAD_CODEC', False)
+        rows = make_report_rows(100)
+
+        @cache_with_ttl(ttl=60, key_prefix='codec_off')
+        def load():
+            return rows
+
+        load()
+        assert _get_cache().get('codec_off') == rows
+
+
+@pytest.mark.slow
+def test_benchmark_memory_and_hit_cpu_per_10k_rows(monkeypatch):
+    """Bytes held by locmem for one 10k-row report, and CPU per cache hit, per encoding."""
+    rows = make_report_rows(10000)
+
+    def measure(value):
+        stored = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        assert decode_payload(pickle.loads(stored)) == rows
+        best = float('inf')
+        for _ in range(5):
+            started = time.process_time()
+            decode_payload(pickle.loads(stored))
+            best = min(best, time.process_time() - started)
+        return len(stored), best * 1000
+
+    plain_bytes, plain_ms = measure(rows)
+    codec_bytes, codec_ms = measure(encode_payload(rows)[0])
+    monkeypatch.setattr(ForecastCacheConfig, 'COLUMNAR_ENCODING', True)
+    columnar_bytes, columnar_ms = measure(encode_payload(rows)[0])
+
+    print(
+        f"\n[Benchmark] 10k rows x {len(rows[0])} cols (stored KB / hit ms): "
+        f"plain {plain_bytes / 1024:.0f} / {plain_ms:.1f} | "
+        f"compressed {codec_bytes / 1024:.0f} / {codec_ms:.1f} | "
+        f"columnar {columnar_bytes / 1024:.0f} / {columnar_ms:.1f}"
+    )
+    assert codec_bytes < plain_bytes / 2
+    assert columnar_bytes < codec_bytes
@@ -0,0 +1,188 @@
+"""
+Tests for backend-driven cache invalidation.
+
+Change events ({domain, month, year}) posted to /api/cache/events/ or
+published on the redis channel must drop exactly the affected cache_with_ttl
+entries and the chat filter options cache.
+"""
+import json
+import time
+
+import pytest
+from django.test import Client, RequestFactory, override_settings
+from django.urls import reverse
+
+from core.config import ForecastCacheConfig
+from chat_app.utils.filter_cache import get_filter_cache
+from centene_forecast_app.app_utils.cache_utils import cache_with_ttl, get_shared_redis_client
+from centene_forecast_app.services import cache_event_service
+from centene_forecast_app.services.cache_event_service import (
+    ChangeEventSubscriber,
+    parse_change_event,
+    publish_change_event,
+)
+from centene_forecast_app.tests.test_cache_redis import redis_cache, redis_settings  # noqa: F401
+from centene_forecast_app.views import cache_views
+
+TOKEN = 'backend-secret'
+
+
+@pytest.fixture
+def forecast_loader():
+    calls = []
+
+    @cache_with_ttl(ttl=900, key_prefix='events_forecast', tags=('forecast',))
+    def load(month, year):
+        calls.append((month, year))
+        return [month, year]
+
+    return load, calls
+
+
+@pytest.fixture
+def filter_cache():
+    cache = get_filter_cache()
+    cache.clear_all()
+    yield cache
+    cache.clear_all()
+
+
+def _post_events(payload, token=TOKEN, user=None):
+    from django.contrib.auth.models import AnonymousUser
+
+    request = RequestFactory().post(
+        '/api/cache/events/', json.dumps(payload), content_type='application/json',
+        HTTP_AUTHORIZATION=f'Bearer {token}'
+    )
+    request.user = user or AnonymousUser()
+    with override_settings(CACHE_EVENTS_TOKEN=TOKEN):
+        response = cache_views.cache_events_view(request)
+    return response.status_code, json.loads(response.content)
+
+
+class TestParseChangeEvent:
+
+    def test_normalizes_month_names(self):
+        assert parse_change_event({'domain': 'roster', 'month': 'March', 'year': '2025'}) == \
+            {'domain': 'roster', 'month': 3, 'year': 2025}
+
+    @pytest.mark.parametrize('payload', [
+        {'domain': 'payroll', 'year': 2025},
+        {'domain': 'forecast', 'month': 13, 'year': 2025},
+        {'domain': 'forecast', 'month': 3},
+        ['forecast'],
+    ])
+    def test_rejects_invalid_events(self, payload):
+        with pytest.raises(ValueError):
+            parse_change_event(payload)
+
+
+class TestWebhook:
+
+    def test_event_invalidates_only_its_period(self, forecast_loader, filter_cache):
+        load, calls = forecast_loader
+        load(3, 2025)
+        load(4, 2025)
+        filter_cache.set(3, 2025, {'platforms': ['Amisys']})
+        filter_cache.set(4, 2025, {'platforms': ['Facets']})
+
+        status, body = _post_events({'domain': 'forecast', 'month': 3, 'year': 2025})
+        load(3, 2025)
+        load(4, 2025)
+
+        assert status == 200
+        assert body['invalidated'] >= 1
+        assert calls == [(3, 2025), (4, 2025), (3, 2025)]
+        assert filter_cache.get(3, 2025) is None
+        assert filter_cache.get(4, 2025) == {'platforms': ['Facets']}
+
+    def test_roster_change_drops_derived_forecast_entries(self, forecast_loader):
+        load, calls = forecast_loader
+        load(3, 2025)
+
+        status, body = _post_events({'events': [{'domain': 'roster', 'month': 'March', 'year': 2025}]})
+        load(3, 2025)
+
+        assert (status, body['events']) == (200, 1)
+        assert len(calls) == 2
+
+    def test_requires_token_or_admin(self, forecast_loader):
+        load, calls = forecast_loader
+        load(3, 2025)
+
+        status, _ = _post_events({'domain': 'forecast', 'month': 3, 'year': 2025}, token='wrong')
+        load(3, 2025)
+
+        assert status == 401
+        assert len(calls) == 1
+
+    def test_admin_session_requires_csrf_token(self, forecast_loader, transactional_db):
+        from core.models import User
+
+        load, calls = forecast_loader
+        load(3, 2025)
+        client = Client(enforce_csrf_checks=True)
+        client.force_login(User.objects.create_superuser('cache_admin'))
+        url = reverse('forecast_app:cache_events')
+        body = json.dumps({'domain': 'forecast', 'month': 3, 'year': 2025})
+
+        forged = client.post(url, body, content_type='application/json', HTTP_ACCEPT='application/json')
+        load(3, 2025)
+        client.cookies['csrftoken'] = csrf_secret = 'x' * 32
+        accepted = client.post(url, body, content_type='application/json', HTTP_ACCEPT='application/json',
+                               HTTP_X_CSRFTOKEN=csrf_secret)
+
+        assert forged.status_code == 403
+        assert len(calls) == 1
+        assert accepted.status_code == 200
+
+    def test_invalid_event_is_rejected(self):
+        status, body = _post_events({'domain': 'payroll'})
+
+        assert status == 400
+        assert 'Unknown domain' in body['error']
+
+
+class TestRedisSubscriber:
+
+    @pytest.fixture
+    def subscriber(self, redis_cache):  # noqa: F811
+        subscriber = ChangeEventSubscriber(get_shared_redis_client())
+        subscriber.start()
+        assert subscriber.subscribed.wait(5)
+        yield subscriber
+        subscriber.stop()
+
+    def _wait_for(self, condition, timeout=5.0):
+        deadline = time.time() + timeout
+        while not condition() and time.time() < deadline:
+            time.sleep(0.02)
+        return condition()
+
+    def test_published_event_is_applied(self, subscriber, forecast_loader, filter_cache):
+        load, calls = forecast_loader
+        load(3, 2025)
+        filter_cache.set(3, 2025, {'platforms': ['Amisys']})
+
+        # Published by the backend (or another worker) straight to the channel
+        get_shared_redis_client().publish(
+            ForecastCacheConfig.CHANGE_EVENT_CHANNEL,
+            json.dumps({'domain': 'forecast', 'month': 3, 'year': 2025})
+        )
+
+        assert self._wait_for(lambda: filter_cache.get(3, 2025) is None)
+        load(3, 2025)
+        assert len(calls) == 2
+
+    def test_own_events_are_skipped(self, subscriber, filter_cache, monkeypatch):
+        applied = []
+        monkeypatch.setattr(cache_event_service, 'apply_change_event', lambda *args, **kwargs: applied.append(args))
+
+        assert publish_change_event({'domain': 'forecast', 'month': 3, 'year': 2025}, applied=True)
+        get_shared_redis_client().publish(
+            ForecastCacheConfig.CHANGE_EVENT_CHANNEL,
+            json.dumps({'domain': 'history', 'month': None, 'year': None, 'origin': 'other', 'applied': True})
+        )
+
+        assert self._wait_for(lambda: applied)
+        assert [event['domain'] for event, in applied] == ['history']
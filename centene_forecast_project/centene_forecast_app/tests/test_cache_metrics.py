@@ -0,0 +1,217 @@
+"""
+Tests for cache observability: per-prefix counters recorded by
+cache_with_ttl, cross-worker aggregation on redis, and the Prometheus
+endpoint.
+"""
+import time
+
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory, override_settings
+
+from core.config import ForecastCacheConfig
+from centene_forecast_app.app_utils import cache_utils
+from centene_forecast_app.app_utils.cache_metrics import (
+    CacheMetrics,
+    hit_ratio,
+    merge_snapshots,
+    render_prometheus,
+)
+from centene_forecast_app.app_utils.cache_utils import (
+    _get_cache,
+    cache_with_ttl,
+    get_cache_metrics,
+    get_cache_stats,
+    invalidate_tags,
+)
+from centene_forecast_app.tests.test_cache_redis import (  # noqa: F401 - fixtures
+    other_worker,
+    redis_cache,
+    redis_settings,
+)
+from centene_forecast_app.views.cache_views import cache_metrics_view
+
+
+class TestCacheMetrics:
+    def test_histogram_buckets(self):
+        metrics = CacheMetrics()
+        metrics.observe_miss('forecast', 0.003)
+        metrics.observe_miss('forecast', 0.3)
+        metrics.observe_miss('forecast', 120)
+
+        latency = metrics.snapshot()['forecast']['miss_latency']
+        assert latency['count'] == 3
+        assert latency['buckets'][0] == 1
+        assert sum(latency['buckets']) == 2  # 120s only lands in +Inf
+
+    def test_merge_and_hit_ratio(self):
+        first = CacheMetrics()
+        second = CacheMetrics()
+        first.incr('forecast', 'hits', 3)
+        second.incr('forecast', 'misses')
+
+        merged = merge_snapshots([first.snapshot(), second.snapshot()])
+
+        assert merged['forecast']['hits'] == 3
+        assert merged['forecast']['misses'] == 1
+        assert hit_ratio(merged['forecast']) == 0.75
+        assert hit_ratio({}) == 0.0
+
+    def test_prometheus_rendering(self):
+        metrics = CacheMetrics()
+        metrics.incr('forecast', 'hits', 2)
+        metrics.observe_miss('forecast', 0.2)
+
+        text = render_prometheus(metrics.snapshot(), workers=2,
+                                 single_flight={'forecast': {'coalesced_waits': 4}})
+
+        assert 'centene_cache_workers 2' in text
+        assert 'centene_cache_hits_total{prefix="forecast"} 2' in text
+        assert 'centene_cache_miss_duration_seconds_bucket{prefix="forecast",le="0.25"} 1' in text
+        assert 'centene_cache_miss_duration_seconds_bucket{prefix="forecast",le="+Inf"} 1' in text
+        assert 'centene_cache_single_flight_events_total{prefix="forecast",event="coalesced_waits"} 4' in text
+
+
+class TestRecordedMetrics:
+    def test_hits_misses_and_sets(self):
+        @cache_with_ttl(ttl=60, key_prefix='metrics_test')
+        def load(month, year):
+            # A record payload, so the codec measures its size
+            return [{'row': row, 'month': month, 'year': year} for row in range(100)]
+
+        load(7, 2025)
+        load(7, 2025)
+        load(7, 2025)
+        load(8, 2025)
+
+        metrics = get_cache_metrics()
+        prefix = metrics['prefixes']['metrics_test']
+        assert metrics['scope'] == 'process'
+        assert prefix['hits'] == 2
+        assert prefix['misses'] == 2
+        assert prefix['sets'] == 2
+        assert prefix['entries'] == 2
+        assert prefix['bytes_written'] > 0
+        assert prefix['miss_latency']['count'] == 2
+        assert prefix['hit_ratio'] == 0.5
+        assert get_cache_stats()['metrics']['prefixes']['metrics_test']['hits'] == 2
+
+    def test_eviction_vs_expiration(self):
+        @cache_with_ttl(ttl=60, key_prefix='metrics_evict')
+        def load(month):
+            return [month]
+
+        load(1)
+        load(2)
+        _get_cache().delete('metrics_evict:1')  # dropped behind our back, before TTL
+        load(1)
+
+        entry = cache_utils._PAYLOAD_SIZES['metrics_evict:2']
+        cache_utils._PAYLOAD_SIZES['metrics_evict:2'] = entry[:5] + (time.time() - 1,)
+        _get_cache().delete('metrics_evict:2')
+        load(2)
+
+        prefix = get_cache_metrics()['prefixes']['metrics_evict']
+        assert prefix['evictions'] == 1
+        assert prefix['expirations'] == 1
+
+    def test_explicit_invalidation_is_not_an_eviction(self):
+        @cache_with_ttl(ttl=60, key_prefix='metrics_tagged', tags=('forecast',))
+        def load(month, year):
+            return [month, year]
+
+        load(7, 2025)
+        invalidate_tags(('forecast',), 7, 2025)
+        load(7, 2025)
+
+        prefix = get_cache_metrics()['prefixes']['metrics_tagged']
+        assert prefix['misses'] == 2
+        assert prefix['evictions'] == 0
+
+    def test_stale_hits_counted(self):
+        @cache_with_ttl(ttl=60, key_prefix='metrics_stale', stale_ttl=60)
+        def load():
+            return [1]
+
+        load()
+        _get_cache().delete(cache_utils._fresh_key('metrics_stale'))
+        load()
+
+        assert get_cache_metrics()['prefixes']['metrics_stale']['stale_hits'] == 1
+
+
+class TestRedisAggregation:
+    def test_metrics_merged_across_workers(self, redis_cache, other_worker):
+        @cache_with_ttl(ttl=60, key_prefix='forecast')
+        def fetch(month, year):
+            return [month, year]
+
+        fetch(7, 2025)
+        fetch(7, 2025)
+
+        # Another worker published its own snapshot to the shared cache
+        other_worker.set('__metrics__:worker:web-2:99', {
+            'worker': 'web-2:99',
+            'timestamp': time.time(),
+            'prefixes': merge_snapshots([{'forecast': {'hits': 5, 'misses': 1}}]),
+            'single_flight': {'forecast': {'coalesced_waits': 3}},
+        }, 60)
+
+        metrics = get_cache_metrics()
+
+        assert metrics['scope'] == 'cluster'
+        assert metrics['workers'] == 2
+        assert 'web-2:99' in metrics['worker_ids']
+        assert metrics['prefixes']['forecast']['hits'] == 6
+        assert metrics['prefixes']['forecast']['misses'] == 2
+        assert metrics['single_flight']['forecast']['coalesced_waits'] == 3
+
+    def test_snapshot_published_for_other_workers(self, redis_cache, other_worker):
+        @cache_with_ttl(ttl=60, key_prefix='forecast')
+        def fetch(month, year):
+            return [month, year]
+
+        fetch(7, 2025)
+        fetch(7, 2025)
+
+        snapshot = other_worker.get(f"__metrics__:worker:{cache_utils._worker_id()}")
+        assert snapshot['worker'] == cache_utils._worker_id()
+        assert snapshot['prefixes']['forecast']['misses'] == 1
+
+    def test_forked_worker_gets_its_own_id(self, monkeypatch):
+        parent_id = cache_utils._worker_id()
+        monkeypatch.setattr(cache_utils.os, 'getpid', lambda: 424242)
+
+        assert cache_utils._worker_id() != parent_id
+        assert cache_utils._worker_id().endswith(':424242')
+        assert cache_utils._local_metrics_snapshot()['worker'].endswith(':424242')
+
+
+class TestMetricsEndpoint:
+    def _request(self, **headers):
+        request = RequestFactory().get('/api/cache/metrics/', **headers)
+        request.user = AnonymousUser()
+        return request
+
+    def test_requires_authentication(self):
+        response = cache_metrics_view(self._request())
+        assert response.status_code == 401
+
+    @override_settings(CACHE_METRICS_TOKEN='scrape-token')
+    def test_bearer_token(self):
+        @cache_with_ttl(ttl=60, key_prefix='metrics_view')
+        def load():
+            return [1]
+
+        load()
+        load()
+
+        response = cache_metrics_view(self._request(HTTP_AUTHORIZATION='Bearer scrape-token'))
+
+        assert response.status_code == 200
+        assert response['Content-Type'].startswith('text/plain; version=0.0.4')
+        assert 'centene_cache_hits_total{prefix="metrics_view"} 1' in response.content.decode()
+
+    @override_settings(CACHE_METRICS_TOKEN='scrape-token')
+    def test_wrong_token_rejected(self):
+        response = cache_metrics_view(self._request(HTTP_AUTHORIZATION='Bearer nope'))
+        assert response.status_code == 401
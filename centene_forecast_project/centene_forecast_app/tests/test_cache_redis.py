@@ -0,0 +1,202 @@
+"""
+Tests for the shared redis cache mode of cache_utils.
+
+Runs against a real redis when CENTENE_TEST_REDIS_URL is set, otherwise
+against an in-process fakeredis server.
+"""
+import os
+
+import pytest
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCache
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+import django.test.signals  # noqa: F401 - resets cache handlers when CACHES is overridden
+
+from core.config import ForecastCacheConfig
+from centene_forecast_app.app_utils import cache_utils
+from centene_forecast_app.app_utils.cache_utils import (
+    cache_with_ttl,
+    clear_all_caches,
+    clear_cascade_caches,
+    clear_forecast_cache,
+    delete_many,
+    delete_pattern,
+    get_cache_metrics,
+    invalidate_tags,
+    validate_cache_backend,
+)
+
+TEST_REDIS_URL = os.environ.get('CENTENE_TEST_REDIS_URL')
+
+
+def _redis_cache_settings():
+    redis_settings = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': TEST_REDIS_URL or 'redis://localhost:6379/15',
+        'KEY_PREFIX': 'centene-test',
+    }
+    if not TEST_REDIS_URL:
+        fakeredis = pytest.importorskip('fakeredis')
+        redis_settings['OPTIONS'] = {
+            'connection_class': getattr(fakeredis, 'FakeRedisConnection', None) or fakeredis.FakeConnection,
+            'server': fakeredis.FakeServer(),
+        }
+    return redis_settings
+
+
+@pytest.fixture
+def redis_settings():
+    return _redis_cache_settings()
+
+
+@pytest.fixture
+def redis_cache(redis_settings):
+    """Switch cache_utils to a 'redis' alias for the duration of a test."""
+    pytest.importorskip('redis')
+    cache_settings = {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'redis': redis_settings,
+    }
+    previous_backend = ForecastCacheConfig.CACHE_BACKEND
+    with override_settings(CACHES=cache_settings):
+        ForecastCacheConfig.CACHE_BACKEND = 'redis'
+        try:
+            clear_all_caches()
+            yield caches['redis']
+            clear_all_caches()
+        finally:
+            ForecastCacheConfig.CACHE_BACKEND = previous_backend
+
+
+@pytest.fixture
+def other_worker(redis_settings, redis_cache):
+    """A second cache client on the same redis, standing in for another worker."""
+    return RedisCache(redis_settings['LOCATION'], redis_settings)
+
+
+def _raw_keys(cache):
+    client = cache._cache.get_client(None, write=True)
+    return sorted(k.decode() for k in client.scan_iter(match='*'))
+
+
+class TestRedisBackend:
+
+    def test_backend_type_detected(self, redis_cache):
+        assert cache_utils._get_cache_backend_type() == 'redis'
+
+    def test_cached_value_shared_between_workers(self, redis_cache, other_worker):
+        calls = []
+
+        @cache_with_ttl(ttl=60, key_prefix='forecast')
+        def fetch(month, year):
+            calls.append((month, year))
+            return [{'id': 1}]
+
+        assert fetch(7, 2025) == [{'id': 1}]
+        assert fetch(7, 2025) == [{'id': 1}]
+        assert calls == [(7, 2025)]
+        assert other_worker.get('forecast:7:2025') == [{'id': 1}]
+        # Redis needs no process-local registry
+        assert 'forecast:7:2025' not in cache_utils._CACHE_KEY_REGISTRY
+
+    def test_delete_pattern_scans_shared_keys(self, redis_cache, other_worker):
+        # Entries written by "another worker" are invisible to any local registry
+        other_worker.set('cascade:years', {'years': []}, 60)
+        other_worker.set('cascade:months:2025', [], 60)
+        other_worker.set('forecast:7:2025', [], 60)
+
+        assert delete_pattern('cascade:*') == 2
+        assert redis_cache.get('cascade:years') is None
+        assert redis_cache.get('forecast:7:2025') == []
+
+    def test_clear_cascade_caches_reaches_other_workers(self, redis_cache, other_worker):
+        other_worker.set('cascade:platforms:2025:7', [], 60)
+
+        clear_cascade_caches()
+
+        assert other_worker.get('cascade:platforms:2025:7') is None
+
+    def test_delete_many_removes_all_keys_together(self, redis_cache):
+        redis_cache.set_many({'forecast:7:2025': [1], 'schema:forecast:7:2025': {'a': 1}}, 60)
+
+        assert delete_many(['forecast:7:2025', 'schema:forecast:7:2025', 'missing']) == 2
+        assert redis_cache.get_many(['forecast:7:2025', 'schema:forecast:7:2025']) == {}
+
+    def test_clear_forecast_cache_uses_shared_delete(self, redis_cache, other_worker):
+        other_worker.set('forecast:7:2025', [1], 60)
+        other_worker.set('schema:forecast:7:2025', {}, 60)
+
+        clear_forecast_cache(7, 2025)
+
+        assert other_worker.get('forecast:7:2025') is None
+        assert other_worker.get('schema:forecast:7:2025') is None
+
+    def test_clear_all_only_touches_prefixed_keys(self, redis_cache):
+        client = redis_cache._cache.get_client(None, write=True)
+        client.set('context:conversation-1', 'chat state')
+        redis_cache.set('forecast:7:2025', [1], 60)
+
+        clear_all_caches()
+
+        assert _raw_keys(redis_cache) == ['context:conversation-1']
+        client.delete('context:conversation-1')
+
+    def test_tag_invalidation_reaches_other_workers(self, redis_cache, other_worker):
+        @cache_with_ttl(ttl=60, key_prefix='forecast', stale_ttl=30, tags=('forecast',))
+        def fetch(month, year):
+            return [month]
+
+        fetch(7, 2025)
+        fetch(8, 2025)
+
+        # Tag sets live in redis, so any worker can invalidate what another cached
+        assert invalidate_tags(['forecast'], 'July', 2025) == 2  # value + freshness marker
+        assert other_worker.get('forecast:7:2025') is None
+        assert other_worker.get('forecast:8:2025') == [8]
+        assert not any(key.endswith('__tag__:forecast:2025:7') for key in _raw_keys(redis_cache))
+
+    def test_tag_invalidation_is_not_an_eviction(self, redis_cache):
+        @cache_with_ttl(ttl=60, key_prefix='forecast', tags=('forecast',))
+        def fetch(month, year):
+            return [month]
+
+        fetch(7, 2025)
+        invalidate_tags(['forecast'], 'July', 2025)
+        fetch(7, 2025)
+
+        assert get_cache_metrics()['prefixes']['forecast']['evictions'] == 0
+
+
+def test_filebased_pattern_delete_uses_registry(tmp_path, monkeypatch):
+    cache_settings = {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'filebased': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': str(tmp_path),
+        },
+    }
+    with override_settings(CACHES=cache_settings):
+        monkeypatch.setattr(ForecastCacheConfig, 'CACHE_BACKEND', 'filebased')
+
+        @cache_with_ttl(ttl=60, key_prefix='cascade:months')
+        def months(year):
+            return [{'value': '1'}]
+
+        months(2025)
+        caches['filebased'].set('forecast:7:2025', [1], 60)
+
+        assert delete_pattern('cascade:*') == 1
+        assert caches['filebased'].get('cascade:months:2025') is None
+        assert caches['filebased'].get('forecast:7:2025') == [1]
+
+
+def test_missing_cache_alias_fails_validation(monkeypatch):
+    cache_settings = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+    with override_settings(CACHES=cache_settings):
+        monkeypatch.setattr(ForecastCacheConfig, 'CACHE_BACKEND', 'redis')
+        with pytest.raises(ImproperlyConfigured, match='CENTENE_REDIS_URL'):
+            validate_cache_backend()
+
+        monkeypatch.setattr(ForecastCacheConfig, 'CACHE_BACKEND', 'default')
+        validate_cache_backend()
@@ -0,0 +1,175 @@
+"""
+Tests for conditional revalidation of cached backend data.
+
+Entries cached with cache_with_ttl(..., revalidate=True) keep the backend's
+ETag / Last-Modified. Once expired they are checked with conditional GETs:
+a 304 must extend the TTL without any body being sent or decoded, a change
+must refetch, and responses without validators keep the plain TTL behaviour.
+"""
+import time
+
+import pytest
+
+from core.config import ForecastCacheConfig
+from centene_forecast_app.app_utils import cache_utils
+from centene_forecast_app.app_utils.cache_utils import (
+    _get_cache,
+    get_cache_metrics,
+    invalidate_tags,
+)
+from centene_forecast_app.tests.conftest import make_forecast_rows
+
+ROWS = make_forecast_rows(250)
+
+
+def versioned_route(rows: list, versions: dict):
+    """Paginated /records/forecast whose pages carry an ETag per (version, skip)."""
+    def _handler(path, query):
+        skip = int(query.get('skip', 0))
+        limit = int(query.get('limit', 100))
+        version = versions.get(skip, 1)
+        page = [dict(row, version=version) for row in rows[skip:skip + limit]]
+        return 200, {'data': page, 'total': len(rows)}, {'ETag': f'"v{version}-{skip}"'}
+    return _handler
+
+
+def _cache_keys(prefix: str, suffix: str = '') -> list:
+    return [
+        key for key in cache_utils._CACHE_KEY_REGISTRY
+        if key.startswith(prefix + ':') and key.endswith(suffix)
+    ]
+
+
+def _expire(prefix: str):
+    """Make every entry of prefix look past its TTL and stale window."""
+    cache = _get_cache()
+    for key in _cache_keys(prefix, ':__validators__'):
+        cache_key = key[:-len(':__validators__')]
+        validators = cache.get(key)
+        validators['stored_at'] -= ForecastCacheConfig.DATA_TTL + ForecastCacheConfig.DATA_STALE_TTL + 1
+        cache.set(key, validators, 60)
+        cache.delete(cache_utils._fresh_key(cache_key))
+
+
+@pytest.fixture(autouse=True)
+def fast_lock_polling(monkeypatch):
+    monkeypatch.setattr(ForecastCacheConfig, 'LOCK_POLL_INTERVAL', 0.01)
+
+
+class TestForecastRevalidation:
+
+    def test_not_modified_extends_ttl_without_transfer(self, stub_backend, api_client):
+        stub_backend.route('/records/forecast', versioned_route(ROWS, {}))
+        first = api_client.get_all_forecast_records(3, 2025, 4)
+        sent = stub_backend.bytes_sent
+
+        _expire('forecast')
+        second = api_client.get_all_forecast_records(3, 2025, 4)
+
+        assert second == first
+        assert stub_backend.bytes_sent == sent
+        assert len(stub_backend.requests_for('/records/forecast')) == 6
+        metrics = get_cache_metrics()['prefixes']['forecast']
+        assert metrics['revalidations'] == 1
+        assert metrics['not_modified'] == 1
+        [cache_key] = _cache_keys('forecast', ':__fresh__')
+        assert _get_cache().get(cache_key) is True
+
+        # Fresh again: served without touching the backend
+        api_client.get_all_forecast_records(3, 2025, 4)
+        assert len(stub_backend.requests_for('/records/forecast')) == 6
+
+    def test_changed_page_refetches_everything(self, stub_backend, api_client):
+        versions = {}
+        stub_backend.route('/records/forecast', versioned_route(ROWS, versions))
+        api_client.get_all_forecast_records(3, 2025, 4)
+
+        versions[200] = 2
+        _expire('forecast')
+        records = api_client.get_all_forecast_records(3, 2025, 4)
+
+        assert sorted(record['version'] for record in records)[-1] == 2
+        assert len(records) == len(ROWS)
+        metrics = get_cache_metrics()['prefixes']['forecast']
+        assert metrics['revalidations'] == 1
+        assert metrics['not_modified'] == 0
+
+    def test_recently_expired_entry_is_served_stale(self, stub_backend, api_client):
+        stub_backend.route('/records/forecast', versioned_route(ROWS, {}))
+        first = api_client.get_all_forecast_records(3, 2025, 4)
+        [fresh_key] = _cache_keys('forecast', ':__fresh__')
+        _get_cache().delete(fresh_key)
+
+        assert api_client.get_all_forecast_records(3, 2025, 4) == first
+
+        deadline = time.time() + 5
+        while _get_cache().get(fresh_key) is None and time.time() < deadline:
+            time.sleep(0.01)
+        assert get_cache_metrics()['prefixes']['forecast']['not_modified'] == 1
+
+    def test_invalidation_drops_validators(self, stub_backend, api_client):
+        stub_backend.route('/records/forecast', versioned_route(ROWS, {}))
+        api_client.get_all_forecast_records(3, 2025, 4)
+        assert _cache_keys('forecast', ':__validators__')
+
+        invalidate_tags(('forecast',), 3, 2025)
+        api_client.get_all_forecast_records(3, 2025, 4)
+
+        assert len(stub_backend.requests_for('/records/forecast')) == 6
+        assert get_cache_metrics()['prefixes']['forecast']['revalidations'] == 0
+
+    def test_failed_page_is_never_revalidated(self, stub_backend, api_client):
+        failing = {100}
+        pages = versioned_route(ROWS, {})
+
+        def _handler(path, query):
+            if int(query.get('skip', 0)) in failing:
+                return 500, {'detail': 'backend unavailable'}
+            return pages(path, query)
+
+        stub_backend.route('/records/forecast', _handler)
+        assert len(api_client.get_all_forecast_records(3, 2025, 4)) == 100
+        assert not _cache_keys('forecast', ':__validators__')
+
+        # Expired: refetched in full, not revalidated into the truncated list
+        failing.clear()
+        [fresh_key] = _cache_keys('forecast', ':__fresh__')
+        _get_cache().delete(fresh_key)
+        api_client.get_all_forecast_records(3, 2025, 4)
+        deadline = time.time() + 5
+        while _get_cache().get(fresh_key) is None and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert len(api_client.get_all_forecast_records(3, 2025, 4)) == len(ROWS)
+        assert get_cache_metrics()['prefixes']['forecast']['revalidations'] == 0
+
+
+class TestSummaryRevalidation:
+
+    def test_last_modified_not_modified(self, stub_backend, api_client):
+        stub_backend.route('/table/summary/capacity', lambda path, query: (
+            200, b'<table>' + b'<tr><td>42</td></tr>' * 500 + b'</table>',
+            {'Content-Type': 'text/html', 'Last-Modified': 'Mon, 03 Mar 2025 10:00:00 GMT'}
+        ))
+        html = api_client.get_table_summary('capacity', 3, 2025)
+        sent = stub_backend.bytes_sent
+
+        _expire('summary')
+        assert api_client.get_table_summary('capacity', 3, 2025) == html
+
+        assert stub_backend.bytes_sent == sent
+        assert len(stub_backend.requests_for('/table/summary/capacity')) == 2
+
+    def test_response_without_validators_keeps_plain_ttl(self, stub_backend, api_client):
+        stub_backend.route('/table/summary/capacity', lambda path, query: (
+            200, b'<table></table>', {'Content-Type': 'text/html'}
+        ))
+        api_client.get_table_summary('capacity', 3, 2025)
+        assert not _cache_keys('summary', ':__validators__')
+
+        [fresh_key] = _cache_keys('summary', ':__fresh__')
+        _get_cache().delete(fresh_key)
+        api_client.get_table_summary('capacity', 3, 2025)
+
+        assert len(stub_backend.requests_for('/table/summary/capacity')) == 2
+        assert get_cache_metrics()['prefixes']['summary']['revalidations'] == 0
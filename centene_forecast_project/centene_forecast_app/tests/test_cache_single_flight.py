@@ -0,0 +1,175 @@
+"""
+Tests for stampede protection in cache_with_ttl.
+
+Covers in-process coalescing of concurrent misses, the cross-worker
+cache lock, and stale-while-revalidate refreshes.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core.config import ForecastCacheConfig
+from centene_forecast_app.app_utils.cache_utils import (
+    _get_cache,
+    cache_with_ttl,
+    get_single_flight_stats,
+    reset_single_flight_stats,
+)
+from centene_forecast_app.tests.conftest import make_forecast_rows, paginated_route
+
+
+@pytest.fixture(autouse=True)
+def fast_lock_polling(monkeypatch):
+    """Keep lock polling quick and counters isolated per test."""
+    monkeypatch.setattr(ForecastCacheConfig, 'LOCK_POLL_INTERVAL', 0.01)
+    monkeypatch.setattr(ForecastCacheConfig, 'LOCK_WAIT_TIMEOUT', 5)
+    reset_single_flight_stats()
+    yield
+    reset_single_flight_stats()
+
+
+def _call_concurrently(func, callers: int):
+    """Call func from `callers` threads released at the same instant."""
+    barrier = threading.Barrier(callers)
+
+    def _call():
+        barrier.wait()
+        return func()
+
+    with ThreadPoolExecutor(max_workers=callers) as executor:
+        futures = [executor.submit(_call) for _ in range(callers)]
+        return [future.result() for future in futures]
+
+
+def test_concurrent_misses_compute_once():
+    calls = []
+
+    @cache_with_ttl(ttl=60, key_prefix='sf_test')
+    def load(month, year):
+        calls.append((month, year))
+        time.sleep(0.2)
+        return {'month': month, 'year': year}
+
+    results = _call_concurrently(lambda: load(7, 2025), callers=10)
+
+    assert len(calls) == 1
+    assert all(result == {'month': 7, 'year': 2025} for result in results)
+    assert get_single_flight_stats()['sf_test']['coalesced_waits'] == 9
+    assert _get_cache().get('sf_test:7:2025:__lock__') is None
+
+
+def test_leader_error_is_shared_and_not_cached():
+    calls = []
+
+    @cache_with_ttl(ttl=60, key_prefix='sf_error')
+    def load():
+        calls.append(1)
+        time.sleep(0.2)
+        raise RuntimeError('backend down')
+
+    def _call():
+        try:
+            load()
+        except RuntimeError as e:
+            return str(e)
+
+    results = _call_concurrently(_call, callers=5)
+
+    assert len(calls) == 1
+    assert results == ['backend down'] * 5
+
+    # Nothing cached, so the next call tries the backend again
+    with pytest.raises(RuntimeError):
+        load()
+    assert len(calls) == 2
+
+
+def test_waits_for_other_worker_holding_lock():
+    """A lock held elsewhere means poll for that worker's value instead of recomputing."""
+    calls = []
+
+    @cache_with_ttl(ttl=60, key_prefix='sf_remote')
+    def load(month):
+        calls.append(month)
+        return 'local'
+
+    cache = _get_cache()
+    cache.add('sf_remote:7:__lock__', 'other-worker', 30)
+
+    def _other_worker_finishes():
+        time.sleep(0.1)
+        cache.set('sf_remote:7', 'remote', 60)
+        cache.delete('sf_remote:7:__lock__')
+
+    threading.Thread(target=_other_worker_finishes).start()
+
+    assert load(7) == 'remote'
+    assert calls == []
+    assert get_single_flight_stats()['sf_remote']['lock_waits'] == 1
+
+
+def test_recomputes_when_lock_released_without_value():
+    calls = []
+
+    @cache_with_ttl(ttl=60, key_prefix='sf_released')
+    def load():
+        calls.append(1)
+        return 'local'
+
+    cache = _get_cache()
+    cache.add('sf_released:__lock__', 'other-worker', 30)
+    threading.Timer(0.05, cache.delete, args=('sf_released:__lock__',)).start()
+
+    assert load() == 'local'
+    assert calls == [1]
+
+
+def test_stale_value_served_while_refreshing():
+    calls = []
+
+    @cache_with_ttl(ttl=60, key_prefix='sf_stale', stale_ttl=60)
+    def load():
+        calls.append(1)
+        time.sleep(0.1)
+        return f"v{len(calls)}"
+
+    assert load() == 'v1'
+
+    # Expire the fresh window only; the value itself is still within stale_ttl
+    _get_cache().delete('sf_stale:__fresh__')
+
+    started = time.monotonic()
+    results = _call_concurrently(load, callers=5)
+    elapsed = time.monotonic() - started
+
+    assert results == ['v1'] * 5
+    assert elapsed < 0.1, "stale reads must not wait for the refresh"
+
+    deadline = time.monotonic() + 2
+    while _get_cache().get('sf_stale') != 'v2' and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert _get_cache().get('sf_stale') == 'v2'
+    assert len(calls) == 2
+    stats = get_single_flight_stats()['sf_stale']
+    assert stats['stale_served'] == 5
+    assert stats['background_refreshes'] == 1
+
+
+def test_concurrent_report_requests_hit_backend_once(stub_backend, api_client):
+    stub_backend.latency = 0.05
+    stub_backend.route('/records/forecast', paginated_route(make_forecast_rows(250)))
+
+    results = _call_concurrently(
+        lambda: api_client.get_all_forecast_records(month=7, year=2025, forecast_month=7),
+        callers=8
+    )
+
+    assert all(len(result) == 250 for result in results)
+    first_page_requests = [
+        query for _, query in stub_backend.requests_for('/records/forecast')
+        if query.get('skip') == '0'
+    ]
+    assert len(first_page_requests) == 1
@@ -0,0 +1,126 @@
+"""
+Tests for tag-based cache invalidation.
+
+Entries are tagged by data domain and (month, year); invalidate_tags()
+must drop exactly the affected period plus cross-period entries.
+"""
+import pytest
+
+from centene_forecast_app.app_utils.cache_utils import (
+    cache_tags,
+    cache_with_ttl,
+    inspect_cache_value,
+    invalidate_tags,
+)
+from centene_forecast_app.app_utils.file_utils import get_upload_period
+from centene_forecast_app.tests.conftest import make_forecast_rows, paginated_route
+
+
+@cache_with_ttl(ttl=60, key_prefix='tag_test:records', tags=('forecast',))
+def _records(month, year):
+    return f"records {month}/{year}"
+
+
+@cache_with_ttl(ttl=60, key_prefix='tag_test:months', tags=('forecast',))
+def _months(year):
+    return f"months {year}"
+
+
+@cache_with_ttl(ttl=60, key_prefix='tag_test:years', tags=('forecast',))
+def _years():
+    return 'years'
+
+
+@cache_with_ttl(ttl=60, key_prefix='tag_test:roster', tags=('{roster_type}',))
+def _roster(roster_type, month, year):
+    return f"{roster_type} {month}/{year}"
+
+
+class TestCacheTags:
+    def test_period_tags(self):
+        assert cache_tags('forecast', 7, 2025) == ['forecast', 'forecast:2025', 'forecast:2025:7']
+        assert cache_tags('forecast', 'July', '2025') == ['forecast', 'forecast:2025', 'forecast:2025:7']
+        assert cache_tags('forecast', None, 2025) == ['forecast', 'forecast:2025', 'forecast:2025:all']
+        assert cache_tags('forecast') == ['forecast', 'forecast:global']
+
+    def test_month_invalidation_keeps_other_months(self):
+        _records(7, 2025)
+        _records(8, 2025)
+        _months(2025)
+        _months(2024)
+        _years()
+
+        invalidate_tags(['forecast'], 7, 2025)
+
+        assert inspect_cache_value('tag_test:records:7:2025') is None
+        assert inspect_cache_value('tag_test:months:2025') is None
+        assert inspect_cache_value('tag_test:years') is None
+        assert inspect_cache_value('tag_test:records:8:2025') == 'records 8/2025'
+        assert inspect_cache_value('tag_test:months:2024') == 'months 2024'
+
+    def test_month_name_matches_numeric_entry(self):
+        _records(4, 2025)
+
+        assert invalidate_tags(['forecast'], 'April', 2025) == 1
+        assert inspect_cache_value('tag_test:records:4:2025') is None
+
+    def test_domain_invalidation_without_period(self):
+        _records(7, 2025)
+        _records(8, 2024)
+
+        invalidate_tags('forecast')
+
+        assert inspect_cache_value('tag_test:records:7:2025') is None
+        assert inspect_cache_value('tag_test:records:8:2024') is None
+
+    def test_domain_placeholder_from_arguments(self):
+        _roster('roster', 7, 2025)
+        _roster('prod_team_roster', 7, 2025)
+
+        invalidate_tags(['prod_team_roster'], 7, 2025)
+
+        assert inspect_cache_value('tag_test:roster:roster:7:2025') == 'roster 7/2025'
+        assert inspect_cache_value('tag_test:roster:prod_team_roster:7:2025') is None
+
+
+class TestEditFlowInvalidation:
+    def test_bench_allocation_update_clears_only_edited_month(self, stub_backend, api_client):
+        stub_backend.route('/records/forecast', paginated_route(make_forecast_rows(10)))
+        stub_backend.route('/api/bench-allocation/update', lambda path, query: (200, {'success': True}))
+
+        api_client.get_all_forecast_records(4, 2025, 4)
+        api_client.get_all_forecast_records(5, 2025, 5)
+        assert len(stub_backend.requests_for('/records/forecast')) == 2
+
+        response = api_client.update_bench_allocation('April', 2025, {}, [], 'notes')
+        assert response['success'] is True
+
+        api_client.get_all_forecast_records(4, 2025, 4)
+        api_client.get_all_forecast_records(5, 2025, 5)
+        months_refetched = [query['month'] for _, query in stub_backend.requests_for('/records/forecast')[2:]]
+        assert months_refetched == ['April']
+
+    def test_failed_update_keeps_cache(self, stub_backend, api_client):
+        stub_backend.route('/records/forecast', paginated_route(make_forecast_rows(10)))
+        stub_backend.route(
+            '/api/edit-view/target-cph/update/',
+            lambda path, query: (400, {'success': False, 'error': 'invalid'})
+        )
+
+        api_client.get_all_forecast_records(4, 2025, 4)
+        api_client.submit_target_cph_update('April', 2025, {}, [], 'notes')
+        api_client.get_all_forecast_records(4, 2025, 4)
+
+        assert len(stub_backend.requests_for('/records/forecast')) == 1
+
+
+@pytest.mark.parametrize('response, filename, expected', [
+    ({'data': {'month': 'July', 'year': 2025}}, 'upload.xlsx', (7, 2025)),
+    ({'month': 3, 'year': '2024'}, 'upload.xlsx', (3, 2024)),
+    ({}, 'forecast_July_2025.xlsx', (7, 2025)),
+    ({}, 'roster-Jul-2025.csv', (7, 2025)),
+    ({}, 'forecast_2025_07.xlsx', (7, 2025)),
+    ({}, 'prod team roster.xlsx', (None, None)),
+])
+def test_get_upload_period(response, filename, expected):
+    assert get_upload_period(response, filename) == expected
@@ -0,0 +1,173 @@
+"""
+Tests for cache warm-up.
+
+warm_caches() must populate exactly the entries the data view reads (same
+methods, same arguments), walk the cascade tree level by level, skip months
+the backend does not have, and report what it warmed.
+"""
+import json
+from datetime import date
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.test import RequestFactory
+
+from centene_forecast_app.app_utils import cache_utils
+from centene_forecast_app.management.commands import warm_caches as warm_caches_command
+from centene_forecast_app import repository
+from centene_forecast_app.app_utils.cache_utils import peek_cached
+from centene_forecast_app.services import cache_warmup_service, dataview_service
+from centene_forecast_app.services.cache_warmup_service import active_report_months, warm_caches
+from centene_forecast_app.views import cache_views
+
+CASCADE = {
+    '/forecast/filter-years': {'years': [{'value': '2025', 'display': '2025'}]},
+    '/roster/filter-years': {'years': [{'value': '2025', 'display': '2025'}]},
+    '/forecast/months/2025': [{'value': '3', 'display': 'March'}, {'value': '4', 'display': 'April'}],
+    '/forecast/platforms': [{'value': 'Amisys', 'display': 'Amisys'}, {'value': 'Facets', 'display': 'Facets'}],
+    '/forecast/markets': [{'value': 'Medicaid', 'display': 'Medicaid'}],
+    '/forecast/localities': [{'value': '', 'display': '-- All Localities --'}, {'value': 'Domestic', 'display': 'Domestic'}],
+    '/forecast/worktypes': [{'value': 'Claims', 'display': 'Claims'}],
+    '/model_schema/roster': {'schema': ['id']},
+    '/model_schema/prod_team_roster': {'schema': ['id']},
+    '/model_schema/forecast': {'schema': ['id']},
+    '/table/summary/capacity': b'<table></table>',
+}
+
+
+@pytest.fixture
+def cascade_backend(stub_backend, api_client, monkeypatch):
+    for path, payload in CASCADE.items():
+        stub_backend.route(path, lambda path, query, payload=payload: (200, payload))
+    monkeypatch.setattr(cache_warmup_service, 'SUMMARY_TYPES', ['capacity'])
+    monkeypatch.setattr(cache_warmup_service, 'get_api_client', lambda: api_client)
+    monkeypatch.setattr(repository, 'get_api_client', lambda: api_client)
+    yield stub_backend
+    dataview_service._tree_failures.clear()
+
+
+def _view_calls(client, month, year):
+    """Every cached read the data view makes for one month."""
+    client.get_forecast_filter_years()
+    client.get_roster_filter_years()
+    client.get_forecast_months_for_year(year)
+    client.get_roster_model_schema('roster', month, year)
+    client.get_table_summary('capacity', month, year)
+    for platform in ('Amisys', 'Facets'):
+        client.get_forecast_platforms(year, month)
+        client.get_forecast_markets(year, month, platform)
+        client.get_forecast_localities(year, month, platform, 'Medicaid')
+        client.get_forecast_worktypes(year, month, platform, 'Medicaid', None)
+        client.get_forecast_worktypes(year, month, platform, 'Medicaid', 'Domestic')
+        client.get_forecast_model_schema(month, year, f'{platform} Medicaid', '')
+        client.get_forecast_model_schema(month, year, f'{platform} Medicaid Domestic', '')
+
+
+def test_warmed_entries_serve_the_data_view(cascade_backend, api_client):
+    result = warm_caches([(3, 2025)])
+    requests_after_warmup = len(cascade_backend.request_log)
+
+    _view_calls(api_client, 3, 2025)
+
+    assert len(cascade_backend.request_log) == requests_after_warmup
+    assert peek_cached('cascade:tree', 2025, 3)['platforms'][1]['value'] == 'Facets'
+    # years x2, months, platforms, 2 schemas, summary, then per platform:
+    # markets, localities, 2 worktypes, 2 forecast schemas; then the tree
+    assert result['warmed'] == 7 + 2 * 6 + 1
+    assert result['failed'] == 0
+    assert result['periods'] == [[3, 2025]]
+    assert result['duration_seconds'] >= 0
+
+
+def test_months_missing_on_backend_are_skipped(cascade_backend):
+    result = warm_caches([(4, 2025), (5, 2025)], include_schemas=False, include_summaries=False)
+
+    assert result['periods'] == [[4, 2025]]
+    assert not cascade_backend.requests_for('/model_schema/roster')
+    assert [query['month'] for _, query in cascade_backend.requests_for('/forecast/platforms')] == ['4']
+
+
+def test_failed_calls_are_counted(cascade_backend):
+    cascade_backend.route('/forecast/markets', lambda path, query: (500, {'detail': 'down'}))
+
+    result = warm_caches([(3, 2025)], include_schemas=False, include_summaries=False)
+
+    assert result['failed'] == 2 + 1  # the tree needs the failed markets too
+    assert not cascade_backend.requests_for('/forecast/localities')
+
+
+def test_active_report_months_wrap_the_year():
+    assert active_report_months(date(2025, 12, 15), months_ahead=1) == [(12, 2025), (1, 2026)]
+
+
+def test_command_reports_count_and_duration(cascade_backend, monkeypatch):
+    monkeypatch.setattr(warm_caches_command, 'is_shared_cache', lambda: True)
+    out = StringIO()
+
+    call_command('warm_caches', '--period', '3/2025', '--no-summaries', stdout=out)
+
+    assert 'Warmed 19 cache entries in' in out.getvalue()
+    assert '(periods: 3/2025)' in out.getvalue()
+
+
+@pytest.mark.parametrize('backend', ['locmem', 'filebased'])
+def test_command_refuses_unshared_cache(cascade_backend, monkeypatch, backend):
+    # filebased entries would be missing from the server's tag registry
+    monkeypatch.setattr(cache_utils, '_get_cache_backend_type', lambda: backend)
+
+    with pytest.raises(CommandError, match='not shared with the server'):
+        call_command('warm_caches', '--period', '3/2025', stdout=StringIO())
+
+    assert not cascade_backend.request_log
+
+
+def _post_warm(body):
+    from core.models import User
+
+    request = RequestFactory().post('/api/cache/warm/', json.dumps(body), content_type='application/json')
+    request.user = User(username='admin', is_active=True, is_superuser=True)
+    response = cache_views.warm_caches_view(request)
+    return response.status_code, json.loads(response.content)
+
+
+def test_endpoint_warms_the_server_cache(cascade_backend, api_client, monkeypatch):
+    threads = []
+
+    def start(periods, **options):
+        thread = cache_warmup_service.start_background_warmup(periods, include_summaries=False, **options)
+        threads.append(thread)
+        return thread
+
+    monkeypatch.setattr(cache_views, 'start_background_warmup', start)
+
+    status, body = _post_warm({'periods': ['3/2025']})
+    threads[0].join(timeout=10)
+    requests_after_warmup = len(cascade_backend.request_log)
+    api_client.get_forecast_markets(2025, 3, 'Amisys')
+
+    assert (status, body['periods']) == (202, [[3, 2025]])
+    assert len(cascade_backend.request_log) == requests_after_warmup
+
+
+def test_endpoint_rejects_concurrent_warmup(cascade_backend):
+    with cache_warmup_service._background_lock:
+        status, body = _post_warm({})
+
+    assert status == 409
+    assert not cascade_backend.request_log
+
+
+@pytest.mark.parametrize('body', [
+    {'periods': ['13/2025']},
+    {'periods': 5},
+    {'months_ahead': []},
+    {'months_ahead': {}},
+    {'months_ahead': '2'},
+    ['3/2025'],
+])
+def test_endpoint_rejects_invalid_request(cascade_backend, body):
+    status, body = _post_warm(body)
+
+    assert status == 400
+    assert not cascade_backend.request_log
@@ -0,0 +1,169 @@
+"""
+Tests for the forecast cascade tree.
+
+get_cascade_tree() must fetch every dropdown level of a month once, cache
+the whole tree, and let the per-level endpoints answer from it without
+waiting for it to be built; a backend error must not be cached, must fall
+back to per-level fetches and must not be retried for a while.
+"""
+import json
+
+import pytest
+from django.test import RequestFactory
+
+from core.config import ForecastCacheConfig
+from centene_forecast_app import repository
+from centene_forecast_app.services import dataview_service
+from centene_forecast_app.services.dataview_service import (
+    get_cascade_tree,
+    get_localities_for_selection,
+    get_markets_for_platform,
+    get_platforms_for_selection,
+    get_worktypes_for_selection,
+    load_cascade_tree,
+    start_cascade_tree_build,
+)
+from centene_forecast_app.views import views
+
+LOCALITIES = [{'value': '', 'display': '-- All Localities --'}, {'value': 'Domestic', 'display': 'Domestic'}]
+
+
+def _worktypes_route(path, query):
+    suffix = f"-{query['locality']}" if 'locality' in query else ''
+    return 200, [{'value': f"{query['platform']}-{query['market']}{suffix}", 'display': 'Claims'}]
+
+
+@pytest.fixture
+def cascade_backend(stub_backend, api_client, monkeypatch):
+    stub_backend.route('/forecast/platforms', lambda path, query: (
+        200, [{'value': 'Amisys', 'display': 'Amisys'}, {'value': 'Facets', 'display': 'Facets'}]
+    ))
+    stub_backend.route('/forecast/markets', lambda path, query: (
+        200, [{'value': 'Medicaid', 'display': 'Medicaid'}, {'value': 'Medicare', 'display': 'Medicare'}]
+    ))
+    stub_backend.route('/forecast/localities', lambda path, query: (200, LOCALITIES))
+    stub_backend.route('/forecast/worktypes', _worktypes_route)
+    monkeypatch.setattr(repository, 'get_api_client', lambda: api_client)
+    yield stub_backend
+    dataview_service._tree_failures.clear()
+
+
+@pytest.fixture
+def tree_builds(monkeypatch):
+    """Threads started by the per-level functions to build the tree."""
+    threads = []
+
+    def start(year, month):
+        thread = start_cascade_tree_build(year, month)
+        if thread is not None:
+            threads.append(thread)
+        return thread
+
+    monkeypatch.setattr(dataview_service, 'start_cascade_tree_build', start)
+    return threads
+
+
+def _get_tree(**params):
+    from core.models import User
+
+    request = RequestFactory().get('/forecast/cascade-tree/', params)
+    request.user = User(username='analyst', is_active=True, is_superuser=True)
+    response = views.forecast_cascade_tree_api(request)
+    return response.status_code, json.loads(response.content)
+
+
+def _request_count(backend):
+    return len(backend.request_log)
+
+
+class TestCascadeTree:
+
+    def test_tree_holds_every_level(self, cascade_backend):
+        tree = get_cascade_tree(2025, 3)
+
+        assert [platform['value'] for platform in tree['platforms']] == ['Amisys', 'Facets']
+        market = tree['platforms'][1]['markets'][0]
+        assert market['localities'] == LOCALITIES
+        assert market['worktypes'] == {
+            '': [{'value': 'Facets-Medicaid', 'display': 'Claims'}],
+            'Domestic': [{'value': 'Facets-Medicaid-Domestic', 'display': 'Claims'}],
+        }
+        # platforms, 2 markets, 4 localities, 4 x (all + Domestic) worktypes
+        assert _request_count(cascade_backend) == 1 + 2 + 4 + 8
+
+    def test_levels_are_served_from_the_cached_tree(self, cascade_backend):
+        get_cascade_tree(2025, 3)
+        requests = _request_count(cascade_backend)
+
+        assert get_platforms_for_selection(2025, 3) == [
+            {'value': 'Amisys', 'display': 'Amisys'}, {'value': 'Facets', 'display': 'Facets'}
+        ]
+        assert [m['value'] for m in get_markets_for_platform(2025, 3, 'Amisys')] == ['Medicaid', 'Medicare']
+        assert get_localities_for_selection(2025, 3, 'Amisys', 'Medicare') == LOCALITIES
+        assert get_worktypes_for_selection(2025, 3, 'Amisys', 'Medicare', 'Domestic') == [
+            {'value': 'Amisys-Medicare-Domestic', 'display': 'Claims'}
+        ]
+        assert get_markets_for_platform(2025, 3, 'Unknown') == []
+        assert _request_count(cascade_backend) == requests
+
+    def test_backend_error_falls_back_to_level_fetch(self, cascade_backend):
+        cascade_backend.route('/forecast/worktypes', lambda path, query: (500, {'detail': 'down'}))
+
+        status, body = _get_tree(year='2025', month='3')
+        platforms = get_platforms_for_selection(2025, 3)
+
+        assert status == 502
+        assert body['success'] is False
+        assert [platform['value'] for platform in platforms] == ['Amisys', 'Facets']
+
+        # The failed tree was not cached
+        cascade_backend.route('/forecast/worktypes', _worktypes_route)
+        assert 'platforms' in get_cascade_tree(2025, 3)
+
+    def test_level_miss_builds_tree_in_background(self, cascade_backend, tree_builds):
+        markets = get_markets_for_platform(2025, 3, 'Amisys')
+
+        assert [m['value'] for m in markets] == ['Medicaid', 'Medicare']
+        assert len(tree_builds) == 1
+        tree_builds[0].join(5)
+        requests = _request_count(cascade_backend)
+
+        assert get_localities_for_selection(2025, 3, 'Amisys', 'Medicaid') == LOCALITIES
+        assert _request_count(cascade_backend) == requests
+
+    def test_failed_build_is_not_retried(self, cascade_backend, tree_builds):
+        cascade_backend.route('/forecast/worktypes', lambda path, query: (500, {'detail': 'down'}))
+
+        assert load_cascade_tree(2025, 3)['success'] is False
+        requests = _request_count(cascade_backend)
+        assert load_cascade_tree(2025, 3)['success'] is False
+        markets = get_markets_for_platform(2025, 3, 'Amisys')
+
+        assert [m['value'] for m in markets] == ['Medicaid', 'Medicare']
+        assert tree_builds == []
+        assert _request_count(cascade_backend) == requests
+
+    def test_disabled_tree_fetches_single_level(self, cascade_backend, monkeypatch):
+        monkeypatch.setattr(ForecastCacheConfig, 'SERVE_CASCADE_FROM_TREE', False)
+
+        get_markets_for_platform(2025, 3, 'Amisys')
+
+        assert [path for path, _ in cascade_backend.request_log] == ['/forecast/markets']
+
+
+class TestCascadeTreeView:
+
+    def test_returns_tree(self, cascade_backend):
+        status, body = _get_tree(year='2025', month='3')
+
+        assert status == 200
+        assert (body['type'], body['year'], body['month'], body['count']) == ('cascade_tree', 2025, 3, 2)
+        assert body['platforms'][0]['markets'][1]['worktypes'][''] == [
+            {'value': 'Amisys-Medicare', 'display': 'Claims'}
+        ]
+
+    def test_invalid_month_is_rejected(self, cascade_backend):
+        status, body = _get_tree(year='2025', month='13')
+
+        assert status == 400
+        assert not cascade_backend.request_log
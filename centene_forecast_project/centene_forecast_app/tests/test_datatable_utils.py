@@ -0,0 +1,114 @@
+"""
+Tests for DataTables server-side processing helpers.
+"""
+from django.http import QueryDict
+
+from centene_forecast_app.app_utils.datatable_utils import (
+    build_datatable_response,
+    is_server_side_request,
+    parse_datatable_request,
+)
+from centene_forecast_app.tests.conftest import make_forecast_rows
+
+
+COLUMNS = ['id', 'main_lob', 'state', 'case_type', 'forecast']
+
+
+def _query(draw=1, start=0, length=10, search='', order=None, column_search=None):
+    """Build the query string DataTables sends in server-side mode."""
+    params = {'draw': draw, 'start': start, 'length': length, 'search[value]': search, 'month': 'Jun-25'}
+    for i, name in enumerate(COLUMNS):
+        params[f'columns[{i}][data]'] = name
+        params[f'columns[{i}][searchable]'] = 'true'
+        params[f'columns[{i}][orderable]'] = 'true'
+        params[f'columns[{i}][search][value]'] = (column_search or {}).get(name, '')
+    for i, (col, direction) in enumerate(order or []):
+        params[f'order[{i}][column]'] = COLUMNS.index(col)
+        params[f'order[{i}][dir]'] = direction
+    query = QueryDict(mutable=True)
+    for key, value in params.items():
+        query[key] = str(value)
+    return query
+
+
+def test_client_side_request_returns_everything():
+    records = make_forecast_rows(30)
+    query = QueryDict('month=Jun-25')
+
+    assert not is_server_side_request(query)
+    response = build_datatable_response(records, query)
+
+    assert response['recordsTotal'] == 30
+    assert response['recordsFiltered'] == 30
+    assert len(response['data']) == 30
+
+
+def test_page_slice_and_draw_echo():
+    records = make_forecast_rows(30000)
+
+    response = build_datatable_response(records, _query(draw=7, start=20, length=10))
+
+    assert response['draw'] == 7
+    assert response['recordsTotal'] == 30000
+    assert response['recordsFiltered'] == 30000
+    assert [r['id'] for r in response['data']] == list(range(20, 30))
+
+
+def test_length_all_returns_remaining_rows():
+    records = make_forecast_rows(25)
+
+    response = build_datatable_response(records, _query(start=20, length=-1))
+
+    assert [r['id'] for r in response['data']] == [20, 21, 22, 23, 24]
+
+
+def test_global_search_filters_case_insensitively():
+    records = make_forecast_rows(100)
+
+    response = build_datatable_response(records, _query(search='GLOBAL', length=100))
+
+    assert response['recordsFiltered'] == 50
+    assert all('GLOBAL' in r['main_lob'] for r in response['data'])
+
+
+def test_column_search_combines_with_global_search():
+    records = make_forecast_rows(100)
+
+    response = build_datatable_response(
+        records, _query(search='domestic', column_search={'state': 'ca'}, length=100)
+    )
+
+    assert response['recordsFiltered'] == 10
+    assert all(r['state'] == 'CA' and 'DOMESTIC' in r['main_lob'] for r in response['data'])
+
+
+def test_multi_column_order():
+    records = make_forecast_rows(20)
+
+    response = build_datatable_response(
+        records, _query(order=[('state', 'asc'), ('forecast', 'desc')], length=4)
+    )
+
+    assert [(r['state'], r['forecast']) for r in response['data']] == [
+        ('CA', 1015), ('CA', 1010), ('CA', 1005), ('CA', 1000)
+    ]
+
+
+def test_order_places_missing_values_last():
+    records = [{'id': 1, 'forecast': None}, {'id': 2, 'forecast': 5}, {'id': 3, 'forecast': 2}]
+    query = QueryDict(
+        'draw=1&start=0&length=10&columns[0][data]=forecast&order[0][column]=0&order[0][dir]=asc',
+    )
+
+    response = build_datatable_response(records, query)
+
+    assert [r['id'] for r in response['data']] == [3, 2, 1]
+
+
+def test_non_orderable_columns_are_ignored():
+    query = QueryDict(
+        'draw=1&start=0&length=10&columns[0][data]=id&columns[0][orderable]=false'
+        '&order[0][column]=0&order[0][dir]=desc'
+    )
+
+    assert parse_datatable_request(query)['order'] == []
@@ -0,0 +1,172 @@
+"""
+Tests for the pooled APIClient transport.
+
+Every APIClient call path must go through the one pooled keep-alive session,
+and the session must report per-endpoint latency and connection reuse.
+HTTPXAdapter (the optional HTTP/2 path) is exercised over HTTP/1.1 here,
+since the stub backend does not speak HTTP/2.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+import requests
+from django.test import RequestFactory
+from urllib3.util.retry import Retry
+
+from core.config import APIClientConfig
+from centene_forecast_app.app_utils import http_transport
+from centene_forecast_app.app_utils.http_transport import (
+    HTTPXAdapter,
+    TransportMetrics,
+    endpoint_label,
+    get_transport_metrics,
+    render_transport_prometheus,
+    reset_transport_metrics,
+)
+from centene_forecast_app.tests.conftest import StubBackend
+
+HISTORY = (200, {'records': [{'id': 1}], 'total': 1})
+
+
+@pytest.fixture
+def keep_alive_backend():
+    backend = StubBackend(keep_alive=True).start()
+    reset_transport_metrics()
+    yield backend
+    backend.stop()
+
+
+@pytest.fixture
+def pooled_client(keep_alive_backend):
+    from centene_forecast_app.repository import APIClient
+
+    client = APIClient(base_url=keep_alive_backend.base_url, max_retries=0)
+    yield client
+    client.close()
+
+
+class TestPooledSession:
+
+    def test_table_summary_uses_pooled_session(self, keep_alive_backend, pooled_client, monkeypatch):
+        keep_alive_backend.route('/table/summary/capacity', lambda path, query: (
+            200, f"<table>{query['month']}</table>".encode(), {'Content-Type': 'text/html'}
+        ))
+        monkeypatch.setattr(requests, 'get', lambda *a, **k: pytest.fail('bare requests.get used'))
+
+        assert pooled_client.get_table_summary('capacity', 3, 2025) == '<table>March</table>'
+        assert get_transport_metrics()['endpoints']['GET /table/summary/capacity']['requests'] == 1
+
+    def test_sequential_calls_reuse_one_connection(self, keep_alive_backend, pooled_client):
+        keep_alive_backend.route('/record_history/all', lambda path, query: HISTORY)
+
+        for _ in range(5):
+            pooled_client.get_all_record_history()
+
+        metrics = get_transport_metrics()['endpoints']['GET /record_history/all']
+        assert metrics['requests'] == 5
+        assert metrics['new_connections'] == 1
+        assert metrics['reused_connections'] == 4
+        assert metrics['latency']['count'] == 5
+
+    def test_concurrent_threads_stay_within_pool(self, keep_alive_backend, pooled_client):
+        keep_alive_backend.route('/record_history/all', lambda path, query: HISTORY)
+        keep_alive_backend.latency = 0.02
+        threads = 6
+
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            for _ in range(3):
+                list(pool.map(lambda _: pooled_client.get_all_record_history(), range(threads)))
+
+        metrics = get_transport_metrics()['endpoints']['GET /record_history/all']
+        assert metrics['new_connections'] <= threads
+        assert metrics['reused_connections'] >= 2 * threads
+        adapter = pooled_client.session.get_adapter(pooled_client.base_url + '/record_history/all')
+        assert adapter._pool_maxsize == APIClientConfig.POOL_MAXSIZE
+
+    def test_upload_prefix_keeps_its_own_retry_policy(self, pooled_client):
+        upload = pooled_client.session.get_adapter(pooled_client.base_url + '/upload/forecast')
+        api = pooled_client.session.get_adapter(pooled_client.base_url + '/record_history/all')
+
+        assert upload is not api
+        assert upload.max_retries.read is False
+
+
+class TestHTTPXAdapter:
+
+    @pytest.fixture
+    def session(self, keep_alive_backend):
+        client = httpx.Client()
+        session = requests.Session()
+        retry = Retry(total=2, backoff_factor=0, status_forcelist=[503], allowed_methods=['GET'])
+        session.mount(keep_alive_backend.base_url + '/', HTTPXAdapter(client, retry))
+        yield session
+        session.close()
+
+    def test_json_and_streamed_responses(self, keep_alive_backend, session):
+        body = bytes(range(256)) * 1000
+        keep_alive_backend.route('/json', lambda path, query: (200, {'ok': query['q']}))
+        keep_alive_backend.route('/file', lambda path, query: (200, body, {'Content-Type': 'application/octet-stream'}))
+
+        assert session.get(keep_alive_backend.base_url + '/json', params={'q': 'x'}).json() == {'ok': 'x'}
+        streamed = session.get(keep_alive_backend.base_url + '/file', stream=True)
+        assert b''.join(streamed.iter_content(4096)) == body
+
+        metrics = get_transport_metrics()['endpoints']
+        assert metrics['GET /json']['new_connections'] == 1
+        assert metrics['GET /file']['reused_connections'] == 1
+
+    def test_status_retry_follows_urllib3_policy(self, keep_alive_backend, session):
+        responses = iter([(503, {'detail': 'busy'}), (200, {'ok': True})])
+        keep_alive_backend.route('/flaky', lambda path, query: next(responses))
+
+        assert session.get(keep_alive_backend.base_url + '/flaky').json() == {'ok': True}
+        assert len(keep_alive_backend.requests_for('/flaky')) == 2
+
+    def test_connection_errors_map_to_requests_exceptions(self):
+        session = requests.Session()
+        session.mount('http://', HTTPXAdapter(httpx.Client(), Retry(total=0)))
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            session.get('http://127.0.0.1:9/unreachable', timeout=2)
+
+
+class TestMetrics:
+
+    def test_endpoint_label_collapses_ids(self):
+        assert endpoint_label('get', 'http://h/api/v1/forecasts/42/months/2025-03?x=1') == \
+            'GET /api/v1/forecasts/{id}/months/2025-03'
+        assert endpoint_label('POST', 'http://h/execution/3fa85f64-5717-4562-b3fc-2c963f66afa6/cancel') == \
+            'POST /execution/{id}/cancel'
+
+    def test_endpoint_cardinality_is_bounded(self):
+        metrics = TransportMetrics(max_endpoints=2)
+        for name in ('GET /a', 'GET /b', 'GET /c', 'GET /d'):
+            metrics.observe(name, 0.01, 0)
+
+        assert sorted(metrics.snapshot()) == ['GET /a', 'GET /b', 'other']
+        assert metrics.snapshot()['other']['requests'] == 2
+
+    def test_prometheus_view(self, keep_alive_backend, pooled_client):
+        from core.models import User
+        from centene_forecast_app.views import cache_views
+
+        keep_alive_backend.route('/record_history/all', lambda path, query: HISTORY)
+        pooled_client.get_all_record_history()
+        request = RequestFactory().get('/api/transport/metrics/')
+        request.user = User(username='ops', is_active=True, is_superuser=True)
+
+        body = cache_views.transport_metrics_view(request).content.decode()
+
+        assert body == render_transport_prometheus(get_transport_metrics())
+        assert 'centene_api_requests_total{endpoint="GET /record_history/all"} 1' in body
+        assert f'centene_api_pool_maxsize {APIClientConfig.POOL_MAXSIZE}' in body
+
+
+def test_http2_without_h2_falls_back(monkeypatch):
+    monkeypatch.setattr(APIClientConfig, 'ENABLE_HTTP2', True)
+    monkeypatch.setattr(http_transport, 'http2_available', lambda: False)
+
+    session = http_transport.build_api_session('https://api.example', Retry(total=0), Retry(total=0))
+
+    assert isinstance(session.get_adapter('https://api.example/x'), http_transport.PooledHTTPAdapter)
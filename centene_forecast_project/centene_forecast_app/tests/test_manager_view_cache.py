@@ -0,0 +1,102 @@
+"""
+Tests for the cached manager view dataset.
+
+The data and KPI endpoints of one dashboard render must share a single
+backend fetch; KPIs for any month index come from precomputed rollups.
+"""
+import json
+
+import pytest
+from django.test import RequestFactory
+
+from centene_forecast_app.services import manager_service
+from centene_forecast_app.views import manager_view
+
+MONTHS = ['2025-02', '2025-03', '2025-04', '2025-05', '2025-06', '2025-07']
+
+
+def _category(category_id, base):
+    return {
+        'id': category_id,
+        'name': category_id.title(),
+        'level': 1,
+        'has_children': False,
+        'data': {
+            month: {'cf': base + i * 10, 'hc': base // 100 + i, 'cap': base + i * 10 - 50, 'gap': -50}
+            for i, month in enumerate(MONTHS)
+        },
+        'children': [],
+    }
+
+
+def _manager_data_route(path, query):
+    return 200, {
+        'report_month': query['report_month'],
+        'months': MONTHS,
+        'categories': [_category('amisys-onshore', 4000), _category('facets', 2000)],
+        'category_name': 'All Categories',
+    }
+
+
+@pytest.fixture
+def dashboard(stub_backend, api_client, monkeypatch):
+    """Stub backend serving manager view data, wired into the views and service."""
+    stub_backend.route('/api/manager-view/data', _manager_data_route)
+    monkeypatch.setattr(manager_view, 'get_api_client', lambda: api_client)
+    monkeypatch.setattr(manager_service, 'get_api_client', lambda: api_client)
+    return stub_backend
+
+
+def _get(view, **params):
+    from core.models import User
+
+    request = RequestFactory().get('/', params)
+    request.user = User(username='manager', is_active=True, is_superuser=True)
+    response = view(request)
+    return response.status_code, json.loads(response.content)
+
+
+class TestManagerViewDataset:
+
+    def test_one_backend_call_per_dashboard_render(self, dashboard):
+        for _ in range(2):
+            status, data = _get(manager_view.manager_view_data_api, report_month='2025-02')
+            assert status == 200
+            status, kpi = _get(manager_view.manager_view_kpi_api, report_month='2025-02')
+            assert status == 200
+
+        assert len(dashboard.requests_for('/api/manager-view/data')) == 1
+        assert kpi['kpi']['kpi_month'] == '2025-03'
+        assert kpi['kpi']['client_forecast'] == 4010 + 2010
+
+    def test_every_kpi_month_index_from_one_fetch(self, dashboard):
+        kpis = [
+            manager_service.calculate_kpi_data('2025-02', None, index)
+            for index in range(len(MONTHS))
+        ]
+
+        assert [kpi['kpi_month'] for kpi in kpis] == MONTHS
+        assert [kpi['capacity_gap'] for kpi in kpis] == [-100] * len(MONTHS)
+        assert len(dashboard.requests_for('/api/manager-view/data')) == 1
+
+    def test_error_response_is_not_cached(self, dashboard):
+        dashboard.route('/api/manager-view/data', lambda path, query: (
+            404, {'detail': 'No data for report month'}
+        ))
+        status, _ = _get(manager_view.manager_view_kpi_api, report_month='2025-02')
+        assert status == 404
+
+        dashboard.route('/api/manager-view/data', _manager_data_route)
+        status, _ = _get(manager_view.manager_view_kpi_api, report_month='2025-02')
+        assert status == 200
+        assert len(dashboard.requests_for('/api/manager-view/data')) == 2
+
+
+def test_build_month_rollups_sums_top_level_only():
+    child = _category('child', 999999)
+    parent = _category('amisys-onshore', 4000)
+    parent['children'] = [child]
+
+    rollups = manager_service.build_month_rollups({'months': MONTHS, 'categories': [parent]})
+
+    assert rollups['2025-02'] == {'cf': 4000, 'hc': 40, 'cap': 3950, 'gap': -50}
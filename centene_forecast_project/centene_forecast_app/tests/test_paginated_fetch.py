@@ -0,0 +1,96 @@
+"""
+Tests for APIClient paginated record fetching.
+
+Covers ordering, key normalization, failure truncation and the
+sequential fallback, plus a wall-time benchmark against the stub backend.
+"""
+import time
+
+import pytest
+
+from core.config import APIClientConfig, ForecastCacheConfig
+from centene_forecast_app.tests.conftest import make_forecast_rows, paginated_route
+
+
+@pytest.fixture
+def no_caching(monkeypatch):
+    monkeypatch.setattr(ForecastCacheConfig, 'ENABLE_CACHING', False)
+
+
+class TestParallelPagination:
+
+    def test_records_reassembled_in_offset_order(self, stub_backend, api_client, no_caching):
+        rows = make_forecast_rows(1234)
+        stub_backend.route('/records/forecast', paginated_route(rows))
+
+        records = api_client.get_all_forecast_records(7, 2025, 8)
+
+        assert [r['id'] for r in records] == list(range(1234))
+        assert len(stub_backend.requests_for('/records/forecast')) == 13
+
+    def test_records_normalized_to_union_of_keys(self, stub_backend, api_client, no_caching):
+        rows = make_forecast_rows(150)
+        rows[120]['extra'] = 'x'
+        stub_backend.route('/records/forecast', paginated_route(rows))
+
+        records = api_client.get_all_forecast_records(7, 2025, 8)
+
+        assert all('extra' in r for r in records)
+        assert records[0]['extra'] is None
+        assert records[120]['extra'] == 'x'
+
+    def test_failed_page_truncates_result(self, stub_backend, api_client, no_caching):
+        rows = make_forecast_rows(500)
+        serve = paginated_route(rows)
+
+        def flaky(path, query):
+            if int(query['skip']) == 200:
+                return 400, {'detail': 'boom'}
+            return serve(path, query)
+
+        stub_backend.route('/records/forecast', flaky)
+
+        records = api_client.get_all_forecast_records(7, 2025, 8)
+
+        assert [r['id'] for r in records] == list(range(200))
+
+    def test_sequential_fallback(self, stub_backend, api_client, no_caching, monkeypatch):
+        monkeypatch.setattr(APIClientConfig, 'ENABLE_PARALLEL_PAGINATION', False)
+        rows = make_forecast_rows(350)
+        stub_backend.route('/records/forecast', paginated_route(rows))
+
+        records = api_client.get_all_forecast_records(7, 2025, 8)
+
+        assert [r['id'] for r in records] == list(range(350))
+
+    def test_roster_uses_records_key(self, stub_backend, api_client, no_caching):
+        rows = make_forecast_rows(250)
+        stub_backend.route('/records/roster', paginated_route(rows, records_key='records'))
+
+        records = api_client.get_all_roster('roster', month=7, year=2025)
+
+        assert len(records) == 250
+        query = stub_backend.requests_for('/records/roster')[0][1]
+        assert query['month'] == 'July' and query['year'] == '2025'
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize('total', [1_000, 10_000, 50_000])
+def test_benchmark_pagination_wall_time(stub_backend, api_client, no_caching, monkeypatch, total):
+    """Report sequential vs parallel wall time with 5ms backend latency per page."""
+    stub_backend.latency = 0.005
+    stub_backend.route('/records/forecast', paginated_route(make_forecast_rows(total)))
+
+    timings = {}
+    for mode in (False, True):
+        monkeypatch.setattr(APIClientConfig, 'ENABLE_PARALLEL_PAGINATION', mode)
+        start = time.perf_counter()
+        records = api_client.get_all_forecast_records(7, 2025, 8)
+        timings[mode] = time.perf_counter() - start
+        assert len(records) == total
+
+    print(
+        f"\n[pagination benchmark] rows={total:>6} "
+        f"sequential={timings[False]:.3f}s parallel={timings[True]:.3f}s "
+        f"(workers={APIClientConfig.PAGE_FETCH_MAX_WORKERS}, speedup={timings[False] / timings[True]:.1f}x)"
+    )
@@ -0,0 +1,251 @@
+"""
+Tests for streamed file downloads.
+
+download_data must relay backend chunks through a StreamingHttpResponse,
+forward the backend's Content-Length / Content-Disposition, and release
+the backend connection when the browser aborts. The relay is async so the
+ASGI handler (daphne) sends chunks as they arrive instead of buffering.
+"""
+import asyncio
+import resource
+import time
+
+import pytest
+from django.core.handlers.asgi import ASGIHandler
+from django.test import Client, RequestFactory
+from django.urls import reverse
+
+from centene_forecast_app.app_utils.file_utils import relay_streaming_download
+from centene_forecast_app.views import views
+
+WORKBOOK = b'PK\x03\x04' + bytes(range(256)) * 2000
+
+
+def _workbook_route(path, query):
+    return 200, WORKBOOK, {
+        'Content-Type': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        'Content-Disposition': f'attachment; filename="roster_{query["month"]}_{query["year"]}.xlsx"',
+    }
+
+
+def _read(response) -> bytes:
+    async def collect():
+        return b''.join([chunk async for chunk in response.streaming_content])
+    return asyncio.run(collect())
+
+
+class FakeBackendResponse:
+    """Minimal streamed requests.Response stand-in that records close()."""
+
+    def __init__(self, chunks, headers=None):
+        self.chunks = chunks
+        self.headers = headers or {}
+        self.closed = False
+
+    def iter_content(self, chunk_size=None):
+        for chunk in self.chunks:
+            if self.closed:
+                raise AssertionError('read after close()')
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def download_view(stub_backend, api_client, monkeypatch):
+    """download_data wired to the stub backend; returns a callable taking query params."""
+    from core.models import User
+
+    monkeypatch.setattr(views, 'get_api_client', lambda: api_client)
+
+    def call(**params):
+        request = RequestFactory().get('/download/', params)
+        request.user = User(username='analyst', is_active=True, is_superuser=True)
+        return views.download_data(request)
+
+    return call
+
+
+@pytest.fixture
+def session_cookie(transactional_db):
+    """Session cookie of a logged-in superuser, for requests sent through the ASGI handler."""
+    from core.models import User
+
+    client = Client()
+    client.force_login(User.objects.create_superuser('asgi_analyst'))
+    return f"sessionid={client.cookies['sessionid'].value}"
+
+
+def _asgi_get(path, query, cookie, disconnect_after=None):
+    """
+    GET through Django's ASGIHandler, as daphne serves it.
+
+    Returns (status, headers, body_bytes, body_messages); body bytes are
+    counted, not kept. With disconnect_after the client goes away after
+    that many body messages.
+    """
+    result = {'status': None, 'headers': {}, 'bytes': 0, 'messages': 0}
+
+    async def run():
+        disconnected = asyncio.Event()
+        request_sent = False
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+            await disconnected.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                result['status'] = message['status']
+                result['headers'] = {k.decode().lower(): v.decode() for k, v in message['headers']}
+            elif message.get('body'):
+                result['bytes'] += len(message['body'])
+                result['messages'] += 1
+                if disconnect_after and result['messages'] >= disconnect_after:
+                    disconnected.set()
+                    await asyncio.sleep(0.05)
+
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1',
+            'method': 'GET', 'scheme': 'http', 'path': path, 'raw_path': path.encode(),
+            'query_string': query.encode(), 'root_path': '',
+            'headers': [(b'host', b'testserver'), (b'cookie', cookie.encode())],
+            'client': ('127.0.0.1', 50000), 'server': ('testserver', 80),
+        }
+        await ASGIHandler()(scope, receive, send)
+
+    asyncio.run(run())
+    return result['status'], result['headers'], result['bytes'], result['messages']
+
+
+class TestDownloadData:
+
+    def test_streams_and_forwards_backend_headers(self, stub_backend, download_view):
+        stub_backend.route('/download_file/roster', _workbook_route)
+
+        response = download_view(data_type='roster', month=3, year=2025)
+
+        assert response.streaming
+        assert response['Content-Length'] == str(len(WORKBOOK))
+        assert response['Content-Disposition'] == 'attachment; filename="roster_March_2025.xlsx"'
+        assert response.is_async
+        assert _read(response) == WORKBOOK
+
+    def test_backend_error_returns_404(self, stub_backend, download_view):
+        stub_backend.route('/download_file/roster', lambda path, query: (404, {'detail': 'missing'}))
+
+        response = download_view(data_type='roster', month=3, year=2025)
+
+        assert response.status_code == 404
+
+
+class TestRelayStreamingDownload:
+
+    def test_falls_back_to_filename_without_backend_headers(self):
+        backend = FakeBackendResponse([b'abc', b'', b'def'])
+
+        response = relay_streaming_download(backend, 'forecast.xlsx')
+
+        assert response['Content-Disposition'] == 'attachment; filename="forecast.xlsx"'
+        assert not response.has_header('Content-Length')
+        assert _read(response) == b'abcdef'
+
+    def test_encoded_body_does_not_forward_length(self):
+        backend = FakeBackendResponse([b'x'], {'Content-Length': '10', 'Content-Encoding': 'gzip'})
+
+        assert not relay_streaming_download(backend, 'f.xlsx').has_header('Content-Length')
+
+    @pytest.mark.django_db  # response.close() fires request_finished, which touches the DB
+    @pytest.mark.parametrize('chunks_read', [0, 1])
+    def test_client_abort_releases_connection(self, chunks_read):
+        backend = FakeBackendResponse([b'a', b'b', b'c'])
+        response = relay_streaming_download(backend, 'f.xlsx')
+
+        async def read_some():
+            content = aiter(response.streaming_content)
+            for _ in range(chunks_read):
+                await anext(content)
+
+        asyncio.run(read_some())
+        response.close()  # what the handler does when the client goes away
+
+        assert backend.closed
+
+
+@pytest.mark.django_db(transaction=True)
+class TestASGIDownload:
+    """download_data served by the ASGI handler, as under daphne."""
+
+    @pytest.fixture(autouse=True)
+    def backend(self, stub_backend, api_client, monkeypatch):
+        monkeypatch.setattr(views, 'get_api_client', lambda: api_client)
+        return stub_backend
+
+    def test_streams_chunks_with_backend_headers(self, backend, session_cookie):
+        backend.route('/download_file/roster', _workbook_route)
+
+        status, headers, received, messages = _asgi_get(
+            reverse('forecast_app:data_download'), 'data_type=roster&month=3&year=2025', session_cookie
+        )
+
+        assert status == 200
+        assert headers['content-length'] == str(len(WORKBOOK))
+        assert headers['content-disposition'] == 'attachment; filename="roster_March_2025.xlsx"'
+        assert received == len(WORKBOOK)
+        assert messages > 1  # relayed in chunks, not one buffered body
+
+    def test_client_disconnect_releases_backend(self, backend, session_cookie, monkeypatch):
+        closed = []
+        original = relay_streaming_download.__globals__['BackendDownloadStream'].close
+        monkeypatch.setattr(
+            relay_streaming_download.__globals__['BackendDownloadStream'], 'close',
+            lambda stream: (closed.append(True), original(stream))
+        )
+        block = b'\0' * (64 * 1024)
+        backend.route('/download_file/forecast', lambda path, query: (
+            200, (block for _ in range(1024)), {'Content-Length': str(1024 * len(block))}
+        ))
+
+        status, _, received, _ = _asgi_get(
+            reverse('forecast_app:data_download'), 'data_type=forecast&month=3&year=2025', session_cookie, disconnect_after=2
+        )
+
+        assert status == 200
+        assert received < 1024 * len(block)
+        assert closed
+        # The backend stopped being read mid-transfer rather than buffered to the end
+        time.sleep(0.2)
+        assert backend.bytes_sent < 1024 * len(block) // 2
+
+
+@pytest.mark.slow
+@pytest.mark.django_db(transaction=True)
+def test_peak_rss_flat_for_200mb_download(stub_backend, api_client, monkeypatch, session_cookie):
+    """Relaying a 200 MB workbook through the ASGI handler must not grow peak RSS by anything near its size."""
+    size = 200 * 1024 * 1024
+    block = b'\0' * (1024 * 1024)
+
+    def big_file(path, query):
+        return 200, (block for _ in range(size // len(block))), {'Content-Length': str(size)}
+
+    monkeypatch.setattr(views, 'get_api_client', lambda: api_client)
+    stub_backend.route('/download_file/forecast', big_file)
+    peak_before_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    status, _, received, messages = _asgi_get(
+        reverse('forecast_app:data_download'), 'data_type=forecast&month=3&year=2025', session_cookie
+    )
+
+    growth_mb = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - peak_before_kb) / 1024
+    print(
+        f"\n[Benchmark] ASGI streamed {received / 1024 / 1024:.0f} MB in {messages} messages, "
+        f"peak RSS growth {growth_mb:.1f} MB"
+    )
+    assert status == 200
+    assert received == size
+    assert growth_mb < 32
@@ -0,0 +1,133 @@
+"""
+Tests for streamed multipart uploads.
+
+APIClient._upload_file must send Django uploads in chunks over the pooled
+session (never reading the whole file), report progress, and keep the
+backend's error detail instead of retrying a processed upload.
+"""
+import io
+import time
+import tracemalloc
+
+import pytest
+import requests
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from django.http.multipartparser import MultiPartParser
+
+from centene_forecast_app.app_utils.file_utils import XLSX_CONTENT_TYPE, MultipartFileStream
+
+WORKBOOK = b'PK\x03\x04' + bytes(range(256)) * 4000
+
+
+def _parse_multipart(body: bytes, content_type: str):
+    """Parse a multipart body the way Django parses incoming uploads."""
+    meta = {'CONTENT_TYPE': content_type, 'CONTENT_LENGTH': str(len(body))}
+    from django.core.files.uploadhandler import MemoryFileUploadHandler
+    _, files = MultiPartParser(meta, io.BytesIO(body), [MemoryFileUploadHandler()]).parse()
+    return files
+
+
+class TestMultipartFileStream:
+
+    def test_body_round_trips_through_multipart_parser(self):
+        upload = SimpleUploadedFile('forecast "March".xlsx', WORKBOOK, content_type=XLSX_CONTENT_TYPE)
+        stream = MultipartFileStream(upload, upload.name, chunk_size=4096)
+
+        body = b''.join(stream)
+
+        assert len(body) == len(stream)
+        files = _parse_multipart(body, stream.content_type)
+        assert files['file'].read() == WORKBOOK
+        assert files['file'].content_type == XLSX_CONTENT_TYPE
+
+    def test_reiterating_resends_whole_file(self):
+        stream = MultipartFileStream(WORKBOOK, 'roster.csv', chunk_size=4096)
+
+        assert b''.join(stream) == b''.join(stream)
+
+    def test_progress_reaches_total(self):
+        reports = []
+        stream = MultipartFileStream(WORKBOOK, 'f.xlsx', chunk_size=100_000,
+                                     progress_callback=lambda sent, total: reports.append((sent, total)))
+
+        list(stream)
+
+        assert reports[-1] == (len(stream), len(stream))
+        assert [sent for sent, _ in reports] == sorted(sent for sent, _ in reports)
+        assert len(reports) > 5
+
+
+class TestUploadFile:
+
+    def test_upload_streams_over_session(self, stub_backend, api_client, monkeypatch):
+        stub_backend.route('/upload/forecast', lambda path, query: (200, {'message': 'ok', 'user': query['user']}))
+        reports = []
+        monkeypatch.setattr(requests, 'post', lambda *a, **k: pytest.fail('bare requests.post used'))
+        upload = SimpleUploadedFile('forecast.xlsx', WORKBOOK)
+
+        result = api_client.upload_forecast_file(upload, upload.name, 'Jane Doe',
+                                                 progress_callback=lambda sent, total: reports.append(sent))
+
+        assert result == {'message': 'ok', 'user': 'Jane Doe'}
+        body = stub_backend.request_bodies['/upload/forecast'][0]
+        assert WORKBOOK in body
+        assert reports[-1] == len(body)
+
+    def test_server_error_keeps_detail_and_is_not_retried(self, stub_backend):
+        from centene_forecast_app.repository import APIClient
+
+        stub_backend.route('/upload/upload_roster', lambda path, query: (500, {'detail': 'Sheet missing'}))
+        client = APIClient(base_url=stub_backend.base_url, max_retries=3)
+
+        result = client.upload_roster_file(WORKBOOK, 'roster.xlsx', 'Jane Doe')
+        client.close()
+
+        assert result == {'error': 'Sheet missing'}
+        assert len(stub_backend.requests_for('/upload/upload_roster')) == 1
+
+
+def _measure(upload_call):
+    tracemalloc.start()
+    started = time.perf_counter()
+    upload_call()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+@pytest.mark.slow
+def test_benchmark_large_upload_memory(stub_backend, api_client):
+    """120 MB workbook: streamed multipart vs read() + files= (the previous path)."""
+    size = 120 * 1024 * 1024
+    stub_backend.store_bodies = False
+    stub_backend.route('/upload/forecast', lambda path, query: (200, {'message': 'ok'}))
+
+    upload = TemporaryUploadedFile('big_forecast.xlsx', XLSX_CONTENT_TYPE, size, None)
+    block = b'\x00PK' * 349525 + b'\x00'
+    for _ in range(size // len(block)):
+        upload.write(block)
+    upload.write(b'\0' * (size - upload.tell()))
+    upload.flush()
+
+    def legacy():
+        upload.seek(0)
+        content = upload.read()
+        requests.post(
+            f"{stub_backend.base_url}/upload/forecast",
+            params={'user': 'bench'},
+            files={'file': (upload.name, content, XLSX_CONTENT_TYPE)},
+            timeout=(30, 300)
+        ).raise_for_status()
+
+    streamed_s, streamed_mb = _measure(lambda: api_client.upload_forecast_file(upload, upload.name, 'bench'))
+    legacy_s, legacy_mb = _measure(legacy)
+    upload.close()
+
+    print(
+        f"\n[Benchmark] 120 MB upload: streamed {streamed_s:.2f}s / peak {streamed_mb:.1f} MB | "
+        f"read()+files= {legacy_s:.2f}s / peak {legacy_mb:.1f} MB"
+    )
+    assert stub_backend.body_sizes['/upload/forecast'][0] > size
+    assert streamed_mb < 16
+    assert legacy_mb > 120
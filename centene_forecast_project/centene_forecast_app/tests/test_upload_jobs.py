@@ -0,0 +1,165 @@
+"""
+Tests for background upload jobs.
+
+upload_view must queue the upload and answer 202 straight away; the worker
+pool sends the file, records progress, invalidates caches only after the
+backend accepted the file, and check_progress reports the outcome.
+"""
+import json
+import os
+import threading
+from datetime import timedelta
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import RequestFactory
+
+from core.config import CacheWarmupConfig, UploadJobConfig
+from core.models import UploadedFile
+from centene_forecast_app.services import upload_service
+from centene_forecast_app.views import views
+
+WORKBOOK = b'PK\x03\x04' + bytes(range(256)) * 2000
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture
+def uploads(stub_backend, api_client, monkeypatch, tmp_path):
+    """Upload jobs wired to the stub backend, recording cache invalidations."""
+    invalidated = []
+    monkeypatch.setattr(upload_service, 'get_api_client', lambda: api_client)
+    monkeypatch.setattr(UploadJobConfig, 'SPOOL_DIR', str(tmp_path))
+    monkeypatch.setattr(upload_service, 'invalidate_tags', lambda *args: invalidated.append(
+        (args, len(stub_backend.requests_for('/upload/forecast')))
+    ))
+    yield invalidated
+    upload_service.shutdown_upload_executor()
+
+
+@pytest.fixture
+def analyst():
+    from core.models import User
+    return User.objects.create(portal_id='analyst', username='analyst', is_superuser=True)
+
+
+def _post_upload(user, filename='forecast_March_2025.xlsx', file_type='forecast'):
+    request = RequestFactory().post('/upload_view/', {
+        'file': SimpleUploadedFile(filename, WORKBOOK),
+        'filetype': file_type,
+    })
+    request.user = user
+    response = views.upload_view(request)
+    return response.status_code, json.loads(response.content)
+
+
+def _progress(user, job_id):
+    request = RequestFactory().get('/check_upload_progress/', {'file_upload_id': job_id})
+    request.user = user
+    response = views.check_progress(request)
+    return response.status_code, json.loads(response.content)
+
+
+class TestUploadJobs:
+
+    def test_upload_returns_before_backend_finishes(self, stub_backend, uploads, analyst):
+        release = threading.Event()
+
+        def slow_backend(path, query):
+            release.wait(10)
+            return 200, {'message': 'File uploaded', 'data': {'warning': 'Row 4 skipped'}}
+
+        stub_backend.route('/upload/forecast', slow_backend)
+
+        status, queued = _post_upload(analyst)
+
+        assert status == 202
+        assert queued['status'] in ('pending', 'uploading')
+        assert not uploads
+        release.set()
+
+        upload_service.wait_for_upload_job(queued['job_id'], timeout=10)
+        status, done = _progress(analyst, queued['job_id'])
+        assert status == 200
+        assert done['status'] == 'completed'
+        assert done['progress'] == 100
+        assert done['message'] == 'File uploaded'
+        assert done['data'] == {'warning': 'Row 4 skipped'}
+
+    def test_caches_invalidated_after_backend_accepted_file(self, stub_backend, uploads, analyst):
+        stub_backend.route('/upload/forecast', lambda path, query: (200, {'message': 'ok', 'user': query['user']}))
+
+        _, queued = _post_upload(analyst)
+        job = upload_service.wait_for_upload_job(queued['job_id'], timeout=10)
+
+        assert WORKBOOK in stub_backend.request_bodies['/upload/forecast'][0]
+        assert uploads == [((('forecast', 'execution'), 3, 2025), 1)]
+        assert not os.path.exists(job.spool_path)
+        assert job.finished_at is not None
+
+    def test_backend_error_fails_job_without_invalidation(self, stub_backend, uploads, analyst):
+        stub_backend.route('/upload/forecast', lambda path, query: (400, {'detail': 'Sheet missing'}))
+
+        _, queued = _post_upload(analyst)
+        upload_service.wait_for_upload_job(queued['job_id'], timeout=10)
+
+        _, data = _progress(analyst, queued['job_id'])
+        assert data['status'] == 'error'
+        assert data['message'] == 'Sheet missing'
+        assert not uploads
+
+    def test_uploaded_month_is_warmed_when_enabled(self, stub_backend, uploads, analyst, monkeypatch):
+        warmed = []
+        monkeypatch.setattr(CacheWarmupConfig, 'WARM_AFTER_UPLOAD', True)
+        monkeypatch.setattr(upload_service, 'warm_caches', lambda periods: warmed.append(
+            (periods, UploadedFile.objects.get().status)
+        ))
+        stub_backend.route('/upload/forecast', lambda path, query: (200, {'message': 'ok'}))
+
+        _, queued = _post_upload(analyst)
+        upload_service.wait_for_upload_job(queued['job_id'], timeout=10)
+
+        assert warmed == [([(3, 2025)], 'completed')]
+
+    def test_unsupported_file_type_is_rejected_without_job(self, uploads, analyst):
+        status, _ = _post_upload(analyst, file_type='payroll')
+
+        assert status == 400
+        assert not UploadedFile.objects.exists()
+
+
+class TestCheckProgress:
+
+    def test_other_users_job_is_not_found(self, analyst):
+        from core.models import User
+
+        owner = User.objects.create(portal_id='owner', username='owner')
+        job = UploadedFile.objects.create(filename='f.xlsx', file_type='roster', uploaded_by=owner)
+        other = User.objects.create(portal_id='other', username='other')
+        other.has_perm = lambda *args, **kwargs: True
+
+        assert _progress(other, job.id)[0] == 404
+        assert _progress(analyst, job.id)[0] == 200
+
+    def test_stalled_job_is_reported_as_failed(self, analyst):
+        job = UploadedFile.objects.create(filename='f.xlsx', file_type='roster', status='uploading')
+        stale = job.updated_at - timedelta(seconds=UploadJobConfig.STALE_AFTER_SECONDS + 1)
+        UploadedFile.objects.filter(id=job.id).update(updated_at=stale)
+
+        _, data = _progress(analyst, job.id)
+
+        assert data['status'] == 'error'
+        assert 'interrupted' in data['message']
+
+    def test_job_queued_in_this_process_is_not_stale(self, analyst, tmp_path, monkeypatch):
+        spool_path = tmp_path / 'queued.xlsx'
+        spool_path.write_bytes(WORKBOOK)
+        job = UploadedFile.objects.create(filename='f.xlsx', file_type='roster', spool_path=str(spool_path))
+        stale = job.updated_at - timedelta(seconds=UploadJobConfig.STALE_AFTER_SECONDS + 1)
+        UploadedFile.objects.filter(id=job.id).update(updated_at=stale)
+        monkeypatch.setitem(upload_service._futures, job.id, upload_service.Future())
+
+        _, data = _progress(analyst, job.id)
+
+        assert data['status'] == 'pending'
+        assert spool_path.exists()
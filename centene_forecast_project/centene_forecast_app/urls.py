@@ -29,6 +29,7 @@ urlpatterns = [
     path('forecast/markets/', views.forecast_markets_api, name='forecast_markets'),
     path('forecast/localities/', views.forecast_localities_api, name='forecast_localities'),
     path('forecast/worktypes/', views.forecast_worktypes_api, name='forecast_worktypes'),
+    path('forecast/cascade-tree/', views.forecast_cascade_tree_api, name='forecast_cascade_tree'),
 
     # Centene Forecasting Power BI Report Endpoints
     # path('reports/<path:catalog_path>/', views.pbi_report, name='pbi_report'),
@@ -68,6 +69,8 @@ urlpatterns = [
 
     # Cache Management API endpoints
     path('api/cache/stats/', cache_views.cache_stats_view, name='cache_stats'),
+    path('api/cache/metrics/', cache_views.cache_metrics_view, name='cache_metrics'),
+    path('api/transport/metrics/', cache_views.transport_metrics_view, name='transport_metrics'),
     path('api/cache/inspect/', cache_views.inspect_cache_view, name='cache_inspect'),
     path('api/cache/config/', cache_views.cache_config_view, name='cache_config'),
     path('api/cache/clear/forecast/', cache_views.clear_forecast_cache_view, name='clear_forecast_cache'),
@@ -75,6 +78,8 @@ urlpatterns = [
     path('api/cache/clear/summary/', cache_views.clear_summary_cache_view, name='clear_summary_cache'),
     path('api/cache/clear/cascade/', cache_views.clear_cascade_caches_view, name='clear_cascade_caches'),
     path('api/cache/clear/all/', cache_views.clear_all_caches_view, name='clear_all_caches'),
+    path('api/cache/events/', cache_views.cache_events_view, name='cache_events'),
+    path('api/cache/warm/', cache_views.warm_caches_view, name='warm_caches'),
 
     # Configuration View endpoints
     path("configuration/", configuration_view.configuration_view_page, name="configuration_view_page"),
@@ -5,14 +5,24 @@ Provides endpoints for cache debugging, inspection, and manual cache clearing.
 Useful for development and troubleshooting cache issues.
 """
 
+import hmac
+import json
 import logging
 from datetime import datetime
-from django.http import JsonResponse
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from django.middleware.csrf import CsrfViewMiddleware
+from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.contrib.auth.decorators import login_required, permission_required
 from centene_forecast_app.app_utils.auth import get_permission_name
 
+from centene_forecast_app.app_utils.cache_metrics import render_prometheus
+from centene_forecast_app.app_utils.http_transport import get_transport_metrics, render_transport_prometheus
+from centene_forecast_app.services.cache_event_service import handle_change_events, parse_change_event
+from centene_forecast_app.services.cache_warmup_service import active_report_months, start_background_warmup
 from centene_forecast_app.app_utils.cache_utils import (
+    get_cache_metrics,
     get_cache_stats,
     inspect_cache_value,
     clear_forecast_cache,
@@ -70,7 +80,15 @@ def cache_stats_view(request):
                 "summary": 900
             },
             "sample_cached_keys": ["cascade:years", "forecast:7:2025"],
-            "sample_count": 2
+            "sample_count": 2,
+            "metrics": {
+                "scope": "cluster",
+                "workers": 4,
+                "hit_ratio": 0.91,
+                "prefixes": {
+                    "forecast": {"hits": 120, "misses": 9, "evictions": 0, ...}
+                }
+            }
         }
     """
     try:
@@ -88,6 +106,94 @@ def cache_stats_view(request):
         )
 
 
+def _has_metrics_token(request) -> bool:
+    """Check the optional bearer token configured for Prometheus scrapers."""
+    return _has_bearer_token(request, getattr(settings, 'CACHE_METRICS_TOKEN', ''))
+
+
+def _has_bearer_token(request, token: str) -> bool:
+    """Check an "Authorization: Bearer <token>" header against a configured token."""
+    auth_header = request.META.get('HTTP_AUTHORIZATION', '')
+    if not token or not auth_header.startswith('Bearer '):
+        return False
+    return hmac.compare_digest(auth_header[len('Bearer '):].encode(), token.encode())
+
+
+@require_http_methods(["GET"])
+def cache_metrics_view(request):
+    """
+    Cache metrics in the Prometheus text exposition format.
+
+    GET /api/cache/metrics/
+
+    Authentication:
+        Logged-in user with view permission, or
+        "Authorization: Bearer <CENTENE_METRICS_TOKEN>" for scrapers
+
+    Returns:
+        text/plain; version=0.0.4
+
+        centene_cache_hits_total{prefix="forecast"} 120
+        centene_cache_misses_total{prefix="forecast"} 9
+        centene_cache_miss_duration_seconds_bucket{prefix="forecast",le="0.5"} 4
+        ...
+    """
+    user = request.user
+    if not _has_metrics_token(request):
+        if not user.is_authenticated:
+            return HttpResponse('Authentication required\n', status=401, content_type='text/plain')
+        if not user.has_perm(get_permission_name("view")):
+            return HttpResponse('Permission denied\n', status=403, content_type='text/plain')
+
+    try:
+        metrics = get_cache_metrics()
+        body = render_prometheus(
+            metrics['prefixes'],
+            workers=metrics['workers'],
+            single_flight=metrics['single_flight']
+        )
+        return HttpResponse(body, content_type='text/plain; version=0.0.4; charset=utf-8')
+    except Exception as e:
+        logger.error(f"Failed to render cache metrics: {e}")
+        return HttpResponse(f'# error: {e}\n', status=500, content_type='text/plain')
+
+
+@require_http_methods(["GET"])
+def transport_metrics_view(request):
+    """
+    Backend API transport metrics in the Prometheus text exposition format.
+
+    GET /api/transport/metrics/
+
+    Per-endpoint request latency and connection reuse of this worker's
+    APIClient session, for sizing APIClientConfig.POOL_MAXSIZE against
+    the worker's thread count.
+
+    Authentication:
+        Same as cache_metrics_view
+
+    Returns:
+        text/plain; version=0.0.4
+
+        centene_api_requests_total{endpoint="GET /record_history/all"} 40
+        centene_api_reused_connections_total{endpoint="GET /record_history/all"} 38
+        centene_api_request_duration_seconds_bucket{endpoint="GET /record_history/all",le="0.1"} 31
+        ...
+    """
+    user = request.user
+    if not _has_metrics_token(request):
+        if not user.is_authenticated:
+            return HttpResponse('Authentication required\n', status=401, content_type='text/plain')
+        if not user.has_perm(get_permission_name("view")):
+            return HttpResponse('Permission denied\n', status=403, content_type='text/plain')
+
+    try:
+        body = render_transport_prometheus(get_transport_metrics())
+        return HttpResponse(body, content_type='text/plain; version=0.0.4; charset=utf-8')
+    except Exception as e:
+        logger.error(f"Failed to render transport metrics: {e}")
+        return HttpResponse(f'# error: {e}\n', status=500, content_type='text/plain')
+
 
 @login_required
 @permission_required(get_permission_name("view"), raise_exception=True)
@@ -373,6 +479,128 @@ def clear_all_caches_view(request):
         )
 
 
+# ============================================================================
+# Cache Warm-up
+# ============================================================================
+
+
+@login_required
+@permission_required(get_permission_name("admin"), raise_exception=True)
+@require_http_methods(["POST"])
+def warm_caches_view(request):
+    """
+    Warm this server's caches for report months in the background.
+
+    POST /api/cache/warm/
+    Body (optional): {"periods": ["3/2025", "4/2025"]} or {"months_ahead": 2}
+
+    Runs inside the server process, so it also warms a process-local
+    (locmem) cache that `manage.py warm_caches` cannot reach.
+
+    Returns:
+        202 {"success": true, "periods": [[3, 2025], [4, 2025]]}
+        400 if the body is not an object with a list of periods / an integer months_ahead
+        409 if a warm-up is already running
+    """
+    try:
+        payload = json.loads(request.body or b'{}')
+        if not isinstance(payload, dict):
+            raise ValueError('Expected a JSON object')
+        values = payload.get('periods') or []
+        if not isinstance(values, list):
+            raise ValueError("'periods' must be a list of MONTH/YEAR strings")
+        periods = []
+        for value in values:
+            month, year = (int(part) for part in str(value).split('/'))
+            if not 1 <= month <= 12:
+                raise ValueError(f"Invalid month in period '{value}'")
+            periods.append((month, year))
+        if not periods:
+            months_ahead = payload.get('months_ahead')
+            if months_ahead is not None and (
+                not isinstance(months_ahead, int) or isinstance(months_ahead, bool) or months_ahead < 0
+            ):
+                raise ValueError("'months_ahead' must be a non-negative integer")
+            periods = active_report_months(months_ahead=months_ahead)
+    except ValueError as e:
+        return JsonResponse(_serialize_cache_error(f'Invalid warm-up request: {e}', 400), status=400)
+
+    if start_background_warmup(periods) is None:
+        return JsonResponse(_serialize_cache_error('A cache warm-up is already running', 409), status=409)
+
+    logger.info(f"Started cache warm-up via API for {periods}")
+    return JsonResponse({
+        'success': True,
+        'message': 'Cache warm-up started',
+        'periods': [list(period) for period in periods],
+        'timestamp': datetime.now().isoformat()
+    }, status=202)
+
+
+# ============================================================================
+# Backend Change Events
+# ============================================================================
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def cache_events_view(request):
+    """
+    Invalidate caches for data changed on the backend.
+
+    POST /api/cache/events/
+    Body: {"domain": "forecast", "month": 3, "year": 2025}
+       or {"events": [{"domain": "roster", "month": "March", "year": 2025}, ...]}
+
+    Domains: ForecastCacheConfig.CHANGE_EVENT_DOMAINS. Without a year the
+    whole domain is invalidated. The events are forwarded to every other
+    worker over redis pub/sub.
+
+    Authentication:
+        "Authorization: Bearer <CENTENE_CACHE_EVENTS_TOKEN>" (backend), or
+        logged-in user with admin permission and a valid CSRF token
+
+    Returns:
+        {"success": true, "events": 1, "invalidated": 12}
+    """
+    user = request.user
+    if not _has_bearer_token(request, getattr(settings, 'CACHE_EVENTS_TOKEN', '')):
+        if not user.is_authenticated:
+            return JsonResponse(_serialize_cache_error('Authentication required', 401), status=401)
+        # Only the token caller is CSRF-exempt; session callers get the usual check
+        if CsrfViewMiddleware(lambda req: None).process_view(request, None, (), {}) is not None:
+            return JsonResponse(_serialize_cache_error('CSRF verification failed', 403), status=403)
+        if not user.has_perm(get_permission_name("admin")):
+            return JsonResponse(_serialize_cache_error('Permission denied', 403), status=403)
+
+    if not ForecastCacheConfig.ENABLE_CHANGE_EVENTS:
+        return JsonResponse(_serialize_cache_error('Change events are disabled', 503), status=503)
+
+    try:
+        payload = json.loads(request.body or b'{}')
+        raw_events = payload.get('events', [payload]) if isinstance(payload, dict) else payload
+        if not isinstance(raw_events, list) or not raw_events:
+            raise ValueError('No change events given')
+        events = [parse_change_event(event) for event in raw_events]
+    except ValueError as e:
+        return JsonResponse(_serialize_cache_error(f'Invalid change event: {e}', 400), status=400)
+
+    try:
+        deleted = handle_change_events(events)
+        return JsonResponse({
+            'success': True,
+            'events': len(events),
+            'invalidated': deleted,
+            'timestamp': datetime.now().isoformat()
+        })
+    except Exception as e:
+        logger.error(f"Failed to apply cache change events: {e}")
+        return JsonResponse(
+            _serialize_cache_error(str(e), 500),
+            status=500
+        )
+
+
 # ============================================================================
 # Cache Configuration Endpoint
 # ============================================================================
@@ -12,6 +12,7 @@ from django.contrib.auth.decorators import login_required, permission_required
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from centene_forecast_app.app_utils.auth import get_permission_name
+from centene_forecast_app.app_utils.file_utils import relay_streaming_download
 
 # Import validators
 from centene_forecast_app.validators.execution_validators import (
@@ -465,26 +466,12 @@ def download_execution_report_api(request, execution_id, report_type):
             )
             return JsonResponse(error_response, status=500)
 
-        # Create streaming HTTP response
-        # Use iterator to stream chunks from the response
-        def file_iterator():
-            try:
-                for chunk in streaming_response.iter_content(chunk_size=8192):
-                    if chunk:
-                        yield chunk
-            except Exception as e:
-                logger.error(f"[Download Report API] Stream error: {e}", exc_info=True)
-                raise
-
-        # Generate filename
+        # Filename used when the backend sends no Content-Disposition
         filename = f"{validated_type}_{validated_id[:8]}.xlsx"
 
-        # Create response with proper headers
-        response = StreamingHttpResponse(
-            file_iterator(),
-            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        )
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        # Relay backend chunks; the backend connection is released when the
+        # download finishes or the browser aborts it
+        response = relay_streaming_download(streaming_response, filename)
 
         logger.info(
             f"[Download Report API] Successfully initiated download: "
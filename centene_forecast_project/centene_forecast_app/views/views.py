@@ -10,8 +10,6 @@ from django.contrib.auth import login, logout, authenticate
 from django.contrib.auth.decorators import login_required, permission_required
 from django.shortcuts import render, redirect
 
-from core.models import UploadedFile
-
 from utils import *
 from centene_forecast_app.repository import *
 from centene_forecast_app.app_utils import *
@@ -36,13 +34,15 @@ from centene_forecast_app.services.dataview_service import (
     get_platforms_for_selection,
     get_markets_for_platform,
     get_localities_for_selection,
-    get_worktypes_for_selection
+    get_worktypes_for_selection,
+    load_cascade_tree
 )
 
 # Data view serializers
 from centene_forecast_app.serializers.dataview_serializers import (
     serialize_filter_options_response,
     serialize_cascade_response,
+    serialize_cascade_tree_response,
     serialize_error_response
 )
 
@@ -54,6 +54,15 @@ from centene_forecast_app.app_utils.cache_utils import (
     clear_all_caches
 )
 
+# DataTables server-side processing
+from centene_forecast_app.app_utils.datatable_utils import build_datatable_response
+from centene_forecast_app.services.upload_service import (
+    UPLOAD_METHODS,
+    get_upload_job,
+    serialize_upload_job,
+    submit_upload_job
+)
+
 import logging
 
 logger = logging.getLogger('django')
@@ -123,101 +132,24 @@ def upload_view(request):
                 serialize_error_response('Invalid file type. Only CSV and Excel files are allowed.', 400),
                 status=400
             )
-        file_content = uploaded_file.read()
-        user_name = get_display_name(request.user)
-
-        response = None 
-        try:       
-            if file_type == 'roster':
-                response = client.upload_roster_file(
-                    file_content=file_content,
-                    filename=uploaded_file.name,
-                    user= user_name
-                )
-            elif file_type == 'forecast':
-                response = client.upload_forecast_file(
-                    file_content=file_content,
-                    filename=uploaded_file.name,
-                    user= user_name
-                )
-            elif file_type == 'prod_team_roster':
-                response = client.upload_prod_team_roster_file(
-                    file_content=file_content,
-                    filename=uploaded_file.name,
-                    user= user_name
-                )
-            elif file_type == 'altered_forecast':
-                response = client.upload_altered_forecast_file(
-                    file_content=file_content,
-                    filename=uploaded_file.name,
-                    user= user_name
-                )
-            else:
-                logger.error("Unsupported file type: %s", file_type)
-                return JsonResponse(
-                    serialize_error_response('Unsupported file type', 400),
-                    status=400
-                )
-        except Exception as e:
-            logger.exception("Exception during file upload: %s", str(e))
-            return JsonResponse(
-                serialize_error_response('Upload failed due to server error', 500),
-                status=500
-            )
-        
-        if 'error' in response:
-            logger.error("Upload failed with error: %s", response['error'])
+        if file_type not in UPLOAD_METHODS:
+            logger.error("Unsupported file type: %s", file_type)
             return JsonResponse(
-                serialize_error_response(response['error'], 400),
+                serialize_error_response('Unsupported file type', 400),
                 status=400
             )
 
-        if response is None:
-            logger.error("Upload failed, response is None")
+        # Send to the backend on the upload worker pool; the page polls check_progress
+        try:
+            job = submit_upload_job(uploaded_file, file_type, request.user)
+        except Exception as e:
+            logger.exception("Exception queueing file upload: %s", str(e))
             return JsonResponse(
-                serialize_error_response('Upload failed', 500),
+                serialize_error_response('Upload failed due to server error', 500),
                 status=500
             )
-        
-        # Clear relevant caches after successful upload
-        # Extract month and year from response or filename if available
-        # For now, clear all caches for safety
-        try:
-            if file_type == 'roster':
-                logger.info("Clearing all caches after successful roster upload")
-                clear_all_caches()
-            elif file_type == 'forecast' or file_type == 'altered_forecast':
-                logger.info("Clearing forecast caches after successful upload")
-                # Clear all forecast-related caches
-                clear_all_caches()
-
-                # NEW: Clear filter options cache for LLM chat validation
-                try:
-                    from chat_app.utils.filter_cache import get_filter_cache
-                    filter_cache = get_filter_cache()
-                    filter_cache.clear_all()
-                    logger.info("Cleared filter options cache for LLM chat validation")
-                except ImportError:
-                    logger.debug("Filter cache not available (chat_app not installed)")
-                except Exception as filter_cache_error:
-                    logger.warning(f"Failed to clear filter cache: {filter_cache_error}")
-
-                logger.info("Note: Cleared cascade caches. Forecast data cache will expire naturally.")
-            elif file_type == 'prod_team_roster':
-                logger.info("Clearing all caches after successful prod team roster upload")
-                clear_all_caches()
-        except Exception as cache_error:
-            # Don't fail the upload if cache clearing fails
-            logger.warning(f"Failed to clear caches after upload: {cache_error}")
-
-        logger.info("File uploaded successfully: %s", uploaded_file.name)
-        resp = {
-            'success': True,
-            'message': response.get('message', "some error fetching message"),
-        }
-        if response.get('data'):
-            resp['data'] = response['data']
-        return JsonResponse(resp, status=200)
+
+        return JsonResponse(serialize_upload_job(job), status=202)
     try:
         data = client.get_all_record_history()
         records =[]
@@ -241,8 +173,15 @@ def upload_view(request):
 @login_required
 @permission_required(get_permission_name("view"), raise_exception=True)
 def forecast_data_table(request):
+    """
+    DataTables ajax endpoint for one forecast month tab.
+
+    Serves pages from the cached full result when the table runs in
+    server-side mode (draw/start/length/search/order), otherwise returns
+    every record.
+    """
     logger.info("Entered forecast_data_table data for user: %s", request.user.username)
-    page = request.GET.get("draw")
+    draw = to_int(request.GET.get("draw")) or 1
     tab_month = request.GET.get("month")
     keys = request.session.get('Filters', {})
     selected_month, selected_year = to_int(keys.get('selected_month')), to_int(keys.get('selected_year'))
@@ -252,22 +191,24 @@ def forecast_data_table(request):
     data = client.get_all_forecast_records(selected_month, selected_year, tab_month, main_lob, worktype)
     if isinstance(data, dict) and not data.get('success', True):
         logger.warning("Forecast data API error: %s", data.get('error'))
-        return JsonResponse({"draw": 1, "recordsTotal": 0, "data": [], "error": data.get('error', 'Failed to load forecast data')}, status=data.get('status_code', 500))
+        return JsonResponse({"draw": draw, "recordsTotal": 0, "recordsFiltered": 0, "data": [], "error": data.get('error', 'Failed to load forecast data')}, status=data.get('status_code', 500))
     records = data if isinstance(data, list) else []
-    response = {
-        "draw": 1,
-        "recordsTotal": len(records),
-        "data": records
-    }
-    logger.debug("Returning response with %d records", len(records))
+    response = build_datatable_response(records, request.GET)
+    logger.debug("Returning %d of %d records", len(response["data"]), len(records))
     logger.info("completed forecast data call")
     return JsonResponse(response, safe=False)
 
 @login_required
 @permission_required(get_permission_name("view"), raise_exception=True)
 def roster_data_table(request, roster_type:str):
+    """
+    DataTables ajax endpoint for roster / prod team roster tables.
+
+    Serves pages from the cached full result when the table runs in
+    server-side mode, otherwise returns every record.
+    """
     logger.info("Entered roster_data_table view for user: %s", request.user.username)
-    page = request.GET.get("draw")
+    draw = to_int(request.GET.get("draw")) or 1
     keys = request.session.get('Filters', {})
     selected_month, selected_year = keys.get('selected_month'), keys.get('selected_year')
     logger.debug("Filters from session: month=%s, year=%s", selected_month, selected_year)
@@ -275,15 +216,11 @@ def roster_data_table(request, roster_type:str):
     data = client.get_all_roster(roster_type, month=int(selected_month), year=int(selected_year))
     if isinstance(data, dict) and not data.get('success', True):
         logger.warning("Roster data API error: %s", data.get('error'))
-        return JsonResponse({"draw": 1, "recordsTotal": 0, "data": [], "error": data.get('error', 'Failed to load roster data')}, status=data.get('status_code', 500))
+        return JsonResponse({"draw": draw, "recordsTotal": 0, "recordsFiltered": 0, "data": [], "error": data.get('error', 'Failed to load roster data')}, status=data.get('status_code', 500))
     records = data if isinstance(data, list) else []
     logger.info("Fetched %d roster records for month=%s, year=%s", len(records), selected_month, selected_year)
-    response = {
-        "draw": 1,
-        "recordsTotal": len(records),
-        "data": records
-    }
-    logger.debug("Returning response with %d records", len(data))
+    response = build_datatable_response(records, request.GET)
+    logger.debug("Returning %d of %d records", len(response["data"]), len(records))
     return JsonResponse(response, safe=False)
 
 @login_required
@@ -569,6 +506,53 @@ def forecast_worktypes_api(request):
             status=500
         )
 
+@login_required
+@permission_required(get_permission_name("view"), raise_exception=True)
+def forecast_cascade_tree_api(request):
+    """
+    API endpoint for fetching all cascade options of a month in one call.
+
+    URL: /forecast/cascade-tree/
+    Method: GET
+    Query Params: year, month (required)
+
+    Returns:
+        JSON response with platforms -> markets -> localities/worktypes
+    """
+    year = request.GET.get('year', '').strip()
+    month = request.GET.get('month', '').strip()
+
+    logger.debug(
+        f"Forecast cascade tree API called - year: {year}, month: {month} "
+        f"(user: {request.user.username})"
+    )
+
+    try:
+        year_int = validate_year(year)
+        month_int = validate_month(month)
+
+        tree = load_cascade_tree(year_int, month_int)
+        if is_api_error(tree):
+            logger.error(f"Backend error building cascade tree: {tree.get('error')}")
+            return JsonResponse(
+                serialize_error_response("Failed to fetch filter options from backend", 502),
+                status=502
+            )
+
+        logger.info(f"Forecast cascade tree API success - {len(tree['platforms'])} platforms returned")
+        return JsonResponse(serialize_cascade_tree_response(tree), status=200)
+
+    except ValidationError as e:
+        logger.warning(f"Validation error in forecast cascade tree API: {str(e)}")
+        return JsonResponse(serialize_error_response(str(e), 400), status=400)
+
+    except Exception as e:
+        logger.error(f"Error in forecast cascade tree API: {str(e)}", exc_info=True)
+        return JsonResponse(
+            serialize_error_response("Failed to fetch filter options", 500),
+            status=500
+        )
+
 @login_required
 @permission_required(get_permission_name("view"), raise_exception=True)
 def data_view(request):
@@ -713,11 +697,11 @@ def download_data(request):
         )
     
     client = get_api_client()
-    file_stream, filename = client.download_file_stream(data_type, selected_month, selected_year)
+    backend_response, filename = client.download_file_stream(data_type, selected_month, selected_year)
 
-    if file_stream:
-        logger.info("data downloaded successfully")
-        return FileResponse(file_stream, as_attachment=True, filename=filename)
+    if backend_response is not None:
+        logger.info("data download started - relaying backend stream")
+        return relay_streaming_download(backend_response, filename)
     else:
         error_msg = f"Failed to fetch {data_type} file for month: {selected_month} year: {selected_year}"
         logger.error(f"Failed to fetch {data_type} file for {selected_month} {selected_year} - API error")
@@ -779,21 +763,15 @@ def redirect_to_allowed_view(request):
 @login_required
 @permission_required(get_permission_name('add'), raise_exception=True)
 def check_progress(request):
-    file_upload_id = request.GET.get('file_upload_id')
-    try:
-        file_upload = UploadedFile.objects.get(id=file_upload_id)
-        data = {
-            'success': True,
-            'progress': file_upload.progress,
-            'status': file_upload.status,
-        }
-        return JsonResponse(data)
-    except UploadedFile.DoesNotExist:
+    """Status, progress and final message of a background upload job."""
+    job = get_upload_job(request.GET.get('file_upload_id'), request.user)
+    if job is None:
         return JsonResponse(
             serialize_error_response('Upload not found', 404),
             status=404
         )
-    
+    return JsonResponse(serialize_upload_job(job))
+
 
 def logout_view(request):
     logout(request)
@@ -26,6 +26,10 @@ from chat_app.routing import websocket_urlpatterns
 # Get Django ASGI application
 django_asgi_app = get_asgi_application()
 
+# Backend change events reach every worker over redis pub/sub (no-op without redis)
+from centene_forecast_app.services.cache_event_service import start_change_event_subscriber  # noqa: E402
+start_change_event_subscriber()
+
 application = ProtocolTypeRouter({
     "http": django_asgi_app,
     "websocket": AllowedHostsOriginValidator(
@@ -148,7 +148,11 @@ CACHES = {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
         'LOCATION': 'forecast-cache',
         'OPTIONS': {
-            'MAX_ENTRIES': 1000
+            # A warmed report month alone is ~platforms x markets x (localities + 1)
+            # worktype lists and forecast schemas plus the levels above them and
+            # the summaries; with two warmed months and live data pages 1000
+            # entries would start culling (a third of the cache at once).
+            'MAX_ENTRIES': 5000
         }
     },
     # secondary cache: File based cache for multiple workers
@@ -162,6 +166,22 @@ CACHES = {
 
 }
 
+# shared cache: Redis for multiple workers/hosts (select with CENTENE_CACHE_BACKEND=redis)
+CENTENE_REDIS_URL = env('CENTENE_REDIS_URL', default='')
+if CENTENE_REDIS_URL:
+    CACHES['redis'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': CENTENE_REDIS_URL,
+        'KEY_PREFIX': 'centene',
+        'TIMEOUT': 900,
+    }
+
+# Bearer token accepted by /api/cache/metrics/ so Prometheus can scrape without a session
+CACHE_METRICS_TOKEN = env('CENTENE_METRICS_TOKEN', default='')
+
+# Bearer token the backend sends with data change events to /api/cache/events/
+CACHE_EVENTS_TOKEN = env('CENTENE_CACHE_EVENTS_TOKEN', default='')
+
 LOGIN_URL = 'forecast_app:login'
 
 # Password validation
@@ -233,6 +253,12 @@ CHAT_CONFIG = {
     'mock_mode': True,  # Set to False to use real LLM (Phase 2)
     'max_conversation_history': 50,
     'rate_limit_messages_per_minute': 10,
+    # Per-process conversation context cache (Redis / DB remain the source of truth)
+    'context_cache_max_entries': 500,
+    'context_cache_max_bytes': 256 * 1024 * 1024,
+    'context_cache_ttl_seconds': 1800,
+    'context_cache_sweep_interval_seconds': 60,
+    'context_blob_cache_max_bytes': 64 * 1024 * 1024,  # decoded payloads shared between contexts
 }
 
 # LLM Configuration (for Phase 2+ when integrating real LLM)
@@ -265,6 +291,8 @@ LLM_LOGGING_CONFIG = {
     'max_preview_length': 500,      # Truncate in production
     'redact_api_keys': True,
     'redact_user_pii': not DEBUG,
+    'max_inline_payload_chars': 2000,   # Longer prompt/response bodies are logged as hash + size
+    'payload_sample_rate': 1.0 if DEBUG else 0.0,   # Share of those bodies written to llm_workflow.payloads
 }
 
 
@@ -415,8 +443,13 @@ LOGGING = {
             'encoding': 'utf-8',
         },
         'conversation_file': {
-            'class': 'chat_app.utils.conversation_log_handler.ConversationFileHandler',
+            # Queues records; a background thread batches the file writes
+            'class': 'chat_app.utils.conversation_log_handler.QueuedConversationHandler',
             'level': 'DEBUG',
+            'queue_size': 10000,        # records beyond this are dropped and counted
+            'max_open_files': 64,       # LRU of open conversation files
+            'batch_size': 256,
+            'flush_interval': 0.2,      # seconds
         },
     },
     'loggers': {
@@ -472,6 +505,12 @@ LOGGING = {
             'level': 'DEBUG',
             'propagate': False,
         },
+        # Full prompt/response bodies referenced by hash from llm_workflow records
+        'llm_workflow.payloads': {
+            'handlers': ['llm_file'],
+            'level': 'DEBUG',
+            'propagate': False,
+        },
     },
 }
 
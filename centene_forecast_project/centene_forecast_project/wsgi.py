@@ -14,3 +14,7 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'centene_forecast_project.settings')
 
 application = get_wsgi_application()
+
+# Backend change events reach every worker over redis pub/sub (no-op without redis)
+from centene_forecast_app.services.cache_event_service import start_change_event_subscriber  # noqa: E402
+start_change_event_subscriber()
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.10 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat_app', '0003_chatwidgetsetting_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConversationContextBlob',
+            fields=[
+                ('digest', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('data', models.JSONField(help_text='Field value (JSON)')),
+                ('size_bytes', models.IntegerField(default=0, help_text='Serialized size of data')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'chat_conversation_context_blobs',
+                'indexes': [models.Index(fields=['created_at'], name='chat_conver_created_9a0748_idx')],
+            },
+        ),
+    ]
@@ -117,10 +117,19 @@ class ConversationContextModel(models.Model):
     def __str__(self):
         return f"Context for {self.conversation.id}"
 
-    def to_conversation_context(self):
+    @property
+    def blob_refs(self) -> dict:
+        """Field name -> ConversationContextBlob digest for offloaded fields."""
+        return dict(self.context_data.get('_blob_refs') or {})
+
+    def to_conversation_context(self, blob_values: dict = None):
         """
         Convert database model to ConversationContext Pydantic model.
 
+        Args:
+            blob_values: Resolved values of offloaded fields (see blob_refs).
+                Rows written before offloading hold everything inline.
+
         Returns:
             ConversationContext instance
         """
@@ -128,6 +137,8 @@ class ConversationContextModel(models.Model):
 
         # Start with stored JSON data
         data = dict(self.context_data)
+        data.pop('_blob_refs', None)
+        data.update(blob_values or {})
 
         # Ensure conversation_id is set
         data['conversation_id'] = str(self.conversation.id)
@@ -146,19 +157,24 @@ class ConversationContextModel(models.Model):
         return ConversationContext(**data)
 
     @classmethod
-    def from_conversation_context(cls, context, conversation):
+    def from_conversation_context(cls, context, conversation, hot_state: dict = None, blob_refs: dict = None):
         """
         Create or update database model from ConversationContext.
 
         Args:
             context: ConversationContext Pydantic model
             conversation: ChatConversation instance
+            hot_state: Pre-serialized context without offloaded fields
+                (default: the full context)
+            blob_refs: Field name -> blob digest for offloaded fields
 
         Returns:
             ConversationContextModel instance (saved)
         """
         # Serialize context to dict
-        context_dict = context.model_dump(mode='json')
+        context_dict = dict(hot_state) if hot_state is not None else context.model_dump(mode='json')
+        if blob_refs:
+            context_dict['_blob_refs'] = blob_refs
 
         # Remove fields that will be stored separately
         context_dict.pop('conversation_id', None)
@@ -178,6 +194,49 @@ class ConversationContextModel(models.Model):
         return obj
 
 
+class ConversationContextBlob(models.Model):
+    """
+    Content-addressed storage for bulky ConversationContext fields.
+
+    Forecast responses, ramp previews and campaign rows are stored once
+    under the SHA-256 of their JSON and referenced from
+    ConversationContextModel.context_data['_blob_refs'], so a chat turn
+    that only changes a filter rewrites a few hundred bytes.
+    """
+    digest = models.CharField(max_length=64, primary_key=True)
+    data = models.JSONField(help_text="Field value (JSON)")
+    size_bytes = models.IntegerField(default=0, help_text="Serialized size of data")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'chat_conversation_context_blobs'
+        indexes = [
+            models.Index(fields=['created_at']),
+        ]
+
+    def __str__(self):
+        return f"Context blob {self.digest[:12]} ({self.size_bytes} bytes)"
+
+    @classmethod
+    def prune_unreferenced(cls, older_than) -> int:
+        """
+        Delete blobs created before `older_than` that no context references.
+
+        Args:
+            older_than: datetime cutoff; newer blobs may belong to a save in progress
+
+        Returns:
+            Number of blobs deleted
+        """
+        referenced = set()
+        for context_data in ConversationContextModel.objects.values_list('context_data', flat=True):
+            referenced.update((context_data or {}).get('_blob_refs', {}).values())
+
+        stale = cls.objects.filter(created_at__lt=older_than).exclude(digest__in=referenced)
+        deleted, _ = stale.delete()
+        return deleted
+
+
 class ChatToolExecution(models.Model):
     """
     Logs tool executions (API calls) made during chat conversations.
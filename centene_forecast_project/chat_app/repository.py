@@ -2,7 +2,10 @@
 API Client for Chat App
 Handles HTTP requests to FastAPI backend's LLM endpoints with proper error handling and retry logic.
 """
+import asyncio
 import logging
+import urllib.parse
+import weakref
 from typing import Dict, Optional
 import httpx
 from django.conf import settings
@@ -10,6 +13,25 @@ from django.conf import settings
 logger = logging.getLogger(__name__)
 
 
+def _build_forecast_params(month: str, year: int, filters: Dict) -> Dict:
+    """Build /api/llm/forecast query params with array syntax for multi-value filters."""
+    params = {
+        'month': month,
+        'year': year
+    }
+
+    # Add multi-value filters using array syntax
+    for key, value in filters.items():
+        if value:  # Only add non-empty filters
+            if isinstance(value, list):
+                # Use array syntax: platform[]=Amisys&platform[]=Facets
+                params[f'{key}[]'] = value
+            else:
+                params[key] = value
+
+    return params
+
+
 class ChatAPIClient:
     """
     API Client for chat app LLM endpoints.
@@ -145,20 +167,7 @@ class ChatAPIClient:
             ...     state=["CA", "TX"]
             ... )
         """
-        # Build params with array syntax for multi-value filters
-        params = {
-            'month': month,
-            'year': year
-        }
-
-        # Add multi-value filters using array syntax
-        for key, value in filters.items():
-            if value:  # Only add non-empty filters
-                if isinstance(value, list):
-                    # Use array syntax: platform[]=Amisys&platform[]=Facets
-                    params[f'{key}[]'] = value
-                else:
-                    params[key] = value
+        params = _build_forecast_params(month, year, filters)
 
         try:
             response = self.get('/api/llm/forecast', params=params)
@@ -513,7 +522,6 @@ class ChatAPIClient:
 
         DELETE /api/v1/forecasts/{forecast_id}/months/{month_key}/ramp/{ramp_name}
         """
-        import urllib.parse
         safe_name = urllib.parse.quote(ramp_name, safe='')
         endpoint = f"/api/v1/forecasts/{forecast_id}/months/{month_key}/ramp/{safe_name}"
         try:
@@ -561,8 +569,270 @@ class ChatAPIClient:
         self.close()
 
 
+class AsyncChatAPIClient:
+    """
+    Async API Client for chat app LLM endpoints.
+
+    Same methods and retry semantics as ChatAPIClient, built on
+    httpx.AsyncClient so agent tools running in the Channels event loop
+    await the backend instead of blocking every WebSocket on the worker.
+
+    One httpx.AsyncClient is kept per event loop: pooled connections
+    belong to the loop that opened them, and tests or management commands
+    may run tools under their own loop.
+
+    Usage:
+        client = get_async_chat_api_client()
+        data = await client.get_forecast_data(month="March", year=2025, platform=["Amisys"])
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: int = 30,
+        max_retries: int = 3,
+        max_connections: int = 20
+    ):
+        """
+        Initialize Async Chat API Client.
+
+        Args:
+            base_url: Base URL for API endpoints (default: from settings.API_BASE_URL)
+            timeout: Request timeout in seconds (default: 30)
+            max_retries: Maximum number of retry attempts for failed requests (default: 3)
+            max_connections: Connection pool size per event loop (default: 20)
+        """
+        self.base_url = (base_url or getattr(settings, 'API_BASE_URL', 'http://127.0.0.1:8888')).rstrip('/')
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.limits = httpx.Limits(
+            max_keepalive_connections=max_connections // 2,
+            max_connections=max_connections
+        )
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        logger.info(f"AsyncChatAPIClient initialized with base_url: {self.base_url}")
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """httpx.AsyncClient bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=self.limits,
+                # Disable SSL verification for corporate networks if needed
+                verify=False
+            )
+            self._clients[loop] = client
+        return client
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """Send a request with the same retry rules as ChatAPIClient.get/post."""
+        url = f"{self.base_url}{endpoint}"
+
+        for attempt in range(self.max_retries):
+            try:
+                logger.debug(f"[Chat API] {method} {url} - Attempt {attempt + 1}/{self.max_retries}")
+
+                response = await self.client.request(method, endpoint, **kwargs)
+                response.raise_for_status()
+
+                logger.debug(f"[Chat API] {method} {url} - Status: {response.status_code}")
+                return response
+
+            except httpx.TimeoutException:
+                logger.error(f"[Chat API] Request timeout after {self.timeout}s: {method} {url}")
+                if attempt == self.max_retries - 1:
+                    raise
+                logger.warning(f"[Chat API] Retrying... ({attempt + 1}/{self.max_retries})")
+
+            except httpx.HTTPStatusError as e:
+                logger.error(f"[Chat API] HTTP error {e.response.status_code}: {method} {url}")
+                logger.error(f"[Chat API] Response: {e.response.text}")
+                raise
+
+            except httpx.RequestError as e:
+                logger.error(f"[Chat API] Request error: {type(e).__name__} - {str(e)}")
+                if attempt == self.max_retries - 1:
+                    raise
+                logger.warning(f"[Chat API] Retrying... ({attempt + 1}/{self.max_retries})")
+
+        raise Exception("Max retries exceeded")
+
+    async def get(self, endpoint: str, params: Optional[Dict] = None, **kwargs) -> httpx.Response:
+        """Make GET request to API endpoint (see ChatAPIClient.get)."""
+        logger.debug(f"[Chat API] Params: {params}")
+        return await self._request('GET', endpoint, params=params, **kwargs)
+
+    async def post(self, endpoint: str, json_data: Optional[Dict] = None, **kwargs) -> httpx.Response:
+        """Make POST request to API endpoint (see ChatAPIClient.post)."""
+        return await self._request('POST', endpoint, json=json_data, **kwargs)
+
+    async def delete(self, endpoint: str) -> httpx.Response:
+        """HTTP DELETE to FastAPI backend (not retried, like ChatAPIClient.delete)."""
+        try:
+            response = await self.client.delete(endpoint)
+            response.raise_for_status()
+            return response
+        except Exception as e:
+            logger.error(f"[Chat API] DELETE {endpoint} failed: {str(e)}", exc_info=True)
+            raise
+
+    async def _get_checked(self, endpoint: str, description: str, params: Optional[Dict] = None) -> Dict:
+        """GET an /api/llm endpoint and raise ValueError when it reports success=False."""
+        response = await self.get(endpoint, params=params)
+        data = response.json()
+
+        if not data.get('success', False):
+            error_msg = data.get('error', 'Unknown error from API')
+            logger.error(f"[Chat API] {description} API returned error: {error_msg}")
+            raise ValueError(f"API Error: {error_msg}")
+
+        return data
+
+    async def get_forecast_data(self, month: str, year: int, **filters) -> Dict:
+        """Get forecast data from /api/llm/forecast (see ChatAPIClient.get_forecast_data)."""
+        params = _build_forecast_params(month, year, filters)
+        try:
+            data = await self._get_checked('/api/llm/forecast', 'Forecast', params=params)
+            logger.info(
+                f"[Chat API] Forecast data retrieved successfully - "
+                f"{data.get('total_records', 0)} records"
+            )
+            return data
+        except Exception as e:
+            logger.error(f"[Chat API] Failed to get forecast data: {str(e)}", exc_info=True)
+            raise
+
+    async def get_filter_options(self, month: str, year: int) -> Dict:
+        """Get valid filter values for a month/year (see ChatAPIClient.get_filter_options)."""
+        params = {'month': month, 'year': year}
+        try:
+            data = await self._get_checked('/api/llm/forecast/filter-options', 'Filter options', params=params)
+            logger.info(
+                f"[Chat API] Filter options retrieved successfully - "
+                f"{data.get('record_count', 0)} records available for {month} {year}"
+            )
+            return data
+        except Exception as e:
+            logger.error(f"[Chat API] Failed to get filter options: {str(e)}", exc_info=True)
+            raise
+
+    async def get_available_reports(self) -> Dict:
+        """Get available forecast reports (see ChatAPIClient.get_available_reports)."""
+        try:
+            data = await self._get_checked('/api/llm/forecast/available-reports', 'Available reports')
+            logger.info(
+                f"[Chat API] Available reports retrieved successfully - "
+                f"{data.get('total_reports', 0)} reports found"
+            )
+            return data
+        except Exception as e:
+            logger.error(f"[Chat API] Failed to get available reports: {str(e)}", exc_info=True)
+            raise
+
+    async def preview_ramp_calculation(self, forecast_id: int, month_key: str, ramp_payload: Dict) -> Dict:
+        """POST /api/v1/forecasts/{forecastId}/months/{monthKey}/ramp/preview"""
+        endpoint = f"/api/v1/forecasts/{forecast_id}/months/{month_key}/ramp/preview"
+        try:
+            data = (await self.post(endpoint, json_data=ramp_payload)).json()
+            logger.info(f"[Chat API] Ramp preview retrieved for forecast {forecast_id}, month {month_key}")
+            return data
+        except Exception as e:
+            logger.error(f"[Chat API] Failed to preview ramp calculation: {str(e)}", exc_info=True)
+            raise
+
+    async def apply_ramp_calculation(self, forecast_id: int, month_key: str, ramp_payload: Dict) -> Dict:
+        """POST /api/v1/forecasts/{forecastId}/months/{monthKey}/ramp/apply"""
+        endpoint = f"/api/v1/forecasts/{forecast_id}/months/{month_key}/ramp/apply"
+        try:
+            data = (await self.post(endpoint, json_data=ramp_payload)).json()
+            logger.info(f"[Chat API] Ramp applied for forecast {forecast_id}, month {month_key}")
+            return data
+        except Exception as e:
+            logger.error(f"[Chat API] Failed to apply ramp calculation: {str(e)}", exc_info=True)
+            raise
+
+    async def get_applied_ramp(self, forecast_id: int, month_key: str) -> Dict:
+        """GET /api/v1/forecasts/{forecastId}/months/{monthKey}/ramp"""
+        endpoint = f"/api/v1/forecasts/{forecast_id}/months/{month_key}/ramp"
+        try:
+            data = (await self.get(endpoint)).json()
+            logger.info(f"[Chat API] Applied ramp retrieved for forecast {forecast_id}, month {month_key}")
+            return data
+        except Exception as e:
+            logger.error(f"[Chat API] Failed to get applied ramp: {str(e)}", exc_info=True)
+            raise
+
+    async def bulk_preview_ramp(self, forecast_id: int, month_key: str, payload: Dict) -> Dict:
+        """POST /api/v1/forecasts/{forecastId}/months/{monthKey}/ramp/bulk-preview"""
+        endpoint = f"/api/v1/forecasts/{forecast_id}/months/{month_key}/ramp/bulk-preview"
+        try:
+            data = (await self.post(endpoint, json_data=payload)).json()
+            logger.info(f"[Chat API] Bulk ramp preview retrieved for forecast {forecast_id}, month {month_key}")
+            return data
+        except Exception as e:
+            logger.error(f"[Chat API] Failed to bulk preview ramp: {str(e)}", exc_info=True)
+            raise
+
+    async def bulk_apply_ramp(self, forecast_id: int, month_key: str, payload: Dict) -> Dict:
+        """POST /api/v1/forecasts/{forecastId}/months/{monthKey}/ramp/bulk-apply"""
+        endpoint = f"/api/v1/forecasts/{forecast_id}/months/{month_key}/ramp/bulk-apply"
+        try:
+            data = (await self.post(endpoint, json_data=payload)).json()
+            logger.info(f"[Chat API] Bulk ramp applied for forecast {forecast_id}, month {month_key}")
+            return data
+        except Exception as e:
+            logger.error(f"[Chat API] Failed to bulk apply ramp: {str(e)}", exc_info=True)
+            raise
+
+    async def delete_ramp(self, forecast_id: int, month_key: str, ramp_name: str) -> Dict:
+        """DELETE /api/v1/forecasts/{forecast_id}/months/{month_key}/ramp/{ramp_name}"""
+        safe_name = urllib.parse.quote(ramp_name, safe='')
+        endpoint = f"/api/v1/forecasts/{forecast_id}/months/{month_key}/ramp/{safe_name}"
+        try:
+            data = (await self.delete(endpoint)).json()
+            logger.info(f"[Chat API] Ramp deleted: {ramp_name} for forecast {forecast_id}, month {month_key}")
+            return data
+        except Exception as e:
+            logger.error(f"[Chat API] Failed to delete ramp: {str(e)}", exc_info=True)
+            raise
+
+    async def get_ramps_for_report(self, year: int, month: str) -> Dict:
+        """GET /api/v1/ramps/report/{year}/{month}"""
+        endpoint = f"/api/v1/ramps/report/{year}/{month}"
+        try:
+            data = (await self.get(endpoint)).json()
+            logger.info(f"[Chat API] Bulk ramps fetched for {month} {year}")
+            return data
+        except Exception as e:
+            logger.error(f"[Chat API] Failed to get ramps for report period: {str(e)}", exc_info=True)
+            raise
+
+    async def aclose(self):
+        """Close the HTTP client of the running event loop."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+            logger.info("[Chat API] Async client closed")
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
+
+
 # Singleton instance for application-wide use
 _chat_api_client_instance: Optional[ChatAPIClient] = None
+_async_chat_api_client_instance: Optional[AsyncChatAPIClient] = None
 
 
 def get_chat_api_client() -> ChatAPIClient:
@@ -593,6 +863,37 @@ def get_chat_api_client() -> ChatAPIClient:
     return _chat_api_client_instance
 
 
+def get_async_chat_api_client() -> AsyncChatAPIClient:
+    """
+    Get or create singleton AsyncChatAPIClient instance.
+
+    Use this from async code (agent tools, consumers); ChatAPIClient
+    blocks the event loop for the whole backend round trip.
+
+    Returns:
+        Configured AsyncChatAPIClient instance
+
+    Usage:
+        from chat_app.repository import get_async_chat_api_client
+
+        client = get_async_chat_api_client()
+        data = await client.get_forecast_data("March", 2025, platform=["Amisys"])
+    """
+    global _async_chat_api_client_instance
+
+    if _async_chat_api_client_instance is None:
+        base_url = getattr(settings, 'API_BASE_URL', 'http://127.0.0.1:8888')
+        timeout = 30
+
+        _async_chat_api_client_instance = AsyncChatAPIClient(
+            base_url=base_url,
+            timeout=timeout
+        )
+        logger.info("[Chat API] Created new AsyncChatAPIClient singleton instance")
+
+    return _async_chat_api_client_instance
+
+
 def reset_chat_api_client():
     """
     Reset singleton instance (useful for testing).
@@ -602,8 +903,12 @@ def reset_chat_api_client():
 
         reset_chat_api_client()  # Force recreation on next get_chat_api_client() call
     """
-    global _chat_api_client_instance
+    global _chat_api_client_instance, _async_chat_api_client_instance
     if _chat_api_client_instance:
         _chat_api_client_instance.close()
         _chat_api_client_instance = None
         logger.info("[Chat API] ChatAPIClient singleton instance reset")
+
+    # Async clients can only be closed from their own event loop (aclose());
+    # drop the instance so the next get_async_chat_api_client() picks up new settings.
+    _async_chat_api_client_instance = None
@@ -31,12 +31,69 @@ logger = logging.getLogger(__name__)
 llm_logger = get_llm_logger()
 
 
+# Static system prompt: byte-identical on every turn of every conversation so
+# that, with the (equally static) tool schemas, the provider can serve it
+# from its prompt cache. Per-turn context is built by _build_context_prompt.
+AGENT_SYSTEM_PROMPT = """You are a workforce capacity planning assistant for Centene.
+
+The CURRENT SESSION CONTEXT (and the SELECTED ROW, if any) is given in the system
+message just before the user's latest message.
+If the user refers to "this row", "the selected row", "FTEs", or wants to change CPH,
+they mean the SELECTED ROW.
+
+INSTRUCTIONS — Think step by step before calling a tool:
+1. Understand exactly what the user wants (data query, filter change, CPH edit, FTE details, ramp setup, report list, etc.)
+2. Identify any filters mentioned (month, year, platform, locality, state, case type).
+3. If month/year is missing AND not in context → reply asking which month/year the user wants. Do NOT call any tool.
+4. If month AND year are known (from message or context):
+   - For a NEW data request → call propose_data_fetch immediately with whatever filters were mentioned (or none). NEVER ask the user about optional filters.
+   - For a filter change on already-loaded data → call get_forecast_data with the merged filter set.
+5. Apply context filter rules:
+   - "also" / "add" / "include" → operation="extend" in update_filters OR pass merged filters to get_forecast_data
+   - "only" / "change to" / "switch" → operation="replace"
+   - "remove" / "without" / "exclude" → operation="remove"
+   - "reset filters" / "clear filters" / "show all" → operation="reset" in update_filters
+   - "start over" / "clear everything" / "reset all" → call clear_context
+   - No filter mentioned → use context filters as defaults
+6. After the tool returns, write a clear, friendly natural language summary.
+
+CRITICAL RULE: When month AND year are both clear, ALWAYS call a tool immediately.
+NEVER ask the user for optional filters such as platform, market, state, or case type.
+If filters are not mentioned, simply omit them — proceed without them.
+
+RAMP / CAMPAIGN RULE: If the context shows "Data: loaded" AND the user is asking about
+the SAME period already in context (same month/year) for setup_ramp_campaign /
+setup_ramp_calculation / get_applied_ramp — call those tools DIRECTLY without fetching first.
+If the user specifies a DIFFERENT month/year than what is in context, fetch that period first
+via propose_data_fetch before calling the ramp tool.
+
+TOOLS AVAILABLE:
+  propose_data_fetch       – show a confirmation card before fetching data (use for NEW data requests or when switching to a different month/year)
+  get_forecast_data        – fetch records/totals directly (use for follow-up filter changes)
+  get_available_reports    – list available report periods
+  get_fte_details          – FTE breakdown for the selected row
+  preview_cph_change       – CPH impact preview for the selected row
+  update_filters           – merge/replace/remove/reset context filters without fetching data
+  clear_context            – wipe all context (full reset)
+  setup_ramp_campaign      – open the Ramp Campaign Manager for bulk ramps across all LOBs and months; requires data to be loaded
+  setup_ramp_calculation   – configure a ramp for a single LOB/month (week-by-week); requires a selected row
+  get_applied_ramp         – view existing ramps for a given month/year
+
+IMPORTANT:
+- Use propose_data_fetch for the first/fresh data request in a session.
+- Use get_forecast_data for subsequent filter refinements (e.g. "now show only California").
+- Only call update_filters alone when the user explicitly asks to change filters
+  WITHOUT requesting new data in the same turn.
+- If "Data: loaded" appears in context, do NOT propose another fetch for ramp operations.
+"""
+
+
 class LLMService:
     """
     CoT tool-calling agent using LangChain + OpenAI.
 
     run_agent() is the single entry point:
-      1. Build context-aware system prompt
+      1. Build the static system prompt + per-turn context message
       2. Bind tools to the LLM
       3. LLM reasons (CoT) and optionally calls a tool
       4. Execute the tool → get UI + data
@@ -115,9 +172,8 @@ class LLMService:
         tools = make_agent_tools(conversation_id, context, self.context_manager)
         llm_with_tools = self.llm.bind_tools(tools)
 
-        # Build message list
-        system_prompt = self._build_system_prompt(context, selected_row)
-        messages: List = [SystemMessage(content=system_prompt)]
+        # Build message list: static prompt, history, per-turn context, user text
+        messages: List = [SystemMessage(content=AGENT_SYSTEM_PROMPT)]
 
         if message_history:
             for msg in message_history[-10:]:
@@ -126,13 +182,14 @@ class LLMService:
                 elif msg['role'] == 'assistant':
                     messages.append(AIMessage(content=msg['content']))
 
+        messages.append(SystemMessage(content=self._build_context_prompt(context, selected_row)))
         messages.append(HumanMessage(content=user_text))
 
         # Log LLM request
         llm_logger.log_llm_request(
             correlation_id=correlation_id,
             model=self.model_name,
-            messages=[{'role': type(m).__name__, 'content': m.content} for m in messages],
+            messages=messages,
             config={'temperature': self.temperature},
             request_type='agent_run',
         )
@@ -148,6 +205,7 @@ class LLMService:
 
         ui_component = ''
         tool_data = {}
+        llm_responses = [response]
 
         if response.tool_calls:
             messages.append(response)  # AIMessage with tool calls
@@ -187,6 +245,7 @@ class LLMService:
             # Second LLM call to generate natural language response
             try:
                 final = await self.llm.ainvoke(messages)
+                llm_responses.append(final)
                 text_response = final.content
             except Exception as e:
                 logger.warning(f"[LLM Service] Final response generation failed: {e}")
@@ -196,10 +255,16 @@ class LLMService:
             text_response = response.content
 
         duration_ms = (time.time() - start_time) * 1000
-        logger.info(f"[LLM Service] run_agent complete in {duration_ms:.0f}ms")
+        token_usage = self._token_usage(*llm_responses)
+        logger.info(
+            f"[LLM Service] run_agent complete in {duration_ms:.0f}ms "
+            f"(input tokens: {token_usage['cached_input_tokens']} cached, "
+            f"{token_usage['uncached_input_tokens']} uncached)"
+        )
         llm_logger.log_llm_response(
             correlation_id=correlation_id,
             response={'has_tool_calls': bool(response.tool_calls), 'text_length': len(text_response)},
+            token_usage=token_usage,
             duration_ms=duration_ms,
             model=self.model_name,
         )
@@ -244,80 +309,49 @@ class LLMService:
             'data': {},
         }
 
-    def _build_system_prompt(
+    def _build_context_prompt(
         self,
         context: ConversationContext,
         selected_row: dict = None,
     ) -> str:
         """
-        Build the CoT system prompt with context summary and optional row info.
+        Build the per-turn part of the system prompt: session context and
+        optional row info. Sent after the history so AGENT_SYSTEM_PROMPT
+        stays an unchanged prefix.
         """
-        context_summary = context.get_context_summary_for_llm()
+        lines = ['CURRENT SESSION CONTEXT:', context.get_context_summary_for_llm()]
 
-        selected_row_block = ''
         if selected_row:
-            selected_row_block = f"""
-SELECTED ROW:
-  Main LOB: {selected_row.get('main_lob', 'N/A')}
-  State:    {selected_row.get('state', 'N/A')}
-  Case Type:{selected_row.get('case_type', 'N/A')}
-  CPH:      {selected_row.get('target_cph', 'N/A')}
-  Monthly data: {json.dumps(selected_row.get('months', {}), indent=2)}
-
-If the user refers to "this row", "the selected row", "FTEs", or wants to change CPH,
-they mean the selected row above.
-"""
-
-        return f"""You are a workforce capacity planning assistant for Centene.
-
-CURRENT SESSION CONTEXT:
-{context_summary}
-{selected_row_block}
-INSTRUCTIONS — Think step by step before calling a tool:
-1. Understand exactly what the user wants (data query, filter change, CPH edit, FTE details, ramp setup, report list, etc.)
-2. Identify any filters mentioned (month, year, platform, locality, state, case type).
-3. If month/year is missing AND not in context → reply asking which month/year the user wants. Do NOT call any tool.
-4. If month AND year are known (from message or context):
-   - For a NEW data request → call propose_data_fetch immediately with whatever filters were mentioned (or none). NEVER ask the user about optional filters.
-   - For a filter change on already-loaded data → call get_forecast_data with the merged filter set.
-5. Apply context filter rules:
-   - "also" / "add" / "include" → operation="extend" in update_filters OR pass merged filters to get_forecast_data
-   - "only" / "change to" / "switch" → operation="replace"
-   - "remove" / "without" / "exclude" → operation="remove"
-   - "reset filters" / "clear filters" / "show all" → operation="reset" in update_filters
-   - "start over" / "clear everything" / "reset all" → call clear_context
-   - No filter mentioned → use context filters as defaults
-6. After the tool returns, write a clear, friendly natural language summary.
-
-CRITICAL RULE: When month AND year are both clear, ALWAYS call a tool immediately.
-NEVER ask the user for optional filters such as platform, market, state, or case type.
-If filters are not mentioned, simply omit them — proceed without them.
-
-RAMP / CAMPAIGN RULE: If the context shows "Data: loaded" AND the user is asking about
-the SAME period already in context (same month/year) for setup_ramp_campaign /
-setup_ramp_calculation / get_applied_ramp — call those tools DIRECTLY without fetching first.
-If the user specifies a DIFFERENT month/year than what is in context, fetch that period first
-via propose_data_fetch before calling the ramp tool.
-
-TOOLS AVAILABLE:
-  propose_data_fetch       – show a confirmation card before fetching data (use for NEW data requests or when switching to a different month/year)
-  get_forecast_data        – fetch records/totals directly (use for follow-up filter changes)
-  get_available_reports    – list available report periods
-  get_fte_details          – FTE breakdown for the selected row
-  preview_cph_change       – CPH impact preview for the selected row
-  update_filters           – merge/replace/remove/reset context filters without fetching data
-  clear_context            – wipe all context (full reset)
-  setup_ramp_campaign      – open the Ramp Campaign Manager for bulk ramps across all LOBs and months; requires data to be loaded
-  setup_ramp_calculation   – configure a ramp for a single LOB/month (week-by-week); requires a selected row
-  get_applied_ramp         – view existing ramps for a given month/year
+            lines += [
+                '',
+                'SELECTED ROW:',
+                f"  Main LOB: {selected_row.get('main_lob', 'N/A')}",
+                f"  State:    {selected_row.get('state', 'N/A')}",
+                f"  Case Type:{selected_row.get('case_type', 'N/A')}",
+                f"  CPH:      {selected_row.get('target_cph', 'N/A')}",
+                f"  Monthly data: {json.dumps(selected_row.get('months', {}), separators=(',', ':'))}",
+            ]
+
+        return '\n'.join(lines)
+
+    @staticmethod
+    def _token_usage(*responses) -> Dict[str, int]:
+        """
+        Token counts reported by the provider, summed over the responses.
 
-IMPORTANT:
-- Use propose_data_fetch for the first/fresh data request in a session.
-- Use get_forecast_data for subsequent filter refinements (e.g. "now show only California").
-- Only call update_filters alone when the user explicitly asks to change filters
-  WITHOUT requesting new data in the same turn.
-- If "Data: loaded" appears in context, do NOT propose another fetch for ramp operations.
-"""
+        cached_input_tokens are prompt tokens served from the provider's
+        prompt cache (usage_metadata input_token_details.cache_read).
+        """
+        usage = {'input_tokens': 0, 'cached_input_tokens': 0, 'output_tokens': 0}
+        for response in responses:
+            metadata = getattr(response, 'usage_metadata', None)
+            if not isinstance(metadata, dict):
+                continue
+            usage['input_tokens'] += metadata.get('input_tokens', 0)
+            usage['cached_input_tokens'] += (metadata.get('input_token_details') or {}).get('cache_read', 0)
+            usage['output_tokens'] += metadata.get('output_tokens', 0)
+        usage['uncached_input_tokens'] = usage['input_tokens'] - usage['cached_input_tokens']
+        return usage
 
     # ─────────────────────────────────────────────────────────────────────────
     # Legacy helpers kept for CPH update flow (still used by chat_service)
@@ -15,7 +15,7 @@ from pydantic import BaseModel, Field
 import httpx
 
 from chat_app.services.tools.validation import ForecastQueryParams
-from chat_app.repository import get_chat_api_client
+from chat_app.repository import get_async_chat_api_client
 from chat_app.exceptions import (
     APIError,
     APIServerError,
@@ -91,8 +91,8 @@ async def fetch_available_reports() -> dict:
     """
     endpoint = "/api/llm/forecast/available-reports"
     try:
-        client = get_chat_api_client()
-        data = client.get_available_reports()
+        client = get_async_chat_api_client()
+        data = await client.get_available_reports()
         logger.info(f"[Forecast Tools] Fetched {data.get('total_reports', 0)} available reports")
         return data
     except httpx.ConnectError as e:
@@ -290,10 +290,10 @@ async def fetch_forecast_data(
             f"with filters: {filters}"
         )
 
-        client = get_chat_api_client()
+        client = get_async_chat_api_client()
 
         # Use repository method which handles array syntax internally
-        data = client.get_forecast_data(
+        data = await client.get_forecast_data(
             month=api_params['month'],
             year=api_params['year'],
             **filters
@@ -527,15 +527,10 @@ async def call_preview_ramp(forecast_id: int, month_key: str, ramp_payload: dict
         APITimeoutError: If API request times out
         APIResponseError: If API returns error status
     """
-    import asyncio
     endpoint = f"/api/v1/forecasts/{forecast_id}/months/{month_key}/ramp/preview"
     try:
-        client = get_chat_api_client()
-        loop = asyncio.get_event_loop()
-        data = await loop.run_in_executor(
-            None,
-            lambda: client.preview_ramp_calculation(forecast_id, month_key, ramp_payload)
-        )
+        client = get_async_chat_api_client()
+        data = await client.preview_ramp_calculation(forecast_id, month_key, ramp_payload)
         logger.info(f"[Forecast Tools] Ramp preview fetched for forecast {forecast_id}, month {month_key}")
         return data
     except httpx.ConnectError as e:
@@ -571,15 +566,10 @@ async def call_apply_ramp(forecast_id: int, month_key: str, ramp_payload: dict)
         APITimeoutError: If API request times out
         APIResponseError: If API returns error status
     """
-    import asyncio
     endpoint = f"/api/v1/forecasts/{forecast_id}/months/{month_key}/ramp/apply"
     try:
-        client = get_chat_api_client()
-        loop = asyncio.get_event_loop()
-        data = await loop.run_in_executor(
-            None,
-            lambda: client.apply_ramp_calculation(forecast_id, month_key, ramp_payload)
-        )
+        client = get_async_chat_api_client()
+        data = await client.apply_ramp_calculation(forecast_id, month_key, ramp_payload)
         logger.info(f"[Forecast Tools] Ramp applied for forecast {forecast_id}, month {month_key}")
         return data
     except httpx.ConnectError as e:
@@ -614,15 +604,10 @@ async def call_get_applied_ramp(forecast_id: int, month_key: str) -> dict:
         APITimeoutError: If API request times out
         APIResponseError: If API returns error status
     """
-    import asyncio
     endpoint = f"/api/v1/forecasts/{forecast_id}/months/{month_key}/ramp"
     try:
-        client = get_chat_api_client()
-        loop = asyncio.get_event_loop()
-        data = await loop.run_in_executor(
-            None,
-            lambda: client.get_applied_ramp(forecast_id, month_key)
-        )
+        client = get_async_chat_api_client()
+        data = await client.get_applied_ramp(forecast_id, month_key)
         logger.info(f"[Forecast Tools] Applied ramp fetched for forecast {forecast_id}, month {month_key}")
         return data
     except httpx.ConnectError as e:
@@ -656,15 +641,10 @@ async def call_bulk_preview_ramp(forecast_id: int, month_key: str, payload: dict
     Raises:
         APIConnectionError, APITimeoutError, APIResponseError
     """
-    import asyncio
     endpoint = f"/api/v1/forecasts/{forecast_id}/months/{month_key}/ramp/bulk-preview"
     try:
-        client = get_chat_api_client()
-        loop = asyncio.get_event_loop()
-        data = await loop.run_in_executor(
-            None,
-            lambda: client.bulk_preview_ramp(forecast_id, month_key, payload)
-        )
+        client = get_async_chat_api_client()
+        data = await client.bulk_preview_ramp(forecast_id, month_key, payload)
         logger.info(f"[Forecast Tools] Bulk ramp preview fetched for forecast {forecast_id}, month {month_key}")
         return data
     except httpx.ConnectError as e:
@@ -698,15 +678,10 @@ async def call_bulk_apply_ramp(forecast_id: int, month_key: str, payload: dict)
     Raises:
         APIConnectionError, APITimeoutError, APIResponseError
     """
-    import asyncio
     endpoint = f"/api/v1/forecasts/{forecast_id}/months/{month_key}/ramp/bulk-apply"
     try:
-        client = get_chat_api_client()
-        loop = asyncio.get_event_loop()
-        data = await loop.run_in_executor(
-            None,
-            lambda: client.bulk_apply_ramp(forecast_id, month_key, payload)
-        )
+        client = get_async_chat_api_client()
+        data = await client.bulk_apply_ramp(forecast_id, month_key, payload)
         logger.info(f"[Forecast Tools] Bulk ramp applied for forecast {forecast_id}, month {month_key}")
         return data
     except httpx.ConnectError as e:
@@ -737,17 +712,12 @@ async def call_delete_ramp(forecast_id: int, month_key: str, ramp_name: str) ->
     Raises:
         APIConnectionError, APITimeoutError, APIResponseError
     """
-    import asyncio
     import urllib.parse
     safe_name = urllib.parse.quote(ramp_name, safe='')
     endpoint = f"/api/v1/forecasts/{forecast_id}/months/{month_key}/ramp/{safe_name}"
     try:
-        client = get_chat_api_client()
-        loop = asyncio.get_event_loop()
-        data = await loop.run_in_executor(
-            None,
-            lambda: client.delete_ramp(forecast_id, month_key, ramp_name)
-        )
+        client = get_async_chat_api_client()
+        data = await client.delete_ramp(forecast_id, month_key, ramp_name)
         logger.info(f"[Forecast Tools] Ramp deleted: {ramp_name} for forecast {forecast_id}, month {month_key}")
         return data
     except httpx.ConnectError as e:
@@ -780,15 +750,10 @@ async def call_get_ramps_for_report(year: int, month: str) -> dict:
     Raises:
         APIConnectionError, APITimeoutError, APIResponseError
     """
-    import asyncio
     endpoint = f"/api/v1/ramps/report/{year}/{month}"
     try:
-        client = get_chat_api_client()
-        loop = asyncio.get_event_loop()
-        data = await loop.run_in_executor(
-            None,
-            lambda: client.get_ramps_for_report(year, month)
-        )
+        client = get_async_chat_api_client()
+        data = await client.get_ramps_for_report(year, month)
         logger.info(f"[Forecast Tools] Bulk ramps fetched for {month} {year}")
         return data
     except httpx.ConnectError as e:
@@ -5,14 +5,15 @@ Proactive validation and reactive diagnosis for forecast queries.
 
 import logging
 import time
-from typing import Dict, List, Optional, Tuple
-from difflib import SequenceMatcher, get_close_matches
+from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import calendar
 
-from chat_app.repository import get_chat_api_client
-from chat_app.utils.filter_cache import get_filter_cache
+from chat_app.repository import get_async_chat_api_client
+from chat_app.utils.filter_cache import get_filter_cache, get_facet_index_cache, get_option_matcher_cache
+from chat_app.utils.facet_index import FacetIndex, build_facet_index
+from chat_app.utils.fuzzy_matcher import OptionMatcher
 from chat_app.services.tools.validation import ForecastQueryParams
 from chat_app.utils.llm_logger import get_llm_logger, get_correlation_id
 
@@ -81,9 +82,16 @@ class FilterValidator:
         "wisconsin": "WI", "wyoming": "WY"
     }
 
+    # Filter option fields validated by validate_all
+    OPTION_FIELDS = (
+        'platforms', 'markets', 'localities', 'main_lobs',
+        'states', 'case_types', 'forecast_months'
+    )
+
     def __init__(self):
         self.cache = get_filter_cache()
-        self.client = get_chat_api_client()
+        self.matcher_cache = get_option_matcher_cache()
+        self.client = get_async_chat_api_client()
 
     async def get_filter_options(
         self,
@@ -116,7 +124,7 @@ class FilterValidator:
                 f"{month_name} {year}"
             )
 
-            response = self.client.get_filter_options(month_name, year)
+            response = await self.client.get_filter_options(month_name, year)
             filter_options = response.get('filter_options', {})
 
             # Cache the result
@@ -139,39 +147,38 @@ class FilterValidator:
     def fuzzy_match(
         self,
         user_value: str,
-        valid_options: List[str]
+        valid_options: Union[List[str], OptionMatcher]
     ) -> ValidationResult:
         """
         Perform fuzzy matching on a single value.
 
-        Uses difflib.get_close_matches with cutoff=0.6 (60% similarity).
+        Exact matches come from the matcher's lowercase lookup; otherwise
+        options sharing trigrams with the value are scored by edit distance
+        similarity with cutoff=0.6 (60% similarity).
 
         Args:
             user_value: User-provided filter value
-            valid_options: List of valid options from API
+            valid_options: Valid options from API, or a prebuilt OptionMatcher
 
         Returns:
             ValidationResult with match confidence and suggestions
         """
+        matcher = valid_options if isinstance(valid_options, OptionMatcher) else OptionMatcher(valid_options)
+
         # Exact match (case-insensitive)
-        for option in valid_options:
-            if user_value.lower() == option.lower():
-                return ValidationResult(
-                    is_valid=True,
-                    field_name="",  # Set by caller
-                    original_value=user_value,
-                    corrected_value=option,  # Normalize case
-                    confidence=1.0,
-                    confidence_level=ConfidenceLevel.HIGH
-                )
+        option = matcher.exact(user_value)
+        if option is not None:
+            return ValidationResult(
+                is_valid=True,
+                field_name="",  # Set by caller
+                original_value=user_value,
+                corrected_value=option,  # Normalize case
+                confidence=1.0,
+                confidence_level=ConfidenceLevel.HIGH
+            )
 
-        # Fuzzy match using difflib
-        matches = get_close_matches(
-            user_value.lower(),
-            [opt.lower() for opt in valid_options],
-            n=3,
-            cutoff=0.6
-        )
+        # Fuzzy match against the trigram candidates
+        matches = matcher.closest(user_value, n=3, cutoff=self.MEDIUM_CONFIDENCE)
 
         if not matches:
             # No close matches - suggest all options
@@ -181,22 +188,10 @@ class FilterValidator:
                 original_value=user_value,
                 confidence=0.0,
                 confidence_level=ConfidenceLevel.LOW,
-                suggestions=valid_options[:5]  # Top 5 suggestions
+                suggestions=matcher.options[:5]  # Top 5 suggestions
             )
 
-        # Find original case version of best match
-        best_match_lower = matches[0]
-        best_match = next(
-            opt for opt in valid_options
-            if opt.lower() == best_match_lower
-        )
-
-        # Calculate confidence using SequenceMatcher
-        confidence = SequenceMatcher(
-            None,
-            user_value.lower(),
-            best_match_lower
-        ).ratio()
+        best_match, confidence = matches[0]
 
         # Determine confidence level
         if confidence >= self.HIGH_CONFIDENCE:
@@ -206,12 +201,6 @@ class FilterValidator:
         else:
             confidence_level = ConfidenceLevel.LOW
 
-        # Get original case versions for suggestions
-        suggestions = [
-            next(opt for opt in valid_options if opt.lower() == m)
-            for m in matches
-        ]
-
         return ValidationResult(
             is_valid=(confidence >= self.MEDIUM_CONFIDENCE),
             field_name="",
@@ -219,7 +208,7 @@ class FilterValidator:
             corrected_value=best_match if confidence >= self.MEDIUM_CONFIDENCE else None,
             confidence=confidence,
             confidence_level=confidence_level,
-            suggestions=suggestions
+            suggestions=[option for option, _ in matches]
         )
 
     def normalize_state_value(self, user_value: str) -> str:
@@ -244,6 +233,29 @@ class FilterValidator:
 
         return user_value
 
+    def _get_option_matchers(
+        self,
+        month: int,
+        year: int,
+        filter_options: dict
+    ) -> Dict[str, OptionMatcher]:
+        """
+        Get the matchers of a filter options snapshot, building them once.
+
+        Cached per month/year next to the filter options; rebuilt when the
+        options were refetched.
+        """
+        cached = self.matcher_cache.get(month, year)
+        if cached and cached['source'] is filter_options:
+            return cached['matchers']
+
+        matchers = {
+            field: OptionMatcher(filter_options.get(field) or [])
+            for field in self.OPTION_FIELDS
+        }
+        self.matcher_cache.set(month, year, {'source': filter_options, 'matchers': matchers})
+        return matchers
+
     async def validate_all(
         self,
         params: ForecastQueryParams
@@ -270,6 +282,7 @@ class FilterValidator:
             )
             return {}
 
+        matchers = self._get_option_matchers(params.month, params.year, filter_options)
         results = {}
 
         # Validate platforms
@@ -278,7 +291,7 @@ class FilterValidator:
                 self._validate_field(
                     'platforms',
                     value,
-                    filter_options.get('platforms', [])
+                    matchers['platforms']
                 )
                 for value in params.platforms
             ]
@@ -289,7 +302,7 @@ class FilterValidator:
                 self._validate_field(
                     'markets',
                     value,
-                    filter_options.get('markets', [])
+                    matchers['markets']
                 )
                 for value in params.markets
             ]
@@ -300,7 +313,7 @@ class FilterValidator:
                 self._validate_field(
                     'localities',
                     value,
-                    filter_options.get('localities', [])
+                    matchers['localities']
                 )
                 for value in params.localities
             ]
@@ -311,7 +324,7 @@ class FilterValidator:
                 self._validate_field(
                     'main_lobs',
                     value,
-                    filter_options.get('main_lobs', [])
+                    matchers['main_lobs']
                 )
                 for value in params.main_lobs
             ]
@@ -321,7 +334,7 @@ class FilterValidator:
             results['states'] = [
                 self._validate_state_field(
                     value,
-                    filter_options.get('states', [])
+                    matchers['states']
                 )
                 for value in params.states
             ]
@@ -332,7 +345,7 @@ class FilterValidator:
                 self._validate_field(
                     'case_types',
                     value,
-                    filter_options.get('case_types', [])
+                    matchers['case_types']
                 )
                 for value in params.case_types
             ]
@@ -343,7 +356,7 @@ class FilterValidator:
                 self._validate_field(
                     'forecast_months',
                     value,
-                    filter_options.get('forecast_months', [])
+                    matchers['forecast_months']
                 )
                 for value in params.forecast_months
             ]
@@ -386,7 +399,7 @@ class FilterValidator:
         self,
         field_name: str,
         user_value: str,
-        valid_options: List[str]
+        valid_options: Union[List[str], OptionMatcher]
     ) -> ValidationResult:
         """Validate a single field value."""
         result = self.fuzzy_match(user_value, valid_options)
@@ -396,7 +409,7 @@ class FilterValidator:
     def _validate_state_field(
         self,
         user_value: str,
-        valid_options: List[str]
+        valid_options: Union[List[str], OptionMatcher]
     ) -> ValidationResult:
         """Validate state field with normalization."""
         # Normalize first
@@ -411,12 +424,16 @@ class CombinationDiagnostic:
     """
     Diagnoses why a filter combination returns 0 records.
 
-    Uses incremental API testing to isolate problematic filters.
+    The unfiltered month is fetched once and indexed (FacetIndex, cached per
+    month/year); problematic filters and working combinations then come from
+    bitset intersections. If the response cannot be indexed, each filter is
+    tested with its own API query instead.
     """
 
     def __init__(self):
-        self.client = get_chat_api_client()
+        self.client = get_async_chat_api_client()
         self.validator = FilterValidator()
+        self.facet_cache = get_facet_index_cache()
 
     async def diagnose(
         self,
@@ -428,9 +445,9 @@ class CombinationDiagnostic:
 
         Strategy:
         1. Check if data exists for month/year (call filter-options)
-        2. Check if ANY records exist (query with no filters)
+        2. Check if ANY records exist (query with no filters, indexed)
         3. Remove filters one-by-one to identify problematic filter
-        4. Fetch valid options for working combinations
+        4. Find valid options for working combinations
 
         Args:
             params: Original query parameters
@@ -480,7 +497,15 @@ class CombinationDiagnostic:
 
         # Step 2: Check if ANY records exist (no filters)
         try:
-            base_data = await self._query_without_filters(params.month, params.year)
+            facet_index = self.facet_cache.get(params.month, params.year)
+            if facet_index is not None:
+                base_data = {'total_records': facet_index.total_records}
+            else:
+                base_data = await self._query_without_filters(params.month, params.year)
+                facet_index = build_facet_index(base_data)
+                if facet_index is not None:
+                    self.facet_cache.set(params.month, params.year, facet_index)
+
             if base_data.get('total_records', 0) == 0:
                 # Data exists in metadata but no actual records
                 return CombinationDiagnosticResult(
@@ -509,12 +534,16 @@ class CombinationDiagnostic:
         total_available = base_data.get('total_records', record_count)
 
         # Step 3: Isolate problematic filter(s)
-        problematic_filters = await self._isolate_problematic_filters(params)
+        if facet_index is not None:
+            problematic_filters = facet_index.problematic_filters(self._build_filters(params))
+        else:
+            problematic_filters = await self._isolate_problematic_filters(params)
 
         # Step 4: Fetch working combinations
         working_combinations = await self._get_working_combinations(
             params,
-            problematic_filters
+            problematic_filters,
+            facet_index
         )
 
         # Step 5: Generate diagnosis message
@@ -564,22 +593,11 @@ class CombinationDiagnostic:
     async def _query_without_filters(self, month: int, year: int) -> dict:
         """Query with just month/year to get baseline record count."""
         month_name = calendar.month_name[month]
-        return self.client.get_forecast_data(month_name, year)
+        return await self.client.get_forecast_data(month_name, year)
 
-    async def _isolate_problematic_filters(
-        self,
-        params: ForecastQueryParams
-    ) -> List[str]:
-        """
-        Remove filters one-by-one to identify which break the combination.
-
-        Returns:
-            List of filter names that cause 0 records
-        """
-        month_name = calendar.month_name[params.month]
-        problematic = []
-
-        # Build filter dict
+    @staticmethod
+    def _build_filters(params: ForecastQueryParams) -> Dict[str, List[str]]:
+        """Map query parameters to API filter names."""
         filters = {}
         if params.platforms:
             filters['platform'] = params.platforms
@@ -593,6 +611,23 @@ class CombinationDiagnostic:
             filters['state'] = params.states
         if params.case_types:
             filters['case_type'] = params.case_types
+        return filters
+
+    async def _isolate_problematic_filters(
+        self,
+        params: ForecastQueryParams
+    ) -> List[str]:
+        """
+        Remove filters one-by-one to identify which break the combination.
+
+        Used when the month could not be indexed; each removal is one query.
+
+        Returns:
+            List of filter names that cause 0 records
+        """
+        month_name = calendar.month_name[params.month]
+        problematic = []
+        filters = self._build_filters(params)
 
         # Test each filter by removing it
         for filter_name in filters.keys():
@@ -600,7 +635,7 @@ class CombinationDiagnostic:
 
             try:
                 # Query with this filter removed
-                test_data = self.client.get_forecast_data(
+                test_data = await self.client.get_forecast_data(
                     month_name,
                     params.year,
                     **test_filters
@@ -625,11 +660,16 @@ class CombinationDiagnostic:
     async def _get_working_combinations(
         self,
         params: ForecastQueryParams,
-        problematic_filters: List[str]
+        problematic_filters: List[str],
+        facet_index: Optional[FacetIndex] = None
     ) -> Dict[str, List[str]]:
         """
         Fetch valid filter values for the working combination.
 
+        With a facet index, each problematic filter lists the values that
+        have records together with the remaining filters (most records
+        first); otherwise, or if there are none, all values of the month.
+
         Returns:
             Dictionary of filter_name → valid_values
         """
@@ -643,9 +683,21 @@ class CombinationDiagnostic:
             return {}
 
         working = {}
+        if facet_index is not None:
+            other_filters = {
+                name: values for name, values in self._build_filters(params).items()
+                if name not in problematic_filters
+            }
+            for filter_name in problematic_filters:
+                combinable = facet_index.values_with(filter_name, other_filters)
+                if combinable:
+                    working[filter_name] = combinable
 
         # For each problematic filter, show what values are available
         for filter_name in problematic_filters:
+            if filter_name in working:
+                continue
+
             # Map API parameter names back to filter option keys
             option_key_map = {
                 'platform': 'platforms',
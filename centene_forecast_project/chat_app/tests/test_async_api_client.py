@@ -0,0 +1,142 @@
+"""
+Async API Client Tests - AsyncChatAPIClient and the tools built on it.
+
+Tests:
+1. Concurrent conversations overlap their backend calls
+2. The event loop keeps running while a tool waits on the backend
+3. Retry semantics match ChatAPIClient (timeouts retried, HTTP errors not)
+4. API-level errors surface as ValueError / ValidationError
+"""
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from chat_app.exceptions import ValidationError
+from chat_app.repository import AsyncChatAPIClient
+from chat_app.services.tools import forecast_tools
+from chat_app.services.tools.validation import ForecastQueryParams
+from centene_forecast_app.tests.conftest import StubBackend
+
+BACKEND_LATENCY = 0.4
+CONVERSATIONS = 6
+
+
+def _forecast_route(path, query):
+    return 200, {
+        'success': True,
+        'month': query.get('month'),
+        'year': int(query.get('year', 0)),
+        'records': [{'main_lob': 'Amisys Medicaid Domestic', 'state': 'CA'}],
+        'total_records': 1,
+    }
+
+
+@pytest.fixture
+def slow_backend():
+    """Stub backend answering /api/llm/forecast after BACKEND_LATENCY seconds."""
+    backend = StubBackend(latency=BACKEND_LATENCY)
+    backend.route('/api/llm/forecast', _forecast_route)
+    backend.route('/api/llm/forecast/filter-options', lambda path, query: (
+        200, {'success': False, 'error': 'No data for period'}
+    ))
+    backend.route('/api/v1/ramps/report/2025/March', lambda path, query: (500, {'detail': 'boom'}))
+    backend.start()
+    yield backend
+    backend.stop()
+
+
+@pytest.fixture
+def async_client(slow_backend, monkeypatch):
+    """AsyncChatAPIClient pointed at the stub, used by the forecast tools."""
+    client = AsyncChatAPIClient(base_url=slow_backend.base_url, timeout=5)
+    monkeypatch.setattr(forecast_tools, 'get_async_chat_api_client', lambda: client)
+    return client
+
+
+class TestConcurrentConversations:
+
+    @pytest.mark.asyncio
+    async def test_conversations_complete_in_max_latency(self, slow_backend, async_client):
+        """N simultaneous forecast queries take ~one backend latency, not N of them."""
+        params = [ForecastQueryParams(month=3, year=2025 + i) for i in range(CONVERSATIONS)]
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*[
+            forecast_tools.fetch_forecast_data(p, enable_validation=False) for p in params
+        ])
+        elapsed = time.perf_counter() - started
+        await async_client.aclose()
+
+        assert [r['year'] for r in results] == [2025 + i for i in range(CONVERSATIONS)]
+        assert len(slow_backend.requests_for('/api/llm/forecast')) == CONVERSATIONS
+        print(
+            f"\n[Concurrency] {CONVERSATIONS} conversations x {BACKEND_LATENCY}s backend: "
+            f"{elapsed:.2f}s (sequential would be {CONVERSATIONS * BACKEND_LATENCY:.1f}s)"
+        )
+        assert elapsed < BACKEND_LATENCY * 2.5
+        assert elapsed < CONVERSATIONS * BACKEND_LATENCY / 2
+
+    @pytest.mark.asyncio
+    async def test_event_loop_not_blocked(self, async_client):
+        """Other coroutines (WebSocket handlers) keep running during a tool call."""
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.05)
+
+        ticker_task = asyncio.create_task(ticker())
+        await forecast_tools.fetch_forecast_data(
+            ForecastQueryParams(month=3, year=2025), enable_validation=False
+        )
+        ticker_task.cancel()
+        await async_client.aclose()
+
+        assert len(ticks) >= 4
+
+
+class TestRetrySemantics:
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_retried(self, slow_backend):
+        client = AsyncChatAPIClient(base_url=slow_backend.base_url, timeout=0.1, max_retries=2)
+
+        with pytest.raises(httpx.TimeoutException):
+            await client.get_forecast_data('March', 2025)
+        await client.aclose()
+
+        assert len(slow_backend.requests_for('/api/llm/forecast')) == 2
+
+    @pytest.mark.asyncio
+    async def test_http_error_is_not_retried(self, slow_backend):
+        client = AsyncChatAPIClient(base_url=slow_backend.base_url, max_retries=3)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_ramps_for_report(2025, 'March')
+        await client.aclose()
+
+        assert len(slow_backend.requests_for('/api/v1/ramps/report/2025/March')) == 1
+
+    @pytest.mark.asyncio
+    async def test_api_error_raises_value_error(self, async_client):
+        with pytest.raises(ValueError, match='No data for period'):
+            await async_client.get_filter_options('March', 2025)
+        await async_client.aclose()
+
+
+class TestForecastToolErrors:
+
+    @pytest.mark.asyncio
+    async def test_unsuccessful_response_becomes_validation_error(self, slow_backend, async_client):
+        slow_backend.route('/api/llm/forecast', lambda path, query: (
+            200, {'success': False, 'error': 'Unknown platform'}
+        ))
+
+        with pytest.raises(ValidationError):
+            await forecast_tools.fetch_forecast_data(
+                ForecastQueryParams(month=3, year=2025), enable_validation=False
+            )
+        await async_client.aclose()
@@ -0,0 +1,149 @@
+"""
+Context Cache Tests - bounded LRU for ConversationContextManager.local_cache.
+
+Tests:
+1. Entry-count and byte bounds evict least recently used contexts
+2. Entries expire TTL seconds after being stored (lazily and via sweep)
+3. Evicted contexts reload from the database; bookkeeping is released
+4. The background sweep frees idle contexts without any access
+5. Decoded blobs are bounded by bytes and reported in the stats
+"""
+import asyncio
+
+import pytest
+
+from chat_app.services.tools.validation import ConversationContext
+from chat_app.utils.context_cache import ContextLRUCache
+from chat_app.utils.context_manager import ConversationContextManager
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestContextLRUCache:
+
+    def test_entry_bound_evicts_least_recently_used(self, clock):
+        evicted = []
+        cache = ContextLRUCache(max_entries=2, ttl_seconds=60, clock=clock,
+                                on_evict=lambda key, value, reason: evicted.append((key, reason)))
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        assert cache.keys() == ['a', 'c']
+        assert evicted == [('b', 'max_entries')]
+        assert cache.stats()['evictions']['max_entries'] == 1
+
+    def test_byte_bound_keeps_newest_entry(self, clock):
+        cache = ContextLRUCache(max_entries=10, max_bytes=1000, ttl_seconds=60, clock=clock)
+        cache.set('a', 1, size=400)
+        cache.set('b', 2, size=400)
+        cache.set('c', 3, size=1500)
+
+        assert cache.keys() == ['c']
+        stats = cache.stats()
+        assert stats['bytes'] == 1500
+        assert stats['evictions']['max_bytes'] == 2
+
+    def test_ttl_expires_lazily_and_by_sweep(self, clock):
+        cache = ContextLRUCache(ttl_seconds=30, clock=clock)
+        cache.set('a', 1, size=10)
+        cache.set('b', 2, size=10)
+
+        clock.now = 20
+        assert cache.get('a') == 1  # reads do not extend the TTL
+        clock.now = 31
+        assert cache.get('a') is None
+        assert len(cache) == 1  # 'b' expired but not yet swept
+        assert cache.expire() == 1
+
+        stats = cache.stats()
+        assert stats['entries'] == 0 and stats['bytes'] == 0
+        assert stats['evictions']['expired'] == 2
+        assert (stats['hits'], stats['misses']) == (1, 1)
+
+    def test_pop_is_not_an_eviction(self, clock):
+        cache = ContextLRUCache(clock=clock)
+        cache.set('a', 1, size=10)
+
+        assert cache.pop('a') == 1
+        assert cache.stats()['bytes'] == 0
+        assert sum(cache.stats()['evictions'].values()) == 0
+
+
+class TestManagerLocalCache:
+
+    @pytest.mark.django_db(transaction=True)
+    @pytest.mark.asyncio
+    async def test_evicted_context_reloads_from_database(self, clock):
+        from asgiref.sync import sync_to_async
+        from chat_app.models import ChatConversation
+        from core.models import User
+
+        user = await sync_to_async(User.objects.create)(username='context-cache-test')
+        conv_a, conv_b = [
+            str((await sync_to_async(ChatConversation.objects.create)(user=user)).id) for _ in range(2)
+        ]
+        manager = ConversationContextManager(
+            local_cache=ContextLRUCache(max_entries=1, ttl_seconds=60, clock=clock)
+        )
+        await manager.save_context(ConversationContext(conversation_id=conv_a, active_states=['CA']))
+        await manager.save_context(ConversationContext(conversation_id=conv_b))
+
+        assert conv_a not in manager.local_cache
+        assert conv_a not in manager._persisted
+        loaded = await manager.get_context(conv_a)
+        assert loaded.active_states == ['CA']
+        await manager.stop_sweeper()
+
+    @pytest.mark.asyncio
+    async def test_stats_report_occupancy(self, clock):
+        manager = ConversationContextManager(local_cache=ContextLRUCache(ttl_seconds=60, clock=clock))
+        manager._db_enabled = False
+        await manager.save_context(ConversationContext(conversation_id='conv-a'))
+
+        stats = manager.get_cache_stats()
+        assert stats['entries'] == 1
+        assert stats['bytes'] > 0
+        assert stats['sweeper_running'] is True
+        await manager.stop_sweeper()
+        assert manager.get_cache_stats()['sweeper_running'] is False
+
+    def test_blob_cache_bounded_by_bytes(self, settings):
+        settings.CHAT_CONFIG = {**settings.CHAT_CONFIG, 'context_blob_cache_max_bytes': 10_000}
+        manager = ConversationContextManager()
+
+        for digest in ('a', 'b', 'c'):
+            manager._cache_blob(digest, {'records': []}, 4_000)
+        manager._cache_blob('huge', {'records': []}, 20_000)
+
+        stats = manager.get_cache_stats()
+        assert list(manager._blobs) == ['b', 'c']
+        assert (stats['blob_cache_entries'], stats['blob_cache_bytes']) == (2, 8_000)
+        assert stats['blob_cache_max_bytes'] == 10_000
+
+    @pytest.mark.asyncio
+    async def test_background_sweep_frees_idle_contexts(self, clock):
+        manager = ConversationContextManager(local_cache=ContextLRUCache(ttl_seconds=30, clock=clock))
+        manager._db_enabled = False
+        manager._sweep_interval = 0.01
+        await manager.save_context(ConversationContext(conversation_id='conv-idle'))
+
+        clock.now = 31
+        await asyncio.sleep(0.05)
+
+        assert manager.get_cache_size() == 0
+        assert manager.get_cache_stats()['evictions']['expired'] == 1
+        await manager.stop_sweeper()
@@ -0,0 +1,244 @@
+"""
+Context Persistence Tests - hot state + content-addressed blob storage.
+
+Tests:
+1. Bulky fields are offloaded to blobs and stored once
+2. Only changed hot fields are written; unchanged saves touch no store
+3. Another worker reloads the full context from the database
+4. Rows written before offloading still load
+5. A missing conversation, a failed save or a pruned blob does not lose blobs or rewrite every turn
+6. Benchmark: save/load latency vs record count (slow)
+"""
+import time
+from unittest.mock import patch
+
+import pytest
+from asgiref.sync import sync_to_async
+
+from chat_app.services.tools.validation import ConversationContext
+from chat_app.utils import context_manager as cm_module
+from chat_app.utils.context_manager import ConversationContextManager
+
+
+def make_forecast_response(record_count: int) -> dict:
+    """Shape of an /api/llm/forecast response with `record_count` rows."""
+    months = {f"Month{i}": label for i, label in enumerate(
+        ['Apr-25', 'May-25', 'Jun-25', 'Jul-25', 'Aug-25', 'Sep-25'], start=1
+    )}
+    records = []
+    for i in range(record_count):
+        record = {
+            'main_lob': f"Amisys Medicaid {'Domestic' if i % 2 else 'Global'}",
+            'state': ['CA', 'TX', 'FL', 'NY', 'GA'][i % 5],
+            'case_type': 'Claims Processing',
+            'target_cph': 12.5,
+            'months': {},
+        }
+        for label in months.values():
+            record['months'][label] = {
+                'forecast': 1000 + i, 'fte_required': 10, 'fte_available': 9,
+                'capacity': 900 + i, 'gap': -100,
+            }
+        records.append(record)
+    return {'success': True, 'records': records, 'months': months, 'total_records': record_count}
+
+
+@pytest.fixture
+def conversation():
+    from chat_app.models import ChatConversation
+    from core.models import User
+
+    user = User.objects.create(username='context-test')
+    return ChatConversation.objects.create(user=user)
+
+
+def count_saves(manager):
+    """Patch the manager's database save, counting calls."""
+    return patch.object(manager, '_save_to_database', wraps=manager._save_to_database)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestDatabasePersistence:
+
+    @pytest.mark.asyncio
+    async def test_round_trip_through_database(self, conversation):
+        from chat_app.models import ConversationContextBlob, ConversationContextModel
+
+        conversation_id = str(conversation.id)
+        writer = ConversationContextManager()
+        context = ConversationContext(conversation_id=conversation_id, forecast_report_month=3,
+                                      forecast_report_year=2025)
+        context.last_forecast_data = make_forecast_response(400)
+        context.pending_campaign_data = [{'forecast_id': i, 'ramp_name': 'Wave 1'} for i in range(200)]
+        await writer.save_context(context)
+        context.active_states = ['FL']
+        await writer.save_context(context)
+
+        row = await sync_to_async(ConversationContextModel.objects.get)(conversation=conversation)
+        assert set(row.blob_refs) == {'last_forecast_data', 'pending_campaign_data'}
+        assert 'last_forecast_data' not in row.context_data
+        assert await sync_to_async(ConversationContextBlob.objects.count)() == 2
+
+        loaded = await ConversationContextManager().get_context(conversation_id)
+        assert loaded.active_states == ['FL']
+        assert loaded.last_forecast_data == context.last_forecast_data
+        assert loaded.pending_campaign_data == context.pending_campaign_data
+
+    @pytest.mark.asyncio
+    async def test_small_payloads_stay_inline(self, conversation):
+        from chat_app.models import ConversationContextBlob
+
+        context = ConversationContext(conversation_id=str(conversation.id))
+        context.report_configuration = {'Apr-25': {'Domestic': {'working_days': 21}}}
+
+        await ConversationContextManager().save_context(context)
+
+        assert await sync_to_async(ConversationContextBlob.objects.count)() == 0
+        loaded = await ConversationContextManager().get_context(str(conversation.id))
+        assert loaded.report_configuration == context.report_configuration
+
+    @pytest.mark.asyncio
+    async def test_unchanged_save_skips_database(self, conversation):
+        manager = ConversationContextManager()
+        context = ConversationContext(conversation_id=str(conversation.id))
+        context.last_forecast_data = make_forecast_response(200)
+
+        with count_saves(manager) as save:
+            await manager.save_context(context)
+            await manager.save_context(context)  # nothing changed
+            context.active_platforms = ['Amisys']
+            await manager.save_context(context)
+
+        assert save.call_count == 2
+        assert save.call_args.args[3] == {}  # the blob is not written again
+
+    @pytest.mark.asyncio
+    async def test_missing_conversation_not_rewritten_every_turn(self, conversation):
+        from chat_app.models import ConversationContextBlob
+
+        manager = ConversationContextManager()
+        orphan = ConversationContext(conversation_id='00000000-0000-0000-0000-000000000000')
+        orphan.last_forecast_data = make_forecast_response(100)
+
+        with count_saves(manager) as save:
+            await manager.save_context(orphan)
+            await manager.save_context(orphan)
+
+        assert save.call_count == 1
+        assert manager._blobs == {}
+
+        # The same payload in a stored conversation is still written
+        context = ConversationContext(conversation_id=str(conversation.id))
+        context.last_forecast_data = orphan.last_forecast_data
+        await manager.save_context(context)
+        assert await sync_to_async(ConversationContextBlob.objects.count)() == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_save_writes_blobs_again(self, conversation):
+        from chat_app.models import ConversationContextBlob
+
+        manager = ConversationContextManager()
+        context = ConversationContext(conversation_id=str(conversation.id))
+        context.last_forecast_data = make_forecast_response(100)
+
+        with patch.object(ConversationContextBlob.objects, 'bulk_create', side_effect=RuntimeError('down')):
+            await manager.save_context(context)
+        await manager.save_context(context)
+
+        loaded = await ConversationContextManager().get_context(str(conversation.id))
+        assert loaded.last_forecast_data == context.last_forecast_data
+
+    @pytest.mark.asyncio
+    async def test_pruned_blob_is_written_again(self, conversation):
+        from chat_app.models import ConversationContextBlob
+
+        conversation_id = str(conversation.id)
+        manager = ConversationContextManager()
+        payload = make_forecast_response(100)
+        context = ConversationContext(conversation_id=conversation_id, last_forecast_data=payload)
+        await manager.save_context(context)
+        await manager.clear_context(conversation_id)
+        await manager.cleanup_old_contexts(max_age_hours=0)
+        assert not await sync_to_async(ConversationContextBlob.objects.exists)()
+
+        # Same payload again, while this process still holds the decoded blob
+        context = ConversationContext(conversation_id=conversation_id, last_forecast_data=payload)
+        await manager.save_context(context)
+
+        loaded = await ConversationContextManager().get_context(conversation_id)
+        assert loaded.last_forecast_data == payload
+
+    @pytest.mark.asyncio
+    async def test_clear_context_forgets_persisted_state(self, conversation):
+        from chat_app.models import ConversationContextModel
+
+        conversation_id = str(conversation.id)
+        manager = ConversationContextManager()
+        await manager.save_context(ConversationContext(conversation_id=conversation_id))
+
+        await manager.clear_context(conversation_id)
+
+        assert not await sync_to_async(ConversationContextModel.objects.exists)()
+        assert conversation_id not in manager._persisted
+
+    @pytest.mark.asyncio
+    async def test_legacy_inline_row_loads(self, conversation):
+        from chat_app.models import ConversationContextModel
+
+        context = ConversationContext(conversation_id=str(conversation.id), active_markets=['Medicare'])
+        context.last_forecast_data = make_forecast_response(50)
+        legacy = context.model_dump(mode='json')
+        legacy.pop('conversation_id')
+        await sync_to_async(ConversationContextModel.objects.create)(
+            conversation=conversation, context_data=legacy
+        )
+
+        loaded = await ConversationContextManager().get_context(str(conversation.id))
+
+        assert loaded.active_markets == ['Medicare']
+        assert loaded.last_forecast_data == context.last_forecast_data
+
+
+@pytest.mark.slow
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_benchmark_save_load_latency(conversation, monkeypatch):
+    """Per-turn save and cold load: full JSON document vs hot state + blobs."""
+    monkeypatch.setattr(cm_module, 'BLOB_CACHE_SIZE', 0)  # force cold blob loads
+    rows = []
+
+    for record_count in (100, 1000, 5000):
+        context = ConversationContext(conversation_id=str(conversation.id))
+        context.last_forecast_data = make_forecast_response(record_count)
+
+        # Previous behaviour: whole model serialized and parsed on every turn
+        started = time.perf_counter()
+        document = context.model_dump_json()
+        legacy_save_ms = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        ConversationContext.model_validate_json(document)
+        legacy_load_ms = (time.perf_counter() - started) * 1000
+
+        manager = ConversationContextManager()
+        await manager.save_context(context)
+        context.active_states = ['CA']
+        started = time.perf_counter()
+        await manager.save_context(context)
+        turn_save_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        loaded = await ConversationContextManager().get_context(context.conversation_id)
+        cold_load_ms = (time.perf_counter() - started) * 1000
+        assert len(loaded.last_forecast_data['records']) == record_count
+
+        rows.append((record_count, len(document), legacy_save_ms, legacy_load_ms, turn_save_ms, cold_load_ms))
+
+    print("\n[Benchmark] records | doc KB | full save ms | full load ms | turn save ms | cold load ms")
+    for record_count, size, legacy_save, legacy_load, turn_save, cold_load in rows:
+        print(
+            f"  {record_count:>6} | {size / 1024:>6.0f} | {legacy_save:>12.1f} | {legacy_load:>12.1f} "
+            f"| {turn_save:>12.1f} | {cold_load:>12.1f}"
+        )
+
+    # A filter change on a 5000-row context no longer re-serializes the payload
+    assert rows[-1][4] < rows[-1][2]
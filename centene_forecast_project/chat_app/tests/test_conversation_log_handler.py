@@ -0,0 +1,169 @@
+"""
+Tests for the conversation log handlers.
+
+QueuedConversationHandler must write the same per-conversation files as
+ConversationFileHandler, from a background writer that keeps a bounded set
+of open files, and drop (and count) records when its queue is full.
+"""
+import logging
+import logging.config
+import time
+
+import pytest
+
+from chat_app.utils.conversation_log_handler import (
+    ConversationFileHandler,
+    QueuedConversationHandler,
+)
+
+TURN_EVENTS = [
+    ('user_message', {'message': 'Show forecast for March 2025'}),
+    ('intent_classified', {'category': 'get_forecast_data', 'confidence': 0.95}),
+    ('parameters_extracted', {'month': 3, 'year': 2025}),
+    ('validation_done', {'is_valid': True}),
+    ('api_call', {'endpoint': '/api/llm/forecast'}),
+    ('api_response', {'records': 42, 'duration_ms': 120}),
+    ('response_sent', {'length': 512}),
+]
+
+
+def _record(conversation_id, correlation_id, event, data=None):
+    record = logging.LogRecord('llm_workflow', logging.INFO, __file__, 0, event, None, None)
+    record.conversation_id = conversation_id
+    record.correlation_id = correlation_id
+    record.event = event
+    record.data = data or {}
+    return record
+
+
+def _event_lines(content):
+    return [line for line in content.splitlines() if line[:3].strip().isdigit()]
+
+
+def _log_turn(handler, conversation_id, correlation_id):
+    for event, data in TURN_EVENTS:
+        handler.handle(_record(conversation_id, correlation_id, event, data))
+
+
+@pytest.fixture
+def queued_handler(tmp_path):
+    handler = QueuedConversationHandler(queue_size=1000, max_open_files=2, flush_interval=0.01)
+    handler.renderer._log_dir = str(tmp_path)
+    yield handler
+    handler.close()
+
+
+class TestQueuedConversationHandler:
+
+    def test_writes_same_layout_as_sync_handler(self, queued_handler, tmp_path):
+        _log_turn(queued_handler, 'conv-1', 'corr-a')
+        _log_turn(queued_handler, 'conv-1', 'corr-b')
+        assert queued_handler.flush()
+
+        content = (tmp_path / 'conv-1.log').read_text(encoding='utf-8')
+        assert content.count('CONVERSATION: conv-1') == 1
+        assert 'TURN 1' in content and 'TURN 2' in content
+        assert len(_event_lines(content)) == 2 * len(TURN_EVENTS)
+        assert queued_handler.get_stats()['records_written'] == 2 * len(TURN_EVENTS)
+
+    def test_open_files_are_bounded(self, queued_handler, tmp_path):
+        for conversation in ('a', 'b', 'c', 'a'):
+            _log_turn(queued_handler, f'conv-{conversation}', f'corr-{conversation}')
+            assert queued_handler.flush()
+
+        assert queued_handler.get_stats()['open_files'] == 2
+        # Reopened after eviction: appended to, header not repeated
+        content = (tmp_path / 'conv-a.log').read_text(encoding='utf-8')
+        assert content.count('CONVERSATION: conv-a') == 1
+        assert content.count('TURN 1') == 1
+        assert len(_event_lines(content)) == 2 * len(TURN_EVENTS)
+
+    def test_full_queue_drops_and_counts(self, queued_handler, monkeypatch):
+        monkeypatch.setattr(queued_handler, '_ensure_writer', lambda: None)
+        queued_handler.queue.maxsize = 3
+
+        _log_turn(queued_handler, 'conv-1', 'corr-a')
+
+        stats = queued_handler.get_stats()
+        assert (stats['queued'], stats['dropped']) == (3, len(TURN_EVENTS) - 3)
+
+    def test_records_without_conversation_are_not_queued(self, queued_handler):
+        queued_handler.handle(_record(None, 'corr-a', 'websocket_connect'))
+        queued_handler.handle(_record(None, 'corr-a', 'websocket_connect', {'conversation_id': 'conv-9'}))
+
+        assert queued_handler.flush()
+        assert queued_handler.get_stats()['records_written'] == 1
+
+    def test_dict_config_keeps_bounded_queue(self, tmp_path):
+        logging.config.dictConfig({
+            'version': 1,
+            'disable_existing_loggers': False,
+            'handlers': {
+                'conversation_file': {
+                    'class': 'chat_app.utils.conversation_log_handler.QueuedConversationHandler',
+                    'queue_size': 5,
+                    'max_open_files': 3,
+                    'flush_interval': 0.01,
+                },
+            },
+            'loggers': {
+                'test_conversation_dict_config': {'handlers': ['conversation_file'], 'propagate': False},
+            },
+        })
+        configured = logging.getLogger('test_conversation_dict_config')
+        handler = configured.handlers[0]
+        handler.renderer._log_dir = str(tmp_path)
+        try:
+            assert handler.get_stats()['queue_size'] == 5
+            assert handler.max_open_files == 3
+
+            configured.warning('user_message', extra={'conversation_id': 'conv-1', 'correlation_id': 'corr-a',
+                                                      'event': 'user_message', 'data': {'message': 'hi'}})
+            assert handler.flush()
+            assert (tmp_path / 'conv-1.log').exists()
+        finally:
+            configured.removeHandler(handler)
+            handler.close()
+
+
+def test_llm_response_shows_cached_token_split():
+    usage = {'input_tokens': 1500, 'cached_input_tokens': 1280, 'uncached_input_tokens': 220, 'output_tokens': 20}
+
+    lines = ConversationFileHandler._build_detail('llm_response', {'duration_ms': 900, 'token_usage': usage})
+
+    assert lines == ['Duration: 900ms',
+                     'Tokens: 1520 total  (1500 input + 20 output)  |  Input: 1280 cached + 220 uncached']
+
+
+@pytest.mark.slow
+def test_benchmark_per_turn_logging_overhead(tmp_path):
+    """Time spent in the logging call per turn: open/append/close vs enqueue."""
+    turns = 200
+    sync_handler = ConversationFileHandler()
+    sync_handler._log_dir = str(tmp_path / 'sync')
+    (tmp_path / 'sync').mkdir()
+    queued = QueuedConversationHandler(queue_size=turns * len(TURN_EVENTS))
+    queued.renderer._log_dir = str(tmp_path / 'queued')
+    (tmp_path / 'queued').mkdir()
+
+    def per_turn_us(handler):
+        started = time.perf_counter()
+        for turn in range(turns):
+            _log_turn(handler, f'conv-{turn % 20}', f'corr-{turn}')
+        return (time.perf_counter() - started) * 1e6 / turns
+
+    sync_us = per_turn_us(sync_handler)
+    queued_us = per_turn_us(queued)
+    started = time.perf_counter()
+    assert queued.flush(timeout=30)
+    drain_ms = (time.perf_counter() - started) * 1000
+    stats = queued.get_stats()
+    queued.close()
+
+    print(
+        f"\n[Benchmark] {turns} turns x {len(TURN_EVENTS)} records: "
+        f"sync {sync_us:.0f}us/turn | queued {queued_us:.0f}us/turn "
+        f"(writer drained in {drain_ms:.1f}ms, {stats['batches_written']} batches)"
+    )
+    assert stats['dropped'] == 0
+    assert queued_us < sync_us
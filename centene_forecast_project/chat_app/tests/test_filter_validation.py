@@ -6,6 +6,8 @@ Tests fuzzy matching, auto-correction, and combination diagnosis features.
 
 import pytest
 import asyncio
+import time
+from difflib import get_close_matches
 from chat_app.services.tools.validation_tools import (
     FilterValidator,
     CombinationDiagnostic,
@@ -14,6 +16,26 @@ from chat_app.services.tools.validation_tools import (
     CombinationDiagnosticResult
 )
 from chat_app.services.tools.validation import ForecastQueryParams
+from chat_app.utils.facet_index import FacetIndex
+from chat_app.utils.filter_cache import invalidate_filter_caches
+from chat_app.utils.fuzzy_matcher import OptionMatcher, bounded_edit_distance
+
+
+def _record(main_lob, state, case_type):
+    platform, market, locality = main_lob.split(' ')
+    return {
+        'main_lob': main_lob, 'state': state, 'case_type': case_type,
+        'platform': platform, 'market': market, 'locality': locality,
+    }
+
+
+FACET_RECORDS = [
+    _record('Amisys Medicaid Domestic', 'CA', 'Claims Processing'),
+    _record('Amisys Medicaid Domestic', 'TX', 'Claims Processing'),
+    _record('Amisys Medicare Global', 'TX', 'Enrollment'),
+    _record('Facets Medicaid Domestic', 'FL', 'Claims Processing'),
+    _record('Facets Medicaid Domestic', 'TX', 'Claims Processing'),
+]
 
 
 class TestFuzzyMatching:
@@ -112,6 +134,115 @@ class TestFuzzyMatching:
         print(f"✅ Multiple suggestions for 'Faces': {result.suggestions}")
 
 
+class TestOptionMatcher:
+    """Test the indexed matcher behind fuzzy_match."""
+
+    @pytest.fixture
+    def case_types(self):
+        return _case_types(400)
+
+    def test_transposition_is_one_edit(self):
+        assert bounded_edit_distance('medicaid', 'medicaid', 2) == 0
+        assert bounded_edit_distance('facets', 'facest', 2) == 1
+        assert bounded_edit_distance('amisys', 'xcelys', 2) == 3
+
+    def test_large_list_finds_typo_through_trigrams(self, case_types):
+        matcher = OptionMatcher(case_types)
+
+        assert matcher.exact('appeals review 7') == 'Appeals Review 7'
+        [(option, score), *_] = matcher.closest('Apeals Reveiw 7')
+        assert option == 'Appeals Review 7'
+        assert 0.80 < score < 0.90
+        assert matcher.closest('Xylophone') == []
+
+    @pytest.mark.asyncio
+    async def test_matchers_built_once_per_snapshot(self, monkeypatch):
+        invalidate_filter_caches()
+        validator = FilterValidator()
+        snapshot = {'platforms': ['Amisys', 'Facets'], 'states': ['CA', 'TX']}
+        built = []
+
+        async def mock_get_filter_options(month, year, force_refresh=False):
+            return snapshot
+
+        original_init = OptionMatcher.__init__
+
+        def counting_init(matcher, options):
+            built.append(list(options))
+            original_init(matcher, options)
+
+        validator.get_filter_options = mock_get_filter_options
+        monkeypatch.setattr(OptionMatcher, '__init__', counting_init)
+        params = ForecastQueryParams(month=3, year=2025, platforms=['Facts'], states=['Texas'])
+
+        first = await validator.validate_all(params)
+        await validator.validate_all(params)
+
+        assert len(built) == len(FilterValidator.OPTION_FIELDS)
+        assert first['platforms'][0].corrected_value == 'Facets'
+        assert first['states'][0].corrected_value == 'TX'
+        invalidate_filter_caches()
+
+
+def _case_types(count):
+    """Realistic case type names: '<category> <step> <n>'."""
+    categories = ['Claims', 'Appeals', 'Enrollment', 'Grievances', 'Correspondence', 'Provider Data',
+                  'Eligibility', 'Billing', 'Prior Auth', 'Member Services']
+    steps = ['Processing', 'Review', 'Adjustment', 'Intake', 'Resolution']
+    names = []
+    while len(names) < count:
+        index = len(names)
+        category = categories[index % len(categories)]
+        step = steps[index // len(categories) % len(steps)]
+        names.append(f"{category} {step} {index // 50}")
+    return names
+
+
+@pytest.mark.slow
+def test_benchmark_fuzzy_match_per_query():
+    """Per-query validation: difflib over the raw list vs prebuilt OptionMatcher."""
+    case_types = _case_types(500)
+    states = sorted(FilterValidator.STATE_NAME_TO_CODE.values()) + ['N/A']
+    queries = [
+        (case_types, 'Claims Procesing 3'), (case_types, 'appeals review 7'),
+        (case_types, 'Eligibilty Intake 9'), (case_types, 'Unknown Work'),
+        (states, 'tx'), (states, 'CX'),
+    ]
+    rounds = 50
+    validator = FilterValidator()
+
+    def legacy(user_value, valid_options):
+        # The previous fuzzy_match: lowercase, exact scan, get_close_matches, case lookup
+        for option in valid_options:
+            if user_value.lower() == option.lower():
+                return option
+        matches = get_close_matches(user_value.lower(), [opt.lower() for opt in valid_options], n=3, cutoff=0.6)
+        return next((opt for opt in valid_options if matches and opt.lower() == matches[0]), None)
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for options, value in queries:
+            legacy(value, options)
+    legacy_us = (time.perf_counter() - started) * 1e6 / (rounds * len(queries))
+
+    started = time.perf_counter()
+    matchers = {id(case_types): OptionMatcher(case_types), id(states): OptionMatcher(states)}
+    build_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for options, value in queries:
+            validator.fuzzy_match(value, matchers[id(options)])
+    indexed_us = (time.perf_counter() - started) * 1e6 / (rounds * len(queries))
+
+    print(
+        f"\n[Benchmark] {len(case_types)} case types + {len(states)} states, {len(queries)} values: "
+        f"difflib {legacy_us:.0f}us/value | OptionMatcher {indexed_us:.0f}us/value "
+        f"(built once in {build_ms:.1f}ms)"
+    )
+    assert indexed_us < legacy_us
+
+
 class TestFilterValidation:
     """Test full filter validation flow."""
 
@@ -246,7 +377,7 @@ class TestCombinationDiagnosis:
         # Mock client.get_forecast_data to simulate filter testing
         call_count = [0]
 
-        def mock_get_forecast_data(month, year, **filters):
+        async def mock_get_forecast_data(month, year, **filters):
             call_count[0] += 1
             # If state filter is removed, return records
             if 'state' not in filters:
@@ -304,6 +435,88 @@ class TestCombinationDiagnosis:
         print(f"✅ Generated diagnosis message:\n{message[:200]}...")
 
 
+class TestFacetIndex:
+    """Test bitset counting over forecast records."""
+
+    @pytest.fixture
+    def index(self):
+        return FacetIndex.from_records(FACET_RECORDS)
+
+    def test_count_ands_fields_and_ors_values(self, index):
+        assert index.count({}) == 5
+        assert index.count({'platform': ['amisys'], 'state': ['TX', 'fl']}) == 2
+        assert index.count({'platform': ['Amisys'], 'state': ['FL']}) == 0
+
+    def test_main_lob_overrides_platform_market_locality(self, index):
+        assert index.count({'main_lob': ['Facets Medicaid Domestic'], 'platform': ['Amisys']}) == 2
+
+    def test_problematic_filters_and_combinable_values(self, index):
+        filters = {'platform': ['Amisys'], 'market': ['Medicare'], 'case_type': ['Claims Processing']}
+
+        assert index.problematic_filters(filters) == ['market', 'case_type']
+        assert index.values_with('state', {'platform': ['Amisys']}) == ['TX', 'CA']
+
+
+class TestFacetIndexDiagnosis:
+    """Test zero-result diagnosis served from the facet index."""
+
+    @pytest.fixture
+    def diagnostic(self, monkeypatch):
+        invalidate_filter_caches()
+        diagnostic = CombinationDiagnostic()
+        calls = []
+
+        async def mock_get_filter_options(month, year, force_refresh=False):
+            return {'platforms': ['Amisys', 'Facets'], 'states': ['CA', 'FL', 'TX'], 'record_count': 5}
+
+        async def mock_get_forecast_data(month, year, **filters):
+            calls.append(filters)
+            return {'total_records': len(FACET_RECORDS), 'records': FACET_RECORDS}
+
+        monkeypatch.setattr(diagnostic.validator, 'get_filter_options', mock_get_filter_options)
+        monkeypatch.setattr(diagnostic.client, 'get_forecast_data', mock_get_forecast_data)
+        yield diagnostic, calls
+        invalidate_filter_caches()
+
+    @pytest.mark.asyncio
+    async def test_single_unfiltered_fetch(self, diagnostic):
+        diagnostic, calls = diagnostic
+        params = ForecastQueryParams(month=3, year=2025, platforms=['Facets'], states=['CA'])
+
+        result = await diagnostic.diagnose(params, {'records': [], 'total_records': 0})
+        again = await diagnostic.diagnose(params, {'records': [], 'total_records': 0})
+
+        assert calls == [{}]
+        assert result.problematic_filters == ['platform', 'state']
+        assert result.working_combinations == {'platform': ['Amisys', 'Facets'], 'state': ['TX', 'CA', 'FL']}
+        assert result.total_records_available == 5
+        assert again.problematic_filters == result.problematic_filters
+
+    @pytest.mark.asyncio
+    async def test_working_values_respect_other_filters(self, diagnostic):
+        diagnostic, calls = diagnostic
+        params = ForecastQueryParams(
+            month=3, year=2025, platforms=['Amisys'], states=['CA'], case_types=['Enrollment']
+        )
+
+        result = await diagnostic.diagnose(params, {'records': [], 'total_records': 0})
+
+        assert result.problematic_filters == ['state', 'case_type']
+        # Only Amisys states, not every state of the month
+        assert result.working_combinations['state'] == ['TX', 'CA']
+
+    @pytest.mark.asyncio
+    async def test_upload_invalidation_drops_index(self, diagnostic):
+        diagnostic, calls = diagnostic
+        params = ForecastQueryParams(month=3, year=2025, platforms=['Facets'], states=['CA'])
+
+        await diagnostic.diagnose(params, {'records': [], 'total_records': 0})
+        invalidate_filter_caches(3, 2025)
+        await diagnostic.diagnose(params, {'records': [], 'total_records': 0})
+
+        assert len(calls) == 2
+
+
 class TestEndToEndValidation:
     """Test end-to-end validation scenarios."""
 
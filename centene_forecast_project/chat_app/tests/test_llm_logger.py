@@ -0,0 +1,169 @@
+"""
+LLM Workflow Logger Tests - lazy, size-aware payloads.
+
+Tests:
+1. Request payloads are not built when the level is disabled
+2. Large prompt bodies are logged as hash + size references
+3. Referenced bodies go to the sampled payload sink once per hash
+4. CPU per turn at INFO and DEBUG (benchmark)
+"""
+import io
+import logging
+import time
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from centene_forecast_project.settings import LLMJSONFormatter
+from chat_app.utils.llm_logger import LLMWorkflowLogger
+
+SYSTEM_PROMPT = 'You are a forecasting assistant. ' * 300
+
+
+class CaptureHandler(logging.Handler):
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class UnreadableMessages(list):
+    """Messages that fail the test if the logger looks at them."""
+
+    def __iter__(self):
+        raise AssertionError('messages were read')
+
+    def __len__(self):
+        raise AssertionError('messages were read')
+
+
+def _messages(history=10):
+    messages = [SystemMessage(content=SYSTEM_PROMPT)]
+    for turn in range(history // 2):
+        messages.append(HumanMessage(content=f'Show forecast for month {turn}'))
+        messages.append(AIMessage(content=f'Here is the forecast for month {turn}.'))
+    messages.append(HumanMessage(content='And for Texas?'))
+    return messages
+
+
+@pytest.fixture
+def workflow_logger(request):
+    name = f'test_llm_workflow.{request.node.name}'
+    workflow_logger = LLMWorkflowLogger(name)
+    workflow_logger.config = {
+        **workflow_logger.config,
+        'enabled': True,
+        'log_full_prompts': True,
+        'log_full_responses': True,
+        'max_inline_payload_chars': 2000,
+        'payload_sample_rate': 1.0,
+    }
+    handlers = {}
+    for logger in (workflow_logger.logger, workflow_logger.payload_logger):
+        handlers[logger.name] = CaptureHandler()
+        logger.addHandler(handlers[logger.name])
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+    workflow_logger.captured = handlers[workflow_logger.logger.name].records
+    workflow_logger.sunk = handlers[workflow_logger.payload_logger.name].records
+    yield workflow_logger
+    for logger in (workflow_logger.logger, workflow_logger.payload_logger):
+        logger.handlers.clear()
+
+
+class TestLazyPayloads:
+
+    def test_request_not_built_when_level_disabled(self, workflow_logger):
+        workflow_logger.logger.setLevel(logging.INFO)
+
+        workflow_logger.log_llm_request('corr-1', 'gpt-4o', UnreadableMessages())
+
+        assert workflow_logger.captured == []
+        assert workflow_logger.sunk == []
+
+    def test_large_bodies_are_references(self, workflow_logger):
+        workflow_logger.log_llm_request('corr-1', 'gpt-4o', _messages(), config={'temperature': 0.1})
+
+        data = workflow_logger.captured[0].data
+        system, *rest = data['messages']
+        assert data['message_count'] == 12
+        assert system == {'role': 'SystemMessage', 'content_ref': {'sha256': system['content_ref']['sha256'],
+                                                                    'chars': len(SYSTEM_PROMPT)}}
+        assert rest[-1] == {'role': 'HumanMessage', 'content': 'And for Texas?'}
+
+    def test_preview_keeps_reference_for_large_bodies(self, workflow_logger):
+        workflow_logger.config['log_full_prompts'] = False
+
+        workflow_logger.log_llm_request('corr-1', 'gpt-4o', _messages())
+
+        data = workflow_logger.captured[0].data
+        assert len(data['messages_preview']) == 5 and data['messages_truncated']
+        assert len(data['messages_preview'][0]['content_preview']) == 200
+        assert data['messages_preview'][0]['content_ref']['chars'] == len(SYSTEM_PROMPT)
+
+    def test_sink_gets_each_body_once(self, workflow_logger):
+        workflow_logger.log_llm_request('corr-1', 'gpt-4o', _messages())
+        workflow_logger.log_llm_request('corr-2', 'gpt-4o', _messages())
+
+        assert len(workflow_logger.sunk) == 1
+        payload = workflow_logger.sunk[0].data
+        assert payload['content'] == SYSTEM_PROMPT
+        assert payload['sha256'] == workflow_logger.captured[1].data['messages'][0]['content_ref']['sha256']
+
+    def test_sink_disabled_by_sample_rate(self, workflow_logger):
+        workflow_logger.config['payload_sample_rate'] = 0.0
+
+        workflow_logger.log_llm_request('corr-1', 'gpt-4o', _messages())
+        workflow_logger.log_llm_response('corr-1', 'x' * 5000, duration_ms=12.0)
+
+        assert workflow_logger.sunk == []
+        assert workflow_logger.captured[1].data['response_ref']['chars'] == 5000
+
+
+@pytest.mark.slow
+def test_benchmark_cpu_per_turn_by_level(workflow_logger):
+    """CPU per turn for request + response logging into a JSON handler."""
+    turns = 300
+    stream_handler = logging.StreamHandler(io.StringIO())
+    stream_handler.setFormatter(LLMJSONFormatter())
+    workflow_logger.logger.handlers = [stream_handler]
+    workflow_logger.payload_logger.handlers = [logging.NullHandler()]
+    workflow_logger.config['log_full_prompts'] = False
+
+    def legacy_turn(messages):
+        # The previous call site: dicts built, previews and config redacted eagerly
+        as_dicts = [{'role': type(m).__name__, 'content': m.content} for m in messages]
+        data = {
+            'model': 'gpt-4o', 'request_type': 'agent_run', 'message_count': len(as_dicts),
+            'config': workflow_logger.redactor.redact({'temperature': 0.1}),
+            'messages_preview': [
+                {'role': msg['role'], 'content_preview': workflow_logger._truncate(str(msg['content'])[:200])}
+                for msg in as_dicts[:5]
+            ],
+        }
+        workflow_logger.logger.log(logging.DEBUG, '', extra={'event': 'llm_request', 'data': data})
+
+    def lazy_turn(messages):
+        workflow_logger.log_llm_request('corr-1', 'gpt-4o', messages, {'temperature': 0.1}, 'agent_run')
+
+    def cpu_us(level, turn):
+        workflow_logger.logger.setLevel(level)
+        messages = _messages()
+        started = time.process_time()
+        for _ in range(turns):
+            turn(messages)
+            workflow_logger.log_llm_response('corr-1', {'text_length': 120}, duration_ms=900.0)
+        return (time.process_time() - started) * 1e6 / turns
+
+    legacy_info = cpu_us(logging.INFO, legacy_turn)
+    lazy_info = cpu_us(logging.INFO, lazy_turn)
+    lazy_debug = cpu_us(logging.DEBUG, lazy_turn)
+
+    print(
+        f"\n[Benchmark] {turns} turns: INFO eager {legacy_info:.1f}us/turn | "
+        f"INFO lazy {lazy_info:.1f}us/turn | DEBUG lazy {lazy_debug:.1f}us/turn"
+    )
+    assert lazy_info < legacy_info
@@ -0,0 +1,110 @@
+"""
+System Prompt Tests - cacheable prompt prefix for the agent.
+
+Tests:
+1. The system prompt and tool schemas are byte-identical across turns and conversations
+2. Per-turn context is sent after the history, right before the user message
+3. Cached vs uncached input tokens reported by the provider are logged
+"""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from chat_app.services import llm_service
+from chat_app.services.llm_service import AGENT_SYSTEM_PROMPT, LLMService
+from chat_app.services.tools.validation import ConversationContext
+
+
+class FakeLLM:
+    """Records what each turn sends; answers without tool calls."""
+
+    def __init__(self, usage=None):
+        self.usage = usage
+        self.requests = []
+        self.tool_schemas = []
+
+    def bind_tools(self, tools):
+        self.tool_schemas.append([convert_to_openai_tool(tool) for tool in tools])
+        return self
+
+    async def ainvoke(self, messages):
+        self.requests.append(list(messages))
+        return AIMessage(content='Which month and year?', usage_metadata=self.usage)
+
+
+def _service(llm, contexts):
+    service = LLMService.__new__(LLMService)
+    service.llm = llm
+    service.model_name = 'gpt-4o-mini'
+    service.temperature = 0.1
+    service.context_manager = AsyncMock()
+    service.context_manager.get_context.side_effect = lambda conversation_id: contexts[conversation_id]
+    return service
+
+
+@pytest.fixture
+def contexts():
+    return {
+        'conv-1': ConversationContext(conversation_id='conv-1', forecast_report_month=3, forecast_report_year=2025),
+        'conv-2': ConversationContext(conversation_id='conv-2', active_platforms=['Amisys']),
+    }
+
+
+class TestCachedPrefix:
+
+    @pytest.mark.asyncio
+    async def test_prefix_identical_across_turns_and_conversations(self, contexts):
+        llm = FakeLLM()
+        service = _service(llm, contexts)
+        row = {'main_lob': 'Amisys Medicaid Domestic', 'state': 'TX', 'case_type': 'Claims',
+               'target_cph': 12.5, 'months': {'Apr-25': {'forecast': 1000}}}
+
+        await service.run_agent('show forecast', 'conv-1')
+        await service.run_agent('only Texas', 'conv-1',
+                                message_history=[{'role': 'user', 'content': 'show forecast'},
+                                                 {'role': 'assistant', 'content': 'Here it is.'}])
+        await service.run_agent('what about this row', 'conv-2', selected_row=row)
+
+        prefixes = {request[0].content for request in llm.requests}
+        assert prefixes == {AGENT_SYSTEM_PROMPT}
+        assert all(schemas == llm.tool_schemas[0] for schemas in llm.tool_schemas)
+        assert 'CURRENT SESSION CONTEXT:' not in AGENT_SYSTEM_PROMPT
+
+    @pytest.mark.asyncio
+    async def test_context_follows_history(self, contexts):
+        llm = FakeLLM()
+        service = _service(llm, contexts)
+        row = {'main_lob': 'Amisys Medicaid Domestic', 'months': {'Apr-25': {'forecast': 1000}}}
+
+        await service.run_agent('what about this row', 'conv-2', selected_row=row,
+                                message_history=[{'role': 'user', 'content': 'hi'}])
+
+        system, history, context_message, user = llm.requests[0]
+        assert isinstance(history, HumanMessage) and history.content == 'hi'
+        assert isinstance(context_message, SystemMessage)
+        assert context_message.content.startswith('CURRENT SESSION CONTEXT:')
+        assert 'Monthly data: {"Apr-25":{"forecast":1000}}' in context_message.content
+        assert user.content == 'what about this row'
+
+
+class TestTokenUsage:
+
+    @pytest.mark.asyncio
+    async def test_cached_input_tokens_are_logged(self, contexts):
+        usage = {'input_tokens': 1500, 'output_tokens': 20, 'total_tokens': 1520,
+                 'input_token_details': {'cache_read': 1280}}
+        service = _service(FakeLLM(usage), contexts)
+
+        with patch.object(llm_service, 'llm_logger') as workflow_logger:
+            await service.run_agent('show forecast', 'conv-1')
+
+        token_usage = workflow_logger.log_llm_response.call_args.kwargs['token_usage']
+        assert token_usage == {'input_tokens': 1500, 'cached_input_tokens': 1280,
+                               'uncached_input_tokens': 220, 'output_tokens': 20}
+
+    def test_missing_usage_counts_zero(self):
+        assert LLMService._token_usage(AIMessage(content='ok')) == {
+            'input_tokens': 0, 'cached_input_tokens': 0, 'uncached_input_tokens': 0, 'output_tokens': 0
+        }
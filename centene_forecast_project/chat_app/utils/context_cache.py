@@ -0,0 +1,211 @@
+"""
+Bounded in-process cache for conversation contexts.
+
+LRU with three limits: entry count, approximate bytes and a TTL since the
+entry was stored. Expired entries are dropped lazily when touched and
+proactively by ConversationContextManager's background sweep. Evictions
+only drop the in-memory copy; the database stays the source of truth and
+is read again on the next miss.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+EVICTION_REASONS = ('expired', 'max_entries', 'max_bytes')
+
+
+class _Entry:
+    __slots__ = ('value', 'size', 'expires_at')
+
+    def __init__(self, value: Any, size: int, expires_at: float):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+
+class ContextLRUCache:
+    """
+    LRU cache bounded by entry count, total size and TTL.
+
+    Supports the dict operations ConversationContextManager used on its
+    old plain-dict cache (``in``, ``[]``, ``del``, ``len``, ``items()``).
+
+    Example:
+        >>> cache = ContextLRUCache(max_entries=2, max_bytes=1024, ttl_seconds=60)
+        >>> cache.set('a', ctx_a, size=400)
+        >>> cache.get('a') is ctx_a
+        True
+        >>> cache.stats()['entries']
+        1
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 500,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl_seconds: float = 1800,
+        on_evict: Optional[Callable[[Hashable, Any, str], None]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_entries: Maximum number of entries
+            max_bytes: Maximum total of entry sizes (as reported to set())
+            ttl_seconds: Lifetime of an entry after it was stored
+            on_evict: Called with (key, value, reason) for every eviction
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.on_evict = on_evict
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions: Dict[str, int] = {reason: 0 for reason in EVICTION_REASONS}
+
+    # ===== CORE OPERATIONS =====
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a live entry (marking it most recently used) or default."""
+        evicted = []
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= self._clock():
+                evicted.append(self._remove(key, 'expired'))
+                entry = None
+            if entry is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._entries.move_to_end(key)
+        self._notify(evicted)
+        return default if entry is None else entry.value
+
+    def set(self, key: Hashable, value: Any, size: int = 0):
+        """
+        Store an entry, then evict least recently used entries over the limits.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            size: Approximate size in bytes, counted against max_bytes
+        """
+        evicted = []
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = _Entry(value, size, self._clock() + self.ttl_seconds)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries:
+                evicted.append(self._remove(next(iter(self._entries)), 'max_entries'))
+            # Never evict the entry just stored for size; one oversized
+            # context is still better kept than reloaded on every access
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                oldest = next(iter(self._entries))
+                if oldest == key:
+                    break
+                evicted.append(self._remove(oldest, 'max_bytes'))
+        self._notify(evicted)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove an entry without counting it as an eviction."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return default
+            self._bytes -= entry.size
+            return entry.value
+
+    def expire(self) -> int:
+        """Drop all expired entries. Returns the number dropped."""
+        evicted = []
+        with self._lock:
+            now = self._clock()
+            for key in [k for k, entry in self._entries.items() if entry.expires_at <= now]:
+                evicted.append(self._remove(key, 'expired'))
+        self._notify(evicted)
+        return len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """Occupancy, hit/miss counts and evictions by reason."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_ratio': round(self._hits / lookups, 4) if lookups else 0.0,
+                'evictions': dict(self._evictions),
+            }
+
+    # ===== DICT COMPATIBILITY =====
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry.expires_at > self._clock()
+
+    def __getitem__(self, key: Hashable) -> Any:
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any):
+        self.set(key, value)
+
+    def __delitem__(self, key: Hashable):
+        sentinel = object()
+        if self.pop(key, sentinel) is sentinel:
+            raise KeyError(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Snapshot of live (key, value) pairs, least recently used first."""
+        with self._lock:
+            now = self._clock()
+            return [(key, entry.value) for key, entry in self._entries.items() if entry.expires_at > now]
+
+    def keys(self) -> List[Hashable]:
+        return [key for key, _ in self.items()]
+
+    # ===== INTERNALS =====
+
+    def _remove(self, key: Hashable, reason: str) -> Tuple[Hashable, Any, str]:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        self._evictions[reason] += 1
+        return key, entry.value, reason
+
+    def _notify(self, evicted: List[Tuple[Hashable, Any, str]]):
+        """Run eviction callbacks outside the lock."""
+        for key, value, reason in evicted:
+            logger.debug(f"[Context Cache] Evicted {key} ({reason})")
+            if self.on_evict:
+                try:
+                    self.on_evict(key, value, reason)
+                except Exception as e:
+                    logger.warning(f"[Context Cache] Eviction callback failed for {key}: {e}")
@@ -2,20 +2,59 @@
 Conversation Context Manager
 
 Manages conversation state across turns for context-aware responses.
-Enhanced with database persistence fallback chain: Redis -> Local Cache -> Database -> New
+Enhanced with database persistence fallback chain: Local Cache -> Database -> New
 
 The context manager is the source of truth for conversation state. Every user input
 updates the store, and the store context is ALWAYS sent to LLM as readable text.
 """
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime, timedelta
 from channels.db import database_sync_to_async
+from django.conf import settings
 
 from chat_app.services.tools.validation import ConversationContext, PreprocessedMessage
+from chat_app.utils.context_cache import ContextLRUCache
 
 logger = logging.getLogger(__name__)
 
+# ConversationContext fields holding backend payloads. Values whose JSON is
+# at least BLOB_MIN_BYTES are stored once as content-addressed blobs and
+# referenced by digest from the (small) hot state document.
+BLOB_FIELDS = (
+    'last_forecast_data',
+    'last_roster_data',
+    'report_configuration',
+    'pending_ramp_preview',
+    'pending_ramp_list_data',
+    'pending_campaign_data',
+    'pending_campaign_preview',
+)
+BLOB_MIN_BYTES = 4096
+
+# Decoded blobs kept per process, so reloading a context after another
+# worker saved it only fetches payloads this process has not seen.
+# Bounded by count and by JSON bytes; overridable via settings.CHAT_CONFIG
+BLOB_CACHE_SIZE = 128
+BLOB_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+BLOB_REFS_FIELD = '_blob_refs'
+
+# Local context cache bounds; overridable via settings.CHAT_CONFIG
+LOCAL_CACHE_MAX_ENTRIES = 500
+LOCAL_CACHE_MAX_BYTES = 256 * 1024 * 1024
+LOCAL_CACHE_TTL = 1800  # 30 minutes since the context was last saved or loaded
+LOCAL_CACHE_SWEEP_INTERVAL = 60
+
+
+def _to_json(value: Any) -> str:
+    """Canonical JSON used for dirty checks and blob digests."""
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+
 
 class ConversationContextManager:
     """
@@ -25,31 +64,63 @@ class ConversationContextManager:
     to enable context-aware responses.
 
     Persistence chain (tries in order):
-    1. Redis (if configured) - for distributed systems
-    2. Local cache - fast in-memory storage
-    3. Database - persistent storage (ConversationContextModel)
-    4. New context - if nothing found
+    1. Local cache - bounded in-memory LRU (entries, bytes, TTL); evicted
+       contexts are reloaded from the database on next access
+    2. Database - persistent storage (ConversationContextModel)
+    3. New context - if nothing found
+
+    Storage layout (database):
+    - Hot state: every field except BLOB_FIELDS, plus '_blob_refs'
+      (field -> digest). Small; written only when a field changed.
+    - Blobs: bulky field values keyed by SHA-256 of their JSON. Written
+      once, then only referenced; loaded only when not already in memory.
+      Whether a blob is stored is checked in the database when a context
+      starts referencing it, never taken from the in-memory copies, since
+      cleanup_old_contexts (in any process) may have pruned it.
+
+    Bulky fields are replaced, never mutated in place, by the chat tools;
+    dirty checks for them compare object identity instead of
+    re-serializing megabytes every turn.
 
     Key principle: The context store is the source of truth.
     """
 
-    def __init__(self, redis_client=None):
+    def __init__(self, local_cache: Optional[ContextLRUCache] = None):
         """
         Initialize context manager.
 
         Args:
-            redis_client: Optional Redis client for distributed storage
+            local_cache: Optional pre-configured local cache (defaults to
+                bounds from settings.CHAT_CONFIG)
         """
-        self.redis = redis_client  # Optional Redis for distributed systems
-        self.local_cache: Dict[str, ConversationContext] = {}  # In-memory storage
+        chat_config = getattr(settings, 'CHAT_CONFIG', {})
+        # In-memory storage, bounded; the database remains the source of truth
+        if local_cache is None:
+            local_cache = ContextLRUCache(
+                max_entries=chat_config.get('context_cache_max_entries', LOCAL_CACHE_MAX_ENTRIES),
+                max_bytes=chat_config.get('context_cache_max_bytes', LOCAL_CACHE_MAX_BYTES),
+                ttl_seconds=chat_config.get('context_cache_ttl_seconds', LOCAL_CACHE_TTL),
+            )
+        self.local_cache = local_cache
+        self.local_cache.on_evict = self._on_evict
+        self._sweep_interval = chat_config.get('context_cache_sweep_interval_seconds', LOCAL_CACHE_SWEEP_INTERVAL)
+        self._sweeper: Optional[asyncio.Task] = None
         self._db_enabled = True  # Database persistence enabled by default
+        # conversation_id -> {field: (value, digest, inline_json, size)} for BLOB_FIELDS
+        self._blob_fields: Dict[str, Dict[str, Tuple[Any, Optional[str], Optional[str], int]]] = {}
+        # conversation_id -> {hot field: JSON last written to the database}
+        self._persisted: Dict[str, Dict[str, str]] = {}
+        # digest -> (decoded value, JSON size): read cache of blobs this process loaded or wrote
+        self._blobs: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._blob_bytes = 0
+        self._blob_max_bytes = chat_config.get('context_blob_cache_max_bytes', BLOB_CACHE_MAX_BYTES)
         logger.info("[Context Manager] Initialized with in-memory storage + DB fallback")
 
     async def get_context(self, conversation_id: str) -> ConversationContext:
         """
         Retrieve conversation context using fallback chain.
 
-        Tries: Redis -> Local Cache -> Database -> New
+        Tries: Local Cache -> Database -> New
 
         Args:
             conversation_id: Unique conversation identifier
@@ -57,33 +128,23 @@ class ConversationContextManager:
         Returns:
             ConversationContext object with current state
         """
-        # Try Redis first if available
-        if self.redis:
-            try:
-                data = await self.redis.get(f"context:{conversation_id}")
-                if data:
-                    logger.debug(f"[Context Manager] Retrieved from Redis: {conversation_id}")
-                    context = ConversationContext.model_validate_json(data)
-                    # Update local cache
-                    self.local_cache[conversation_id] = context
-                    return context
-            except Exception as e:
-                logger.warning(f"[Context Manager] Redis error: {e}, trying local cache")
+        self._ensure_sweeper()
 
         # Try local cache
-        if conversation_id in self.local_cache:
+        context = self.local_cache.get(conversation_id)
+        if context is not None:
             logger.debug(f"[Context Manager] Retrieved from local cache: {conversation_id}")
-            return self.local_cache[conversation_id]
+            return context
 
         # Try database
         if self._db_enabled:
             try:
-                context = await self._load_from_database(conversation_id)
-                if context:
+                loaded = await self._load_from_database(conversation_id)
+                if loaded:
                     logger.debug(f"[Context Manager] Retrieved from database: {conversation_id}")
                     # Update local cache
-                    self.local_cache[conversation_id] = context
-                    return context
+                    self._remember_loaded(*loaded)
+                    return loaded[0]
             except Exception as e:
                 logger.warning(f"[Context Manager] Database error: {e}, creating new context")
 
@@ -93,34 +154,134 @@ class ConversationContextManager:
 
     async def save_context(self, context: ConversationContext):
         """
-        Persist conversation context to all available storage layers.
+        Persist conversation context to the local cache and the database.
+
+        The database row is written only when a hot field changed since the
+        last successful save; bulky fields go to content-addressed blobs that
+        are written once. A save with no changes touches no store.
 
         Args:
             context: ConversationContext object to save
         """
-        # Save to Redis if available
-        if self.redis:
-            try:
-                await self.redis.setex(
-                    f"context:{context.conversation_id}",
-                    3600,  # 1 hour TTL
-                    context.model_dump_json()
-                )
-                logger.debug(f"[Context Manager] Saved to Redis: {context.conversation_id}")
-            except Exception as e:
-                logger.warning(f"[Context Manager] Redis save error: {e}")
+        conversation_id = context.conversation_id
+        self._ensure_sweeper()
+
+        hot_state, blob_refs, new_blobs = self._split_context(context)
+        field_json = {name: _to_json(value) for name, value in hot_state.items()}
+        field_json[BLOB_REFS_FIELD] = _to_json(blob_refs)
 
         # Always save to local cache
-        self.local_cache[context.conversation_id] = context
-        logger.debug(f"[Context Manager] Saved to local cache: {context.conversation_id}")
+        self.local_cache.set(conversation_id, context, size=self._entry_size(conversation_id, field_json))
+        logger.debug(f"[Context Manager] Saved to local cache: {conversation_id}")
 
-        # Save to database asynchronously (don't block)
-        if self._db_enabled:
-            try:
-                await self._save_to_database(context)
-                logger.debug(f"[Context Manager] Saved to database: {context.conversation_id}")
-            except Exception as e:
-                logger.warning(f"[Context Manager] Database save error: {e}")
+        if not self._db_enabled:
+            return
+
+        persisted = self._persisted.get(conversation_id, {})
+        if persisted == field_json and not new_blobs:
+            logger.debug(f"[Context Manager] No changes to persist: {conversation_id}")
+            return
+
+        try:
+            stored = await self._save_to_database(context, hot_state, blob_refs, new_blobs)
+        except Exception as e:
+            logger.warning(f"[Context Manager] Database save error: {e}")
+            # Write everything again next time, including blobs
+            self._forget(conversation_id)
+            return
+
+        # A missing conversation row is not retried on every turn
+        self._persisted[conversation_id] = field_json
+        if stored:
+            logger.debug(f"[Context Manager] Saved to database: {conversation_id}")
+            for digest, (text, value) in new_blobs.items():
+                self._cache_blob(digest, value, len(text))
+
+    # ===== HOT STATE / BLOB SPLIT =====
+
+    def _split_context(self, context: ConversationContext) -> Tuple[Dict, Dict[str, str], Dict[str, Tuple[str, Any]]]:
+        """
+        Split a context into hot state and blob references.
+
+        Returns:
+            (hot_state, blob_refs, new_blobs) where hot_state is the JSON-ready
+            context without offloaded fields, blob_refs maps field -> digest,
+            and new_blobs maps digest -> (json, value) for blobs this context
+            newly references (the database write skips those already stored).
+        """
+        hot_state = context.model_dump(mode='json', exclude=set(BLOB_FIELDS))
+        known = self._blob_fields.setdefault(context.conversation_id, {})
+        blob_refs: Dict[str, str] = {}
+        new_blobs: Dict[str, Tuple[str, Any]] = {}
+
+        for name in BLOB_FIELDS:
+            value = getattr(context, name)
+            entry = known.get(name)
+            if entry is None or entry[0] is not value:
+                text = _to_json(value)
+                if value is None or len(text) < BLOB_MIN_BYTES:
+                    entry = (value, None, text, len(text))
+                else:
+                    entry = (value, hashlib.sha256(text.encode()).hexdigest(), None, len(text))
+                    # Not skipped when held in self._blobs: the stored copy
+                    # may have been pruned since it was cached
+                    new_blobs[entry[1]] = (text, value)
+                known[name] = entry
+
+            if entry[1]:
+                blob_refs[name] = entry[1]
+            else:
+                hot_state[name] = value
+
+        return hot_state, blob_refs, new_blobs
+
+    def _remember_loaded(
+        self,
+        context: ConversationContext,
+        hot_state: Dict,
+        blob_refs: Dict[str, str],
+        blob_sizes: Dict[str, int]
+    ):
+        """Record a context loaded from a store as already persisted there."""
+        conversation_id = context.conversation_id
+
+        field_json = {name: _to_json(value) for name, value in hot_state.items()}
+        field_json[BLOB_REFS_FIELD] = _to_json(blob_refs)
+        self._persisted[conversation_id] = field_json
+        self._blob_fields[conversation_id] = {
+            name: (getattr(context, name), digest, None, blob_sizes.get(digest, 0))
+            for name, digest in blob_refs.items()
+        }
+        self.local_cache.set(conversation_id, context, size=self._entry_size(conversation_id, field_json))
+
+    def _entry_size(self, conversation_id: str, field_json: Dict[str, str]) -> int:
+        """Approximate in-memory size of a context: hot state JSON plus blob JSON."""
+        size = sum(len(text) for text in field_json.values())
+        for entry in self._blob_fields.get(conversation_id, {}).values():
+            if entry[1]:
+                size += entry[3]
+        return size
+
+    def _cache_blob(self, digest: str, value: Any, size: int):
+        """Keep a decoded blob, evicting least recently used ones over the count and byte bounds."""
+        previous = self._blobs.pop(digest, None)
+        if previous is not None:
+            self._blob_bytes -= previous[1]
+        if size > self._blob_max_bytes:
+            return
+        self._blobs[digest] = (value, size)
+        self._blob_bytes += size
+        while len(self._blobs) > BLOB_CACHE_SIZE or self._blob_bytes > self._blob_max_bytes:
+            _, (_, evicted_size) = self._blobs.popitem(last=False)
+            self._blob_bytes -= evicted_size
+
+    def _forget(self, conversation_id: str):
+        self._persisted.pop(conversation_id, None)
+        self._blob_fields.pop(conversation_id, None)
+
+    def _on_evict(self, conversation_id: str, context: ConversationContext, reason: str):
+        """Local cache eviction: drop bookkeeping so the next save writes in full."""
+        self._forget(conversation_id)
 
     async def update_entities(
         self,
@@ -349,17 +510,9 @@ class ConversationContextManager:
         Args:
             conversation_id: Conversation identifier to clear
         """
-        # Remove from Redis if available
-        if self.redis:
-            try:
-                await self.redis.delete(f"context:{conversation_id}")
-                logger.debug(f"[Context Manager] Cleared from Redis: {conversation_id}")
-            except Exception as e:
-                logger.warning(f"[Context Manager] Redis delete error: {e}")
-
         # Remove from local cache
-        if conversation_id in self.local_cache:
-            del self.local_cache[conversation_id]
+        self.local_cache.pop(conversation_id)
+        self._forget(conversation_id)
 
         # Remove from database
         if self._db_enabled:
@@ -379,6 +532,56 @@ class ConversationContextManager:
         """
         return len(self.local_cache)
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get local cache occupancy and eviction counts.
+
+        Returns:
+            Dictionary with entries/bytes vs limits, hits, misses,
+            evictions by reason and the decoded blobs held (count, bytes)
+        """
+        stats = self.local_cache.stats()
+        stats['blob_cache_entries'] = len(self._blobs)
+        stats['blob_cache_bytes'] = self._blob_bytes
+        stats['blob_cache_max_bytes'] = self._blob_max_bytes
+        stats['sweeper_running'] = self._sweeper is not None and not self._sweeper.done()
+        return stats
+
+    # ===== BACKGROUND EXPIRY =====
+
+    def _ensure_sweeper(self):
+        """Start the expiry sweep on the running event loop if it is not running."""
+        if self._sweep_interval <= 0:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._sweeper and not self._sweeper.done() and self._sweeper.get_loop() is loop:
+            return
+        self._sweeper = loop.create_task(self._sweep_expired())
+
+    async def _sweep_expired(self):
+        """Periodically drop expired local cache entries so idle contexts free memory."""
+        while True:
+            await asyncio.sleep(self._sweep_interval)
+            try:
+                expired = self.local_cache.expire()
+                if expired:
+                    logger.info(f"[Context Manager] Expired {expired} contexts from local cache")
+            except Exception as e:
+                logger.warning(f"[Context Manager] Local cache sweep error: {e}")
+
+    async def stop_sweeper(self):
+        """Cancel the background expiry sweep (e.g. on shutdown or in tests)."""
+        if self._sweeper and not self._sweeper.done():
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+        self._sweeper = None
+
     async def cleanup_old_contexts(self, max_age_hours: int = 24):
         """
         Clean up old conversation contexts from local cache.
@@ -389,11 +592,12 @@ class ConversationContextManager:
         now = datetime.now()
         removed = 0
 
-        for conv_id, context in list(self.local_cache.items()):
+        for conv_id, context in self.local_cache.items():
             age_hours = (now - context.last_updated).total_seconds() / 3600
 
             if age_hours > max_age_hours:
-                del self.local_cache[conv_id]
+                self.local_cache.pop(conv_id)
+                self._forget(conv_id)
                 removed += 1
 
         if removed > 0:
@@ -402,12 +606,23 @@ class ConversationContextManager:
                 f"older than {max_age_hours} hours"
             )
 
+        if self._db_enabled:
+            try:
+                pruned = await self._prune_blobs(now - timedelta(hours=max_age_hours))
+                if pruned:
+                    logger.info(f"[Context Manager] Pruned {pruned} unreferenced context blobs")
+            except Exception as e:
+                logger.warning(f"[Context Manager] Blob prune error: {e}")
+
     # ===== DATABASE OPERATIONS =====
 
     @database_sync_to_async
-    def _load_from_database(self, conversation_id: str) -> Optional[ConversationContext]:
-        """Load context from database."""
-        from chat_app.models import ConversationContextModel, ChatConversation
+    def _load_from_database(
+        self,
+        conversation_id: str
+    ) -> Optional[Tuple[ConversationContext, Dict, Dict[str, str], Dict[str, int]]]:
+        """Load context from database, resolving blobs not already in memory."""
+        from chat_app.models import ConversationContextModel, ConversationContextBlob, ChatConversation
 
         try:
             # Get the conversation
@@ -419,7 +634,28 @@ class ConversationContextManager:
             ).first()
 
             if context_model:
-                return context_model.to_conversation_context()
+                blob_refs = context_model.blob_refs
+                values = {digest: self._blobs[digest] for digest in set(blob_refs.values()) if digest in self._blobs}
+                missing = set(blob_refs.values()) - set(values)
+                if missing:
+                    for digest, data, size in ConversationContextBlob.objects.filter(
+                        digest__in=missing
+                    ).values_list('digest', 'data', 'size_bytes'):
+                        values[digest] = (data, size)
+                        self._cache_blob(digest, data, size)
+
+                blob_values = {}
+                for name, digest in list(blob_refs.items()):
+                    if digest in values:
+                        blob_values[name] = values[digest][0]
+                    else:
+                        logger.warning(f"[Context Manager] Missing blob for {name}: {conversation_id}")
+                        del blob_refs[name]
+
+                context = context_model.to_conversation_context(blob_values)
+                hot_state = context.model_dump(mode='json', exclude=set(blob_refs))
+                blob_sizes = {digest: size for digest, (_, size) in values.items()}
+                return context, hot_state, blob_refs, blob_sizes
 
         except ChatConversation.DoesNotExist:
             logger.debug(f"[Context Manager] Conversation not found in DB: {conversation_id}")
@@ -429,24 +665,68 @@ class ConversationContextManager:
         return None
 
     @database_sync_to_async
-    def _save_to_database(self, context: ConversationContext):
-        """Save context to database."""
-        from chat_app.models import ConversationContextModel, ChatConversation
+    def _save_to_database(
+        self,
+        context: ConversationContext,
+        hot_state: Dict,
+        blob_refs: Dict[str, str],
+        new_blobs: Dict[str, Tuple[str, Any]]
+    ) -> bool:
+        """
+        Save hot state and any new blobs to database.
+
+        Newly referenced blobs are looked up by digest and only the ones
+        missing from the table (never stored, or pruned) are written.
+
+        Returns:
+            True if stored, False if the conversation does not exist.
+            Other database errors propagate to save_context.
+        """
+        from chat_app.models import ConversationContextModel, ConversationContextBlob, ChatConversation
+        from django.utils import timezone
 
         try:
             # Get the conversation
             conversation = ChatConversation.objects.get(id=context.conversation_id)
 
+            # Blobs first, so a stored reference always resolves
+            if new_blobs:
+                blobs = ConversationContextBlob.objects.filter(digest__in=list(new_blobs))
+                existing = set(blobs.values_list('digest', flat=True))
+                if existing:
+                    # Referenced again: keep them out of a concurrent prune
+                    blobs.update(created_at=timezone.now())
+                ConversationContextBlob.objects.bulk_create(
+                    [
+                        ConversationContextBlob(digest=digest, data=value, size_bytes=len(text))
+                        for digest, (text, value) in new_blobs.items()
+                        if digest not in existing
+                    ],
+                    ignore_conflicts=True
+                )
+
             # Save context model
-            ConversationContextModel.from_conversation_context(context, conversation)
+            ConversationContextModel.from_conversation_context(
+                context, conversation, hot_state=hot_state, blob_refs=blob_refs
+            )
+            return True
 
         except ChatConversation.DoesNotExist:
             logger.warning(
                 f"[Context Manager] Cannot save - conversation not found: "
                 f"{context.conversation_id}"
             )
-        except Exception as e:
-            logger.warning(f"[Context Manager] Database save error: {e}")
+            return False
+
+    @database_sync_to_async
+    def _prune_blobs(self, older_than: datetime) -> int:
+        """Delete database blobs no stored context references."""
+        from chat_app.models import ConversationContextBlob
+        from django.utils import timezone
+
+        if timezone.is_naive(older_than) and timezone.is_aware(timezone.now()):
+            older_than = timezone.make_aware(older_than)
+        return ConversationContextBlob.prune_unreferenced(older_than)
 
     @database_sync_to_async
     def _delete_from_database(self, conversation_id: str):
@@ -481,9 +761,9 @@ class ConversationContextManager:
 _context_manager: Optional[ConversationContextManager] = None
 
 
-def get_context_manager(redis_client=None) -> ConversationContextManager:
+def get_context_manager() -> ConversationContextManager:
     """Get or create context manager singleton."""
     global _context_manager
     if _context_manager is None:
-        _context_manager = ConversationContextManager(redis_client=redis_client)
+        _context_manager = ConversationContextManager()
     return _context_manager
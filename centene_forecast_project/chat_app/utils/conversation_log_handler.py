@@ -24,7 +24,7 @@ Example output
                                      Modified by sanitizer: No  |  Length: 38 chars
   10:30:00.200  [LLM REQUEST    ]  →  Model: gpt-4  |  Messages in context: 3
   10:30:03.441  [LLM RESPONSE   ]  ←  Duration: 3241ms
-                                     Tokens: 472 total  (410 prompt + 62 completion)
+                                     Tokens: 472 total  (410 input + 62 output)  |  Input: 256 cached + 154 uncached
   10:30:03.450  [CLASSIFIED     ]  ◆  Category: get_forecast_data  |  Confidence: 91%
                                      Reasoning: User asked for forecast data for January CA
   10:30:03.490  [COMPLETE       ]  ■  SUCCESS  |  Total time: 3490ms  |  Category: get_forecast_data
@@ -36,12 +36,27 @@ Example output
   10:30:15.010  [API CALL       ]  →  GET /forecast/data  →  200  (180ms)
   10:30:15.011  [QUERY          ]  ←  ✓ success  |  Records: 42  |  Duration: 185ms
   10:30:15.015  [TOOL DONE      ]  ✓  Tool: confirm_category_get_forecast_data  |  Duration: 210ms
+
+Writing
+───────
+QueuedConversationHandler (the handler configured in settings.LOGGING)
+only puts records on a bounded queue; a background ConversationLogWriter
+formats them, keeps an LRU of open conversation files and writes/flushes
+in batches, so the event loop never blocks on the filesystem. Records that
+do not fit in the queue are dropped and counted. ConversationFileHandler
+formats and writes synchronously (one open/append/close per record).
 """
 
 import logging
 import os
+import queue
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Event → (display label, icon) mapping
@@ -116,27 +131,31 @@ class ConversationFileHandler(logging.Handler):
     # ── header writers ────────────────────────────────────────────────────────
 
     @staticmethod
-    def _write_conversation_header(f, conversation_id: str) -> None:
-        ts = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
-        f.write(_HEAVY_SEP + '\n')
-        f.write(f'  CONVERSATION: {conversation_id}\n')
-        f.write(f'  Started: {ts}\n')
-        f.write(_HEAVY_SEP + '\n')
+    def conversation_header(conversation_id: str, created: Optional[float] = None) -> str:
+        ts = _utc(created).strftime('%Y-%m-%d %H:%M:%S UTC')
+        return (
+            f'{_HEAVY_SEP}\n'
+            f'  CONVERSATION: {conversation_id}\n'
+            f'  Started: {ts}\n'
+            f'{_HEAVY_SEP}\n'
+        )
 
     @staticmethod
-    def _write_turn_header(f, correlation_id: str, turn_num: int) -> None:
-        ts = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
-        f.write('\n')
-        f.write(_SEPARATOR + '\n')
-        f.write(f'  TURN {turn_num}  ·  {ts}  ·  {correlation_id}\n')
-        f.write(_SEPARATOR + '\n')
+    def _turn_header(correlation_id: str, turn_num: int, created: Optional[float] = None) -> str:
+        ts = _utc(created).strftime('%Y-%m-%d %H:%M:%S')
+        return (
+            '\n'
+            f'{_SEPARATOR}\n'
+            f'  TURN {turn_num}  ·  {ts}  ·  {correlation_id}\n'
+            f'{_SEPARATOR}\n'
+        )
 
     # ── event formatter ───────────────────────────────────────────────────────
 
     def _format_record(self, record: logging.LogRecord,
                        event: str, data: dict) -> str:
         label, icon = _EVENT_CONFIG.get(event, (event.upper()[:_LABEL_WIDTH], ' '))
-        ts = datetime.now(timezone.utc).strftime('%H:%M:%S.%f')[:_TS_WIDTH]
+        ts = _utc(record.created).strftime('%H:%M:%S.%f')[:_TS_WIDTH]
 
         # Error/warning marker appended to icon
         if record.levelno >= logging.ERROR:
@@ -196,10 +215,15 @@ class ConversationFileHandler(logging.Handler):
             usage = data.get('token_usage') or {}
             lines.append(f'Duration: {duration}ms')
             if usage:
-                pt = usage.get('prompt_tokens', '?')
-                ct = usage.get('completion_tokens', '?')
-                tt = usage.get('total_tokens', '?')
-                lines.append(f'Tokens: {tt} total  ({pt} prompt + {ct} completion)')
+                it = usage.get('input_tokens', '?')
+                ot = usage.get('output_tokens', '?')
+                tt = it + ot if isinstance(it, int) and isinstance(ot, int) else '?'
+                cached = usage.get('cached_input_tokens', '?')
+                uncached = usage.get('uncached_input_tokens', '?')
+                lines.append(
+                    f'Tokens: {tt} total  ({it} input + {ot} output)  |  '
+                    f'Input: {cached} cached + {uncached} uncached'
+                )
 
         elif event == 'intent_classification':
             category   = data.get('category', '?')
@@ -323,41 +347,289 @@ class ConversationFileHandler(logging.Handler):
 
         return lines
 
+    # ── rendering ─────────────────────────────────────────────────────────────
+
+    def render(self, record: logging.LogRecord) -> Optional[Tuple[str, str]]:
+        """
+        Format a record for its conversation file.
+
+        Returns:
+            (conversation_id, text) where text includes a TURN header when the
+            record starts a new turn, or None for records without a conversation
+        """
+        conversation_id = getattr(record, 'conversation_id', None)
+        correlation_id  = getattr(record, 'correlation_id', None)
+        event           = getattr(record, 'event', 'unknown')
+        data            = getattr(record, 'data', {}) or {}
+
+        # Also try to pick up conversation_id from data dict
+        # (e.g. websocket_connect logs it there)
+        if not conversation_id:
+            conversation_id = data.get('conversation_id')
+
+        if not conversation_id:
+            return None  # Nothing to route without a conversation
+
+        text = ''
+        last_corr = self._last_correlation.get(conversation_id)
+        if correlation_id and correlation_id != last_corr:
+            turn_num = self._turn_counter.get(conversation_id, 0) + 1
+            self._turn_counter[conversation_id] = turn_num
+            self._last_correlation[conversation_id] = correlation_id
+            text = self._turn_header(correlation_id, turn_num, record.created)
+
+        return conversation_id, text + self._format_record(record, event, data) + '\n'
+
     # ── emit ──────────────────────────────────────────────────────────────────
 
     def emit(self, record: logging.LogRecord) -> None:
         try:
-            conversation_id = getattr(record, 'conversation_id', None)
-            correlation_id  = getattr(record, 'correlation_id', None)
-            event           = getattr(record, 'event', 'unknown')
-            data            = getattr(record, 'data', {}) or {}
-
-            # Also try to pick up conversation_id from data dict
-            # (e.g. websocket_connect logs it there)
-            if not conversation_id:
-                conversation_id = data.get('conversation_id')
-
-            if not conversation_id:
-                return  # Nothing to route without a conversation
+            rendered = self.render(record)
+            if rendered is None:
+                return
+            conversation_id, text = rendered
 
             file_path  = self._file_path(conversation_id)
             is_new_file = not os.path.exists(file_path)
 
-            last_corr  = self._last_correlation.get(conversation_id)
-            is_new_turn = correlation_id and correlation_id != last_corr
-
             with open(file_path, 'a', encoding='utf-8') as f:
                 if is_new_file:
-                    self._write_conversation_header(f, conversation_id)
+                    f.write(self.conversation_header(conversation_id, record.created))
+                f.write(text)
+
+        except Exception:
+            self.handleError(record)
+
+
+def _utc(created: Optional[float]) -> datetime:
+    """Record creation time (now if unknown) in UTC."""
+    if created is None:
+        return datetime.now(timezone.utc)
+    return datetime.fromtimestamp(created, timezone.utc)
+
 
-                if is_new_turn:
-                    turn_num = self._turn_counter.get(conversation_id, 0) + 1
-                    self._turn_counter[conversation_id] = turn_num
-                    self._last_correlation[conversation_id] = correlation_id
-                    self._write_turn_header(f, correlation_id, turn_num)
+# ─────────────────────────────────────────────────────────────────────────────
+# Queued pipeline
+# ─────────────────────────────────────────────────────────────────────────────
+
+_STOP = object()
+
+
+class ConversationLogWriter(threading.Thread):
+    """
+    Background thread writing queued records to conversation files.
+
+    Collects up to batch_size records (waiting at most flush_interval after
+    the first one), groups them by conversation and writes each group with
+    one write() + flush(). Open files are kept in an LRU of max_open_files.
+    """
+
+    def __init__(self, record_queue: queue.Queue, renderer: ConversationFileHandler,
+                 max_open_files: int = 64, batch_size: int = 256, flush_interval: float = 0.2):
+        super().__init__(name='conversation-log-writer', daemon=True)
+        self.queue = record_queue
+        self.renderer = renderer
+        self.max_open_files = max_open_files
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # {conversation_id: open file}, least recently written first
+        self._files: 'OrderedDict[str, object]' = OrderedDict()
+        self.records_written = 0
+        self.batches_written = 0
+
+    def run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = self._next_batch()
+            stopping = self._write_batch(batch)
+        self._close_files()
+
+    def _next_batch(self) -> list:
+        batch = [self.queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size and not isinstance(batch[-1], threading.Event) \
+                and batch[-1] is not _STOP:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self.queue.get(timeout=remaining) if remaining > 0 else self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_batch(self, batch: list) -> bool:
+        """Write one batch; returns True when the stop marker was seen."""
+        chunks: Dict[str, List[str]] = {}
+        flush_requests = []
+        stopping = False
+        written = 0
+        for item in batch:
+            if item is _STOP:
+                stopping = True
+            elif isinstance(item, threading.Event):
+                flush_requests.append(item)
+            else:
+                try:
+                    rendered = self.renderer.render(item)
+                except Exception:
+                    self.renderer.handleError(item)
+                    continue
+                if rendered is not None:
+                    conversation_id, text = rendered
+                    chunks.setdefault(conversation_id, []).append(text)
+                    written += 1
+
+        for conversation_id, texts in chunks.items():
+            try:
+                f = self._file(conversation_id)
+                f.write(''.join(texts))
+                f.flush()
+            except Exception as e:
+                logger.warning(f"[Conversation Log] Failed to write {conversation_id}: {e}")
+                self._close_file(conversation_id)
+
+        if chunks:
+            self.records_written += written
+            self.batches_written += 1
+        for event in flush_requests:
+            event.set()
+        return stopping
+
+    def _file(self, conversation_id: str):
+        f = self._files.get(conversation_id)
+        if f is not None:
+            self._files.move_to_end(conversation_id)
+            return f
+
+        while len(self._files) >= self.max_open_files:
+            _, oldest = self._files.popitem(last=False)
+            oldest.close()
+
+        f = open(self.renderer._file_path(conversation_id), 'a', encoding='utf-8')
+        if f.tell() == 0:
+            f.write(self.renderer.conversation_header(conversation_id))
+        self._files[conversation_id] = f
+        return f
+
+    def _close_file(self, conversation_id: str) -> None:
+        f = self._files.pop(conversation_id, None)
+        if f is not None:
+            try:
+                f.close()
+            except Exception:
+                pass
+
+    def _close_files(self) -> None:
+        for conversation_id in list(self._files):
+            self._close_file(conversation_id)
+
+    @property
+    def open_files(self) -> int:
+        return len(self._files)
+
+
+class QueuedConversationHandler(logging.Handler):
+    """
+    Non-blocking conversation log handler.
+
+    emit() only puts the record on a bounded queue; ConversationLogWriter
+    does the formatting and file I/O. When the queue is full the record is
+    dropped and counted in `dropped` rather than blocking the caller.
+
+    Deliberately not a logging.handlers.QueueHandler: from Python 3.12
+    dictConfig replaces the queue of QueueHandler subclasses configured by
+    'class' with its own, which would ignore queue_size.
+
+    Configured in settings.LOGGING:
+        'conversation_file': {
+            'class': 'chat_app.utils.conversation_log_handler.QueuedConversationHandler',
+            'queue_size': 10000,
+            'max_open_files': 64,
+        }
+    """
 
-                line = self._format_record(record, event, data)
-                f.write(line + '\n')
+    # Log a warning for the first dropped record and then every N drops
+    DROP_WARNING_INTERVAL = 1000
 
+    def __init__(self, queue_: Optional[queue.Queue] = None, queue_size: int = 10000,
+                 max_open_files: int = 64, batch_size: int = 256, flush_interval: float = 0.2):
+        super().__init__()
+        self.queue = queue_ if queue_ is not None else queue.Queue(maxsize=queue_size)
+        self.renderer = ConversationFileHandler()
+        self.max_open_files = max_open_files
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._writer: Optional[ConversationLogWriter] = None
+        self._writer_lock = threading.Lock()
+
+    def _ensure_writer(self) -> None:
+        if self._writer is not None and self._writer.is_alive():
+            return
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = ConversationLogWriter(
+                    self.queue, self.renderer, self.max_open_files, self.batch_size, self.flush_interval
+                )
+                self._writer.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Only records routed to a conversation are worth queueing
+        if not (getattr(record, 'conversation_id', None)
+                or (getattr(record, 'data', None) or {}).get('conversation_id')):
+            return
+        # Formatting happens on the writer thread (from event/data, not msg)
+        try:
+            self.enqueue(record)
         except Exception:
             self.handleError(record)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self._ensure_writer()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Called under the handler lock, so the counter is not racy
+            self.dropped += 1
+            if self.dropped % self.DROP_WARNING_INTERVAL == 1:
+                logger.warning(
+                    f"[Conversation Log] Queue full, dropped {self.dropped} record(s) so far"
+                )
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until everything queued so far is written.
+
+        Returns:
+            True if the writer caught up within timeout
+        """
+        if self._writer is None or not self._writer.is_alive():
+            return True
+        done = threading.Event()
+        try:
+            self.queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        writer = self._writer
+        if writer is not None and writer.is_alive():
+            try:
+                self.queue.put(_STOP, timeout=5.0)
+                writer.join(5.0)
+            except queue.Full:
+                logger.warning("[Conversation Log] Queue full at shutdown, pending records lost")
+        self._writer = None
+        super().close()
+
+    def get_stats(self) -> dict:
+        """Queue and writer counters for monitoring."""
+        writer = self._writer
+        return {
+            'queued': self.queue.qsize(),
+            'queue_size': self.queue.maxsize,
+            'dropped': self.dropped,
+            'records_written': writer.records_written if writer else 0,
+            'batches_written': writer.batches_written if writer else 0,
+            'open_files': writer.open_files if writer else 0,
+        }
@@ -0,0 +1,182 @@
+"""
+Forecast Facet Index
+Bitset index over the filter fields of one month's forecast records.
+
+Built once from an unfiltered /api/llm/forecast response and cached per
+month/year (see get_facet_index_cache), it answers "how many records match
+this filter subset" with bitset intersections instead of backend queries.
+Matching follows the API: case-insensitive, OR within a field, AND across
+fields, and main_lob overrides platform/market/locality.
+"""
+
+from typing import Dict, Iterable, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Filter (API parameter) name -> record field
+FACET_FIELDS = ('platform', 'market', 'locality', 'main_lob', 'state', 'case_type')
+
+# Ignored by the API when main_lob is given
+MAIN_LOB_OVERRIDES = ('platform', 'market', 'locality')
+
+
+def _normalize(value) -> str:
+    return str(value).strip().lower()
+
+
+class FacetIndex:
+    """
+    Co-occurrence index of forecast filter values.
+
+    Each (field, value) maps to an int used as a bitset of record positions.
+
+    Example:
+        >>> index = FacetIndex.from_records(response['records'])
+        >>> index.count({'platform': ['Amisys'], 'state': ['CA', 'TX']})
+        42
+        >>> index.problematic_filters({'platform': ['Amisys'], 'state': ['ZZ']})
+        ['state']
+    """
+
+    def __init__(self, total_records: int, postings: Dict[str, Dict[str, int]], labels: Dict[str, Dict[str, str]]):
+        """
+        Args:
+            total_records: Number of indexed records
+            postings: field -> normalized value -> bitset of record positions
+            labels: field -> normalized value -> value as returned by the API
+        """
+        self.total_records = total_records
+        self.all_records = (1 << total_records) - 1
+        self.postings = postings
+        self.labels = labels
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict]) -> 'FacetIndex':
+        """
+        Build the index from forecast records.
+
+        Args:
+            records: Records of an unfiltered /api/llm/forecast response
+
+        Returns:
+            FacetIndex over FACET_FIELDS
+        """
+        positions: Dict[str, Dict[str, List[int]]] = {field: {} for field in FACET_FIELDS}
+        labels: Dict[str, Dict[str, str]] = {field: {} for field in FACET_FIELDS}
+        total = 0
+        for position, record in enumerate(records):
+            total = position + 1
+            for field in FACET_FIELDS:
+                value = record.get(field)
+                if value in (None, ''):
+                    continue
+                key = _normalize(value)
+                positions[field].setdefault(key, []).append(position)
+                labels[field].setdefault(key, str(value))
+
+        # Set bits in a bytearray, one int conversion per value
+        postings: Dict[str, Dict[str, int]] = {field: {} for field in FACET_FIELDS}
+        size = (total + 7) // 8
+        for field, values in positions.items():
+            for key, record_positions in values.items():
+                bits = bytearray(size)
+                for position in record_positions:
+                    bits[position >> 3] |= 1 << (position & 7)
+                postings[field][key] = int.from_bytes(bits, 'little')
+
+        logger.info(
+            f"[Facet Index] Built index over {total} records "
+            f"({sum(len(values) for values in postings.values())} facet values)"
+        )
+        return cls(total, postings, labels)
+
+    def matches(self, filters: Dict[str, List[str]]) -> int:
+        """
+        Bitset of the records matching a filter combination.
+
+        Args:
+            filters: API filter name -> accepted values (empty/None = no filter)
+
+        Returns:
+            Bitset of matching record positions
+        """
+        active = {field: values for field, values in filters.items() if values and field in FACET_FIELDS}
+        if 'main_lob' in active:
+            active = {field: values for field, values in active.items() if field not in MAIN_LOB_OVERRIDES}
+
+        result = self.all_records
+        for field, values in active.items():
+            field_postings = self.postings.get(field, {})
+            field_bits = 0
+            for value in values:
+                field_bits |= field_postings.get(_normalize(value), 0)
+            result &= field_bits
+            if not result:
+                break
+        return result
+
+    def count(self, filters: Dict[str, List[str]]) -> int:
+        """Number of records matching a filter combination."""
+        return self.matches(filters).bit_count()
+
+    def problematic_filters(self, filters: Dict[str, List[str]]) -> List[str]:
+        """
+        Filters whose removal makes a zero-result combination return records.
+
+        Args:
+            filters: API filter name -> values of the failing query
+
+        Returns:
+            Filter names, in the order given
+        """
+        return [
+            field for field, values in filters.items()
+            if values and self.count({k: v for k, v in filters.items() if k != field}) > 0
+        ]
+
+    def values_with(self, field: str, filters: Dict[str, List[str]]) -> List[str]:
+        """
+        Values of a field that have records together with other filters.
+
+        Args:
+            field: Field to list values of
+            filters: Other filters (any filter on field itself is ignored)
+
+        Returns:
+            Values as returned by the API, most records first
+        """
+        within = self.matches({k: v for k, v in filters.items() if k != field})
+        counts = [
+            (bits_in.bit_count(), self.labels[field][key])
+            for key, bits in self.postings.get(field, {}).items()
+            if (bits_in := bits & within)
+        ]
+        return [label for _, label in sorted(counts, key=lambda item: (-item[0], item[1]))]
+
+    def get_stats(self) -> dict:
+        """Index size for monitoring."""
+        return {
+            'total_records': self.total_records,
+            'facet_values': {field: len(values) for field, values in self.postings.items()},
+        }
+
+
+def build_facet_index(response: Optional[dict]) -> Optional[FacetIndex]:
+    """
+    Build a FacetIndex from an unfiltered /api/llm/forecast response.
+
+    Returns:
+        FacetIndex, or None if the response does not carry every record
+        (e.g. a truncated or paginated payload) and cannot be indexed
+    """
+    if not isinstance(response, dict):
+        return None
+    records = response.get('records') or []
+    total = response.get('total_records', len(records))
+    if len(records) < total:
+        logger.info(
+            f"[Facet Index] Response holds {len(records)} of {total} records, not indexing"
+        )
+        return None
+    return FacetIndex.from_records(records)
@@ -1,6 +1,11 @@
 """
 Filter Options Cache Manager
 Centralized caching for /api/llm/forecast/filter-options with TTL management.
+
+Further instances hold per-month structures derived from the same data: the
+FacetIndex (chat_app.utils.facet_index) used for zero-result diagnosis and
+the OptionMatchers (chat_app.utils.fuzzy_matcher) used for filter
+validation; invalidate_filter_caches() clears them all.
 """
 
 from typing import Optional, Dict
@@ -28,18 +33,20 @@ class FilterOptionsCache:
         ['Amisys', 'Facets']
     """
 
-    def __init__(self, ttl_seconds: int = 300):
+    def __init__(self, ttl_seconds: int = 300, key_prefix: str = 'filter_options'):
         """
         Initialize cache with configurable TTL.
 
         Args:
             ttl_seconds: Time-to-live in seconds (default: 300 = 5 minutes)
+            key_prefix: Cache key prefix (default: 'filter_options')
         """
         self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
         self.cache: Dict[str, dict] = {}
         self.timestamps: Dict[str, datetime] = {}
 
-        logger.info(f"[Filter Cache] Initialized with TTL={ttl_seconds}s")
+        logger.info(f"[Filter Cache] Initialized {key_prefix} with TTL={ttl_seconds}s")
 
     def _make_key(self, month: int, year: int) -> str:
         """
@@ -50,13 +57,13 @@ class FilterOptionsCache:
             year: Report year
 
         Returns:
-            Cache key string in format "filter_options:{year}:{month}"
+            Cache key string in format "{key_prefix}:{year}:{month}"
 
         Example:
             >>> cache._make_key(3, 2025)
             'filter_options:2025:3'
         """
-        return f"filter_options:{year}:{month}"
+        return f"{self.key_prefix}:{year}:{month}"
 
     def get(self, month: int, year: int) -> Optional[dict]:
         """
@@ -177,8 +184,10 @@ class FilterOptionsCache:
         }
 
 
-# Singleton instance
+# Singleton instances
 _filter_cache = FilterOptionsCache()
+_facet_index_cache = FilterOptionsCache(key_prefix='facet_index')
+_option_matcher_cache = FilterOptionsCache(key_prefix='option_matchers')
 
 
 def get_filter_cache() -> FilterOptionsCache:
@@ -196,3 +205,42 @@ def get_filter_cache() -> FilterOptionsCache:
         >>> options = cache.get(3, 2025)
     """
     return _filter_cache
+
+
+def get_facet_index_cache() -> FilterOptionsCache:
+    """
+    Get singleton cache of per-month FacetIndex objects.
+
+    Returns:
+        Singleton FilterOptionsCache instance keyed "facet_index:{year}:{month}"
+    """
+    return _facet_index_cache
+
+
+def get_option_matcher_cache() -> FilterOptionsCache:
+    """
+    Get singleton cache of per-month filter option matchers.
+
+    Returns:
+        Singleton FilterOptionsCache instance keyed "option_matchers:{year}:{month}"
+    """
+    return _option_matcher_cache
+
+
+def invalidate_filter_caches(month: Optional[int] = None, year: Optional[int] = None):
+    """
+    Drop cached filter options, facet indexes and option matchers for a month/year.
+
+    Args:
+        month: Report month (1-12); without month and year every entry is dropped
+        year: Report year
+
+    Example:
+        >>> # After a forecast upload for March 2025
+        >>> invalidate_filter_caches(3, 2025)
+    """
+    for cache in (_filter_cache, _facet_index_cache, _option_matcher_cache):
+        if month and year:
+            cache.invalidate(month, year)
+        else:
+            cache.clear_all()
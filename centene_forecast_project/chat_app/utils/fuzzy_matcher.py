@@ -0,0 +1,162 @@
+"""
+Indexed Fuzzy Matcher
+Precomputed lookup structures for matching user filter values to options.
+
+An OptionMatcher is built once per filter options snapshot (see
+FilterValidator._get_option_matchers) and answers:
+- exact, case-insensitive hits from a lowercase -> canonical dict
+- fuzzy hits by scoring only the options that share trigrams with the
+  value, using an edit distance bounded by the similarity cutoff
+
+Similarity is 1 - distance / longer length, with the optimal string
+alignment distance (a swap of adjacent letters is one edit).
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _trigrams(value: str) -> set:
+    """Trigrams of a lowercase value, padded so short values still get some."""
+    padded = f"$${value}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def pattern_masks(value: str) -> Dict[str, int]:
+    """Bit mask of each character's positions in value (for osa_distance)."""
+    masks: Dict[str, int] = {}
+    for position, char in enumerate(value):
+        masks[char] = masks.get(char, 0) | (1 << position)
+    return masks
+
+
+def osa_distance(pattern: str, masks: Dict[str, int], text: str) -> int:
+    """
+    Optimal string alignment distance (adjacent transpositions count 1).
+
+    Bit-parallel (Hyyrö 2003): one pass over text with the pattern's
+    character masks, so the cost is linear in len(text) for patterns of
+    any practical length.
+
+    Args:
+        pattern: First string
+        masks: pattern_masks(pattern), precomputed per option
+        text: Second string
+
+    Returns:
+        Edit distance between pattern and text
+    """
+    length = len(pattern)
+    if not length:
+        return len(text)
+    full = (1 << length) - 1
+    last = 1 << (length - 1)
+    vp, vn, d0, previous_match = full, 0, 0, 0
+    distance = length
+    for char in text:
+        match = masks.get(char, 0)
+        transposition = (((~d0) & match) << 1) & previous_match
+        d0 = ((((match & vp) + vp) ^ vp) | match | vn | transposition) & full
+        hp = (vn | ~(d0 | vp)) & full
+        hn = d0 & vp
+        if hp & last:
+            distance += 1
+        elif hn & last:
+            distance -= 1
+        hp = ((hp << 1) | 1) & full
+        hn = (hn << 1) & full
+        vp = (hn | ~(d0 | hp)) & full
+        vn = hp & d0
+        previous_match = match
+    return distance
+
+
+def bounded_edit_distance(a: str, b: str, bound: int) -> int:
+    """
+    OSA distance of a and b, or bound + 1 if it exceeds bound.
+
+    The length difference is checked first, so far-off strings cost nothing.
+    """
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > bound:
+        return bound + 1
+    return min(osa_distance(a, pattern_masks(a), b), bound + 1)
+
+
+class OptionMatcher:
+    """
+    Matches user values against one field's valid options.
+
+    Example:
+        >>> matcher = OptionMatcher(['Amisys', 'Facets', 'Xcelys'])
+        >>> matcher.exact('amisys')
+        'Amisys'
+        >>> matcher.closest('Facts')
+        [('Facets', 0.833...)]
+    """
+
+    # Options scored per fuzzy lookup; small lists are always scored in full
+    MAX_CANDIDATES = 25
+
+    def __init__(self, options: Iterable[str]):
+        """
+        Args:
+            options: Valid option values as returned by the API
+        """
+        self.options: List[str] = [str(option) for option in options]
+        self.canonical: Dict[str, str] = {}
+        for option in self.options:
+            self.canonical.setdefault(option.lower(), option)
+
+        self._keys: List[str] = list(self.canonical)
+        self._masks: List[Dict[str, int]] = [pattern_masks(key) for key in self._keys]
+        self._grams: Dict[str, List[int]] = {}
+        for position, key in enumerate(self._keys):
+            for gram in _trigrams(key):
+                self._grams.setdefault(gram, []).append(position)
+
+    def exact(self, value: str) -> Optional[str]:
+        """Option equal to value ignoring case, in its API spelling."""
+        return self.canonical.get(value.lower())
+
+    def closest(self, value: str, n: int = 3, cutoff: float = 0.6) -> List[Tuple[str, float]]:
+        """
+        Best fuzzy matches of a value.
+
+        Args:
+            value: User-provided value
+            n: Maximum number of matches
+            cutoff: Minimum similarity (0-1)
+
+        Returns:
+            (option, similarity) pairs, best first
+        """
+        value_lower = value.lower()
+        scored = []
+        for position in self._candidates(value_lower):
+            key = self._keys[position]
+            longest = max(len(key), len(value_lower))
+            bound = int((1 - cutoff) * longest + 1e-9)
+            if abs(len(key) - len(value_lower)) > bound:
+                continue
+            distance = osa_distance(key, self._masks[position], value_lower)
+            if distance <= bound:
+                scored.append((1 - distance / longest, position))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [(self.canonical[self._keys[position]], score) for score, position in scored[:n]]
+
+    def _candidates(self, value_lower: str) -> List[int]:
+        """Positions of the options worth scoring, most shared trigrams first."""
+        if len(self._keys) <= self.MAX_CANDIDATES:
+            return list(range(len(self._keys)))
+        shared = Counter()
+        for gram in _trigrams(value_lower):
+            shared.update(self._grams.get(gram, ()))
+        return [position for position, _ in shared.most_common(self.MAX_CANDIDATES)]
+
+    def __len__(self) -> int:
+        return len(self.options)
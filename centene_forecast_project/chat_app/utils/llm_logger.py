@@ -13,13 +13,16 @@ Provides structured JSON logging for the full LLM workflow including:
 All logs use correlation IDs to trace full request lifecycle.
 """
 
+import hashlib
 import json
 import logging
+import random
 import time
 import traceback
 import re
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 from contextvars import ContextVar
 from dataclasses import dataclass, field, asdict
 from functools import wraps
@@ -46,6 +49,8 @@ def get_llm_logging_config() -> dict:
         'max_preview_length': 500,
         'redact_api_keys': True,
         'redact_user_pii': not getattr(settings, 'DEBUG', False),
+        'max_inline_payload_chars': 2000,
+        'payload_sample_rate': 1.0 if getattr(settings, 'DEBUG', False) else 0.0,
     })
 
 
@@ -228,10 +233,20 @@ class LLMWorkflowLogger:
 
     Provides structured logging methods for each stage of LLM processing.
     All methods accept a correlation_id for request tracing.
+
+    Prompt and response bodies longer than max_inline_payload_chars are
+    logged as {'sha256', 'chars'} references. A payload_sample_rate share of
+    them is written once per hash, redacted, to the '<logger>.payloads'
+    debug sink.
     """
 
+    # Payload hashes remembered as already written to the debug sink
+    MAX_SINK_HASHES = 1024
+
     def __init__(self, logger_name: str = 'llm_workflow'):
         self.logger = logging.getLogger(logger_name)
+        self.payload_logger = logging.getLogger(f'{logger_name}.payloads')
+        self._sunk_payloads: 'OrderedDict[str, None]' = OrderedDict()
         self.config = get_llm_logging_config()
         self.redactor = LogDataRedactor(
             redact_api_keys=self.config.get('redact_api_keys', True),
@@ -242,14 +257,22 @@ class LLMWorkflowLogger:
         self,
         level: int,
         event: str,
-        data: Dict[str, Any],
+        data: Union[Dict[str, Any], Callable[[], Dict[str, Any]]],
         correlation_id: Optional[str] = None,
         conversation_id: Optional[str] = None,
         user_id: Optional[str] = None
     ) -> None:
-        """Internal logging method with structured data."""
-        if not self.config.get('enabled', True):
+        """
+        Internal logging method with structured data.
+
+        data may be a callable returning the dict; it is only called when
+        the logger emits at this level, so costly payloads are never built
+        (or redacted and serialized by the formatters) for dropped records.
+        """
+        if not self.config.get('enabled', True) or not self.logger.isEnabledFor(level):
             return
+        if callable(data):
+            data = data()
 
         # Create log record with extra fields
         extra = {
@@ -279,6 +302,58 @@ class LLMWorkflowLogger:
             return text
         return text[:max_len] + f'... [truncated, {len(text)} total chars]'
 
+    def _payload_ref(self, content: str, kind: str, correlation_id: Optional[str] = None) -> Dict[str, Any]:
+        """Hash/size reference to a large payload, sending the body to the debug sink if sampled."""
+        digest = hashlib.sha256(content.encode('utf-8', 'replace')).hexdigest()[:16]
+        ref = {'sha256': digest, 'chars': len(content)}
+        if self._sample_payload(digest):
+            self.payload_logger.debug('', extra={
+                'event': 'llm_payload',
+                'correlation_id': correlation_id or get_correlation_id(),
+                'data': {
+                    'sha256': digest,
+                    'kind': kind,
+                    'chars': len(content),
+                    'content': self.redactor.redact(content),
+                },
+            })
+        return ref
+
+    def _sample_payload(self, digest: str) -> bool:
+        """Whether a payload goes to the debug sink (sampled, once per hash)."""
+        rate = self.config.get('payload_sample_rate', 0.0)
+        if rate <= 0 or not self.payload_logger.isEnabledFor(logging.DEBUG):
+            return False
+        if digest in self._sunk_payloads:
+            # Same body as an earlier record (e.g. an unchanged system prompt)
+            self._sunk_payloads.move_to_end(digest)
+            return False
+        if rate < 1 and random.random() >= rate:
+            return False
+        self._sunk_payloads[digest] = None
+        if len(self._sunk_payloads) > self.MAX_SINK_HASHES:
+            self._sunk_payloads.popitem(last=False)
+        return True
+
+    def _message_entry(self, message: Any, full: bool, correlation_id: Optional[str] = None) -> Dict[str, Any]:
+        """Log entry of one prompt message (dict with role/content or LangChain message)."""
+        if isinstance(message, dict):
+            role, content = message.get('role', 'unknown'), message.get('content', '')
+        else:
+            role, content = type(message).__name__, getattr(message, 'content', '')
+        content = str(content)
+
+        entry = {'role': role}
+        if len(content) > self.config.get('max_inline_payload_chars', 2000):
+            entry['content_ref'] = self._payload_ref(content, role, correlation_id)
+            if full:
+                return entry
+        if full:
+            entry['content'] = content
+        else:
+            entry['content_preview'] = self._truncate(content[:200])
+        return entry
+
     # -------------------------------------------------------------------------
     # USER INPUT LOGGING
     # -------------------------------------------------------------------------
@@ -326,37 +401,41 @@ class LLMWorkflowLogger:
         self,
         correlation_id: str,
         model: str,
-        messages: List[Dict[str, Any]],
+        messages: List[Any],
         config: Optional[Dict[str, Any]] = None,
         request_type: str = 'chat_completion'
     ) -> None:
-        """Log LLM API request."""
-        data = {
-            'model': model,
-            'request_type': request_type,
-            'message_count': len(messages),
-        }
+        """
+        Log LLM API request.
+
+        messages may be dicts with role/content or the LangChain messages
+        themselves; they are only read when the record is emitted.
+        """
+        def build() -> Dict[str, Any]:
+            data = {
+                'model': model,
+                'request_type': request_type,
+                'message_count': len(messages),
+            }
 
-        if config:
-            # Redact any API keys in config
-            data['config'] = self.redactor.redact(config)
+            if config:
+                # Redact any API keys in config
+                data['config'] = self.redactor.redact(config)
 
-        # Include full messages only in DEBUG mode
-        if self.config.get('log_full_prompts', False):
-            data['messages'] = messages
-        else:
-            # Log message roles and truncated content
-            data['messages_preview'] = [
-                {
-                    'role': msg.get('role', 'unknown'),
-                    'content_preview': self._truncate(str(msg.get('content', ''))[:200])
-                }
-                for msg in messages[:5]  # First 5 messages only
-            ]
-            if len(messages) > 5:
-                data['messages_truncated'] = True
-
-        self._log(logging.DEBUG, 'llm_request', data, correlation_id=correlation_id)
+            # Include full messages only in DEBUG mode
+            if self.config.get('log_full_prompts', False):
+                data['messages'] = [self._message_entry(msg, True, correlation_id) for msg in messages]
+            else:
+                # Log message roles and truncated content
+                data['messages_preview'] = [
+                    self._message_entry(msg, False, correlation_id)
+                    for msg in messages[:5]  # First 5 messages only
+                ]
+                if len(messages) > 5:
+                    data['messages_truncated'] = True
+            return data
+
+        self._log(logging.DEBUG, 'llm_request', build, correlation_id=correlation_id)
 
     def log_llm_response(
         self,
@@ -367,33 +446,38 @@ class LLMWorkflowLogger:
         model: Optional[str] = None
     ) -> None:
         """Log LLM API response."""
-        data = {
-            'duration_ms': duration_ms,
-        }
-
-        if model:
-            data['model'] = model
-
-        if token_usage:
-            data['token_usage'] = token_usage
-
-        # Extract response content
-        response_content = None
-        if hasattr(response, 'content'):
-            response_content = response.content
-        elif isinstance(response, dict):
-            response_content = response.get('content') or response.get('message', {}).get('content')
-        elif isinstance(response, str):
-            response_content = response
-
-        if response_content:
-            data['response_length'] = len(str(response_content))
-            if self.config.get('log_full_responses', False):
-                data['response'] = response_content
-            else:
-                data['response_preview'] = self._truncate(str(response_content))
+        def build() -> Dict[str, Any]:
+            data = {
+                'duration_ms': duration_ms,
+            }
 
-        self._log(logging.INFO, 'llm_response', data, correlation_id=correlation_id)
+            if model:
+                data['model'] = model
+
+            if token_usage:
+                data['token_usage'] = token_usage
+
+            # Extract response content
+            response_content = None
+            if hasattr(response, 'content'):
+                response_content = response.content
+            elif isinstance(response, dict):
+                response_content = response.get('content') or response.get('message', {}).get('content')
+            elif isinstance(response, str):
+                response_content = response
+
+            if response_content:
+                text = str(response_content)
+                data['response_length'] = len(text)
+                if not self.config.get('log_full_responses', False):
+                    data['response_preview'] = self._truncate(text)
+                elif len(text) > self.config.get('max_inline_payload_chars', 2000):
+                    data['response_ref'] = self._payload_ref(text, 'response', correlation_id)
+                else:
+                    data['response'] = response_content
+            return data
+
+        self._log(logging.INFO, 'llm_response', build, correlation_id=correlation_id)
 
     # -------------------------------------------------------------------------
     # INTENT CLASSIFICATION LOGGING
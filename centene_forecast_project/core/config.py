@@ -5,6 +5,8 @@ Business logic configuration for the application.
 Separate from Django settings.py for better modularity and testability.
 """
 
+import os
+import tempfile
 from typing import Optional
 
 
@@ -235,6 +237,33 @@ class ForecastCacheConfig:
     These change infrequently and can be cached longer.
     """
 
+    SERVE_CASCADE_FROM_TREE: bool = True
+    """
+    Answer the per-level cascade endpoints from the cached cascade tree.
+    Default: True
+
+    The whole platform -> market -> locality -> worktype tree of a month is
+    fetched once (in parallel) and cached under 'cascade:tree:<year>:<month>'.
+    The per-level endpoints only read a tree that is already cached; on a
+    miss they fetch their own level and start building the tree in the
+    background. If building the tree fails, each level is fetched on its own.
+    """
+
+    CASCADE_TREE_MAX_WORKERS: int = 8
+    """
+    Concurrent backend requests while building a cascade tree.
+    Default: 8
+    """
+
+    CASCADE_TREE_FAILURE_TTL: int = 30
+    """
+    Seconds a failed cascade tree build is remembered (per process).
+    Default: 30 seconds
+
+    Failed trees are not cached, so without this every dropdown request
+    during a backend outage would start another full tree build.
+    """
+
     DATA_TTL: int = 900
     """
     Cache timeout for roster and forecast data records.
@@ -267,14 +296,218 @@ class ForecastCacheConfig:
     Set to False to disable caching for debugging.
     """
 
-    CACHE_BACKEND: str = 'default'
+    # Stampede protection
+    ENABLE_SINGLE_FLIGHT: bool = True
+    """
+    Coalesce concurrent cache misses for the same key into one computation.
+    Default: True
+
+    Within a worker, callers wait on the in-flight call; across workers a
+    short-lived '<key>:__lock__' cache entry elects one computing worker.
+    """
+
+    LOCK_TTL: int = 60
+    """
+    Lifetime of the cross-worker recompute lock in seconds.
+    Default: 60 seconds
+
+    Must exceed the slowest backend fetch; a crashed worker's lock
+    expires after this long.
+    """
+
+    LOCK_WAIT_TIMEOUT: int = 60
+    """
+    Maximum seconds a caller waits for another caller's recompute
+    before computing the value itself.
+    Default: 60 seconds
+    """
+
+    LOCK_POLL_INTERVAL: float = 0.1
+    """
+    Seconds between cache polls while waiting on another worker's lock.
+    Default: 0.1 seconds
+    """
+
+    DATA_STALE_TTL: int = 120
+    """
+    Stale-while-revalidate window for roster and forecast data in seconds.
+    Default: 2 minutes (120 seconds)
+
+    After DATA_TTL expires, readers keep getting the previous value for up
+    to this long while one background refresh runs. Set to 0 to disable.
+    Explicit invalidation (uploads, clear endpoints) removes stale values too.
+    """
+
+    # Conditional revalidation
+    ENABLE_REVALIDATION: bool = True
+    """
+    Revalidate expired backend data with conditional GETs.
+    Default: True
+
+    Entries cached with cache_with_ttl(..., revalidate=True) keep the
+    backend's ETag / Last-Modified. Once their TTL passes they are checked
+    with If-None-Match / If-Modified-Since; a 304 Not Modified extends the
+    TTL without downloading or decoding the data again.
+    """
+
+    REVALIDATION_WINDOW: int = 14400
+    """
+    Seconds an expired, revalidatable value is kept for a conditional GET.
+    Default: 4 hours (14400 seconds)
+
+    Must stay below TAG_SET_TTL so invalidation still finds these entries.
+    """
+
+    # Payload codec
+    ENABLE_PAYLOAD_CODEC: bool = True
+    """
+    Store large cached record lists in compact form (see app_utils/cache_codec.py).
+    Default: True
+
+    Record payloads above PAYLOAD_COMPRESSION_THRESHOLD are compressed (and
+    stored columnar with COLUMNAR_ENCODING). Other values are stored
+    unchanged.
+
+    Payload sizes (cache metrics bytes_written / stored_bytes) are measured
+    by the codec for record payloads only; other entries, and every entry
+    with the codec off, are reported as 0.
+    """
+
+    COLUMNAR_MIN_ROWS: int = 50
+    """
+    Minimum length of a list of same-shaped dicts before the codec handles it.
+    Default: 50 rows
+    """
+
+    COLUMNAR_ENCODING: bool = False
+    """
+    Store record payloads as columns instead of row dicts.
+    Default: False
+
+    10k forecast rows x 30 columns: 516 KB columnar + zlib vs 838 KB row
+    pickle + zlib vs 1.9 MB plain, but a cache hit takes ~32 ms vs ~30 ms vs
+    ~21 ms of CPU (rebuilding the dicts). Enable only where worker memory
+    matters more than hit latency.
+    """
+
+    PAYLOAD_COMPRESSION: str = 'zlib'
+    """
+    Compression for large cached payloads.
+    Default: 'zlib'
+    options: 'zlib', 'lz4' (requires the lz4 package, else zlib), 'none'.
+    """
+
+    PAYLOAD_COMPRESSION_LEVEL: int = 1
+    """
+    zlib compression level (1-9).
+    Default: 1
+
+    Level 1 gets most of the size reduction on record payloads at a
+    fraction of the CPU cost of higher levels.
+    """
+
+    PAYLOAD_COMPRESSION_THRESHOLD: int = 32768
+    """
+    Pickled size in bytes above which a cached payload is compressed.
+    Default: 32 KB (32768 bytes)
+    """
+
+    # Tag-based invalidation
+    TAG_SET_TTL: int = 86400
+    """
+    Lifetime of a tag's key set on redis in seconds.
+    Default: 24 hours (86400 seconds)
+
+    Must be longer than every tagged entry's TTL so a tag never expires
+    while entries it points to are still cached.
+    """
+
+    UPLOAD_INVALIDATION_DOMAINS: dict = {
+        'forecast': ('forecast', 'execution'),
+        'altered_forecast': ('forecast', 'execution'),
+        'roster': ('roster', 'forecast', 'execution'),
+        'prod_team_roster': ('prod_team_roster',),
+    }
+    """
+    Cache tag domains invalidated after a successful upload, by file type.
+
+    Only the uploaded (month, year) of each domain is dropped, together with
+    that domain's cross-period entries (e.g. the list of available years).
+    Roster uploads also drop forecast entries, since allocation derives
+    FTE availability and capacity from the roster.
+    """
+
+    # Backend change events
+    ENABLE_CHANGE_EVENTS: bool = True
+    """
+    Accept backend data change events for cache invalidation.
+    Default: True
+
+    The backend reports {domain, month, year} changes by POSTing to
+    /api/cache/events/ or publishing to CHANGE_EVENT_CHANNEL; the matching
+    entries are dropped at once instead of living out their TTL.
+    """
+
+    CHANGE_EVENT_CHANNEL: str = 'centene:cache:changes'
+    """
+    Redis pub/sub channel carrying change events between workers.
+    Default: 'centene:cache:changes'
+
+    Every worker subscribes when the redis cache backend is in use, so
+    process-local caches (chat filter options) are cleared on all of them.
+    """
+
+    CHANGE_EVENT_DOMAINS: dict = {
+        'forecast': ('forecast', 'execution'),
+        'roster': ('roster', 'forecast', 'execution'),
+        'prod_team_roster': ('prod_team_roster',),
+        'execution': ('execution',),
+        'history': ('history',),
+    }
     """
-    Django cache backend to use.
-    Default: 'default' (uses settings.CACHES['default'])
-    options: 'default', 'filebased'.
+    Cache tag domains invalidated by a change event, by event domain.
+
+    Mirrors UPLOAD_INVALIDATION_DOMAINS: a roster change also drops
+    forecast entries derived from the roster.
+    """
+
+    CHANGE_EVENT_RECONNECT_DELAY: float = 5.0
+    """
+    Seconds the change event subscriber waits before reconnecting to redis.
+    Default: 5 seconds
+    """
+
+    # Metrics
+    METRICS_PUBLISH_INTERVAL: int = 15
+    """
+    Seconds between publishing this worker's cache metrics to redis.
+    Default: 15 seconds
+
+    Each worker writes one small snapshot so /api/cache/stats and
+    /api/cache/metrics can report totals across all workers.
+    Ignored for process-local backends.
+    """
+
+    METRICS_SNAPSHOT_TTL: int = 300
+    """
+    Lifetime of a published worker snapshot in seconds.
+    Default: 5 minutes (300 seconds)
+
+    Snapshots of workers that stopped (restart, scale down) age out.
+    """
+
+    CACHE_BACKEND: str = os.environ.get('CENTENE_CACHE_BACKEND', 'default')
+    """
+    Django cache alias (key of settings.CACHES) used by cache_utils.
+    Default: 'default' (locmem), overridable via CENTENE_CACHE_BACKEND env var.
+    options: 'default', 'filebased', 'redis'.
 
     For development: Uses locmem (local memory cache)
-    For production: Can switch to file-based or Redis
+    For production with several gunicorn/daphne workers: 'redis', so every
+    worker shares one copy of cached data and pattern invalidation
+    (delete_pattern / clear_cascade_caches) reaches all workers.
+    The 'redis' alias exists only when CENTENE_REDIS_URL is set; an alias
+    missing from settings.CACHES stops startup (validate_cache_backend).
     """
 
     @classmethod
@@ -287,14 +520,349 @@ class ForecastCacheConfig:
         """
         return {
             'cascade_ttl': cls.CASCADE_TTL,
+            'serve_cascade_from_tree': cls.SERVE_CASCADE_FROM_TREE,
             'data_ttl': cls.DATA_TTL,
             'schema_ttl': cls.SCHEMA_TTL,
             'summary_ttl': cls.SUMMARY_TTL,
             'enable_caching': cls.ENABLE_CACHING,
             'cache_backend': cls.CACHE_BACKEND,
+            'enable_single_flight': cls.ENABLE_SINGLE_FLIGHT,
+            'lock_ttl': cls.LOCK_TTL,
+            'lock_wait_timeout': cls.LOCK_WAIT_TIMEOUT,
+            'data_stale_ttl': cls.DATA_STALE_TTL,
+            'enable_revalidation': cls.ENABLE_REVALIDATION,
+            'revalidation_window': cls.REVALIDATION_WINDOW,
+            'tag_set_ttl': cls.TAG_SET_TTL,
+            'enable_change_events': cls.ENABLE_CHANGE_EVENTS,
+            'change_event_channel': cls.CHANGE_EVENT_CHANNEL,
+            'enable_payload_codec': cls.ENABLE_PAYLOAD_CODEC,
+            'columnar_encoding': cls.COLUMNAR_ENCODING,
+            'payload_compression': cls.PAYLOAD_COMPRESSION,
+            'payload_compression_threshold': cls.PAYLOAD_COMPRESSION_THRESHOLD,
+            'metrics_publish_interval': cls.METRICS_PUBLISH_INTERVAL,
         }
 
 
+class APIClientConfig:
+    """
+    Backend API Client Configuration
+
+    Controls how APIClient talks to the FastAPI backend: pagination
+    strategy and concurrency for multi-page record fetches.
+    """
+
+    PAGE_SIZE: int = 100
+    """
+    Number of records requested per page from paginated record endpoints.
+    Default: 100 records
+    """
+
+    ENABLE_PARALLEL_PAGINATION: bool = True
+    """
+    Fetch remaining pages concurrently once the first page reports 'total'.
+    Default: True
+
+    Set to False to fall back to strictly sequential page walking.
+    """
+
+    PAGE_FETCH_MAX_WORKERS: int = 8
+    """
+    Maximum number of pages fetched in parallel for a single report.
+    Default: 8 workers
+
+    Keep this at or below the HTTP connection pool size so workers
+    reuse pooled connections instead of opening new ones.
+    """
+
+    DOWNLOAD_CHUNK_SIZE: int = 64 * 1024
+    """
+    Bytes read from the backend per chunk when relaying file downloads.
+    Default: 64 KB
+
+    Downloads are streamed to the browser chunk by chunk, so worker
+    memory per download stays around this size regardless of file size.
+    """
+
+    UPLOAD_CHUNK_SIZE: int = 256 * 1024
+    """
+    Bytes read from an uploaded file per chunk when streaming it to the backend.
+    Default: 256 KB
+
+    Uploads are sent as a streamed multipart body over the pooled session,
+    so the file is never held in worker memory as a whole.
+    """
+
+    POOL_CONNECTIONS: int = 10
+    """
+    Number of per-host connection pools the APIClient session keeps.
+    Default: 10 pools
+
+    The client only talks to the backend host, so this rarely matters.
+    """
+
+    POOL_MAXSIZE: int = 32
+    """
+    Keep-alive connections kept open per backend host.
+    Default: 32 connections
+
+    Size this to the concurrent requests one worker process can make:
+    gunicorn threads per worker, plus PAGE_FETCH_MAX_WORKERS for parallel
+    page fetches and UploadJobConfig.MAX_WORKERS for background uploads.
+    The reuse ratio at /api/transport/metrics/ shows when it is too small.
+    """
+
+    POOL_BLOCK: bool = False
+    """
+    Block when all pooled connections are busy instead of opening extra ones.
+    Default: False
+
+    With False, overflow connections are opened and closed after use.
+    """
+
+    ENABLE_HTTP2: bool = False
+    """
+    Send backend requests over HTTP/2 via httpx.
+    Default: False
+
+    Requires the optional 'h2' package (pip install httpx[http2]) and an
+    https:// API_BASE_URL; falls back to HTTP/1.1 keep-alive otherwise.
+    """
+
+    @classmethod
+    def validate(cls) -> None:
+        """
+        Validate configuration values.
+        Raises ValueError if any configuration is invalid.
+        """
+        if not isinstance(cls.PAGE_SIZE, int) or cls.PAGE_SIZE < 1:
+            raise ValueError(f"PAGE_SIZE must be a positive integer, got {cls.PAGE_SIZE}")
+
+        if not isinstance(cls.PAGE_FETCH_MAX_WORKERS, int) or not (1 <= cls.PAGE_FETCH_MAX_WORKERS <= 32):
+            raise ValueError(
+                f"PAGE_FETCH_MAX_WORKERS must be between 1 and 32, got {cls.PAGE_FETCH_MAX_WORKERS}"
+            )
+
+        if not isinstance(cls.DOWNLOAD_CHUNK_SIZE, int) or cls.DOWNLOAD_CHUNK_SIZE < 1024:
+            raise ValueError(f"DOWNLOAD_CHUNK_SIZE must be at least 1024 bytes, got {cls.DOWNLOAD_CHUNK_SIZE}")
+
+        if not isinstance(cls.UPLOAD_CHUNK_SIZE, int) or cls.UPLOAD_CHUNK_SIZE < 1024:
+            raise ValueError(f"UPLOAD_CHUNK_SIZE must be at least 1024 bytes, got {cls.UPLOAD_CHUNK_SIZE}")
+
+        if not isinstance(cls.POOL_CONNECTIONS, int) or cls.POOL_CONNECTIONS < 1:
+            raise ValueError(f"POOL_CONNECTIONS must be a positive integer, got {cls.POOL_CONNECTIONS}")
+
+        if not isinstance(cls.POOL_MAXSIZE, int) or cls.POOL_MAXSIZE < cls.PAGE_FETCH_MAX_WORKERS:
+            raise ValueError(
+                f"POOL_MAXSIZE must be at least PAGE_FETCH_MAX_WORKERS ({cls.PAGE_FETCH_MAX_WORKERS}), "
+                f"got {cls.POOL_MAXSIZE}"
+            )
+
+    @classmethod
+    def get_config_dict(cls) -> dict:
+        """
+        Get all configuration as a dictionary.
+
+        Returns:
+            Dictionary of all API client configuration values
+        """
+        return {
+            'page_size': cls.PAGE_SIZE,
+            'enable_parallel_pagination': cls.ENABLE_PARALLEL_PAGINATION,
+            'page_fetch_max_workers': cls.PAGE_FETCH_MAX_WORKERS,
+            'download_chunk_size': cls.DOWNLOAD_CHUNK_SIZE,
+            'upload_chunk_size': cls.UPLOAD_CHUNK_SIZE,
+            'pool_connections': cls.POOL_CONNECTIONS,
+            'pool_maxsize': cls.POOL_MAXSIZE,
+            'pool_block': cls.POOL_BLOCK,
+            'enable_http2': cls.ENABLE_HTTP2,
+        }
+
+
+# Validate API client configuration on module import
+try:
+    APIClientConfig.validate()
+except ValueError as e:
+    raise RuntimeError(f"Invalid APIClientConfig: {e}")
+
+
+class UploadJobConfig:
+    """
+    Background Upload Job Configuration
+
+    Controls the local worker pool that sends uploaded files to the backend
+    after upload_view has returned, and how job progress is reported.
+    """
+
+    MAX_WORKERS: int = 2
+    """
+    Number of uploads sent to the backend concurrently per process.
+    Default: 2 workers
+
+    Further uploads wait in the pool's queue with status 'pending'.
+    """
+
+    SPOOL_DIR: str = os.path.join(tempfile.gettempdir(), 'centene_upload_jobs')
+    """
+    Directory uploaded files are copied to until their job has finished.
+    Default: <system temp dir>/centene_upload_jobs
+
+    Django removes its own temporary upload file when the request ends,
+    so each job keeps a private copy that is deleted once the job is done.
+    """
+
+    UPLOAD_PROGRESS_SHARE: int = 90
+    """
+    Share of the progress bar (percent) covered by sending the file.
+    Default: 90
+
+    The remainder covers the post-completion cache invalidation stage.
+    """
+
+    PROGRESS_STEP_PERCENT: int = 5
+    """
+    Minimum progress change (percent) before it is written to the job row.
+    Default: 5
+    """
+
+    STALE_AFTER_SECONDS: int = 3600
+    """
+    Unfinished jobs not updated for this long are reported as failed.
+    Default: 3600 seconds (1 hour)
+
+    Covers jobs lost to a process restart, so the upload page stops polling.
+    """
+
+    @classmethod
+    def validate(cls) -> None:
+        """
+        Validate configuration values.
+        Raises ValueError if any configuration is invalid.
+        """
+        if not isinstance(cls.MAX_WORKERS, int) or not (1 <= cls.MAX_WORKERS <= 16):
+            raise ValueError(f"MAX_WORKERS must be between 1 and 16, got {cls.MAX_WORKERS}")
+
+        if not (0 < cls.UPLOAD_PROGRESS_SHARE < 100):
+            raise ValueError(
+                f"UPLOAD_PROGRESS_SHARE must be between 1 and 99, got {cls.UPLOAD_PROGRESS_SHARE}"
+            )
+
+        if not (1 <= cls.PROGRESS_STEP_PERCENT <= cls.UPLOAD_PROGRESS_SHARE):
+            raise ValueError(
+                f"PROGRESS_STEP_PERCENT must be between 1 and UPLOAD_PROGRESS_SHARE, "
+                f"got {cls.PROGRESS_STEP_PERCENT}"
+            )
+
+        if cls.STALE_AFTER_SECONDS < 60:
+            raise ValueError(f"STALE_AFTER_SECONDS must be at least 60, got {cls.STALE_AFTER_SECONDS}")
+
+    @classmethod
+    def get_config_dict(cls) -> dict:
+        """
+        Get all configuration as a dictionary.
+
+        Returns:
+            Dictionary of all upload job configuration values
+        """
+        return {
+            'max_workers': cls.MAX_WORKERS,
+            'spool_dir': cls.SPOOL_DIR,
+            'upload_progress_share': cls.UPLOAD_PROGRESS_SHARE,
+            'progress_step_percent': cls.PROGRESS_STEP_PERCENT,
+            'stale_after_seconds': cls.STALE_AFTER_SECONDS,
+        }
+
+
+# Validate upload job configuration on module import
+try:
+    UploadJobConfig.validate()
+except ValueError as e:
+    raise RuntimeError(f"Invalid UploadJobConfig: {e}")
+
+
+class CacheWarmupConfig:
+    """
+    Cache Warm-up Configuration
+
+    Controls prefetching of the forecast cascade tree, model schemas and
+    summaries for the active report months (POST /api/cache/warm/, the
+    optional post-upload hook and, for shared cache backends only,
+    manage.py warm_caches), so the first user after a deploy or cache
+    clear does not pay for every round trip.
+    """
+
+    MONTHS_AHEAD: int = 1
+    """
+    Report months warmed after the current calendar month.
+    Default: 1 (current and next month)
+
+    Months the backend has no data for are skipped.
+    """
+
+    MAX_WORKERS: int = 8
+    """
+    Concurrent backend requests while warming.
+    Default: 8
+
+    Stays below APIClientConfig.POOL_MAXSIZE so warming shares the pool
+    with live requests.
+    """
+
+    INCLUDE_SCHEMAS: bool = True
+    """
+    Warm roster and forecast model schemas.
+    Default: True
+    """
+
+    INCLUDE_SUMMARIES: bool = True
+    """
+    Warm the summary tables (one request per SUMMARY_TYPES entry and month).
+    Default: True
+    """
+
+    WARM_AFTER_UPLOAD: bool = False
+    """
+    Warm the uploaded month once an upload job has invalidated its caches.
+    Default: False
+
+    Runs on the upload worker after the job is reported completed.
+    """
+
+    @classmethod
+    def validate(cls) -> None:
+        """
+        Validate configuration values.
+        Raises ValueError if any configuration is invalid.
+        """
+        if not isinstance(cls.MONTHS_AHEAD, int) or not (0 <= cls.MONTHS_AHEAD <= 12):
+            raise ValueError(f"MONTHS_AHEAD must be between 0 and 12, got {cls.MONTHS_AHEAD}")
+
+        if not isinstance(cls.MAX_WORKERS, int) or not (1 <= cls.MAX_WORKERS <= 32):
+            raise ValueError(f"MAX_WORKERS must be between 1 and 32, got {cls.MAX_WORKERS}")
+
+    @classmethod
+    def get_config_dict(cls) -> dict:
+        """
+        Get all configuration as a dictionary.
+
+        Returns:
+            Dictionary of all cache warm-up configuration values
+        """
+        return {
+            'months_ahead': cls.MONTHS_AHEAD,
+            'max_workers': cls.MAX_WORKERS,
+            'include_schemas': cls.INCLUDE_SCHEMAS,
+            'include_summaries': cls.INCLUDE_SUMMARIES,
+            'warm_after_upload': cls.WARM_AFTER_UPLOAD,
+        }
+
+
+# Validate cache warm-up configuration on module import
+try:
+    CacheWarmupConfig.validate()
+except ValueError as e:
+    raise RuntimeError(f"Invalid CacheWarmupConfig: {e}")
+
+
 class ExecutionMonitoringConfig:
     """
     Execution Monitoring Page Configuration
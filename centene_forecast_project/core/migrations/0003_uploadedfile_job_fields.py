@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-16 19:38
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_alter_uploadedfile_file_data'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='uploadedfile',
+            name='file_type',
+            field=models.CharField(blank=True, default='', max_length=50),
+        ),
+        migrations.AddField(
+            model_name='uploadedfile',
+            name='finished_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='uploadedfile',
+            name='message',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='uploadedfile',
+            name='result',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='uploadedfile',
+            name='spool_path',
+            field=models.CharField(blank=True, default='', max_length=500),
+        ),
+        migrations.AddField(
+            model_name='uploadedfile',
+            name='uploaded_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='upload_jobs', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='uploadedfile',
+            name='file_data',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+    ]
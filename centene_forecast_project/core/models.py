@@ -1,4 +1,5 @@
 import logging
+from django.conf import settings
 from django.db import models
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 
@@ -53,12 +54,34 @@ class User(AbstractUser):
 
 
 class UploadedFile(models.Model):
-   file_data = models.BinaryField()
+   """Background upload job; polled by the upload page via check_progress."""
+   STATUS_PENDING = 'pending'
+   STATUS_UPLOADING = 'uploading'
+   STATUS_INVALIDATING = 'invalidating'
+   STATUS_COMPLETED = 'completed'
+   STATUS_ERROR = 'error'
+   FINISHED_STATUSES = (STATUS_COMPLETED, STATUS_ERROR)
+
+   file_data = models.BinaryField(null=True, blank=True)
    filename = models.CharField(max_length=255)
-   status = models.CharField(max_length=20, default='pending')
+   file_type = models.CharField(max_length=50, blank=True, default='')
+   spool_path = models.CharField(max_length=500, blank=True, default='')
+   uploaded_by = models.ForeignKey(
+       settings.AUTH_USER_MODEL, null=True, blank=True,
+       on_delete=models.SET_NULL, related_name='upload_jobs'
+   )
+   status = models.CharField(max_length=20, default=STATUS_PENDING)
    progress = models.IntegerField(default=0)
+   message = models.TextField(blank=True, default='')
+   result = models.JSONField(null=True, blank=True)
    created_at = models.DateTimeField(auto_now_add=True)
    updated_at = models.DateTimeField(auto_now=True)
+   finished_at = models.DateTimeField(null=True, blank=True)
+
+   @property
+   def is_finished(self) -> bool:
+       return self.status in self.FINISHED_STATUSES
+
    def __str__(self):
        return f"Upload {self.id} - {self.status}"
 